@@ -3,8 +3,11 @@ from django.contrib.auth.admin import UserAdmin
 from .models import User, UserRole,UserRolePermission
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.models import Group
-from .models import InfinityLogs
-from django_admin_listfilter_dropdown.filters import RelatedDropdownFilter,DropdownFilter
+from .models import InfinityLogs, InfinityLogRollup
+from django_admin_listfilter_dropdown.filters import RelatedDropdownFilter,DropdownFilter,SimpleDropdownFilter
+from django.db.models import F, FloatField, ExpressionWrapper
+from django.utils import timezone
+from infinity_fire_solutions.pagination import CachedCountPaginator
 
 
 class UserRolePermissionInline(admin.TabularInline):
@@ -58,20 +61,110 @@ class UserFilter(AutocompleteFilter):
     title = 'user_role' # display title
     field_name = 'user_role' # name of the foreign key field
  
+class LogPeriodFilter(admin.SimpleListFilter):
+    """
+    Filter the logs to a recent period; a range on the timestamp indexes and partitions.
+    """
+    title = 'timestamp'
+    parameter_name = 'period'
+    periods = {
+        '1h': timezone.timedelta(hours=1),
+        '24h': timezone.timedelta(days=1),
+        '7d': timezone.timedelta(days=7),
+        '30d': timezone.timedelta(days=30),
+    }
+
+    def lookups(self, request, model_admin):
+        return (('1h', 'Last hour'), ('24h', 'Last 24 hours'), ('7d', 'Last 7 days'), ('30d', 'Last 30 days'))
+
+    def queryset(self, request, queryset):
+        if self.value() in self.periods:
+            return queryset.filter(timestamp__gte=timezone.now() - self.periods[self.value()])
+        return queryset
+
+
+class LogModuleFilter(SimpleDropdownFilter):
+    """
+    Module filter listing the modules of the hourly rollups instead of a DISTINCT over the logs.
+    """
+    title = 'module'
+    parameter_name = 'module'
+
+    def lookups(self, request, model_admin):
+        modules = InfinityLogRollup.objects.order_by('module').values_list('module', flat=True).distinct()
+        return [(module, module) for module in modules]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(module=self.value())
+        return queryset
+
+
+class LogUserRoleFilter(SimpleDropdownFilter):
+    """
+    User role filter listing the roles instead of a DISTINCT over the logs.
+    """
+    title = 'user_role'
+    parameter_name = 'user_role'
+
+    def lookups(self, request, model_admin):
+        roles = UserRole.objects.order_by('name').values_list('name', flat=True)
+        return [('admin', 'admin')] + [(role, role) for role in roles if role != 'admin']
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(user_role=self.value())
+        return queryset
+
+
+class LogActionFilter(admin.SimpleListFilter):
+    title = 'action_type'
+    parameter_name = 'action_type'
+
+    def lookups(self, request, model_admin):
+        return (('create', 'create'), ('update', 'update'), ('delete', 'delete'), ('get', 'get'))
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(action_type=self.value())
+        return queryset
+
+
+class LogStatusFilter(admin.SimpleListFilter):
+    """
+    Filter the logs by class of status code, replacing the outcome dropdown.
+    """
+    title = 'outcome'
+    parameter_name = 'status'
+
+    def lookups(self, request, model_admin):
+        return (('2', 'Success (2xx)'), ('3', 'Redirect (3xx)'), ('4', 'Client error (4xx)'), ('5', 'Server error (5xx)'))
+
+    def queryset(self, request, queryset):
+        if self.value() in ('2', '3', '4', '5'):
+            start = int(self.value()) * 100
+            return queryset.filter(status_code__gte=start, status_code__lt=start + 100)
+        return queryset
+
+
 class InfinityLogsAdmin(admin.ModelAdmin):
     list_display = ('module', 'action_type', 'user_role', 'outcome', 'status_code', 'ip_address', 'username', 'timestamp')
-    search_fields = ('ip_address',)  # Add 'username' to search fields
-    search_help_text = 'search by: IP Address' # Update search help text
-    list_filter = (('module',DropdownFilter),
-                   ('action_type',DropdownFilter),
-                   ('user_role',DropdownFilter),
-                   ('outcome',DropdownFilter),
-                   ('username',DropdownFilter),
-                   ('timestamp',DropdownFilter),                      
+    # Prefix and exact searches, which can use the indexes; the username dropdown is replaced by the search.
+    search_fields = ('^username', '=ip_address')
+    search_help_text = 'search by: username (start), IP Address (exact)'
+    list_filter = (LogPeriodFilter,
+                   LogModuleFilter,
+                   LogActionFilter,
+                   LogUserRoleFilter,
+                   LogStatusFilter,
     )
     # autocomplete_fields=['']
     readonly_fields = ('timestamp',)
     list_per_page = 20
+    ordering = ('-timestamp',)
+    # The total count is cached and the unfiltered count skipped, see CachedCountPaginator.
+    paginator = CachedCountPaginator
+    show_full_result_count = False
 
 
  
@@ -87,5 +180,35 @@ class InfinityLogsAdmin(admin.ModelAdmin):
 admin.site.register(User, CustomUserAdmin)
 admin.site.register(InfinityLogs,InfinityLogsAdmin)
 admin.site.register(UserRole, UserRoleAdmin)
+
+
+@admin.register(InfinityLogRollup)
+class InfinityLogRollupAdmin(admin.ModelAdmin):
+    """
+    Hourly requests, errors and execution times per module, read from the rollups
+    computed by `manage.py maintain_infinity_logs`.
+    """
+    list_display = ('hour', 'module', 'requests', 'errors', 'server_errors', 'error_rate', 'avg_elapsed_time', 'p95_elapsed_time', 'max_elapsed_time')
+    list_filter = (('module', DropdownFilter),)
+    date_hierarchy = 'hour'
+    list_per_page = 50
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            error_rate_value=ExpressionWrapper(F('errors') * 100.0 / F('requests'), output_field=FloatField())
+        )
+
+    @admin.display(description='Error rate (%)', ordering='error_rate_value')
+    def error_rate(self, obj):
+        return round(obj.error_rate_value or 0, 2)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
 # admin.site.register(UserRolePermission)
 # admin.site.unregister(Group)
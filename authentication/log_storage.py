@@ -0,0 +1,296 @@
+import os
+import gzip
+import json
+import math
+import logging
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from authentication.models import InfinityLogs, InfinityLogRollup
+from infinity_fire_solutions.aws_helper import upload_signature_to_s3
+
+logger = logging.getLogger(__name__)
+
+# The InfinityLogs table is partitioned by RANGE (TO_DAYS(timestamp)) with one partition
+# per month named p<YYYYMM>, and a last partition holding anything later. Dropping the
+# partition of a month removes its rows without scanning or locking the others. The table
+# is partitioned once by `manage.py partition_infinity_logs`, see partition_table.
+LOGS_TABLE = InfinityLogs._meta.db_table
+MAX_PARTITION = 'pmax'
+
+# Rows read per round trip when archiving a month.
+ARCHIVE_CHUNK_SIZE = 2000
+
+
+def month_start(value):
+    """
+    The first moment, in UTC, of the month of a datetime.
+    """
+    value = value.astimezone(dt_timezone.utc) if timezone.is_aware(value) else value.replace(tzinfo=dt_timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month, count):
+    """
+    The first moment of the month `count` months after (or before) `month`.
+    """
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month):
+    return f'p{month:%Y%m}'
+
+
+def partition_definition(month):
+    """
+    SQL of the partition of a month: the rows before the first day of the next month.
+    """
+    return f"PARTITION {partition_name(month)} VALUES LESS THAN (TO_DAYS('{add_months(month, 1):%Y-%m-%d}'))"
+
+
+def list_partitions():
+    """
+    The partitions of the logs table.
+
+    Returns:
+        list: (name, month) tuples in order, month is None for the last partition; empty
+              if the table is not partitioned.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT PARTITION_NAME FROM information_schema.PARTITIONS '
+            'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL '
+            'ORDER BY PARTITION_ORDINAL_POSITION',
+            [LOGS_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        month = None
+        if name != MAX_PARTITION:
+            month = datetime.strptime(name[1:], '%Y%m').replace(tzinfo=dt_timezone.utc)
+        partitions.append((name, month))
+    return partitions
+
+
+def partitioning_statements(months_ahead=None):
+    """
+    SQL partitioning the logs table by month, from the month of its first log to
+    `months_ahead` months after the current one.
+
+    MySQL needs the partitioning column in every unique key, so the primary key becomes
+    (id, timestamp); id stays AUTO_INCREMENT and unique.
+
+    Returns:
+        list: The ALTER TABLE statements, in order.
+    """
+    months_ahead = settings.INFINITY_LOGS_PARTITIONS_AHEAD if months_ahead is None else months_ahead
+    first = InfinityLogs.objects.order_by('timestamp').values_list('timestamp', flat=True).first()
+    month = month_start(first or timezone.now())
+    last = add_months(month_start(timezone.now()), months_ahead)
+    definitions = []
+    while month <= last:
+        definitions.append(partition_definition(month))
+        month = add_months(month, 1)
+    definitions.append(f'PARTITION {MAX_PARTITION} VALUES LESS THAN MAXVALUE')
+    return [
+        f'ALTER TABLE `{LOGS_TABLE}` DROP PRIMARY KEY, ADD PRIMARY KEY (id, timestamp)',
+        f'ALTER TABLE `{LOGS_TABLE}` PARTITION BY RANGE (TO_DAYS(timestamp)) ({", ".join(definitions)})',
+    ]
+
+
+def partition_table(months_ahead=None):
+    """
+    Partition the logs table by month, see partitioning_statements.
+
+    Both statements rebuild the whole table, copying every row, and block the writes of
+    the log writer while they run; on a large table run it in a maintenance window.
+
+    Returns:
+        list: The names of the created partitions, empty if the table was already partitioned.
+    """
+    if list_partitions():
+        return []
+    with connection.cursor() as cursor:
+        for statement in partitioning_statements(months_ahead):
+            cursor.execute(statement)
+    return [name for name, month in list_partitions()]
+
+
+def ensure_partitions(months_ahead=None):
+    """
+    Create the partitions of the current month and of the next `months_ahead` months,
+    by splitting them off the last partition, which is empty then and so cheap to split.
+
+    Returns:
+        list: The names of the created partitions.
+    """
+    months_ahead = settings.INFINITY_LOGS_PARTITIONS_AHEAD if months_ahead is None else months_ahead
+    partitions = list_partitions()
+    if not partitions:
+        logger.warning("%s is not partitioned, no partition created; run `manage.py partition_infinity_logs`.", LOGS_TABLE)
+        return []
+
+    last_month = max(month for name, month in partitions if month is not None)
+    target = add_months(month_start(timezone.now()), months_ahead)
+    months = []
+    month = add_months(last_month, 1)
+    while month <= target:
+        months.append(month)
+        month = add_months(month, 1)
+    if not months:
+        return []
+
+    definitions = ', '.join([partition_definition(month) for month in months] + [f'PARTITION {MAX_PARTITION} VALUES LESS THAN MAXVALUE'])
+    with connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE `{LOGS_TABLE}` REORGANIZE PARTITION {MAX_PARTITION} INTO ({definitions})')
+    return [partition_name(month) for month in months]
+
+
+def archive_month(month):
+    """
+    Write the logs of a month and every month before it, oldest first, to a gzipped JSON
+    lines file and upload it to INFINITY_LOGS_ARCHIVE_FOLDER in S3.
+
+    Returns:
+        tuple: (S3 key, number of archived rows).
+
+    Raises:
+        RuntimeError: If the upload failed.
+    """
+    rows = InfinityLogs.objects.filter(timestamp__lt=add_months(month, 1)).order_by('timestamp').values()
+    file_name = f'{LOGS_TABLE}-{month:%Y-%m}.jsonl.gz'
+    count = 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, file_name)
+        with gzip.open(path, 'wt', encoding='utf-8') as archive:
+            for row in rows.iterator(chunk_size=ARCHIVE_CHUNK_SIZE):
+                archive.write(json.dumps(row, default=str) + '\n')
+                count += 1
+        if not upload_signature_to_s3(file_name, path, settings.INFINITY_LOGS_ARCHIVE_FOLDER):
+            raise RuntimeError(f"Upload of the {month:%Y-%m} InfinityLogs archive to S3 failed.")
+
+    return f'{settings.INFINITY_LOGS_ARCHIVE_FOLDER}/{file_name}', count
+
+
+def apply_retention(retention_months=None, dry_run=False):
+    """
+    Archive and drop the partitions of the months older than the retention.
+
+    The hours of a month are rolled up before its partition is dropped, so the rollups
+    keep covering archived months.
+
+    Args:
+        retention_months (int, optional): Months of logs kept, INFINITY_LOGS_RETENTION_MONTHS by default.
+        dry_run (bool): Only report the partitions that would be archived.
+
+    Returns:
+        list: A dict per expired partition with its name, S3 key and number of rows.
+    """
+    retention_months = settings.INFINITY_LOGS_RETENTION_MONTHS if retention_months is None else retention_months
+    cutoff = add_months(month_start(timezone.now()), -retention_months)
+
+    partitions = list_partitions()
+    if not partitions:
+        logger.warning("%s is not partitioned, no logs archived; run `manage.py partition_infinity_logs`.", LOGS_TABLE)
+
+    archived = []
+    for name, month in partitions:
+        if month is None or month >= cutoff:
+            continue
+        if dry_run:
+            archived.append({'partition': name, 'key': None, 'rows': None})
+            continue
+
+        rollup_logs(since=month, until=add_months(month, 1))
+        key, rows = archive_month(month)
+        with connection.cursor() as cursor:
+            cursor.execute(f'ALTER TABLE `{LOGS_TABLE}` DROP PARTITION {name}')
+        logger.info("Archived %s InfinityLogs rows of partition %s to %s", rows, name, key)
+        archived.append({'partition': name, 'key': key, 'rows': rows})
+    return archived
+
+
+def percentile(values, fraction):
+    """
+    Nearest-rank percentile of sorted values, 0 for no values.
+    """
+    if not values:
+        return 0
+    return values[max(math.ceil(fraction * len(values)) - 1, 0)]
+
+
+def _rollups_of_day(day_start, day_end):
+    # The logs are read a day at a time and grouped in Python: MySQL has no percentile
+    # aggregate, and one indexed range read per day beats one query per hour and module.
+    groups = {}
+    rows = InfinityLogs.objects.filter(timestamp__gte=day_start, timestamp__lt=day_end).values_list(
+        'timestamp', 'module', 'status_code', 'elapsed_time'
+    )
+    for timestamp, module, status_code, elapsed_time in rows.iterator(chunk_size=ARCHIVE_CHUNK_SIZE):
+        hour = timestamp.replace(minute=0, second=0, microsecond=0)
+        group = groups.setdefault((hour, module), {'elapsed': [], 'errors': 0, 'server_errors': 0})
+        group['elapsed'].append(float(elapsed_time))
+        group['errors'] += status_code >= 400
+        group['server_errors'] += status_code >= 500
+
+    rollups = []
+    for (hour, module), group in groups.items():
+        elapsed = sorted(group['elapsed'])
+        rollups.append(InfinityLogRollup(
+            hour=hour,
+            module=module,
+            requests=len(elapsed),
+            errors=group['errors'],
+            server_errors=group['server_errors'],
+            avg_elapsed_time=sum(elapsed) / len(elapsed),
+            p95_elapsed_time=percentile(elapsed, 0.95),
+            max_elapsed_time=elapsed[-1],
+        ))
+    return rollups
+
+
+def rollup_logs(since=None, until=None):
+    """
+    Compute the hourly rollups of the logs between two moments, replacing the rollups
+    of those hours.
+
+    By default the hours from INFINITY_LOGS_ROLLUP_LOOKBACK_HOURS before the last rollup
+    (the records of those hours may have been written late by the log writer), or from
+    the first log, up to the start of the current hour are computed.
+
+    Args:
+        since (datetime, optional): Start of the first hour.
+        until (datetime, optional): End of the last hour.
+
+    Returns:
+        int: The number of rollups written.
+    """
+    until = (until or timezone.now()).replace(minute=0, second=0, microsecond=0)
+    if since is None:
+        last_hour = InfinityLogRollup.objects.order_by('-hour').values_list('hour', flat=True).first()
+        if last_hour:
+            since = last_hour - timedelta(hours=settings.INFINITY_LOGS_ROLLUP_LOOKBACK_HOURS)
+        else:
+            since = InfinityLogs.objects.order_by('timestamp').values_list('timestamp', flat=True).first()
+            if since is None:
+                return 0
+    since = since.replace(minute=0, second=0, microsecond=0)
+
+    written = 0
+    day_start = since
+    while day_start < until:
+        day_end = min(day_start.replace(hour=0) + timedelta(days=1), until)
+        rollups = _rollups_of_day(day_start, day_end)
+        with transaction.atomic():
+            InfinityLogRollup.objects.filter(hour__gte=day_start, hour__lt=day_end).delete()
+            InfinityLogRollup.objects.bulk_create(rollups)
+        written += len(rollups)
+        day_start = day_end
+    return written
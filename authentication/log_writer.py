@@ -0,0 +1,375 @@
+import os
+import glob
+import json
+import time
+import fcntl
+import queue
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_DROP = 'drop'
+OVERFLOW_SPILL = 'spill'
+
+
+class InfinityLogWriter:
+    """
+    Buffered, batched writer for InfinityLogs records.
+
+    Requests only enqueue a compact record (a plain dict of InfinityLogs fields with
+    unmasked payloads); a single daemon thread masks the payloads and persists the
+    records with bulk_create, either when a batch is full or when the flush interval
+    elapses.
+
+    The in-memory queue is bounded. When it is full the caller waits at most
+    `enqueue_timeout` seconds (backpressure) and then the overflow policy applies:
+    'drop' discards the record, 'spill' appends it, masked, to a JSON-lines file in
+    `spill_dir`. Spilled records, as well as batches that failed to write because the
+    database was slow or unavailable, are replayed by the writer once the queue drains;
+    the spill files of every process are replayed, so records spilled by a worker that
+    has since exited are not lost. Records the database rejects on their own (e.g. a
+    value too long for its column) are moved to a quarantine file instead of being
+    retried forever.
+
+    Args:
+        batch_size (int): Maximum number of records written per bulk_create.
+        flush_interval (float): Maximum seconds a record waits in the queue.
+        max_queue_size (int): Capacity of the in-memory queue.
+        enqueue_timeout (float): Seconds a request may block on a full queue.
+        overflow_policy (str): Either 'drop' or 'spill'.
+        spill_dir (str): Directory holding spilled records.
+        asynchronous (bool): When False records are written inline, which is what
+            tests and management commands usually want.
+        metrics_interval (float): Seconds between metric reports in the application log
+            (0 disables them). `stats()` can be read at any time.
+    """
+
+    def __init__(self, batch_size=100, flush_interval=2.0, max_queue_size=5000,
+                 enqueue_timeout=0.05, overflow_policy=OVERFLOW_SPILL, spill_dir='/tmp/infinity_logs',
+                 asynchronous=True, metrics_interval=300):
+        self.asynchronous = asynchronous
+        self.metrics_interval = metrics_interval
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.overflow_policy = overflow_policy
+        self.spill_dir = spill_dir
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._thread = None
+        self._stopped = threading.Event()
+
+        self._metrics = {
+            'enqueued': 0,
+            'written': 0,
+            'dropped': 0,
+            'spilled': 0,
+            'replayed': 0,
+            'quarantined': 0,
+            'failed_flushes': 0,
+            'flushes': 0,
+            'last_flush_latency': 0.0,
+            'max_flush_latency': 0.0,
+            'total_flush_latency': 0.0,
+        }
+
+    @property
+    def spill_file(self):
+        # One file per process so forked workers never interleave their writes.
+        return os.path.join(self.spill_dir, f'spill-{os.getpid()}.jsonl')
+
+    @property
+    def quarantine_file(self):
+        return os.path.join(self.spill_dir, 'quarantine.jsonl')
+
+    @contextmanager
+    def _file_lock(self, name, mode):
+        """
+        Hold an flock on `spill_dir`/`name`, shared between the processes of the host.
+
+        Yields:
+            bool: False if `mode` includes LOCK_NB and the lock is held elsewhere.
+        """
+        os.makedirs(self.spill_dir, exist_ok=True)
+        with open(os.path.join(self.spill_dir, name), 'a') as lock:
+            try:
+                fcntl.flock(lock, mode)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def start(self):
+        """
+        Start the background writer thread if it is not already running.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name='infinity-log-writer', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """
+        Stop the background thread and flush whatever is still queued.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._flush(self._drain())
+
+    def enqueue(self, record):
+        """
+        Queue a log record for writing.
+
+        Args:
+            record (dict): InfinityLogs field values.
+
+        Returns:
+            bool: True if the record was queued or spilled, False if it was dropped.
+        """
+        if not self.asynchronous:
+            self._incr('enqueued')
+            self._flush([record])
+            return True
+
+        self.start()
+        try:
+            self._queue.put(record, timeout=self.enqueue_timeout)
+        except queue.Full:
+            return self._overflow([record])
+
+        self._incr('enqueued')
+        return True
+
+    def stats(self):
+        """
+        Return a snapshot of the writer metrics.
+
+        Returns:
+            dict: Counters, flush latencies (seconds) and the current queue depth.
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+        flushes = metrics['flushes'] or 1
+        metrics['avg_flush_latency'] = metrics['total_flush_latency'] / flushes
+        metrics['queue_depth'] = self._queue.qsize()
+        metrics['queue_capacity'] = self._queue.maxsize
+        return metrics
+
+    def _incr(self, key, amount=1):
+        with self._lock:
+            self._metrics[key] += amount
+
+    def _run(self):
+        last_report = time.monotonic()
+        while not self._stopped.is_set():
+            batch = self._collect()
+            if batch:
+                self._flush(batch)
+            elif self._queue.empty():
+                self._replay_spill()
+
+            if self.metrics_interval and time.monotonic() - last_report >= self.metrics_interval:
+                logger.info("InfinityLogs writer metrics: %s", self.stats())
+                last_report = time.monotonic()
+
+    def _collect(self):
+        """
+        Block until a batch is full or the flush interval elapses.
+        """
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain(self):
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def _flush(self, records):
+        """
+        Persist records in batches. A batch the database rejects is retried record by
+        record, see _flush_one_by_one.
+        """
+        from authentication.models import InfinityLogs
+
+        for start in range(0, len(records), self.batch_size):
+            chunk = records[start:start + self.batch_size]
+            started = time.monotonic()
+            try:
+                close_old_connections()
+                InfinityLogs.objects.bulk_create([InfinityLogs(**prepare_log_record(record)) for record in chunk])
+            except Exception:
+                logger.exception("Failed to write %s InfinityLogs records", len(chunk))
+                self._incr('failed_flushes')
+                self._flush_one_by_one(chunk)
+                continue
+
+            self._record_flush(len(chunk), time.monotonic() - started)
+
+    def _flush_one_by_one(self, records):
+        """
+        Write the records of a failed batch one at a time.
+
+        While the database is unreachable the remaining records are spilled and replayed
+        later; a record failing on a working connection can never be written and is
+        quarantined, so it does not hold back the rest of its batch.
+        """
+        from authentication.models import InfinityLogs
+
+        for index, record in enumerate(records):
+            started = time.monotonic()
+            try:
+                close_old_connections()
+                InfinityLogs.objects.create(**prepare_log_record(record))
+            except Exception:
+                if not connection.is_usable():
+                    self._spill(records[index:])
+                    return
+                logger.exception("Quarantining an InfinityLogs record the database rejected")
+                self._quarantine(record)
+                continue
+
+            self._record_flush(1, time.monotonic() - started)
+
+    def _record_flush(self, written, latency):
+        with self._lock:
+            self._metrics['written'] += written
+            self._metrics['flushes'] += 1
+            self._metrics['last_flush_latency'] = latency
+            self._metrics['total_flush_latency'] += latency
+            self._metrics['max_flush_latency'] = max(self._metrics['max_flush_latency'], latency)
+
+    def _overflow(self, records):
+        if self.overflow_policy == OVERFLOW_SPILL:
+            return self._spill(records)
+        self._incr('dropped', len(records))
+        return False
+
+    def _write_lines(self, path, records):
+        # Records leave the process masked, as they would be stored in the database.
+        with self._spill_lock, self._file_lock('spill.lock', fcntl.LOCK_SH):
+            with open(path, 'a') as spill:
+                for record in records:
+                    spill.write(json.dumps(prepare_log_record(record), default=str) + '\n')
+
+    def _spill(self, records):
+        """
+        Append records to the spill file of the process as JSON lines.
+        """
+        try:
+            self._write_lines(self.spill_file, records)
+        except OSError:
+            logger.exception("Failed to spill %s InfinityLogs records", len(records))
+            self._incr('dropped', len(records))
+            return False
+
+        self._incr('spilled', len(records))
+        return True
+
+    def _quarantine(self, record):
+        """
+        Append a record that cannot be written to the quarantine file, which is never
+        replayed; it is kept for inspection only.
+        """
+        try:
+            self._write_lines(self.quarantine_file, [record])
+        except OSError:
+            logger.exception("Failed to quarantine an InfinityLogs record")
+            self._incr('dropped')
+            return
+        self._incr('quarantined')
+
+    def _replay_spill(self):
+        """
+        Move spilled records back through the writer once the queue is idle.
+
+        One process at a time replays the spill files of all processes, including files
+        left behind by exited workers and replays interrupted by a restart. Files are
+        renamed under an exclusive lock, so no process is appending to them meanwhile.
+        """
+        if not os.path.isdir(self.spill_dir):
+            return
+
+        with self._file_lock('replay.lock', fcntl.LOCK_EX | fcntl.LOCK_NB) as locked:
+            if not locked:
+                return
+
+            with self._spill_lock, self._file_lock('spill.lock', fcntl.LOCK_EX):
+                for spill_file in glob.glob(os.path.join(self.spill_dir, 'spill-*.jsonl')):
+                    os.replace(spill_file, f'{spill_file}.replay')
+
+            replayed = 0
+            for replay_file in sorted(glob.glob(os.path.join(self.spill_dir, 'spill-*.jsonl.replay'))):
+                with open(replay_file) as spill:
+                    batch = []
+                    for line in spill:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        batch.append(json.loads(line))
+                        if len(batch) >= self.batch_size:
+                            self._flush(batch)
+                            replayed += len(batch)
+                            batch = []
+                    if batch:
+                        self._flush(batch)
+                        replayed += len(batch)
+                os.remove(replay_file)
+
+        self._incr('replayed', replayed)
+
+
+def prepare_log_record(record):
+    """
+    Mask sensitive values of a queued record right before it is written.
+
+    Args:
+        record (dict): InfinityLogs field values as queued by the request.
+
+    Returns:
+        dict: Field values safe to store.
+    """
+    from authentication.signals import mask_sensitive_data
+
+    record = dict(record)
+    record['api'] = mask_sensitive_data(record.get('api'), mask_api_parameters=True)
+    record['request_payload'] = mask_sensitive_data(record.get('request_payload'))
+    record['response_payload'] = mask_sensitive_data(record.get('response_payload'))
+    return record
+
+
+log_writer = InfinityLogWriter(
+    batch_size=settings.INFINITY_LOGS_BATCH_SIZE,
+    flush_interval=settings.INFINITY_LOGS_FLUSH_INTERVAL,
+    max_queue_size=settings.INFINITY_LOGS_MAX_QUEUE_SIZE,
+    enqueue_timeout=settings.INFINITY_LOGS_ENQUEUE_TIMEOUT,
+    overflow_policy=settings.INFINITY_LOGS_OVERFLOW_POLICY,
+    spill_dir=settings.INFINITY_LOGS_SPILL_DIR,
+    asynchronous=settings.INFINITY_LOGS_ASYNC,
+    metrics_interval=settings.INFINITY_LOGS_METRICS_INTERVAL,
+)
+atexit.register(log_writer.stop)
@@ -0,0 +1,89 @@
+import os
+import json
+import tempfile
+import tracemalloc
+from django.core.handlers.wsgi import WSGIRequest
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.request_capture import preview_body, preview_multipart
+
+BOUNDARY = 'BenchmarkBoundary'
+CHUNK_SIZE = 1024 * 1024
+
+
+def _write_multipart(file, size):
+    """
+    Write a multipart body with a form field and a file of `size` bytes.
+    """
+    file.write((
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="description"\r\n\r\nSurvey photos\r\n'
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="file"; filename="upload.bin"\r\n'
+        f'Content-Type: application/octet-stream\r\n\r\n'
+    ).encode())
+    chunk = os.urandom(CHUNK_SIZE)
+    written = 0
+    while written < size:
+        part = chunk[:min(CHUNK_SIZE, size - written)]
+        file.write(part)
+        written += len(part)
+    file.write(f'\r\n--{BOUNDARY}--\r\n'.encode())
+    file.flush()
+    return file.tell()
+
+
+def _request(file, length):
+    file.seek(0)
+    return WSGIRequest({
+        'REQUEST_METHOD': 'POST',
+        'PATH_INFO': '/fra/upload/',
+        'SCRIPT_NAME': '',
+        'SERVER_NAME': 'testserver',
+        'SERVER_PORT': '80',
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': file,
+        'CONTENT_TYPE': f'multipart/form-data; boundary={BOUNDARY}',
+        'CONTENT_LENGTH': str(length),
+    })
+
+
+def _legacy_capture(request):
+    # What the logger middleware did before: read the whole body before the view.
+    request_data = request.body
+    request.FILES
+    return f'{len(request_data)} bytes'
+
+
+def _preview_capture(request):
+    request_data = preview_body(request)
+    request.FILES
+    return request_data if request_data is not None else preview_multipart(request)
+
+
+class Command(BaseCommand):
+    help = ('Measure the memory used to log a large multipart upload, reading the whole body as the logger '
+            'middleware used to and with the bounded preview. The view is simulated by parsing request.FILES.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size-mb', type=int, default=100, help='Size of the uploaded file in MB.')
+
+    def handle(self, *args, **options):
+        if options['size_mb'] < 1:
+            raise CommandError('--size-mb must be positive.')
+
+        results = {}
+        with tempfile.TemporaryFile() as body:
+            length = _write_multipart(body, options['size_mb'] * 1024 * 1024)
+            for name, capture in (('legacy', _legacy_capture), ('preview', _preview_capture)):
+                request = _request(body, length)
+                tracemalloc.start()
+                try:
+                    logged = capture(request)
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+                    if hasattr(request, '_files'):
+                        for upload in request.FILES.values():
+                            upload.close()
+                results[name] = {'peak_memory_mb': round(peak / 1024 / 1024, 2), 'logged': logged}
+
+        self.stdout.write(json.dumps({'body_mb': round(length / 1024 / 1024, 2), **results}, indent=2, default=str))
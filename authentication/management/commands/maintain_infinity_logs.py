@@ -0,0 +1,33 @@
+import json
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from authentication.log_storage import rollup_logs, ensure_partitions, apply_retention
+
+
+class Command(BaseCommand):
+    help = ('Roll up the InfinityLogs of the past hours, create the partitions of the coming months and '
+            'archive the months older than the retention to S3. Run it hourly, e.g. from cron.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retention-months', type=int, default=settings.INFINITY_LOGS_RETENTION_MONTHS,
+                            help='Months of logs kept in the database.')
+        parser.add_argument('--months-ahead', type=int, default=settings.INFINITY_LOGS_PARTITIONS_AHEAD,
+                            help='Months of partitions created ahead of the current one.')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only list the partitions that would be archived.')
+
+    def handle(self, *args, **options):
+        if not options['dry_run']:
+            written = rollup_logs()
+            self.stdout.write(f'Wrote {written} hourly rollups.')
+
+            created = ensure_partitions(options['months_ahead'])
+            if created:
+                self.stdout.write(f'Created partitions {", ".join(created)}.')
+
+        archived = apply_retention(options['retention_months'], dry_run=options['dry_run'])
+        if archived:
+            self.stdout.write(json.dumps(archived, indent=2))
+        self.stdout.write(self.style.SUCCESS(
+            f'{"Would archive" if options["dry_run"] else "Archived"} {len(archived)} partitions.'
+        ))
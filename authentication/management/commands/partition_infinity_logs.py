@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from authentication.log_storage import partition_table, partitioning_statements, list_partitions
+
+
+class Command(BaseCommand):
+    help = ('Partition the InfinityLogs table by month, once, before `maintain_infinity_logs` can archive '
+            'and drop old months. It rebuilds the whole table, copying every row and blocking the log '
+            'writes while it runs: run it in a maintenance window.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=settings.INFINITY_LOGS_PARTITIONS_AHEAD,
+                            help='Months of partitions created ahead of the current one.')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only print the SQL that would be run.')
+
+    def handle(self, *args, **options):
+        if list_partitions():
+            self.stdout.write(self.style.SUCCESS('InfinityLogs is already partitioned.'))
+            return
+
+        if options['dry_run']:
+            for statement in partitioning_statements(options['months_ahead']):
+                self.stdout.write(f'{statement};')
+            return
+
+        created = partition_table(options['months_ahead'])
+        self.stdout.write(self.style.SUCCESS(f'Partitioned InfinityLogs into {", ".join(created)}.'))
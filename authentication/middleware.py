@@ -3,9 +3,11 @@
 from django.urls import reverse
 from django.shortcuts import redirect
 from django.contrib.auth import logout
-from django.urls import resolve
 from django.http import HttpResponse
 from authentication.signals import api_request_logged
+from authentication.request_capture import (
+    CAPTURE_SKIP, CAPTURE_PREVIEW, resolve_route, capture_mode, preview_body, preview_multipart,
+)
 from django.core.exceptions import PermissionDenied
 from django.conf import settings
 from django.dispatch import receiver
@@ -124,30 +126,34 @@ class ForcePasswordChangeBackend:
         return response
 
 class SimpleAPILoggerMiddleware:
+    """
+    Middleware sending the api_request_logged signal, which writes the InfinityLogs record,
+    for every request of a resolvable URL.
+
+    The route is resolved once and cached on the request. The request body is captured
+    according to INFINITY_LOGS_BODY_CAPTURE, as a bounded preview at most: uploads are
+    never read into memory for the log, see authentication/request_capture.py.
+    """
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        # Continue with the original request processing
-        request_data = request.body if request.body else ''
-        response = self.get_response(request)
+        match = resolve_route(request)
+        mode = capture_mode(match)
+        if mode == CAPTURE_SKIP:
+            return self.get_response(request)
 
-        # Check if the request is in the 'admin' namespace
-        namespace = resolve(request.path_info).namespace
-
-        if namespace == 'admin':
-            return response
+        request_data = preview_body(request) if mode == CAPTURE_PREVIEW else None
+        response = self.get_response(request)
+        if mode == CAPTURE_PREVIEW and request_data is None:
+            request_data = preview_multipart(request)
 
         api_request_logged.send(
             sender=self.__class__,
             request_data=request_data,
             request=request,
             response=response,
+            resolver_match=match,
         )
 
-        # Add the function call to capture request and response payload
-        # self.log_request_and_response(request_data, response)
-
         return response
-    
-
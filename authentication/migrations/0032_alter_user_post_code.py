@@ -0,0 +1,19 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:04
+
+import customer_management.post_codes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0031_alter_userrolepermission_module'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='post_code',
+            field=models.CharField(blank=True, max_length=10, null=True, validators=[customer_management.post_codes.validate_post_code]),
+        ),
+    ]
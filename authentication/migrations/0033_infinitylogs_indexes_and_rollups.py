@@ -0,0 +1,57 @@
+# Hand-written: the InfinityLogs indexes and the InfinityLogRollup model.
+#
+# The table is not partitioned here: partitioning rebuilds the whole table, copying every
+# row, so it is run explicitly with `manage.py partition_infinity_logs`, not by `migrate`.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0032_alter_user_post_code'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='infinitylogs',
+            index=models.Index(fields=['timestamp'], name='InfinityLog_timesta_8e1637_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='infinitylogs',
+            index=models.Index(fields=['module', 'timestamp'], name='InfinityLog_module_66dd28_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='infinitylogs',
+            index=models.Index(fields=['user_role', 'timestamp'], name='InfinityLog_user_ro_70705e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='infinitylogs',
+            index=models.Index(fields=['username', 'timestamp'], name='InfinityLog_usernam_c2e4cb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='infinitylogs',
+            index=models.Index(fields=['status_code', 'timestamp'], name='InfinityLog_status__165c08_idx'),
+        ),
+        migrations.CreateModel(
+            name='InfinityLogRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField()),
+                ('module', models.CharField(max_length=20)),
+                ('requests', models.PositiveIntegerField(default=0)),
+                ('errors', models.PositiveIntegerField(default=0)),
+                ('server_errors', models.PositiveIntegerField(default=0)),
+                ('avg_elapsed_time', models.FloatField(default=0)),
+                ('p95_elapsed_time', models.FloatField(default=0)),
+                ('max_elapsed_time', models.FloatField(default=0)),
+            ],
+            options={
+                'verbose_name': 'InfinityLogs Rollup',
+                'verbose_name_plural': 'InfinityLogs Rollups',
+                'db_table': 'InfinityLogRollups',
+                'ordering': ['-hour', 'module'],
+                'unique_together': {('hour', 'module')},
+            },
+        ),
+    ]
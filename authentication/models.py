@@ -2,7 +2,7 @@ from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from cities_light.models import City, Country, Region
 from ckeditor.fields import RichTextField
-from customer_management.constants import POST_CODE_LIST
+from customer_management.post_codes import validate_post_code
 from django.utils.safestring import mark_safe
 
 
@@ -196,7 +196,7 @@ class User(AbstractBaseUser, PermissionsMixin):
     country = models.CharField(max_length=255, null=True, blank=True)
     town = models.CharField(max_length=255, null=True, blank=True)
     county = models.CharField(max_length=255, null=True, blank=True)
-    post_code = models.CharField(max_length=10, choices=POST_CODE_LIST, null=True, blank=True)
+    post_code = models.CharField(max_length=10, validators=[validate_post_code], null=True, blank=True)
 
     # relationship with UserRole
     company_name = models.CharField(max_length=100, blank=True, null=True)
@@ -281,4 +281,47 @@ class InfinityLogs(models.Model):
     class Meta:
         db_table = 'InfinityLogs'
         verbose_name = 'InfinityLogs'
-        verbose_name_plural = 'InfinityLogs '
\ No newline at end of file
+        verbose_name_plural = 'InfinityLogs '
+        # The table is partitioned by month of timestamp, see authentication/log_storage.py.
+        indexes = [
+            models.Index(fields=['timestamp']),
+            models.Index(fields=['module', 'timestamp']),
+            models.Index(fields=['user_role', 'timestamp']),
+            models.Index(fields=['username', 'timestamp']),
+            models.Index(fields=['status_code', 'timestamp']),
+        ]
+
+
+class InfinityLogRollup(models.Model):
+    """
+    Hourly summary of the InfinityLogs of a module, computed by the `maintain_infinity_logs`
+    management command. The summaries outlive the archived log partitions.
+
+    Fields:
+        - hour: Start of the hour summarised
+        - module: Module of the application
+        - requests: Number of logged requests
+        - errors: Requests answered with a 4xx or 5xx status code
+        - server_errors: Requests answered with a 5xx status code
+        - avg_elapsed_time: Average server execution time (in seconds)
+        - p95_elapsed_time: 95th percentile of the server execution time (in seconds)
+        - max_elapsed_time: Longest server execution time (in seconds)
+    """
+    hour = models.DateTimeField()
+    module = models.CharField(max_length=20)
+    requests = models.PositiveIntegerField(default=0)
+    errors = models.PositiveIntegerField(default=0)
+    server_errors = models.PositiveIntegerField(default=0)
+    avg_elapsed_time = models.FloatField(default=0)
+    p95_elapsed_time = models.FloatField(default=0)
+    max_elapsed_time = models.FloatField(default=0)
+
+    def __str__(self):
+        return f"{self.module} {self.hour:%Y-%m-%d %H:00}"
+
+    class Meta:
+        db_table = 'InfinityLogRollups'
+        verbose_name = 'InfinityLogs Rollup'
+        verbose_name_plural = 'InfinityLogs Rollups'
+        ordering = ['-hour', 'module']
+        unique_together = [('hour', 'module')]
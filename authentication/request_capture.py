@@ -0,0 +1,116 @@
+import json
+from django.conf import settings
+from django.urls import resolve
+from django.urls.exceptions import Resolver404
+
+# Capture modes of INFINITY_LOGS_BODY_CAPTURE: 'skip' logs nothing, 'none' logs the
+# request without its body and 'preview' with a bounded preview of the body.
+CAPTURE_SKIP = 'skip'
+CAPTURE_NONE = 'none'
+CAPTURE_PREVIEW = 'preview'
+
+# Bodies of these content types are text and previewed; other bodies are only described.
+TEXT_CONTENT_TYPES = ('application/json', 'application/vnd.api+json', 'application/x-www-form-urlencoded',
+                      'application/xml')
+
+
+def resolve_route(request):
+    """
+    Resolve the URL of a request once and cache the match on the request.
+
+    Returns:
+        ResolverMatch: The match, None for URLs that do not resolve.
+    """
+    if not hasattr(request, 'api_log_route'):
+        try:
+            request.api_log_route = resolve(request.path_info)
+        except Resolver404:
+            request.api_log_route = None
+    return request.api_log_route
+
+
+def capture_mode(match):
+    """
+    The capture mode of a route: the INFINITY_LOGS_BODY_CAPTURE entry of its URL namespace,
+    else of its module (the first segment of the route, e.g. 'customer'), else
+    INFINITY_LOGS_BODY_CAPTURE_DEFAULT.
+    """
+    if match is None:
+        return CAPTURE_SKIP
+    modes = settings.INFINITY_LOGS_BODY_CAPTURE
+    if match.namespace and match.namespace in modes:
+        return modes[match.namespace]
+    return modes.get(match.route.split('/')[0], settings.INFINITY_LOGS_BODY_CAPTURE_DEFAULT)
+
+
+def _truncate(value):
+    limit = settings.INFINITY_LOGS_BODY_PREVIEW_SIZE
+    if isinstance(value, str) and len(value) > limit:
+        return f'{value[:limit]}... ({len(value)} characters)'
+    return value
+
+
+def _content_length(request):
+    try:
+        return int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        return 0
+
+
+def preview_body(request):
+    """
+    Preview the body of a request before it is dispatched.
+
+    Only bodies of text content types up to INFINITY_LOGS_BODY_CAPTURE_MAX_SIZE are read;
+    Django keeps them in memory anyway once read by the view. JSON and form bodies are
+    parsed, so sensitive keys can be masked by the log writer.
+
+    Returns:
+        The preview (dict or str), or None for multipart bodies, which are left to the
+        upload handlers and previewed after the view with preview_multipart.
+    """
+    length = _content_length(request)
+    content_type = request.content_type or ''
+    if not length:
+        return ''
+    if content_type == 'multipart/form-data':
+        return None
+    if content_type not in TEXT_CONTENT_TYPES and not content_type.startswith('text/'):
+        return f'** {content_type or "Unknown"} body of {length} bytes **'
+    if length > settings.INFINITY_LOGS_BODY_CAPTURE_MAX_SIZE:
+        return f'** {content_type} body of {length} bytes, not captured **'
+
+    text = request.body.decode(request.encoding or 'utf-8', errors='replace')
+    if content_type in ('application/json', 'application/vnd.api+json'):
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return _truncate(text)
+        if isinstance(data, dict):
+            return {key: _truncate(value) for key, value in data.items()}
+        return _truncate(text)
+    if content_type == 'application/x-www-form-urlencoded':
+        return {key: _truncate(value) for key, value in request.POST.dict().items()}
+    return _truncate(text)
+
+
+def preview_multipart(request):
+    """
+    Preview a multipart body after the view: its form fields and the names and sizes of
+    its files, never their content.
+
+    The body is only described if the view did not parse it, so logging never makes
+    Django read an upload the view did not need.
+    """
+    length = _content_length(request)
+    # request._files is set once the body has been parsed, by the view or by the CSRF check.
+    if not hasattr(request, '_files'):
+        return f'** multipart/form-data body of {length} bytes **'
+
+    preview = {key: _truncate(value) for key, value in request.POST.dict().items()}
+    preview['files'] = [
+        {'field': field, 'name': upload.name, 'size': upload.size, 'content_type': upload.content_type}
+        for field, uploads in request.FILES.lists()
+        for upload in uploads
+    ]
+    return preview
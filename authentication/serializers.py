@@ -7,7 +7,7 @@ from infinity_fire_solutions.custom_form_validation import *
 from cities_light.models import City, Country, Region
 from .models import User, UserRole
 import re
-from customer_management.constants import POST_CODE_LIST
+from customer_management.post_codes import PostCodeField
 
 
 
@@ -487,12 +487,11 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'base_template': 'custom_input.html'
         },
     )
-    post_code = serializers.ChoiceField(
+    post_code = PostCodeField(
         label=('Post Code'),
         required=True,
-        choices=POST_CODE_LIST,
         style={
-            'base_template': 'custom_select.html'
+            'base_template': 'custom_post_code.html'
         },
 
 
@@ -1,5 +1,4 @@
 import re
-import json
 import time
 import logging
 from functools import wraps
@@ -8,7 +7,9 @@ from django.utils import timezone
 from django.urls import resolve
 from django.urls.exceptions import Resolver404
 from django.dispatch import receiver, Signal
-from authentication.models import InfinityLogs
+from django.db.models.signals import post_save, post_delete
+from authentication.models import InfinityLogs, UserRole, UserRolePermission
+from authentication.log_writer import log_writer
 SENSITIVE_KEYS = ['password', 'token', 'access', 'refresh']
     
 api_request_logged = Signal()
@@ -146,12 +147,15 @@ def mask_sensitive_data(data, mask_api_parameters=False):
 def log_api_request(sender, **kwargs):
     request = kwargs.get('request')
     response = kwargs.get('response')
-    api_route = resolve(request.path_info).route
+    # The middleware resolves the URL once and passes the match along.
+    match = kwargs.get('resolver_match') or resolve(request.path_info)
+    api_route = match.route
     module_name = api_route.split('/')[0]
-    namespace = resolve(request.path_info).namespace
+    namespace = match.namespace
     namespaces = ['admin', 'docs']
 
-    if namespace in namespaces or api_route == 'dashboard/' or api_route == '':
+    # Health probes run every few seconds per pod and are not user activity.
+    if namespace in namespaces or api_route in ('dashboard/', '', 'healthz/', 'readyz/'):
         return response
 
     start_time = time.time()
@@ -176,18 +180,10 @@ def log_api_request(sender, **kwargs):
         username = [request.user.first_name if api_route not in routes and not isinstance(request.user, AnonymousUser) and request.user else None]
         user_id = [request.user.id if api_route not in routes and not isinstance(request.user, AnonymousUser) and request.user else 0][0]
 
-        if request_data is not None:
-                if not isinstance(request_data, str) and not isinstance(request_data, bytes):
-                            request_payload = json.loads(mask_sensitive_data(request_data.decode('utf-8')))
-                else:
-                    request_payload = mask_sensitive_data(request_data)
-        else:
-                request_payload = None
-        api = request.build_absolute_uri()
+        # Payloads are queued unmasked; the log writer masks them off the request thread.
+        request_payload = request_data
         response_body = response.data if hasattr(response, 'data') else None
         outcome = f'{http_status_codes.get(response.status_code, "Unknown")}'
-        response_payload = mask_sensitive_data(response_body)
-        response_body = response.data if hasattr(response, 'data') else None
 
         if response_body:
             if response.get('content-type') == 'application/gzip':
@@ -197,13 +193,13 @@ def log_api_request(sender, **kwargs):
             elif getattr(response, 'streaming', False):
                 response_payload = '** Streaming **'
             else:
-                response_payload = mask_sensitive_data(response_body)
+                response_payload = response_body
         else:
             response_payload = 'No response body'
             logging.basicConfig(level=logging.DEBUG)
 
         data = dict(
-            api=mask_sensitive_data(api, mask_api_parameters=True),
+            api=api,
             access_type=headers['USER_AGENT'].split('/')[0],
             ip_address=get_client_ip(request),
             page_slug=api_route,
@@ -231,7 +227,7 @@ def log_api_request(sender, **kwargs):
             method=method,
             status_code=response.status_code,
         )
-        InfinityLogs.objects.create(**data)
+        log_writer.enqueue(data)
     else:
         return response
 
@@ -250,20 +246,17 @@ def get_client_ip(request):
         return ''
 
 
-def log_api_request(request, response):
-    # Log the request and response or relevant information
-    logging.debug(f"Request: {request}")
-    logging.debug(f"Response: {response}")
-    logging.basicConfig(level=logging.DEBUG)
-
-
-
-    # Log the index and list length before accessing the index
-    logging.debug(f"Index: {InfinityLogs}, List length: {len(50)}")
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+@receiver(post_save, sender=UserRolePermission)
+@receiver(post_delete, sender=UserRolePermission)
+def invalidate_role_permissions(sender, **kwargs):
+    """
+    Invalidate the cached role permission matrices whenever a role or one of its permissions changes.
+    """
+    from infinity_fire_solutions.permission import invalidate_permission_cache
 
-    # Log any relevant information after accessing the list
-    logging.debug("Code after accessing the list")
-   
+    invalidate_permission_cache()
 
 
 def update_object(request, obj_id):
@@ -1,7 +1,7 @@
 from django import template
-from infinity_fire_solutions.permission import get_user_module_permissions
+from infinity_fire_solutions.permission import can
 from django.urls import resolve, Resolver404
-from common_app.models import MenuItem
+from common_app.menu import get_menu_tree
 import re
 
 register = template.Library()
@@ -18,10 +18,7 @@ def has_add_permission(user, module_name):
     Returns:
         bool: True if the user has the 'add' permission for the specified module, False otherwise.
     """
-    user_permissions = get_user_module_permissions(user, module_name)
-    for permission in user_permissions.values():
-        if permission['can_create_data'] != False:
-            return permission['can_create_data']
+    return can(user, module_name, 'create')
 
 
 @register.filter
@@ -36,14 +33,10 @@ def has_update_permission(user, module_name):
     Returns:
         bool: True if the user has the 'update' permission for the specified module, False otherwise.
     """
-    user_permissions = get_user_module_permissions(user, module_name)
-    for permission in user_permissions.values():
-        if permission['can_change_data'] != "none":
-            if permission['can_change_data'] == "all":
-                return permission['can_change_data']
-            else:
-                return True
-    return False
+    access = can(user, module_name, 'change')
+    if access == "all":
+        return access
+    return bool(access)
 
 @register.filter
 def has_delete_permission(user, module_name):
@@ -57,14 +50,10 @@ def has_delete_permission(user, module_name):
     Returns:
         bool: True if the user has the 'delete' permission for the specified module, False otherwise.
     """
-    user_permissions = get_user_module_permissions(user, module_name)
-    for permission in user_permissions.values():
-        if permission['can_delete_data'] != "none":
-            if permission['can_delete_data'] == "all":
-                return permission['can_delete_data']
-            else:
-                return True
-    return False
+    access = can(user, module_name, 'delete')
+    if access == "all":
+        return access
+    return bool(access)
 
 
 @register.filter
@@ -79,14 +68,10 @@ def has_view_permission(user, module_name):
     Returns:
         bool: True if the user has the 'view' permission for the specified module, False otherwise.
     """
-    user_permissions = get_user_module_permissions(user, module_name)
-    for permission in user_permissions.values():
-        if permission['can_view_data'] != "none":
-            if permission['can_view_data'] == "all":
-                return permission['can_view_data']
-            else:
-                return True
-    return False
+    access = can(user, module_name, 'view')
+    if access == "all":
+        return access
+    return bool(access)
 
 @register.filter
 def get_active_menu(current_path):
@@ -99,7 +84,7 @@ def get_active_menu(current_path):
     Returns:
         str: The active menu name or None if no active menu found.
     """
-    allowed_menu_items = MenuItem.objects.filter(parent=None).distinct().order_by('order')
+    allowed_menu_items = get_menu_tree()
     current_url = current_path
     active_menu = None
     pattern = r"s$" 
@@ -113,7 +98,7 @@ def get_active_menu(current_path):
     for item in allowed_menu_items:
         # Convert menu name to lowercase and replace spaces with underscores
         # Remove trailing "s" from plural menu names
-        menu_name = re.sub(pattern, "", item.name.replace(" ", "_")).lower()
+        menu_name = re.sub(pattern, "", item['name'].replace(" ", "_")).lower()
         # Check if the menu name is in the first segment of the URL
         if menu_name in first_segment:
             active_menu = menu_name
@@ -1 +1,53 @@
+from django.core.cache import cache
+from django.test import TestCase
 
+from authentication.models import UserRole, UserRolePermission
+from infinity_fire_solutions.permission import get_role_permission_matrix, role_can
+
+
+class RolePermissionCacheTests(TestCase):
+    """
+    The permission matrix of a role is loaded once and then served from the cache until
+    the role or one of its permissions changes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.role = UserRole.objects.create(name='Surveyor')
+        cls.permission = UserRolePermission.objects.create(
+            role=cls.role, module='customer', can_create_data=True,
+            can_list_data='All', can_change_data='self', can_view_data='all', can_delete_data='none',
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_cache_hit(self):
+        with self.assertNumQueries(2):
+            matrix = get_role_permission_matrix(self.role.id)
+        self.assertEqual(matrix['role_name'], 'Surveyor')
+        self.assertEqual(matrix['modules']['customer']['can_list_data'], 'all')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_role_permission_matrix(self.role.id), matrix)
+            self.assertEqual(role_can(self.role.id, 'customer', 'change'), 'self')
+            self.assertFalse(role_can(self.role.id, 'customer', 'delete'))
+
+    def test_permission_change_invalidates(self):
+        get_role_permission_matrix(self.role.id)
+        self.permission.can_delete_data = 'all'
+        self.permission.save()
+        with self.assertNumQueries(2):
+            self.assertEqual(role_can(self.role.id, 'customer', 'delete'), 'all')
+
+    def test_role_change_invalidates(self):
+        get_role_permission_matrix(self.role.id)
+        self.role.name = 'Senior Surveyor'
+        self.role.save()
+        self.assertEqual(get_role_permission_matrix(self.role.id)['role_name'], 'Senior Surveyor')
+
+    def test_permission_delete_invalidates(self):
+        get_role_permission_matrix(self.role.id)
+        self.permission.delete()
+        self.assertFalse(role_can(self.role.id, 'customer', 'list'))
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import MenuItem, EmailNotificationTemplate,AdminConfiguration,SORValidity,UpdateWindowConfiguration
+from .models import MenuItem, EmailNotificationTemplate,AdminConfiguration,SORValidity,UpdateWindowConfiguration,PDFRenderJob,ImportJob,DocumentSequence,OutboundEmail,RenditionJob
 
 
 
@@ -42,5 +42,42 @@ class UpdateWindowConfigurationAdmin(admin.ModelAdmin):
     list_display = ('start_date', 'end_date', 'is_active')
 
 
+@admin.register(PDFRenderJob)
+class PDFRenderJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'document_type', 'object_id', 'status', 'attempts', 'render_time', 'created_at', 'finished_at')
+    list_filter = ('status', 'document_type')
+    exclude = ('html_content',)
+    readonly_fields = ('error', 'pdf_path', 'content_hash', 'render_time', 'started_at', 'finished_at')
+
+
+@admin.register(ImportJob)
+class ImportJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'import_type', 'file_name', 'status', 'rows_processed', 'rows_failed', 'created_by', 'created_at', 'finished_at')
+    list_filter = ('status', 'import_type')
+    exclude = ('errors',)
+    readonly_fields = ('rows_processed', 'rows_failed', 'rows_created', 'rows_updated', 'rolled_back', 'error', 'started_at', 'finished_at')
+
+
+@admin.register(RenditionJob)
+class RenditionJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'model', 'status', 'attempts', 'created_at', 'finished_at')
+    list_filter = ('status', 'model')
+    readonly_fields = ('error', 'started_at', 'finished_at')
+
+
+@admin.register(DocumentSequence)
+class DocumentSequenceAdmin(admin.ModelAdmin):
+    list_display = ('name', 'next_value', 'updated_at')
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ('id', 'to_email', 'subject', 'status', 'attempts', 'send_time', 'created_at', 'sent_at')
+    list_filter = ('status', 'template_name')
+    search_fields = ('to_email', 'subject')
+    exclude = ('html_content',)
+    readonly_fields = ('error', 'message_id', 'send_time', 'started_at', 'sent_at')
+
+
 admin.site.register(MenuItem, MenuItemAdmin)
 admin.site.register(SORValidity, SORValidityAdmin)
\ No newline at end of file
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CommonAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'common_app'
+
+    def ready(self):
+        import common_app.signals
@@ -0,0 +1,231 @@
+import os
+import uuid
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+
+from infinity_fire_solutions.aws_helper import s3_client, timed_s3_operation
+from infinity_fire_solutions.permission import can
+from .rendition_jobs import queue_renditions
+
+logger = logging.getLogger(__name__)
+
+DIRECT_UPLOAD_SALT = 'common_app.direct_uploads'
+
+
+class DirectUploadError(Exception):
+    """
+    Raised when an upload grant cannot be issued or an upload cannot be confirmed.
+    """
+
+
+def _requirement_documents(user, data_access_value):
+    from requirement_management.models import RequirementAsset
+    from requirement_management.views import filter_requirements
+
+    requirements = filter_requirements(data_access_value, user)
+    return {
+        'get_parent': lambda object_id: requirements.filter(pk=object_id).first(),
+        'folder': lambda requirement: f'requirement/{requirement.id}',
+        'build': lambda requirement, key: RequirementAsset(requirement_id=requirement, document_path=key),
+        'model': RequirementAsset,
+    }
+
+
+def _requirement_defect_documents(user, data_access_value):
+    from requirement_management.models import RequirementDefect, RequirementDefectDocument
+    from requirement_management.views import filter_requirements
+
+    defects = RequirementDefect.objects.filter(requirement_id__in=filter_requirements(data_access_value, user))
+    return {
+        'get_parent': lambda object_id: defects.filter(pk=object_id).first(),
+        'folder': lambda defect: f'requirement/{defect.id}/defects',
+        'build': lambda defect, key: RequirementDefectDocument(
+            requirement_id_id=defect.requirement_id_id, defect_id=defect, document_path=key
+        ),
+        'model': RequirementDefectDocument,
+    }
+
+
+def _stw_documents(user, data_access_value):
+    from work_planning_management.models import STWAsset, STWRequirements
+
+    stws = STWRequirements.objects.filter(Q(user_id=user) if data_access_value == 'self' else Q())
+    return {
+        'get_parent': lambda object_id: stws.filter(pk=object_id).first(),
+        'folder': lambda stw: f'work_planning/{stw.id}',
+        'build': lambda stw, key: STWAsset(stw_id=stw, document_path=key),
+        'model': STWAsset,
+    }
+
+
+def _stw_defect_documents(user, data_access_value):
+    from work_planning_management.models import STWDefect, STWDefectDocument
+
+    defects = STWDefect.objects.filter(Q(stw_id__user_id=user) if data_access_value == 'self' else Q())
+    return {
+        'get_parent': lambda object_id: defects.filter(pk=object_id).first(),
+        'folder': lambda defect: f'work_planning/{defect.id}/defects',
+        'build': lambda defect, key: STWDefectDocument(stw_id_id=defect.stw_id_id, defect_id=defect, document_path=key),
+        'model': STWDefectDocument,
+    }
+
+
+# Documents that can be uploaded straight to S3, keyed by upload target: the permission
+# module the user must be allowed to change, and a builder returning how to find the
+# parent record the user may change, the S3 folder of its documents and how to build a
+# document row for an uploaded key.
+DIRECT_UPLOAD_TARGETS = {
+    'requirement': ('fire_risk_assessment', _requirement_documents),
+    'requirement_defect': ('fire_risk_assessment', _requirement_defect_documents),
+    'stw': ('survey', _stw_documents),
+    'stw_defect': ('survey', _stw_defect_documents),
+}
+
+
+def _get_target(user, target, object_id):
+    if target not in DIRECT_UPLOAD_TARGETS or not str(object_id).isdigit():
+        raise DirectUploadError('The upload target is not supported.')
+
+    module, build_documents = DIRECT_UPLOAD_TARGETS[target]
+    data_access_value = can(user, module, 'change')
+    if not data_access_value:
+        raise DirectUploadError('You are not authorized to perform this action.')
+
+    documents = build_documents(user, data_access_value)
+    parent = documents['get_parent'](object_id)
+    if parent is None:
+        raise DirectUploadError('You are not authorized to perform this action.')
+    return documents, parent
+
+
+def create_upload_grants(user, target, object_id, files):
+    """
+    Issue presigned POST grants to upload documents of a record straight to S3.
+
+    Every grant allows a single upload to a new key in the record's folder, of at most
+    DIRECT_UPLOAD_MAX_SIZE bytes and with the declared content type. The signed token
+    of the grant is sent back to confirm_uploads once the upload is done.
+
+    Args:
+        user (User): The user uploading the documents.
+        target (str): One of the DIRECT_UPLOAD_TARGETS keys.
+        object_id (int): The id of the record the documents belong to.
+        files (list): {'name': str, 'content_type': str, 'size': int} dicts.
+
+    Returns:
+        list: One {'name', 'key', 'url', 'fields', 'token'} dict per file.
+
+    Raises:
+        DirectUploadError: If the user may not upload to the record or a file is not accepted.
+    """
+    documents, parent = _get_target(user, target, object_id)
+
+    if not files:
+        raise DirectUploadError('No files to upload.')
+    if len(files) > settings.DIRECT_UPLOAD_MAX_FILES:
+        raise DirectUploadError(f'No more than {settings.DIRECT_UPLOAD_MAX_FILES} files can be uploaded at once.')
+
+    folder = documents['folder'](parent)
+    grants = []
+    for file in files:
+        name = os.path.basename(str(file.get('name', ''))).strip()
+        extension = name.split('.')[-1].lower() if '.' in name else ''
+        if extension not in settings.SUPPORTED_EXTENSIONS:
+            raise DirectUploadError(f'"{name}": File extension "{extension}" is not allowed.')
+        try:
+            size = int(file.get('size', 0))
+        except (TypeError, ValueError):
+            size = 0
+        if not 0 < size <= settings.DIRECT_UPLOAD_MAX_SIZE:
+            raise DirectUploadError(f'"{name}": File size must be no more than {settings.DIRECT_UPLOAD_MAX_SIZE // (1024 * 1024)}MB.')
+
+        key = f'{folder}/{uuid.uuid4()}_{name}'
+        content_type = str(file.get('content_type') or 'application/octet-stream')
+        with timed_s3_operation('presign_post'):
+            post = s3_client.generate_presigned_post(
+                settings.AWS_BUCKET_NAME, key,
+                Fields={'Content-Type': content_type},
+                Conditions=[
+                    {'Content-Type': content_type},
+                    ['content-length-range', 1, settings.DIRECT_UPLOAD_MAX_SIZE],
+                ],
+                ExpiresIn=settings.DIRECT_UPLOAD_EXPIRATION,
+            )
+        grants.append({
+            'name': name,
+            'key': key,
+            'url': post['url'],
+            'fields': post['fields'],
+            'token': signing.dumps({'user': user.pk, 'target': target, 'object_id': parent.pk, 'key': key}, salt=DIRECT_UPLOAD_SALT),
+        })
+    return grants
+
+
+def _uploaded(key):
+    try:
+        with timed_s3_operation('head'):
+            s3_client.head_object(Bucket=settings.AWS_BUCKET_NAME, Key=key)
+        return True
+    except Exception:
+        logger.warning("Confirmed upload %s was not found in S3", key)
+        return False
+
+
+def confirm_uploads(user, tokens):
+    """
+    Create the document rows of files uploaded with grants from create_upload_grants.
+
+    The tokens are checked against the user and their age, the objects are checked to
+    exist in S3, and the rows are created with one bulk_create; their renditions are
+    queued for the rendition worker. Tokens of keys already confirmed are ignored, so a
+    retried confirmation does not duplicate documents.
+
+    Args:
+        user (User): The user who uploaded the files.
+        tokens (list): The tokens of the grants.
+
+    Returns:
+        list: The created document rows.
+
+    Raises:
+        DirectUploadError: If a token is invalid or expired, or the grants are for several records.
+    """
+    if not tokens:
+        raise DirectUploadError('No uploads to confirm.')
+
+    grants = []
+    for token in tokens:
+        try:
+            grant = signing.loads(token, salt=DIRECT_UPLOAD_SALT, max_age=settings.DIRECT_UPLOAD_EXPIRATION * 2)
+        except signing.BadSignature:
+            raise DirectUploadError('The upload grant is invalid or has expired.')
+        if grant['user'] != user.pk:
+            raise DirectUploadError('You are not authorized to perform this action.')
+        grants.append(grant)
+
+    targets = {(grant['target'], grant['object_id']) for grant in grants}
+    if len(targets) > 1:
+        raise DirectUploadError('The uploads must all belong to the same record.')
+    target, object_id = targets.pop()
+
+    documents, parent = _get_target(user, target, object_id)
+    model = documents['model']
+
+    keys = list(dict.fromkeys(grant['key'] for grant in grants))
+    existing = set(model.objects.filter(document_path__in=keys).values_list('document_path', flat=True))
+    keys = [key for key in keys if key not in existing]
+    if not keys:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(settings.AWS_S3_MAX_WORKERS, len(keys))) as executor:
+        uploaded = [key for key, found in zip(keys, executor.map(_uploaded, keys)) if found]
+
+    rows = [documents['build'](parent, key) for key in uploaded]
+    model.objects.bulk_create(rows)
+    # The browser uploaded the originals only; the rendition worker makes the thumbnail
+    # and print renditions, the pages show the originals until then.
+    queue_renditions(model, rows)
+    return rows
@@ -0,0 +1,171 @@
+import os
+import time
+import logging
+from django.conf import settings
+from django.db import transaction, close_old_connections
+from django.db.models import Avg, Count, Max, Q
+from django.utils import timezone
+
+from common_app.models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+def queue_email(to_email, subject, html_content, template_name='', attachment_key=None, attachment_name=None):
+    """
+    Put a rendered email in the outbox.
+
+    The email is saved in the transaction of the caller, so it is only sent if that
+    transaction commits.
+
+    Args:
+        to_email (str): The recipient.
+        subject (str): The subject.
+        html_content (str): The rendered HTML body.
+        template_name (str, optional): The template the body was rendered from.
+        attachment_key (str, optional): The S3 key of a file to attach.
+        attachment_name (str, optional): The file name of the attachment, defaults to the S3 file name.
+
+    Returns:
+        OutboundEmail: The queued email.
+    """
+    return OutboundEmail.objects.create(
+        to_email=to_email,
+        subject=subject[:255],
+        html_content=html_content,
+        template_name=template_name,
+        attachment_key=attachment_key or None,
+        attachment_name=attachment_name or (os.path.basename(attachment_key) if attachment_key else None),
+    )
+
+
+def claim_emails(limit):
+    """
+    Claim up to `limit` emails due for sending.
+
+    Rows are locked with SKIP LOCKED, so several workers can poll the outbox without
+    sending the same email twice.
+
+    Args:
+        limit (int): Maximum number of emails to claim.
+
+    Returns:
+        list: The claimed OutboundEmail instances.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(status='pending', next_attempt_at__lte=now)
+            .order_by('next_attempt_at')[:limit]
+        )
+        OutboundEmail.objects.filter(pk__in=[outbound.pk for outbound in emails]).update(
+            status='sending', started_at=now
+        )
+    for outbound in emails:
+        outbound.status = 'sending'
+        outbound.started_at = now
+    return emails
+
+
+def requeue_stale_emails(older_than):
+    """
+    Put emails left in "sending" by a crashed worker back in the outbox.
+
+    An email may be sent twice if the worker crashed after SES accepted it.
+
+    Args:
+        older_than (int): Seconds after which a sending email is considered stale.
+
+    Returns:
+        int: The number of requeued emails.
+    """
+    cutoff = timezone.now() - timezone.timedelta(seconds=older_than)
+    return OutboundEmail.objects.filter(status='sending', started_at__lt=cutoff).update(status='pending')
+
+
+def retry_delay(attempts):
+    """
+    Seconds to wait before the next attempt: EMAIL_RETRY_BACKOFF doubled after every failed attempt.
+    """
+    return settings.EMAIL_RETRY_BACKOFF * 2 ** max(attempts - 1, 0)
+
+
+def process_email(outbound, email=None):
+    """
+    Send a claimed email through SES and record the outcome.
+
+    Failed emails are retried with exponential backoff until EMAIL_MAX_ATTEMPTS is
+    reached; emails SES rejects are failed straight away.
+
+    Args:
+        outbound (OutboundEmail): An email claimed by claim_emails.
+        email (Email, optional): The sender, whose SES client is reused.
+
+    Returns:
+        bool: True if the email was sent.
+    """
+    from infinity_fire_solutions.email import Email, is_permanent_error
+
+    started = time.monotonic()
+    outbound.attempts += 1
+    try:
+        outbound.message_id = (email or Email()).deliver(outbound)
+        outbound.status = 'sent'
+        outbound.error = None
+        outbound.send_time = time.monotonic() - started
+        outbound.sent_at = timezone.now()
+        outbound.save(update_fields=['attempts', 'message_id', 'status', 'error', 'send_time', 'sent_at'])
+        return True
+
+    except Exception as e:
+        logger.exception("Email %s to %s failed", outbound.pk, outbound.to_email)
+        outbound.error = str(e)
+        if is_permanent_error(e) or outbound.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+            outbound.status = 'failed'
+        else:
+            outbound.status = 'pending'
+            outbound.next_attempt_at = timezone.now() + timezone.timedelta(seconds=retry_delay(outbound.attempts))
+        outbound.save(update_fields=['attempts', 'error', 'status', 'next_attempt_at'])
+        return False
+
+    finally:
+        close_old_connections()
+
+
+def email_metrics(since=None):
+    """
+    Throughput and latency of the outbox per template.
+
+    Args:
+        since (datetime, optional): Only count emails queued after this moment. Defaults to the last 24 hours.
+
+    Returns:
+        dict: Keyed by template, with email counts per status, sent emails per minute, the
+              average/maximum send time in seconds and the oldest due email still waiting.
+    """
+    since = since or timezone.now() - timezone.timedelta(hours=24)
+    window_minutes = max((timezone.now() - since).total_seconds() / 60, 1)
+
+    rows = OutboundEmail.objects.filter(created_at__gte=since).values('template_name').annotate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='pending')),
+        sending=Count('id', filter=Q(status='sending')),
+        sent=Count('id', filter=Q(status='sent')),
+        failed=Count('id', filter=Q(status='failed')),
+        retried=Count('id', filter=Q(attempts__gt=1)),
+        avg_send_time=Avg('send_time', filter=Q(status='sent')),
+        max_send_time=Max('send_time', filter=Q(status='sent')),
+    ).order_by('template_name')
+
+    metrics = {}
+    for row in rows:
+        template_name = row.pop('template_name') or 'other'
+        row['sent_per_minute'] = row['sent'] / window_minutes
+        metrics[template_name] = row
+
+    oldest = OutboundEmail.objects.filter(status='pending', next_attempt_at__lte=timezone.now()).order_by('created_at').values_list('created_at', flat=True).first()
+    return {
+        'templates': metrics,
+        'queue_lag_seconds': (timezone.now() - oldest).total_seconds() if oldest else 0,
+    }
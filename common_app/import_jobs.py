@@ -0,0 +1,250 @@
+import io
+import csv
+import uuid
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import connections, transaction, close_old_connections
+from django.utils import timezone
+
+from common_app.models import ImportJob
+from infinity_fire_solutions.aws_helper import download_file_from_s3, upload_file_to_s3
+from infinity_fire_solutions.importers import COERCIONS, get_file_ext, import_file
+
+logger = logging.getLogger(__name__)
+
+IMPORT_S3_FOLDER = 'imports'
+
+
+def _fra_importer(job, options):
+    from authentication.models import User
+    from requirement_management.fra_import import FRAImporter
+
+    customer = User.objects.get(pk=options.pop('customer_id'))
+    return FRAImporter(customer, job.created_by, **options)
+
+
+def _sor_importer(job, options):
+    from authentication.models import User
+    from requirement_management.sor_import import SORImporter
+
+    customer = User.objects.get(pk=options.pop('customer_id'))
+    return SORImporter(customer, job.created_by, **options)
+
+
+def _stock_item_importer(job, options):
+    from stock_management.item_import import ItemImporter
+    from stock_management.models import Vendor
+
+    vendor = Vendor.objects.get(pk=options.pop('vendor_id'))
+    return ItemImporter(vendor, job.created_by, **options)
+
+
+# Builds the ImportSink of a job from its importer options, keyed by ImportJob.import_type.
+IMPORT_JOB_IMPORTERS = {
+    'fra': _fra_importer,
+    'sor': _sor_importer,
+    'stock_item': _stock_item_importer,
+}
+
+
+def queue_import(user, upload, import_type, mapping, coercions=None, encoding='utf-8-sig', **importer_options):
+    """
+    Upload a CSV/Excel file to S3 and queue its import.
+
+    With IMPORT_JOBS_ASYNC disabled the job is processed straight away, in the request.
+
+    Args:
+        user (User): The user importing the file; the imported records are created by them.
+        upload (UploadedFile): The uploaded file.
+        import_type (str): One of the IMPORT_JOB_IMPORTERS keys.
+        mapping (dict): {field: header}, see infinity_fire_solutions.importers.map_row.
+        coercions (dict, optional): {field: name of a COERCIONS function}.
+        encoding (str): Encoding of CSV files.
+        **importer_options: Keyword arguments of the importer, e.g. customer_id or vendor_id.
+
+    Returns:
+        ImportJob: The queued job.
+
+    Raises:
+        ValueError: If the file type is not supported.
+    """
+    ext = get_file_ext(upload.name)
+    if ext not in ('csv', 'xlsx', 'xls', 'ods'):
+        raise ValueError('The file type is not supported.')
+
+    unique_filename = f'{uuid.uuid4()}.{ext}'
+    upload_file_to_s3(unique_filename, upload, IMPORT_S3_FOLDER)
+
+    job = ImportJob.objects.create(
+        import_type=import_type,
+        file_path=f'{IMPORT_S3_FOLDER}/{unique_filename}',
+        file_name=upload.name[:255],
+        options={
+            'mapping': mapping,
+            'coercions': coercions or {},
+            'encoding': encoding,
+            'importer': importer_options,
+        },
+        created_by=user,
+    )
+
+    if not settings.IMPORT_JOBS_ASYNC:
+        job.status = 'processing'
+        job.attempts = 1
+        job.started_at = timezone.now()
+        job.save(update_fields=['status', 'attempts', 'started_at'])
+        process_import_job(job)
+    return job
+
+
+def claim_import_jobs(limit):
+    """
+    Claim up to `limit` pending jobs for this worker, skipping rows locked by other workers.
+
+    Args:
+        limit (int): Maximum number of jobs to claim.
+
+    Returns:
+        list: The claimed ImportJob instances.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            ImportJob.objects.select_for_update(skip_locked=True)
+            .filter(status='pending')
+            .order_by('created_at')[:limit]
+        )
+        for job in jobs:
+            job.status = 'processing'
+            job.started_at = now
+            job.attempts += 1
+            job.save(update_fields=['status', 'started_at', 'attempts'])
+    return jobs
+
+
+def requeue_stale_import_jobs(older_than):
+    """
+    Put jobs left in "processing" by a crashed worker back in the queue.
+
+    Args:
+        older_than (int): Seconds after which a processing job is considered stale.
+
+    Returns:
+        int: The number of requeued jobs.
+    """
+    cutoff = timezone.now() - timezone.timedelta(seconds=older_than)
+    return ImportJob.objects.filter(status='processing', started_at__lt=cutoff).update(status='pending')
+
+
+class ImportJobProgress:
+    """
+    Records the progress of a job after every chunk.
+
+    The import runs in one transaction, so the updates are written from a separate
+    thread, which has its own database connection and autocommits: the status endpoint
+    sees them while the import is still running.
+    """
+
+    def __init__(self, job):
+        self.job = job
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'import-job-{job.pk}')
+        self._closed = False
+
+    def __call__(self, report):
+        self._executor.submit(self._save, report.total, len(report.errors), report.created, report.updated)
+
+    def _save(self, rows_processed, rows_failed, rows_created, rows_updated):
+        try:
+            ImportJob.objects.filter(pk=self.job.pk).update(
+                rows_processed=rows_processed, rows_failed=rows_failed,
+                rows_created=rows_created, rows_updated=rows_updated,
+            )
+        except Exception:
+            logger.exception("Failed to record the progress of import job %s", self.job.pk)
+
+    def close(self):
+        """
+        Wait for the pending updates and close the thread's database connection.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._executor.submit(connections.close_all)
+        self._executor.shutdown(wait=True)
+
+
+def process_import_job(job):
+    """
+    Download a claimed job's file from S3 and import it, recording the outcome on the job.
+
+    Jobs that raise are retried until IMPORT_JOB_MAX_ATTEMPTS is reached; the import
+    transaction is rolled back, so a retry starts from a clean state.
+
+    Args:
+        job (ImportJob): A job claimed by claim_import_jobs.
+
+    Returns:
+        bool: True if the file was imported (possibly with rejected rows).
+    """
+    progress = ImportJobProgress(job)
+    options = dict(job.options)
+
+    try:
+        importer = IMPORT_JOB_IMPORTERS[job.import_type](job, dict(options.get('importer', {})))
+        coercions = {field: COERCIONS[name] for field, name in options.get('coercions', {}).items()}
+
+        ext = get_file_ext(job.file_path)
+        with tempfile.NamedTemporaryFile(suffix=f'.{ext}') as local_file:
+            download_file_from_s3(job.file_path, local_file)
+            local_file.seek(0)
+            report = import_file(
+                local_file, importer, options.get('mapping'), coercions,
+                encoding=options.get('encoding', 'utf-8-sig'), progress=progress,
+            )
+
+        progress.close()
+        job.status = 'completed'
+        job.error = None
+        job.rows_processed = report.total
+        job.rows_failed = len(report.errors)
+        job.rows_created = report.created
+        job.rows_updated = report.updated
+        job.rolled_back = report.rolled_back
+        job.errors = report.errors[:settings.IMPORT_JOB_MAX_STORED_ERRORS]
+        job.finished_at = timezone.now()
+        job.save(update_fields=[
+            'status', 'error', 'rows_processed', 'rows_failed', 'rows_created', 'rows_updated',
+            'rolled_back', 'errors', 'finished_at',
+        ])
+        return True
+
+    except Exception as e:
+        progress.close()
+        logger.exception("Import job %s failed", job.pk)
+        job.error = str(e)
+        job.status = 'pending' if job.attempts < settings.IMPORT_JOB_MAX_ATTEMPTS else 'failed'
+        job.finished_at = timezone.now()
+        job.save(update_fields=['error', 'status', 'finished_at'])
+        return False
+
+    finally:
+        close_old_connections()
+
+
+def import_job_errors_csv(job):
+    """
+    Render the rejected rows of a job as CSV.
+
+    Returns:
+        str: CSV with one line per error message.
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(['Row', 'Reference', 'Field', 'Error'])
+    for error in job.errors:
+        for field, messages in error['errors'].items():
+            for message in messages:
+                writer.writerow([error['row'], error.get('key', ''), field, message])
+    return output.getvalue()
@@ -0,0 +1,61 @@
+import time
+import json
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from common_app import sequences
+from common_app.models import DocumentSequence
+
+BENCHMARK_SEQUENCE = 'benchmark'
+
+
+class Command(BaseCommand):
+    help = ('Allocate document numbers from many threads at once and check that none is allocated twice. '
+            'A throwaway "benchmark" sequence is used and deleted afterwards.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--numbers', type=int, default=5000, help='Total numbers to allocate.')
+        parser.add_argument('--concurrency', type=int, default=32, help='Threads allocating at the same time.')
+        parser.add_argument('--block-size', type=int, default=1, help='Values reserved per allocation round trip.')
+
+    def handle(self, *args, **options):
+        if options['numbers'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--numbers and --concurrency must be positive.')
+
+        sequences.DOCUMENT_SEQUENCES[BENCHMARK_SEQUENCE] = {
+            'prefix': 'BM', 'padding': 6, 'block_size': options['block_size'],
+        }
+
+        def allocate(_):
+            try:
+                return sequences.next_number(BENCHMARK_SEQUENCE)
+            finally:
+                connections.close_all()
+
+        try:
+            started = time.monotonic()
+            with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+                numbers = list(executor.map(allocate, range(options['numbers'])))
+            elapsed = time.monotonic() - started
+        finally:
+            DocumentSequence.objects.filter(name=BENCHMARK_SEQUENCE).delete()
+            sequences.DOCUMENT_SEQUENCES.pop(BENCHMARK_SEQUENCE, None)
+            sequences._created.discard(BENCHMARK_SEQUENCE)
+            sequences._blocks.pop(BENCHMARK_SEQUENCE, None)
+
+        duplicates = len(numbers) - len(set(numbers))
+        self.stdout.write(json.dumps({
+            'numbers': len(numbers),
+            'concurrency': options['concurrency'],
+            'block_size': options['block_size'],
+            'seconds': round(elapsed, 2),
+            'numbers_per_second': round(len(numbers) / elapsed, 1) if elapsed else None,
+            'duplicates': duplicates,
+            'first': min(numbers),
+            'last': max(numbers),
+        }, indent=2))
+
+        if duplicates:
+            raise CommandError(f'{duplicates} numbers were allocated more than once.')
+        self.stdout.write(self.style.SUCCESS('No number was allocated twice.'))
@@ -0,0 +1,63 @@
+import time
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Load test a URL of the running application server and report requests/second and latencies.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('url', help='The URL to request, e.g. http://localhost:8000/readyz/.')
+        parser.add_argument('--requests', type=int, default=1000, help='Total number of requests.')
+        parser.add_argument('--concurrency', type=int, default=20, help='Requests in flight at the same time.')
+        parser.add_argument('--timeout', type=float, default=30, help='Seconds before a request is counted as failed.')
+        parser.add_argument('--session-cookie', help='A sessionid cookie, to load test pages behind the login.')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--requests and --concurrency must be positive.')
+
+        # One keep-alive session per thread, the way browsers behind the load balancer connect.
+        local = threading.local()
+
+        def session():
+            if not hasattr(local, 'session'):
+                local.session = requests.Session()
+                if options['session_cookie']:
+                    local.session.cookies.set('sessionid', options['session_cookie'])
+            return local.session
+
+        def request(_):
+            started = time.monotonic()
+            try:
+                response = session().get(options['url'], timeout=options['timeout'], allow_redirects=False)
+                status = response.status_code
+            except requests.RequestException:
+                status = None
+            return time.monotonic() - started, status
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            results = list(executor.map(request, range(options['requests'])))
+        elapsed = time.monotonic() - started
+
+        latencies = sorted(latency for latency, _ in results)
+        statuses = {}
+        for _, status in results:
+            statuses[str(status or 'error')] = statuses.get(str(status or 'error'), 0) + 1
+
+        def percentile(value):
+            return round(latencies[min(int(len(latencies) * value / 100), len(latencies) - 1)] * 1000, 1)
+
+        self.stdout.write(json.dumps({
+            'url': options['url'],
+            'requests': len(results),
+            'concurrency': options['concurrency'],
+            'seconds': round(elapsed, 2),
+            'requests_per_second': round(len(results) / elapsed, 1) if elapsed else None,
+            'latency_ms': {'p50': percentile(50), 'p90': percentile(90), 'p99': percentile(99), 'max': percentile(100)},
+            'statuses': statuses,
+        }, indent=2))
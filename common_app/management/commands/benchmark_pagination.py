@@ -0,0 +1,77 @@
+import time
+import json
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, reset_queries
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from infinity_fire_solutions.pagination import paginate, keyset_fields, encode_cursor
+
+
+class Command(BaseCommand):
+    help = ('Time reading deep pages of a list with OFFSET and with a keyset cursor, as the list views do. '
+            'Run it against a copy of the database with a million rows or more in the model, '
+            'e.g. --model requirement_management.Requirement.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', required=True, help='The listed model, as app_label.Model.')
+        parser.add_argument('--per-page', type=int, default=20, help='Rows per page.')
+        parser.add_argument('--pages', type=int, nargs='+', default=[1, 100, 1000, 10000],
+                            help='Page numbers to read.')
+
+    def _timed(self, request_path):
+        request = RequestFactory().get(request_path)
+        with CaptureQueriesContext(connection) as queries:
+            started = time.monotonic()
+            page = paginate(request, self.queryset, self.per_page)
+            list(page)
+            elapsed = time.monotonic() - started
+        return page, {'ms': round(elapsed * 1000, 1), 'queries': len(queries)}
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options['model'])
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+        if options['per_page'] < 1:
+            raise CommandError('--per-page must be positive.')
+
+        self.per_page = options['per_page']
+        self.queryset = model.objects.order_by('-created_at' if any(
+            field.name == 'created_at' for field in model._meta.fields
+        ) else '-pk')
+        key_fields = keyset_fields(self.queryset)
+
+        results = []
+        for number in sorted(set(options['pages'])):
+            if number < 2:
+                continue
+            # The keyset read starts from the last row of the previous page, as the
+            # "next" link of that page would.
+            previous_page, _ = self._timed(f'/?page={number - 1}')
+            if not len(previous_page) or previous_page.number != number - 1:
+                self.stdout.write(f'Page {number} is past the last page, skipped.')
+                continue
+            cursor = encode_cursor('next', previous_page[len(previous_page) - 1], key_fields)
+
+            offset_page, offset_timing = self._timed(f'/?page={number}')
+            keyset_page, keyset_timing = self._timed(f'/?page={number}&cursor={cursor}')
+            results.append({
+                'page': number,
+                'offset': offset_timing,
+                'keyset': keyset_timing,
+                'same_rows': [row.pk for row in offset_page] == [row.pk for row in keyset_page],
+            })
+            reset_queries()
+
+        self.stdout.write(json.dumps({
+            'model': options['model'],
+            'ordering': list(self.queryset.query.order_by),
+            'rows': self.queryset.count(),
+            'per_page': self.per_page,
+            'pages': results,
+        }, indent=2))
+
+        if any(not result['same_rows'] for result in results):
+            raise CommandError('The keyset and OFFSET pages differ.')
@@ -0,0 +1,36 @@
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from infinity_fire_solutions.image_renditions import IMAGE_RENDITIONS, ensure_renditions
+
+# Document models whose images get thumbnail and print renditions.
+RENDITION_MODELS = [
+    'requirement_management.RequirementAsset',
+    'requirement_management.RequirementDefectDocument',
+    'work_planning_management.STWAsset',
+    'work_planning_management.STWDefectDocument',
+]
+
+
+class Command(BaseCommand):
+    help = 'Create the missing thumbnail and print renditions of the uploaded survey photos'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200, help='Documents processed at a time.')
+        parser.add_argument('--limit', type=int, help='Stop after this many documents per model.')
+
+    def handle(self, *args, **options):
+        for model_name in RENDITION_MODELS:
+            model = apps.get_model(model_name)
+            missing = Q()
+            for field in IMAGE_RENDITIONS:
+                missing |= Q(**{f'{field}__isnull': True})
+            images = Q(document_path__iregex=r'\.(%s)$' % '|'.join(settings.IMAGE_SUPPORTED_EXTENSIONS))
+            ids = list(model.objects.filter(missing, images).order_by('id').values_list('id', flat=True)[:options['limit']])
+
+            created = 0
+            for start in range(0, len(ids), options['batch_size']):
+                created += ensure_renditions(model, model.objects.filter(id__in=ids[start:start + options['batch_size']]))
+            self.stdout.write(f'{model_name}: {created} of {len(ids)} documents given renditions.')
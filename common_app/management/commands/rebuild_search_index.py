@@ -0,0 +1,25 @@
+import time
+from django.core.management.base import BaseCommand
+from common_app.models import SearchEntry
+from common_app.search import SEARCH_ENTITIES, entity_model, index_queryset
+
+
+class Command(BaseCommand):
+    help = ('Rebuild the search entries of customers, FRAs, quotations, jobs, stock items and vendors. '
+            'Run it once after the search index is created; signals keep it up to date afterwards.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--entity', action='append', choices=list(SEARCH_ENTITIES),
+                            help='Only rebuild this entity, may be repeated. All entities by default.')
+        parser.add_argument('--batch-size', type=int, default=500, help='Records indexed per batch.')
+
+    def handle(self, *args, **options):
+        for entity in options['entity'] or SEARCH_ENTITIES:
+            started = time.monotonic()
+            written = index_queryset(entity, batch_size=options['batch_size'])
+            # Entries of records deleted without signals, e.g. by raw SQL.
+            removed, _ = SearchEntry.objects.filter(entity=entity).exclude(
+                object_id__in=entity_model(entity).objects.values('pk')
+            ).delete()
+            self.stdout.write(f'{entity}: {written} entries written, {removed} removed in {time.monotonic() - started:.2f}s')
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt.'))
@@ -0,0 +1,60 @@
+import time
+import json
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from common_app.email_outbox import claim_emails, process_email, requeue_stale_emails, email_metrics
+from infinity_fire_solutions.email import Email
+
+
+class Command(BaseCommand):
+    help = 'Send the emails queued in the outbox through Amazon SES'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=settings.EMAIL_SEND_CONCURRENCY,
+                            help='Maximum number of emails sent at the same time.')
+        parser.add_argument('--max-rate', type=float, default=settings.EMAIL_MAX_SEND_RATE,
+                            help='Maximum emails sent per second, the SES sending quota of the account.')
+        parser.add_argument('--poll-interval', type=float, default=settings.EMAIL_WORKER_POLL_INTERVAL,
+                            help='Seconds to wait before polling again when the outbox is empty.')
+        parser.add_argument('--once', action='store_true',
+                            help='Send the emails currently due and exit.')
+        parser.add_argument('--stats', action='store_true',
+                            help='Print the throughput metrics per template and exit.')
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            self.stdout.write(json.dumps(email_metrics(), indent=2, default=str))
+            return
+
+        concurrency = max(options['concurrency'], 1)
+        requeued = requeue_stale_emails(settings.EMAIL_STALE_AFTER)
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'Requeued {requeued} stale emails.'))
+
+        # One SES client, and so one connection pool, for all the sending threads.
+        email = Email()
+        self.stdout.write(self.style.SUCCESS(f'Email worker started with {concurrency} senders.'))
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                # Claim about a second's worth of emails at the send rate, so a batch does
+                # not sit claimed while waiting for the rate limit.
+                batch_size = max(min(concurrency * 4, int(options['max_rate'] or concurrency * 4)), 1)
+                emails = claim_emails(batch_size)
+                if not emails:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                started = time.monotonic()
+                results = list(executor.map(lambda outbound: process_email(outbound, email), emails))
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f'Sent {results.count(True)}/{len(emails)} emails in {elapsed:.2f}s '
+                    f'({len(emails) / elapsed if elapsed else 0:.2f} emails/s)'
+                )
+
+                if options['max_rate'] > 0:
+                    time.sleep(max(len(emails) / options['max_rate'] - elapsed, 0))
@@ -0,0 +1,39 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from common_app.import_jobs import claim_import_jobs, process_import_job, requeue_stale_import_jobs
+
+
+class Command(BaseCommand):
+    help = 'Process queued CSV/Excel imports (FRAs, SOR items and stock items)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--poll-interval', type=float, default=settings.IMPORT_WORKER_POLL_INTERVAL,
+                            help='Seconds to wait before polling again when the queue is empty.')
+        parser.add_argument('--once', action='store_true',
+                            help='Process the jobs currently queued and exit.')
+
+    def handle(self, *args, **options):
+        requeued = requeue_stale_import_jobs(settings.IMPORT_JOB_STALE_AFTER)
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'Requeued {requeued} stale import jobs.'))
+
+        self.stdout.write(self.style.SUCCESS('Import worker started.'))
+
+        # Imports are database bound, so jobs run one at a time; start more workers to run more in parallel.
+        while True:
+            jobs = claim_import_jobs(1)
+            if not jobs:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            job = jobs[0]
+            started = time.monotonic()
+            imported = process_import_job(job)
+            elapsed = time.monotonic() - started
+            self.stdout.write(
+                f'Import job {job.pk} ({job.import_type}) {"finished" if imported else "failed"} in {elapsed:.2f}s: '
+                f'{job.rows_processed} rows, {job.rows_failed} rejected'
+            )
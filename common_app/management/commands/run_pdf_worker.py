@@ -0,0 +1,58 @@
+import time
+import json
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from common_app.pdf_jobs import claim_pdf_jobs, process_pdf_job, requeue_stale_pdf_jobs, pdf_job_metrics
+
+
+class Command(BaseCommand):
+    help = 'Render queued PDF documents (reports, quotations, RLO letters and invoices)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=settings.PDF_RENDER_CONCURRENCY,
+                            help='Maximum number of wkhtmltopdf processes running at the same time.')
+        parser.add_argument('--poll-interval', type=float, default=settings.PDF_WORKER_POLL_INTERVAL,
+                            help='Seconds to wait before polling again when the queue is empty.')
+        parser.add_argument('--once', action='store_true',
+                            help='Process the jobs currently queued and exit.')
+        parser.add_argument('--stats', action='store_true',
+                            help='Print the throughput metrics per document type and exit.')
+
+    def requeue_stale_jobs(self):
+        requeued = requeue_stale_pdf_jobs(settings.PDF_JOB_STALE_AFTER)
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'Requeued {requeued} stale PDF jobs.'))
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            self.stdout.write(json.dumps(pdf_job_metrics(), indent=2, default=str))
+            return
+
+        concurrency = max(options['concurrency'], 1)
+        self.requeue_stale_jobs()
+        self.stdout.write(self.style.SUCCESS(f'PDF worker started with {concurrency} renderers.'))
+
+        # Each thread drives one wkhtmltopdf process, so the pool bounds the number of renderers.
+        next_requeue = time.monotonic() + settings.PDF_JOB_STALE_AFTER
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                if time.monotonic() >= next_requeue:
+                    # Jobs of workers that crashed since this one started.
+                    self.requeue_stale_jobs()
+                    next_requeue = time.monotonic() + settings.PDF_JOB_STALE_AFTER
+
+                jobs = claim_pdf_jobs(concurrency)
+                if not jobs:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                started = time.monotonic()
+                results = list(executor.map(process_pdf_job, jobs))
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f'Rendered {results.count(True)}/{len(jobs)} PDFs in {elapsed:.2f}s '
+                    f'({len(jobs) / elapsed if elapsed else 0:.2f} jobs/s)'
+                )
@@ -0,0 +1,47 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from common_app.rendition_jobs import claim_rendition_jobs, process_rendition_job, requeue_stale_rendition_jobs
+
+
+class Command(BaseCommand):
+    help = 'Make the thumbnail and print renditions of photos uploaded straight to S3'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--poll-interval', type=float, default=settings.RENDITION_WORKER_POLL_INTERVAL,
+                            help='Seconds to wait before polling again when the queue is empty.')
+        parser.add_argument('--once', action='store_true',
+                            help='Process the jobs currently queued and exit.')
+
+    def requeue_stale_jobs(self):
+        requeued = requeue_stale_rendition_jobs(settings.RENDITION_JOB_STALE_AFTER)
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'Requeued {requeued} stale rendition jobs.'))
+
+    def handle(self, *args, **options):
+        self.requeue_stale_jobs()
+        self.stdout.write(self.style.SUCCESS('Rendition worker started.'))
+
+        # The documents of a job are processed concurrently (AWS_S3_MAX_WORKERS), so jobs run one at a time.
+        next_requeue = time.monotonic() + settings.RENDITION_JOB_STALE_AFTER
+        while True:
+            if time.monotonic() >= next_requeue:
+                # Jobs of workers that crashed since this one started.
+                self.requeue_stale_jobs()
+                next_requeue = time.monotonic() + settings.RENDITION_JOB_STALE_AFTER
+
+            jobs = claim_rendition_jobs(1)
+            if not jobs:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            job = jobs[0]
+            started = time.monotonic()
+            updated = process_rendition_job(job)
+            elapsed = time.monotonic() - started
+            if updated is None:
+                self.stdout.write(f'Rendition job {job.pk} failed in {elapsed:.2f}s')
+            else:
+                self.stdout.write(f'Rendition job {job.pk}: {updated}/{len(job.document_paths)} documents given renditions in {elapsed:.2f}s')
@@ -0,0 +1,122 @@
+import re
+from django.conf import settings
+from common_app.models import MenuItem
+from infinity_fire_solutions.permission import get_role_permission_matrix, matrix_can
+from infinity_fire_solutions.shared_cache import shared_cache
+
+MENU_VERSION_KEY = 'menu:version'
+
+
+def get_menu_version():
+    """
+    Get the current menu version stamp, creating it if the cache is cold.
+
+    Returns:
+        int: The version stamp used in every cached menu key.
+    """
+    return shared_cache.get_or_set(MENU_VERSION_KEY, 1, timeout=None)
+
+
+def invalidate_menu_cache():
+    """
+    Invalidate every cached menu by bumping the version stamp.
+
+    Old entries are never read again and simply expire.
+    """
+    try:
+        shared_cache.incr(MENU_VERSION_KEY)
+    except ValueError:
+        shared_cache.set(MENU_VERSION_KEY, 1, timeout=None)
+
+
+def menu_module_name(item_name):
+    """
+    Derive the permission module name from a menu item name, e.g. "Contacts" -> "contact".
+
+    Args:
+        item_name (str): The name of the menu item.
+
+    Returns:
+        str: The module name used in UserRolePermission.
+    """
+    return re.sub(r"s$", "", item_name.replace(" ", "_")).lower()
+
+
+def get_menu_tree():
+    """
+    Get the role independent menu tree, built with a single MenuItem query.
+
+    Returns:
+        list: Top level menu items ordered by 'order', each a dict with a 'children' list.
+    """
+    cache_key = f'menu:tree:{get_menu_version()}'
+    tree = shared_cache.get(cache_key)
+    if tree is not None:
+        return tree
+
+    nodes = {}
+    for item in MenuItem.objects.order_by('id'):
+        nodes[item.id] = {
+            'id': item.id,
+            'parent_id': item.parent_id,
+            'permission_required': item.permission_required,
+            'name': item.name,
+            'url': item.url,
+            'icon': item.icon,
+            'order': item.order,
+            'children': [],
+        }
+
+    tree = []
+    for node in nodes.values():
+        if node['parent_id'] is None:
+            tree.append(node)
+        elif node['parent_id'] in nodes:
+            nodes[node['parent_id']]['children'].append(node)
+    tree.sort(key=lambda node: node['order'])
+
+    shared_cache.set(cache_key, tree, settings.MENU_CACHE_TIMEOUT)
+    return tree
+
+
+def _build_menu(nodes, permissions, is_submenu=False):
+    menu_data = []
+    for node in nodes:
+        if node['permission_required'] and not is_submenu:
+            module_name = menu_module_name(node['name'])
+            if not (matrix_can(permissions, module_name, 'create') or matrix_can(permissions, module_name, 'list')):
+                continue
+
+        menu_data.append({
+            'url': node['url'],
+            'name': node['name'],
+            'submenu': _build_menu(node['children'], permissions, is_submenu=True) if node['children'] else None,
+            'icon': node['icon'],
+        })
+    return menu_data
+
+
+def get_role_menu(role_id, permissions=None):
+    """
+    Get the navigation menu for a role, building and caching it on a cache miss.
+
+    Menus are invalidated by the MenuItem/UserRolePermission signals; a per-process cache
+    keeps them for LOCAL_CACHE_TIMEOUT seconds at most (see infinity_fire_solutions.shared_cache).
+
+    Args:
+        role_id (int): The id of the UserRole.
+        permissions (dict, optional): The role permission matrix if already loaded for the
+            request, see get_role_permission_matrix.
+
+    Returns:
+        list: Menu entries with 'url', 'name', 'submenu' and 'icon' keys.
+    """
+    cache_key = f'menu:role:{role_id}:{get_menu_version()}'
+    menu_data = shared_cache.get(cache_key)
+    if menu_data is not None:
+        return menu_data
+
+    menu_data = _build_menu(get_menu_tree(), permissions or get_role_permission_matrix(role_id))
+
+    shared_cache.set(cache_key, menu_data, settings.MENU_CACHE_TIMEOUT)
+    return menu_data
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.3 on 2026-10-18 09:12
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('common_app', '0008_sorvalidity_update_window'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PDFRenderJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('document_type', models.CharField(choices=[('report', 'FRA Report'), ('quotation', 'Quotation'), ('rlo', 'RLO Letter'), ('invoice', 'Invoice')], max_length=30)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('html_content', models.TextField()),
+                ('options', models.JSONField(blank=True, default=dict)),
+                ('s3_folder', models.CharField(max_length=500)),
+                ('file_name', models.CharField(max_length=255)),
+                ('extra', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('rendering', 'Rendering'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=30)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('pdf_path', models.CharField(blank=True, max_length=500, null=True)),
+                ('render_time', models.FloatField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'PDF Render Job',
+                'verbose_name_plural': 'PDF Render Jobs',
+                'ordering': ['-id'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='common_app__status_d6e4f2_idx'), models.Index(fields=['document_type', 'object_id'], name='common_app__documen_3f56bf_idx')],
+            },
+        ),
+    ]
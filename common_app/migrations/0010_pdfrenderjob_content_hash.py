@@ -0,0 +1,18 @@
+# Generated by Django 4.2.3 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0009_pdfrenderjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pdfrenderjob',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.3 on 2026-10-18 13:05
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('common_app', '0010_pdfrenderjob_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('import_type', models.CharField(choices=[('fra', 'FRA'), ('sor', 'SOR'), ('stock_item', 'Stock Item')], max_length=30)),
+                ('file_path', models.CharField(max_length=500)),
+                ('file_name', models.CharField(max_length=255)),
+                ('options', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=30)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('rows_processed', models.PositiveIntegerField(default=0)),
+                ('rows_failed', models.PositiveIntegerField(default=0)),
+                ('rows_created', models.PositiveIntegerField(default=0)),
+                ('rows_updated', models.PositiveIntegerField(default=0)),
+                ('rolled_back', models.BooleanField(default=False)),
+                ('errors', models.JSONField(blank=True, default=list)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Import Job',
+                'verbose_name_plural': 'Import Jobs',
+                'ordering': ['-id'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='common_app__status_584a22_idx')],
+            },
+        ),
+    ]
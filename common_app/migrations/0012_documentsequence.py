@@ -0,0 +1,27 @@
+# Generated by Django 4.2.3 on 2026-10-18 15:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0011_importjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('next_value', models.PositiveBigIntegerField(default=1)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Document Sequence',
+                'verbose_name_plural': 'Document Sequences',
+                'ordering': ['name'],
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.3 on 2026-10-18 16:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0012_documentsequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity', models.CharField(choices=[('customer', 'Customer'), ('requirement', 'FRA'), ('quotation', 'Quotation'), ('job', 'Job'), ('item', 'Stock Item'), ('vendor', 'Vendor')], max_length=30)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('customer_id', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('owner_id', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('title', models.CharField(max_length=255)),
+                ('content', models.TextField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Search Entry',
+                'verbose_name_plural': 'Search Entries',
+                'indexes': [models.Index(fields=['entity', 'customer_id'], name='common_app__entity_8624d0_idx')],
+                'unique_together': {('entity', 'object_id')},
+            },
+        ),
+        # Django has no FULLTEXT indexes. The ngram parser indexes every 2 character
+        # sequence (ngram_token_size), so words match anywhere like the __icontains
+        # searches it replaces, not only from their start.
+        migrations.RunSQL(
+            sql='CREATE FULLTEXT INDEX common_app_searchentry_fulltext ON common_app_searchentry (title, content) WITH PARSER ngram',
+            reverse_sql='DROP INDEX common_app_searchentry_fulltext ON common_app_searchentry',
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.3 on 2026-10-18 16:40
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0013_searchentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboundEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('to_email', models.EmailField(max_length=254)),
+                ('subject', models.CharField(max_length=255)),
+                ('html_content', models.TextField()),
+                ('template_name', models.CharField(blank=True, max_length=255)),
+                ('attachment_key', models.CharField(blank=True, max_length=500, null=True)),
+                ('attachment_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=30)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('message_id', models.CharField(blank=True, max_length=255, null=True)),
+                ('send_time', models.FloatField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Outbound Email',
+                'verbose_name_plural': 'Outbound Emails',
+                'ordering': ['-id'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='common_app__status_76718e_idx')],
+            },
+        ),
+    ]
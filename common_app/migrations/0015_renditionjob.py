@@ -0,0 +1,33 @@
+# Generated by Django 4.2.3 on 2026-10-18 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common_app', '0014_outboundemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RenditionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=100)),
+                ('document_paths', models.JSONField(default=list)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=30)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Rendition Job',
+                'verbose_name_plural': 'Rendition Jobs',
+                'ordering': ['-id'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='common_app__status_34e93f_idx')],
+            },
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.conf import settings
 from django.contrib.auth.models import Group
 from ckeditor.fields import RichTextField
 from django.utils import timezone
@@ -8,6 +9,50 @@ PURPOSE_CHOICES = [
         ('new_user_registration', 'New User Registration'),
  ]   
 
+PDF_JOB_STATUS_CHOICES = [
+    ('pending', 'Pending'),
+    ('rendering', 'Rendering'),
+    ('completed', 'Completed'),
+    ('failed', 'Failed'),
+]
+
+# Statuses during which a document's PDF is not available yet.
+PDF_JOB_ACTIVE_STATUSES = ('pending', 'rendering')
+
+PDF_DOCUMENT_TYPE_CHOICES = [
+    ('report', 'FRA Report'),
+    ('quotation', 'Quotation'),
+    ('rlo', 'RLO Letter'),
+    ('invoice', 'Invoice'),
+]
+
+IMPORT_JOB_STATUS_CHOICES = [
+    ('pending', 'Pending'),
+    ('processing', 'Processing'),
+    ('completed', 'Completed'),
+    ('failed', 'Failed'),
+]
+
+EMAIL_STATUS_CHOICES = [
+    ('pending', 'Pending'),
+    ('sending', 'Sending'),
+    ('sent', 'Sent'),
+    ('failed', 'Failed'),
+]
+
+RENDITION_JOB_STATUS_CHOICES = [
+    ('pending', 'Pending'),
+    ('processing', 'Processing'),
+    ('completed', 'Completed'),
+    ('failed', 'Failed'),
+]
+
+IMPORT_TYPE_CHOICES = [
+    ('fra', 'FRA'),
+    ('sor', 'SOR'),
+    ('stock_item', 'Stock Item'),
+]
+
 class AdminConfiguration(models.Model):
     tax_rate = models.DecimalField(max_digits=5, decimal_places=2, default=20.00)  # Default tax rate of 20%
 
@@ -82,8 +127,264 @@ class SORValidity(models.Model):
     #         if timezone.now() <= edit_window_end_date:
     #             return True
     #     return False
-    
 
 
-    
-    
\ No newline at end of file
+class PDFRenderJob(models.Model):
+    """
+    A queued PDF rendering job, processed by the `run_pdf_worker` management command.
+
+    The HTML is rendered in the request (cheap); converting it with wkhtmltopdf and
+    uploading the result to S3 (slow) happens in the worker.
+
+    Attributes:
+        document_type (CharField): The kind of document (choices defined in PDF_DOCUMENT_TYPE_CHOICES).
+        object_id (PositiveBigIntegerField): The primary key of the document the PDF belongs to.
+        html_content (TextField): The rendered HTML to convert.
+        options (JSONField): wkhtmltopdf options.
+        s3_folder (CharField): The S3 folder the PDF is uploaded to.
+        file_name (CharField): The file name of the PDF in the S3 folder.
+        extra (JSONField): Data used after completion, e.g. by the email notification.
+        status (CharField): Status of the job (choices defined in PDF_JOB_STATUS_CHOICES).
+        attempts (PositiveSmallIntegerField): Number of times the job was picked up.
+        error (TextField): The last error, if any.
+        pdf_path (CharField): The S3 key of the generated PDF.
+        content_hash (CharField): SHA-256 of the normalised HTML and options, see pdf_content_hash.
+        render_time (FloatField): Seconds spent rendering and uploading the PDF.
+        created_by (ForeignKey): The user who queued the job.
+    """
+    document_type = models.CharField(max_length=30, choices=PDF_DOCUMENT_TYPE_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    html_content = models.TextField()
+    options = models.JSONField(default=dict, blank=True)
+    s3_folder = models.CharField(max_length=500)
+    file_name = models.CharField(max_length=255)
+    extra = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=30, choices=PDF_JOB_STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(null=True, blank=True)
+    pdf_path = models.CharField(max_length=500, null=True, blank=True)
+    content_hash = models.CharField(max_length=64, null=True, blank=True)
+    render_time = models.FloatField(null=True, blank=True)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "PDF Render Job"
+        verbose_name_plural = "PDF Render Jobs"
+        ordering = ['-id']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['document_type', 'object_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_document_type_display()} {self.object_id} - {self.status}"
+
+
+class ImportJob(models.Model):
+    """
+    A bulk CSV/Excel import, processed in the background by the `run_import_worker` management command.
+
+    The request only uploads the file to S3 and queues the job; the worker streams the
+    file through the importer of `import_type` and records its progress on the job.
+
+    Attributes:
+        import_type (CharField): The kind of records imported (choices defined in IMPORT_TYPE_CHOICES).
+        file_path (CharField): The S3 key of the uploaded file.
+        file_name (CharField): The name of the uploaded file.
+        options (JSONField): Column mapping, coercions, encoding and importer options.
+        status (CharField): Status of the job (choices defined in IMPORT_JOB_STATUS_CHOICES).
+        attempts (PositiveSmallIntegerField): Number of times the job was picked up.
+        rows_processed (PositiveIntegerField): Rows read so far.
+        rows_failed (PositiveIntegerField): Rows rejected so far.
+        rows_created (PositiveIntegerField): Records inserted.
+        rows_updated (PositiveIntegerField): Existing records updated.
+        rolled_back (BooleanField): True if nothing was saved because some rows were rejected.
+        errors (JSONField): The per-row errors of the import report.
+        error (TextField): The error that stopped the job, if any.
+        created_by (ForeignKey): The user who uploaded the file.
+    """
+    import_type = models.CharField(max_length=30, choices=IMPORT_TYPE_CHOICES)
+    file_path = models.CharField(max_length=500)
+    file_name = models.CharField(max_length=255)
+    options = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=30, choices=IMPORT_JOB_STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    rows_processed = models.PositiveIntegerField(default=0)
+    rows_failed = models.PositiveIntegerField(default=0)
+    rows_created = models.PositiveIntegerField(default=0)
+    rows_updated = models.PositiveIntegerField(default=0)
+    rolled_back = models.BooleanField(default=False)
+    errors = models.JSONField(default=list, blank=True)
+    error = models.TextField(null=True, blank=True)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Import Job"
+        verbose_name_plural = "Import Jobs"
+        ordering = ['-id']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_import_type_display()} import {self.file_name} - {self.status}"
+
+
+class RenditionJob(models.Model):
+    """
+    Image renditions to make for documents already in S3, processed by the
+    `run_rendition_worker` management command.
+
+    Queued when the browser uploaded the originals straight to S3, so the request only
+    creates the document rows; downloading and re-encoding the images happens in the worker.
+
+    Attributes:
+        model (CharField): The label of the document model, e.g. "requirement_management.RequirementAsset".
+        document_paths (JSONField): The S3 keys of the documents.
+        status (CharField): Status of the job (choices defined in RENDITION_JOB_STATUS_CHOICES).
+        attempts (PositiveSmallIntegerField): Number of times the job was picked up.
+        error (TextField): The last error, if any.
+    """
+    model = models.CharField(max_length=100)
+    document_paths = models.JSONField(default=list)
+    status = models.CharField(max_length=30, choices=RENDITION_JOB_STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Rendition Job"
+        verbose_name_plural = "Rendition Jobs"
+        ordering = ['-id']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.model} renditions - {self.status}"
+
+
+class DocumentSequence(models.Model):
+    """
+    Counter of a document number sequence, e.g. the IFB numbers of purchase orders.
+
+    The row is locked while it is incremented, see common_app/sequences.py.
+
+    Attributes:
+        name (CharField): The sequence, one of the DOCUMENT_SEQUENCES keys.
+        next_value (PositiveBigIntegerField): The next number to allocate.
+    """
+    name = models.CharField(max_length=50, unique=True)
+    next_value = models.PositiveBigIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Document Sequence"
+        verbose_name_plural = "Document Sequences"
+        ordering = ['name']
+
+    def __str__(self):
+        return f"{self.name} - {self.next_value}"
+
+
+SEARCH_ENTITY_CHOICES = [
+    ('customer', 'Customer'),
+    ('requirement', 'FRA'),
+    ('quotation', 'Quotation'),
+    ('job', 'Job'),
+    ('item', 'Stock Item'),
+    ('vendor', 'Vendor'),
+]
+
+
+class SearchEntry(models.Model):
+    """
+    Denormalized search document of a customer, FRA, quotation, job, stock item or vendor.
+
+    The entries are kept up to date by signals (see common_app/signals.py) and searched
+    through a MySQL FULLTEXT index on title and content using the ngram parser, created in
+    the migration of this model, see common_app/search.py.
+
+    Attributes:
+        entity (CharField): The kind of record (choices defined in SEARCH_ENTITY_CHOICES).
+        object_id (PositiveBigIntegerField): The primary key of the record.
+        customer_id (PositiveBigIntegerField): The customer the record belongs to, if any.
+        owner_id (PositiveBigIntegerField): The user who created the record, if known.
+        title (CharField): Text shown in the search results.
+        content (TextField): The searched text.
+    """
+    entity = models.CharField(max_length=30, choices=SEARCH_ENTITY_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    customer_id = models.PositiveBigIntegerField(null=True, blank=True)
+    owner_id = models.PositiveBigIntegerField(null=True, blank=True)
+    title = models.CharField(max_length=255)
+    content = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Search Entry"
+        verbose_name_plural = "Search Entries"
+        unique_together = [('entity', 'object_id')]
+        indexes = [
+            models.Index(fields=['entity', 'customer_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_entity_display()} {self.object_id} - {self.title}"
+
+
+class OutboundEmail(models.Model):
+    """
+    An email in the outbox, sent through Amazon SES by the `run_email_worker` management command.
+
+    The HTML is rendered when the email is queued, so the worker needs no template
+    context; the attachment is read from S3 by key when the email is sent.
+
+    Attributes:
+        to_email (EmailField): The recipient.
+        subject (CharField): The subject.
+        html_content (TextField): The rendered HTML body.
+        template_name (CharField): The template the body was rendered from, for the metrics.
+        attachment_key (CharField): The S3 key of the attachment, if any.
+        attachment_name (CharField): The file name of the attachment in the email.
+        status (CharField): Status of the email (choices defined in EMAIL_STATUS_CHOICES).
+        attempts (PositiveSmallIntegerField): Number of times sending was tried.
+        next_attempt_at (DateTimeField): The email is not sent before this moment.
+        error (TextField): The last error, if any.
+        message_id (CharField): The SES message id once sent.
+        send_time (FloatField): Seconds spent building and sending the message.
+    """
+    to_email = models.EmailField()
+    subject = models.CharField(max_length=255)
+    html_content = models.TextField()
+    template_name = models.CharField(max_length=255, blank=True)
+    attachment_key = models.CharField(max_length=500, null=True, blank=True)
+    attachment_name = models.CharField(max_length=255, null=True, blank=True)
+    status = models.CharField(max_length=30, choices=EMAIL_STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    error = models.TextField(null=True, blank=True)
+    message_id = models.CharField(max_length=255, null=True, blank=True)
+    send_time = models.FloatField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Outbound Email"
+        verbose_name_plural = "Outbound Emails"
+        ordering = ['-id']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} to {self.to_email} - {self.status}"
@@ -0,0 +1,354 @@
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import tempfile
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction, close_old_connections
+from django.db.models import Avg, Count, Max, Q
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.module_loading import import_string
+import pdfkit
+
+from common_app.models import PDFRenderJob
+from infinity_fire_solutions.aws_helper import upload_signature_to_s3
+from infinity_fire_solutions.custom_form_validation import pdf_options
+
+logger = logging.getLogger(__name__)
+
+# Models whose PDFs are rendered by the worker, keyed by PDFRenderJob.document_type.
+PDF_DOCUMENT_MODELS = {
+    'report': 'requirement_management.Report',
+    'quotation': 'requirement_management.Quotation',
+    'rlo': 'work_planning_management.RLO',
+    'invoice': 'invoice_management.Invoice',
+}
+
+# Functions making the missing image renditions of a document and rendering its template
+# again, for jobs queued with make_renditions; they return None when nothing changed.
+PDF_RENDITION_RENDERERS = {
+    'report': 'requirement_management.report_pdf.render_report_with_renditions',
+}
+
+
+# Query string parameters of presigned S3 URLs. They change on every render, so they are
+# left out of the content hash; the object keys they point to are kept.
+PRESIGNED_PARAMS_PATTERN = re.compile(r'(?:X-Amz-[\w-]+|AWSAccessKeyId|Signature|Expires)=[^&"\'\s<>]*')
+
+
+def pdf_content_hash(html_content, options=None):
+    """
+    Hash the rendered HTML and the PDF options of a document.
+
+    Two renders with the same hash produce the same PDF, so the stored PDF can be reused.
+
+    Args:
+        html_content (str): The rendered HTML.
+        options (dict, optional): wkhtmltopdf options.
+
+    Returns:
+        str: The hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(PRESIGNED_PARAMS_PATTERN.sub('', html_content).encode('utf-8'))
+    digest.update(json.dumps(options or pdf_options, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def get_document_model(document_type):
+    """
+    Get the model class of a PDF document type.
+
+    Args:
+        document_type (str): One of the PDF_DOCUMENT_MODELS keys.
+
+    Returns:
+        Model: The Django model class.
+    """
+    return apps.get_model(PDF_DOCUMENT_MODELS[document_type])
+
+
+def queue_pdf_render(instance, document_type, template_name, context, s3_folder, file_name, user=None, extra=None,
+                     options=None, make_renditions=False):
+    """
+    Render the HTML for a document and queue its conversion to PDF.
+
+    The document's pdf_status is set to "pending"; the worker sets pdf_path and
+    pdf_status once the PDF has been uploaded to S3. If the document already has a PDF
+    rendered from the same content (see pdf_content_hash) and nothing has to be done
+    after rendering, the job is completed straight away with the existing PDF.
+
+    Args:
+        instance (Model): The Report, Quotation, RLO or Invoice the PDF belongs to.
+        document_type (str): One of the PDF_DOCUMENT_MODELS keys.
+        template_name (str): The template to render.
+        context (dict): Context data for rendering the HTML template.
+        s3_folder (str): The S3 folder to upload the PDF to.
+        file_name (str): Name of the PDF file.
+        user (User, optional): The user queuing the job.
+        extra (dict, optional): JSON data for the completion step, e.g. email notifications.
+        options (dict, optional): wkhtmltopdf options, defaults to the shared pdf_options.
+        make_renditions (bool): Let the worker make the missing image renditions of the
+            document and render the template again before the PDF, see PDF_RENDITION_RENDERERS.
+
+    Returns:
+        PDFRenderJob: The queued job.
+    """
+    html_content = render_to_string(template_name, context)
+    options = options or pdf_options
+    extra = extra or {}
+    if make_renditions and document_type in PDF_RENDITION_RENDERERS:
+        extra = {**extra, 'renditions_template': template_name}
+    content_hash = pdf_content_hash(html_content, options)
+
+    job = PDFRenderJob(
+        document_type=document_type,
+        object_id=instance.pk,
+        html_content=html_content,
+        options=options,
+        s3_folder=s3_folder,
+        file_name=file_name,
+        extra=extra,
+        content_hash=content_hash,
+        created_by=user if user and user.is_authenticated else None,
+    )
+
+    if not extra and instance.pdf_path and instance.pdf_hash == content_hash:
+        now = timezone.now()
+        job.status = 'completed'
+        job.pdf_path = instance.pdf_path
+        job.render_time = 0
+        job.started_at = now
+        job.finished_at = now
+
+    with transaction.atomic():
+        job.save()
+        type(instance).objects.filter(pk=instance.pk).update(pdf_status=job.status)
+
+    instance.pdf_status = job.status
+    return job
+
+
+def claim_pdf_jobs(limit):
+    """
+    Claim up to `limit` pending jobs for this worker.
+
+    Rows are locked with SKIP LOCKED, so several workers can poll the same table
+    without picking the same job twice.
+
+    Args:
+        limit (int): Maximum number of jobs to claim.
+
+    Returns:
+        list: The claimed PDFRenderJob instances.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            PDFRenderJob.objects.select_for_update(skip_locked=True)
+            .filter(status='pending')
+            .order_by('created_at')[:limit]
+        )
+        for job in jobs:
+            job.status = 'rendering'
+            job.started_at = now
+            job.attempts += 1
+            job.save(update_fields=['status', 'started_at', 'attempts'])
+
+    for job in jobs:
+        _set_document_status(job, pdf_status='rendering')
+    return jobs
+
+
+def requeue_stale_pdf_jobs(older_than):
+    """
+    Put jobs left in "rendering" by a crashed worker back in the queue, together with the
+    pdf_status of their documents.
+
+    Args:
+        older_than (int): Seconds after which a rendering job is considered stale.
+
+    Returns:
+        int: The number of requeued jobs.
+    """
+    cutoff = timezone.now() - timezone.timedelta(seconds=older_than)
+    with transaction.atomic():
+        jobs = list(
+            PDFRenderJob.objects.select_for_update(skip_locked=True)
+            .filter(status='rendering', started_at__lt=cutoff)
+            .values_list('pk', 'document_type', 'object_id')
+        )
+        if not jobs:
+            return 0
+
+        PDFRenderJob.objects.filter(pk__in=[pk for pk, _, _ in jobs]).update(status='pending')
+        object_ids = {}
+        for _, document_type, object_id in jobs:
+            object_ids.setdefault(document_type, []).append(object_id)
+        for document_type, ids in object_ids.items():
+            get_document_model(document_type).objects.filter(pk__in=ids).update(pdf_status='pending')
+    return len(jobs)
+
+
+def retry_pdf_render(instance, document_type):
+    """
+    Queue the last failed job of a document again, with fresh attempts.
+
+    Args:
+        instance (Model): The document whose pdf_status is "failed".
+        document_type (str): One of the PDF_DOCUMENT_MODELS keys.
+
+    Returns:
+        bool: True if a job was queued again, False if the document has no failed job.
+    """
+    job = PDFRenderJob.objects.filter(
+        document_type=document_type, object_id=instance.pk, status='failed'
+    ).order_by('-id').first()
+    if job is None:
+        return False
+
+    with transaction.atomic():
+        PDFRenderJob.objects.filter(pk=job.pk).update(status='pending', attempts=0, started_at=None, finished_at=None)
+        type(instance).objects.filter(pk=instance.pk).update(pdf_status='pending')
+    instance.pdf_status = 'pending'
+    return True
+
+
+def process_pdf_job(job):
+    """
+    Render a claimed job with wkhtmltopdf, upload it to S3 and update the document.
+
+    Failed jobs are retried until PDF_JOB_MAX_ATTEMPTS is reached.
+
+    Args:
+        job (PDFRenderJob): A job claimed by claim_pdf_jobs.
+
+    Returns:
+        bool: True if the PDF was generated.
+    """
+    output_file = None
+    started = time.monotonic()
+
+    try:
+        _render_with_renditions(job)
+        document = get_document_model(job.document_type).objects.filter(pk=job.object_id).values('pdf_path', 'pdf_hash').first()
+        if job.content_hash and document and document['pdf_path'] and document['pdf_hash'] == job.content_hash:
+            # Same content as the stored PDF: reuse the S3 object.
+            job.pdf_path = document['pdf_path']
+        else:
+            # A file of its own: jobs of other renderers and workers may have the same file name.
+            fd, output_file = tempfile.mkstemp(suffix='.pdf')
+            os.close(fd)
+            pdfkit.from_string(job.html_content, output_file, options=job.options or pdf_options)
+            if not upload_signature_to_s3(job.file_name, output_file, job.s3_folder):
+                raise RuntimeError("Upload of the PDF to S3 failed.")
+            job.pdf_path = f'{job.s3_folder}/{job.file_name}'
+
+        job.status = 'completed'
+        job.error = None
+        job.render_time = time.monotonic() - started
+        job.finished_at = timezone.now()
+        job.save(update_fields=['pdf_path', 'status', 'error', 'render_time', 'finished_at'])
+        _set_document_status(job, pdf_status='completed', pdf_path=job.pdf_path, pdf_hash=job.content_hash)
+
+        _notify(job)
+        return True
+
+    except Exception as e:
+        logger.exception("PDF job %s failed", job.pk)
+        job.error = str(e)
+        job.status = 'pending' if job.attempts < settings.PDF_JOB_MAX_ATTEMPTS else 'failed'
+        job.finished_at = timezone.now()
+        job.save(update_fields=['error', 'status', 'finished_at'])
+        _set_document_status(job, pdf_status=job.status)
+        return False
+
+    finally:
+        if output_file and os.path.exists(output_file):
+            os.remove(output_file)
+        close_old_connections()
+
+
+def _render_with_renditions(job):
+    """
+    Make the missing image renditions of the document of a job and replace its HTML with
+    the one embedding them. Requests queue the job with the originals embedded, so the
+    originals are downloaded and re-encoded here rather than in the request.
+    """
+    template_name = (job.extra or {}).get('renditions_template')
+    if not template_name or job.document_type not in PDF_RENDITION_RENDERERS:
+        return
+
+    document = get_document_model(job.document_type).objects.filter(pk=job.object_id).first()
+    html_content = import_string(PDF_RENDITION_RENDERERS[job.document_type])(document, template_name) if document else None
+    if html_content is None:
+        return
+    job.html_content = html_content
+    job.content_hash = pdf_content_hash(html_content, job.options or pdf_options)
+    job.save(update_fields=['html_content', 'content_hash'])
+
+
+def _set_document_status(job, **fields):
+    get_document_model(job.document_type).objects.filter(pk=job.object_id).update(**fields)
+
+
+def _notify(job):
+    """
+    Send the notifications requested when the job was queued.
+    """
+    if not job.extra.get('notify_quantity_surveyor'):
+        return
+
+    from infinity_fire_solutions.email import Email
+
+    report = get_document_model(job.document_type).objects.select_related(
+        'requirement_id__quantity_surveyor', 'requirement_id__surveyor'
+    ).filter(pk=job.object_id).first()
+    requirement = report.requirement_id if report else None
+
+    # send email to QS
+    if requirement and requirement.quantity_surveyor and requirement.surveyor:
+        context = {'user': requirement.quantity_surveyor, 'surveyor': requirement.surveyor, 'site_url': job.extra.get('site_url')}
+
+        try:
+            email = Email()
+            email.send_mail(requirement.quantity_surveyor.email, 'email_templates/report.html', context,
+                            "Submission of Survey Report", job.pdf_path)
+        except Exception:
+            logger.exception("Report email for PDF job %s failed", job.pk)
+
+
+def pdf_job_metrics(since=None):
+    """
+    Throughput and latency of the PDF jobs per document type.
+
+    Args:
+        since (datetime, optional): Only count jobs created after this moment. Defaults to the last 24 hours.
+
+    Returns:
+        dict: Keyed by document type, with job counts per status, completed jobs per minute
+              and the average/maximum render time in seconds.
+    """
+    since = since or timezone.now() - timezone.timedelta(hours=24)
+    window_minutes = max((timezone.now() - since).total_seconds() / 60, 1)
+
+    rows = PDFRenderJob.objects.filter(created_at__gte=since).values('document_type').annotate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='pending')),
+        rendering=Count('id', filter=Q(status='rendering')),
+        completed=Count('id', filter=Q(status='completed')),
+        failed=Count('id', filter=Q(status='failed')),
+        avg_render_time=Avg('render_time', filter=Q(status='completed')),
+        max_render_time=Max('render_time', filter=Q(status='completed')),
+    ).order_by('document_type')
+
+    metrics = {}
+    for row in rows:
+        document_type = row.pop('document_type')
+        row['completed_per_minute'] = row['completed'] / window_minutes
+        metrics[document_type] = row
+    return metrics
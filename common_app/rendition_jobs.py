@@ -0,0 +1,100 @@
+import logging
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction, close_old_connections
+from django.utils import timezone
+
+from common_app.models import RenditionJob
+from infinity_fire_solutions.image_renditions import ensure_renditions, is_image
+
+logger = logging.getLogger(__name__)
+
+
+def queue_renditions(model, documents):
+    """
+    Queue the renditions of documents for the rendition worker.
+
+    Args:
+        model (Model): The document model, see ensure_renditions.
+        documents (iterable): Rows of the model; only images are queued.
+
+    Returns:
+        RenditionJob: The queued job, None if no document is an image.
+    """
+    document_paths = [document.document_path for document in documents if is_image(document.document_path)]
+    if not document_paths:
+        return None
+    return RenditionJob.objects.create(model=model._meta.label, document_paths=document_paths)
+
+
+def claim_rendition_jobs(limit):
+    """
+    Claim up to `limit` pending jobs for this worker, skipping rows locked by other workers.
+
+    Args:
+        limit (int): Maximum number of jobs to claim.
+
+    Returns:
+        list: The claimed RenditionJob instances.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            RenditionJob.objects.select_for_update(skip_locked=True)
+            .filter(status='pending')
+            .order_by('created_at')[:limit]
+        )
+        for job in jobs:
+            job.status = 'processing'
+            job.started_at = now
+            job.attempts += 1
+            job.save(update_fields=['status', 'started_at', 'attempts'])
+    return jobs
+
+
+def requeue_stale_rendition_jobs(older_than):
+    """
+    Put jobs left in "processing" by a crashed worker back in the queue.
+
+    Args:
+        older_than (int): Seconds after which a processing job is considered stale.
+
+    Returns:
+        int: The number of requeued jobs.
+    """
+    cutoff = timezone.now() - timezone.timedelta(seconds=older_than)
+    return RenditionJob.objects.filter(status='processing', started_at__lt=cutoff).update(status='pending')
+
+
+def process_rendition_job(job):
+    """
+    Make the missing renditions of the documents of a claimed job.
+
+    Documents deleted since the job was queued are skipped. Failed jobs are retried until
+    RENDITION_JOB_MAX_ATTEMPTS is reached.
+
+    Args:
+        job (RenditionJob): A job claimed by claim_rendition_jobs.
+
+    Returns:
+        int: The number of documents given renditions, None if the job failed.
+    """
+    try:
+        model = apps.get_model(job.model)
+        updated = ensure_renditions(model, model.objects.filter(document_path__in=job.document_paths))
+        job.status = 'completed'
+        job.error = None
+        job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'error', 'finished_at'])
+        return updated
+
+    except Exception as e:
+        logger.exception("Rendition job %s failed", job.pk)
+        job.error = str(e)
+        job.status = 'pending' if job.attempts < settings.RENDITION_JOB_MAX_ATTEMPTS else 'failed'
+        job.finished_at = timezone.now()
+        job.save(update_fields=['error', 'status', 'finished_at'])
+        return None
+
+    finally:
+        close_old_connections()
@@ -0,0 +1,361 @@
+from functools import reduce
+from operator import or_
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, Value, FloatField
+from django.db.models.expressions import RawSQL
+from django.urls import reverse
+from django.utils.html import strip_tags
+
+from infinity_fire_solutions.permission import can
+from .models import SearchEntry
+
+# Longest searched text stored per record.
+MAX_CONTENT_LENGTH = 20000
+
+# Must list the columns of the FULLTEXT index in its order, see migration 0013_searchentry.
+MATCH_SQL = 'MATCH (title, content) AGAINST (%s IN BOOLEAN MODE)'
+
+
+def _text(*values):
+    return ' '.join(strip_tags(str(value)) for value in values if value)
+
+
+def _customer_document(user):
+    if not user.roles_id or 'customer' not in user.roles.name.lower():
+        return None
+    return {
+        'title': user.company_name or f'{user.first_name} {user.last_name}',
+        'content': _text(user.company_name, user.first_name, user.last_name, user.email),
+        'customer_id': user.id,
+        'owner_id': user.created_by_id,
+    }
+
+
+def _requirement_document(requirement):
+    site_address = requirement.site_address
+    return {
+        'title': requirement.RBNO or f'FRA {requirement.id}',
+        'content': _text(
+            requirement.RBNO, requirement.UPRN, requirement.action, requirement.description,
+            site_address and site_address.site_name, site_address and site_address.address,
+            site_address and site_address.post_code,
+        ),
+        'customer_id': requirement.customer_id_id,
+        'owner_id': requirement.user_id_id,
+    }
+
+
+def _quotation_document(quotation):
+    requirement = quotation.requirement_id
+    return {
+        'title': f'Quotation {quotation.id} - {requirement.RBNO or f"FRA {requirement.id}"}',
+        'content': _text(requirement.RBNO, requirement.UPRN, requirement.action, requirement.description),
+        'customer_id': quotation.customer_id_id,
+        'owner_id': quotation.user_id_id,
+    }
+
+
+def _job_document(job):
+    team = job.assigned_to_team
+    members = [member.name for member in job.assigned_to_member.all()]
+    if team:
+        members += [member.name for member in team.members.all()]
+    return {
+        'title': str(job),
+        'content': _text(str(job), team and team.team_name, *dict.fromkeys(members)),
+        'customer_id': job.customer_id_id,
+        'owner_id': None,
+    }
+
+
+def _item_document(item):
+    vendor = item.vendor_id
+    return {
+        'title': item.item_name,
+        'content': _text(item.item_name, item.reference_number, item.description, vendor and vendor.company),
+        'customer_id': None,
+        'owner_id': item.user_id_id,
+    }
+
+
+def _vendor_document(vendor):
+    return {
+        'title': vendor.company or f'{vendor.first_name} {vendor.last_name}',
+        'content': _text(vendor.company, vendor.first_name, vendor.last_name, vendor.email, vendor.phone_number),
+        'customer_id': None,
+        'owner_id': vendor.user_id_id,
+    }
+
+
+# The indexed records, keyed by SearchEntry.entity. 'module' is the permission module
+# whose list access scopes the results, 'document' builds the entry of a record (None
+# removes it) and 'url' the link of a result. 'depends_on' lists, per related model whose
+# data the entries include, the lookups from the record to it; the entries are updated
+# when such a related record changes (see common_app/signals.py).
+SEARCH_ENTITIES = {
+    'customer': {
+        'model': 'authentication.User',
+        'module': 'customer',
+        'document': _customer_document,
+        'select_related': ['roles'],
+        'url': lambda entry: reverse('customer_detail', kwargs={'customer_id': entry.object_id}),
+    },
+    'requirement': {
+        'model': 'requirement_management.Requirement',
+        'module': 'fire_risk_assessment',
+        'document': _requirement_document,
+        'select_related': ['site_address'],
+        'depends_on': {'customer_management.SiteAddress': ['site_address']},
+        'url': lambda entry: reverse('customer_requirement_view', kwargs={'customer_id': entry.customer_id, 'pk': entry.object_id}),
+    },
+    'quotation': {
+        'model': 'requirement_management.Quotation',
+        'module': 'fire_risk_assessment',
+        'document': _quotation_document,
+        'select_related': ['requirement_id'],
+        'depends_on': {'requirement_management.Requirement': ['requirement_id']},
+        'url': lambda entry: reverse('customer_quotation_view', kwargs={'customer_id': entry.customer_id, 'quotation_id': entry.object_id}),
+    },
+    'job': {
+        'model': 'work_planning_management.Job',
+        'module': 'work_planning',
+        'document': _job_document,
+        'select_related': ['assigned_to_team'],
+        'prefetch_related': ['assigned_to_member', 'assigned_to_team__members'],
+        'depends_on': {
+            'work_planning_management.Team': ['assigned_to_team'],
+            'work_planning_management.Member': ['assigned_to_member', 'assigned_to_team__members'],
+        },
+        'url': lambda entry: reverse('job_detail', kwargs={'customer_id': entry.customer_id, 'job_id': entry.object_id}) if entry.customer_id else None,
+    },
+    'item': {
+        'model': 'stock_management.Item',
+        'module': 'stock_management',
+        'document': _item_document,
+        'select_related': ['vendor_id'],
+        'depends_on': {'stock_management.Vendor': ['vendor_id']},
+        'url': lambda entry: reverse('inventory_view', kwargs={'item_id': entry.object_id}),
+    },
+    'vendor': {
+        'model': 'stock_management.Vendor',
+        'module': 'stock_management',
+        'document': _vendor_document,
+        'url': lambda entry: reverse('vendor_billing_detail', kwargs={'vendor_id': entry.object_id}),
+    },
+}
+
+
+def entity_model(entity):
+    return apps.get_model(SEARCH_ENTITIES[entity]['model'])
+
+
+def entities_of(model):
+    """
+    The entities whose records are instances of a model.
+    """
+    return [entity for entity in SEARCH_ENTITIES if entity_model(entity) is model]
+
+
+def dependency_models():
+    """
+    The related models whose data the entries of other records include, see 'depends_on'.
+    """
+    return {apps.get_model(label) for definition in SEARCH_ENTITIES.values() for label in definition.get('depends_on', {})}
+
+
+def dependent_records(model, pk):
+    """
+    The records whose entries include data of a related record, e.g. the FRAs at a site address.
+
+    Args:
+        model (Model): The model of the related record.
+        pk: Its primary key.
+
+    Returns:
+        dict: {entity: QuerySet of the dependent records}.
+    """
+    dependents = {}
+    for entity, definition in SEARCH_ENTITIES.items():
+        lookups = definition.get('depends_on', {}).get(model._meta.label)
+        if lookups:
+            dependents[entity] = entity_model(entity).objects.filter(
+                reduce(or_, (Q(**{lookup: pk}) for lookup in lookups))
+            ).distinct()
+    return dependents
+
+
+def _entry_fields(entity, instance):
+    document = SEARCH_ENTITIES[entity]['document'](instance)
+    if document is not None:
+        document['title'] = document['title'][:255]
+        document['content'] = document['content'][:MAX_CONTENT_LENGTH]
+    return document
+
+
+def index_object(entity, instance):
+    """
+    Create, update or remove the search entry of a record.
+    """
+    document = _entry_fields(entity, instance)
+    if document is None:
+        remove_object(entity, instance.pk)
+        return
+    SearchEntry.objects.update_or_create(entity=entity, object_id=instance.pk, defaults=document)
+
+
+def remove_object(entity, object_id):
+    SearchEntry.objects.filter(entity=entity, object_id=object_id).delete()
+
+
+def index_queryset(entity, queryset=None, batch_size=500):
+    """
+    Rebuild the search entries of many records, a batch at a time: the entries of a batch
+    are deleted and inserted again with bulk_create. Used after bulk imports, which do not
+    send signals, and by the `rebuild_search_index` management command.
+
+    Args:
+        entity (str): One of the SEARCH_ENTITIES keys.
+        queryset (QuerySet, optional): The records, all records of the entity by default.
+        batch_size (int): Records indexed per batch.
+
+    Returns:
+        int: The number of entries written.
+    """
+    definition = SEARCH_ENTITIES[entity]
+    if queryset is None:
+        queryset = entity_model(entity).objects.all()
+    queryset = queryset.select_related(*definition.get('select_related', [])).order_by('pk')
+
+    written = 0
+    last_pk = None
+    while True:
+        batch_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        batch = list(batch_queryset.prefetch_related(*definition.get('prefetch_related', []))[:batch_size])
+        if not batch:
+            return written
+        last_pk = batch[-1].pk
+
+        entries = []
+        for instance in batch:
+            document = _entry_fields(entity, instance)
+            if document is not None:
+                entries.append(SearchEntry(entity=entity, object_id=instance.pk, **document))
+
+        with transaction.atomic():
+            SearchEntry.objects.filter(entity=entity, object_id__in=[instance.pk for instance in batch]).delete()
+            SearchEntry.objects.bulk_create(entries)
+        written += len(entries)
+
+
+def _boolean_query(terms):
+    # Every word is required and quoted, so the boolean mode operators typed by users are
+    # searched as text. Within quotes the ngram parser matches the word anywhere.
+    return ' '.join(f'+"{term}"' for term in terms)
+
+
+def matching_entries(q, entities=None):
+    """
+    The search entries matching every word of a search, best matches first.
+
+    Words at least SEARCH_NGRAM_TOKEN_SIZE long are matched with the FULLTEXT index, shorter
+    ones with a LIKE over the entries left.
+
+    Args:
+        q (str): The search.
+        entities (iterable, optional): Only entries of these entities.
+
+    Returns:
+        QuerySet: The entries, annotated with their `score`; none for an empty search.
+    """
+    terms = [term for term in q.replace('"', ' ').split() if term.strip('+-<>()~*@')]
+    entries = SearchEntry.objects.all()
+    if entities is not None:
+        entries = entries.filter(entity__in=list(entities))
+    if not terms:
+        return entries.none()
+
+    indexed = [term for term in terms if len(term) >= settings.SEARCH_NGRAM_TOKEN_SIZE]
+    for term in terms:
+        if term not in indexed:
+            entries = entries.filter(Q(title__icontains=term) | Q(content__icontains=term))
+
+    if not indexed:
+        return entries.annotate(score=Value(0.0, output_field=FloatField())).order_by('-updated_at')
+    return entries.annotate(
+        score=RawSQL(MATCH_SQL, [_boolean_query(indexed)], output_field=FloatField())
+    ).filter(score__gt=0).order_by('-score', '-updated_at')
+
+
+def search_queryset(queryset, entity, q, field='pk'):
+    """
+    Filter the queryset of a list view to the records matching a search.
+
+    Args:
+        queryset (QuerySet): The records listed by the view.
+        entity (str): One of the SEARCH_ENTITIES keys.
+        q (str): The search; the queryset is returned unchanged when it is empty.
+        field (str): The field of the queryset holding the ids of the entity's records.
+
+    Returns:
+        QuerySet: The matching records.
+    """
+    if not q or not q.strip():
+        return queryset
+    object_ids = matching_entries(q, [entity]).order_by().values('object_id')
+    return queryset.filter(**{f'{field}__in': object_ids})
+
+
+def _customer_of_contact(user):
+    contact_person = getattr(user, 'contactperson', None)
+    customer_meta = contact_person.customer if contact_person else None
+    return customer_meta.user_id if customer_meta else None
+
+
+def search(user, q, entities=None, limit=None):
+    """
+    Ranked search across the indexed records a user may list.
+
+    Every entity needs the list permission of its module; with "self" access only the
+    records created by the user are found, and customer contacts only find the records of
+    their customer.
+
+    Args:
+        user (User): The user searching.
+        q (str): The search.
+        entities (iterable, optional): Only search these entities, all by default.
+        limit (int, optional): Maximum number of results, SEARCH_RESULTS_LIMIT by default.
+
+    Returns:
+        list: The results as dicts with 'entity', 'id', 'title', 'url' and 'score'.
+    """
+    scopes = []
+    for entity in entities or SEARCH_ENTITIES:
+        access = can(user, SEARCH_ENTITIES[entity]['module'], 'list')
+        if not access:
+            continue
+        scope = Q(entity=entity)
+        if access == 'self':
+            scope &= Q(owner_id=user.id)
+        scopes.append(scope)
+    if not scopes:
+        return []
+
+    entries = matching_entries(q).filter(reduce(or_, scopes))
+    if user.roles and user.roles.name == 'customer_contact':
+        customer = _customer_of_contact(user)
+        if not customer:
+            return []
+        entries = entries.filter(customer_id=customer.id)
+
+    return [
+        {
+            'entity': entry.entity,
+            'id': entry.object_id,
+            'title': entry.title,
+            'url': SEARCH_ENTITIES[entry.entity]['url'](entry),
+            'score': entry.score,
+        }
+        for entry in entries[:limit or settings.SEARCH_RESULTS_LIMIT]
+    ]
@@ -0,0 +1,122 @@
+import os
+import threading
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from .models import DocumentSequence
+
+
+def _numbers_after(model, field, prefix):
+    """
+    Seed of a sequence taking over existing numbers: one more than the highest
+    "<prefix><digits>" value of the field.
+    """
+    def seed():
+        values = model.objects.filter(**{f'{field}__startswith': prefix}).values_list(field, flat=True)
+        numbers = [int(value[len(prefix):]) for value in values.iterator() if value[len(prefix):].isdigit()]
+        return max(numbers, default=0) + 1
+    return seed
+
+
+def _purchase_order_seed():
+    from purchase_order_management.models import PurchaseOrder
+    return _numbers_after(PurchaseOrder, 'po_number', 'IFB')()
+
+
+# Document number sequences, keyed by DocumentSequence.name. 'seed' gives the first
+# number when the sequence row is created; 'block_size' overrides
+# DOCUMENT_SEQUENCE_BLOCK_SIZE.
+DOCUMENT_SEQUENCES = {
+    'purchase_order': {'prefix': 'IFB', 'padding': 4, 'seed': _purchase_order_seed},
+}
+
+_blocks = {}
+_blocks_lock = threading.Lock()
+_created = set()
+
+
+def format_number(name, value):
+    """
+    Format a sequence value, e.g. 12 -> "IFB0012".
+    """
+    definition = DOCUMENT_SEQUENCES[name]
+    return f"{definition['prefix']}{str(value).zfill(definition['padding'])}"
+
+
+def _ensure_sequence(name):
+    # Created outside the locking transaction: concurrent first allocations race on the
+    # unique name instead of deadlocking on gap locks.
+    if name in _created:
+        return
+    if not DocumentSequence.objects.filter(name=name).exists():
+        seed = DOCUMENT_SEQUENCES[name].get('seed')
+        try:
+            with transaction.atomic():
+                DocumentSequence.objects.create(name=name, next_value=seed() if seed else 1)
+        except IntegrityError:
+            pass
+    _created.add(name)
+
+
+def reserve_values(name, count=1):
+    """
+    Reserve consecutive values of a sequence with one locked increment of its row.
+
+    The row lock is held until the end of the transaction, so call this outside of long
+    transactions to keep allocations from waiting on each other.
+
+    Args:
+        name (str): One of the DOCUMENT_SEQUENCES keys.
+        count (int): Number of values to reserve.
+
+    Returns:
+        int: The first reserved value; the values up to first + count - 1 are reserved too.
+
+    Raises:
+        KeyError: If the sequence is not defined.
+    """
+    if name not in DOCUMENT_SEQUENCES:
+        raise KeyError(f"Unknown document sequence '{name}'.")
+    _ensure_sequence(name)
+
+    with transaction.atomic():
+        sequence = DocumentSequence.objects.select_for_update().get(name=name)
+        first = sequence.next_value
+        sequence.next_value = first + count
+        sequence.save(update_fields=['next_value', 'updated_at'])
+    return first
+
+
+def next_number(name):
+    """
+    Allocate the next number of a document sequence, e.g. next_number('purchase_order') -> "IFB0013".
+
+    With a block size above 1, every process reserves that many values at once and hands
+    them out from memory: allocations rarely touch the database, at the cost of gaps
+    (values left in a block when a worker exits) and of numbers from different workers not
+    following the order of creation.
+
+    Returns:
+        str: The formatted number, never allocated before.
+    """
+    block_size = DOCUMENT_SEQUENCES.get(name, {}).get('block_size', settings.DOCUMENT_SEQUENCE_BLOCK_SIZE)
+    if block_size <= 1:
+        return format_number(name, reserve_values(name))
+
+    with _blocks_lock:
+        block = _blocks.get(name)
+        # A block inherited from the parent of a forked worker is the parent's, not ours.
+        if block is None or block['pid'] != os.getpid() or block['next'] >= block['end']:
+            first = reserve_values(name, block_size)
+            block = _blocks[name] = {'pid': os.getpid(), 'next': first, 'end': first + block_size}
+        value = block['next']
+        block['next'] += 1
+    return format_number(name, value)
+
+
+def preview_number(name):
+    """
+    The number the next allocation will probably get, for display in forms. Nothing is reserved.
+    """
+    _ensure_sequence(name)
+    return format_number(name, DocumentSequence.objects.get(name=name).next_value)
@@ -0,0 +1,112 @@
+from django.db.models.signals import post_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver
+from authentication.models import UserRolePermission
+from common_app import search
+from common_app.models import MenuItem
+from common_app.menu import invalidate_menu_cache
+from work_planning_management.models import Job, Team
+
+
+@receiver(post_save, sender=MenuItem)
+@receiver(post_delete, sender=MenuItem)
+@receiver(post_save, sender=UserRolePermission)
+@receiver(post_delete, sender=UserRolePermission)
+def invalidate_menu_on_change(sender, **kwargs):
+    """
+    Invalidate the cached navigation menus whenever a menu item or a role permission changes.
+    """
+    invalidate_menu_cache()
+
+
+def update_search_entry(sender, instance, update_fields=None, **kwargs):
+    """
+    Update the search entry of an indexed record when it is saved.
+    """
+    # Logins only update last_login, which is not searched.
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    for entity in search.entities_of(sender):
+        search.index_object(entity, instance)
+
+
+def remove_search_entry(sender, instance, **kwargs):
+    """
+    Remove the search entry of an indexed record when it is deleted.
+    """
+    for entity in search.entities_of(sender):
+        search.remove_object(entity, instance.pk)
+
+
+for entity in search.SEARCH_ENTITIES:
+    post_save.connect(update_search_entry, sender=search.entity_model(entity), dispatch_uid=f'search_save_{entity}')
+    post_delete.connect(remove_search_entry, sender=search.entity_model(entity), dispatch_uid=f'search_delete_{entity}')
+
+
+def update_dependent_search_entries(sender, instance, created=False, **kwargs):
+    """
+    Update the entries including data of a saved related record, e.g. the FRAs at a site
+    address, the quotations of an FRA or the jobs of a team.
+    """
+    if created:
+        return
+    for entity, queryset in search.dependent_records(sender, instance.pk).items():
+        search.index_queryset(entity, queryset)
+
+
+def collect_dependent_search_entries(sender, instance, **kwargs):
+    """
+    Remember the records depending on a related record about to be deleted: once it is
+    gone, e.g. a member removed from jobs and teams, they cannot be found anymore.
+    """
+    instance._search_dependents = {
+        entity: list(queryset.values_list('pk', flat=True))
+        for entity, queryset in search.dependent_records(sender, instance.pk).items()
+    }
+
+
+def update_search_entries_after_delete(sender, instance, **kwargs):
+    """
+    Update the entries of the records that depended on a deleted related record.
+    """
+    for entity, pks in getattr(instance, '_search_dependents', {}).items():
+        if pks:
+            search.index_queryset(entity, search.entity_model(entity).objects.filter(pk__in=pks))
+
+
+for model in search.dependency_models():
+    label = model._meta.label_lower
+    post_save.connect(update_dependent_search_entries, sender=model, dispatch_uid=f'search_dependents_save_{label}')
+    pre_delete.connect(collect_dependent_search_entries, sender=model, dispatch_uid=f'search_dependents_collect_{label}')
+    post_delete.connect(update_search_entries_after_delete, sender=model, dispatch_uid=f'search_dependents_delete_{label}')
+
+
+@receiver(m2m_changed, sender=Job.assigned_to_member.through)
+def update_job_search_entries(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Jobs are found by the names of their members, so their entries follow assignments.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        search.index_object('job', instance)
+    elif pk_set:
+        search.index_queryset('job', Job.objects.filter(pk__in=pk_set))
+
+
+@receiver(m2m_changed, sender=Team.members.through)
+def update_team_job_search_entries(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Jobs are found by the names of their team's members, so their entries follow the team.
+    """
+    if reverse and action == 'pre_clear':
+        # The teams of a member are unknown once cleared.
+        instance._search_teams = list(instance.team_set.values_list('pk', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        search.index_queryset('job', Job.objects.filter(assigned_to_team=instance))
+        return
+    team_ids = pk_set if action != 'post_clear' else getattr(instance, '_search_teams', [])
+    if team_ids:
+        search.index_queryset('job', Job.objects.filter(assigned_to_team__in=team_ids))
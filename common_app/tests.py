@@ -1,3 +1,132 @@
-from django.test import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings, skipUnlessDBFeature
+from django.utils import timezone
 
-# Create your tests here.
+from authentication.models import User, UserRole, UserRolePermission
+from common_app import sequences
+from common_app.menu import get_role_menu
+from common_app.models import DocumentSequence, MenuItem, PDFRenderJob
+from common_app.pdf_jobs import requeue_stale_pdf_jobs
+from work_planning_management.models import Job, RLO
+
+
+@skipUnlessDBFeature('has_select_for_update')
+class DocumentSequenceConcurrencyTests(TransactionTestCase):
+    """
+    Purchase order numbers allocated concurrently are unique and leave no gaps.
+
+    A TransactionTestCase, so every thread commits on its own connection and the row
+    lock of the sequence is really contended.
+    """
+    threads = 8
+    allocations = 40
+
+    def setUp(self):
+        # The created sequences and the reserved blocks are remembered per process.
+        sequences._created.clear()
+        sequences._blocks.clear()
+        self.addCleanup(sequences._blocks.clear)
+        self.addCleanup(sequences._created.clear)
+
+    def allocate(self):
+        def next_number(_):
+            try:
+                return sequences.next_number('purchase_order')
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            return list(executor.map(next_number, range(self.allocations)))
+
+    def assertUniqueAndGapless(self, numbers):
+        self.assertEqual(len(set(numbers)), self.allocations)
+        self.assertEqual(
+            sorted(numbers),
+            sorted(sequences.format_number('purchase_order', value) for value in range(1, self.allocations + 1)),
+        )
+
+    @override_settings(DOCUMENT_SEQUENCE_BLOCK_SIZE=1)
+    def test_concurrent_allocations(self):
+        numbers = self.allocate()
+        self.assertUniqueAndGapless(numbers)
+        self.assertEqual(DocumentSequence.objects.get(name='purchase_order').next_value, self.allocations + 1)
+
+    @override_settings(DOCUMENT_SEQUENCE_BLOCK_SIZE=5)
+    def test_concurrent_allocations_from_blocks(self):
+        # The allocations fill whole blocks, so the process leaves no reserved value unused.
+        numbers = self.allocate()
+        self.assertUniqueAndGapless(numbers)
+        self.assertEqual(DocumentSequence.objects.get(name='purchase_order').next_value, self.allocations + 1)
+
+    @override_settings(DOCUMENT_SEQUENCE_BLOCK_SIZE=5)
+    def test_blocks_continue_the_sequence(self):
+        first = self.allocate()
+        second = self.allocate()
+        self.allocations *= 2
+        self.assertUniqueAndGapless(first + second)
+
+
+class MenuCacheTests(TestCase):
+    """
+    The menu of a role is built once and then served from the default cache, also when
+    it is per-process, until a menu item or a role permission changes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.role = UserRole.objects.create(name='Surveyor')
+        cls.permission = UserRolePermission.objects.create(
+            role=cls.role, module='contact', can_create_data=False,
+            can_list_data='all', can_change_data='all', can_view_data='all', can_delete_data='none',
+        )
+        MenuItem.objects.create(name='Contacts', url='/contact/', icon='fa-user', order=1, permission_required=True)
+        MenuItem.objects.create(name='Dashboard', url='/', icon='fa-home', order=0)
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_warm_cache_needs_no_queries(self):
+        menu = get_role_menu(self.role.id)
+        self.assertEqual([entry['name'] for entry in menu], ['Dashboard', 'Contacts'])
+        with self.assertNumQueries(0):
+            self.assertEqual(get_role_menu(self.role.id), menu)
+
+    def test_menu_item_change_invalidates(self):
+        get_role_menu(self.role.id)
+        MenuItem.objects.create(name='Reports', url='/reports/', icon='fa-file', order=2)
+        self.assertEqual([entry['name'] for entry in get_role_menu(self.role.id)], ['Dashboard', 'Contacts', 'Reports'])
+
+    def test_permission_change_invalidates(self):
+        get_role_menu(self.role.id)
+        self.permission.can_list_data = 'none'
+        self.permission.save()
+        self.assertEqual([entry['name'] for entry in get_role_menu(self.role.id)], ['Dashboard'])
+
+
+class PDFJobRequeueTests(TestCase):
+    """
+    Jobs left rendering by a crashed worker go back in the queue with their documents.
+    """
+
+    def test_requeue_stale_jobs(self):
+        user = User.objects.create_user(email='admin@example.com', password='password', first_name='Admin', last_name='User')
+        job = Job.objects.create()
+        stale = RLO.objects.create(user_id=user, job=job, name='stale', pdf_status='rendering')
+        running = RLO.objects.create(user_id=user, job=job, name='running', pdf_status='rendering')
+        now = timezone.now()
+        for rlo, started_at in ((stale, now - timezone.timedelta(hours=1)), (running, now)):
+            PDFRenderJob.objects.create(
+                document_type='rlo', object_id=rlo.pk, html_content='<p></p>', s3_folder='rlo',
+                file_name=f'{rlo.name}.pdf', status='rendering', started_at=started_at,
+            )
+
+        self.assertEqual(requeue_stale_pdf_jobs(600), 1)
+        self.assertEqual(PDFRenderJob.objects.get(object_id=stale.pk).status, 'pending')
+        self.assertEqual(PDFRenderJob.objects.get(object_id=running.pk).status, 'rendering')
+        stale.refresh_from_db()
+        running.refresh_from_db()
+        self.assertEqual(stale.pdf_status, 'pending')
+        self.assertEqual(running.pdf_status, 'rendering')
@@ -4,4 +4,12 @@ from . import views
 
 urlpatterns = [
     path('', login_required(views.dashboard), name='dashboard'),
-]
\ No newline at end of file
+    path('pdf-jobs/<int:pk>/status/', login_required(views.pdf_job_status), name='pdf_job_status'),
+    path('import-jobs/<int:pk>/status/', login_required(views.import_job_status), name='import_job_status'),
+    path('import-jobs/<int:pk>/errors/', login_required(views.import_job_errors), name='import_job_errors'),
+    path('uploads/grants/', login_required(views.direct_upload_grants), name='direct_upload_grants'),
+    path('uploads/confirm/', login_required(views.direct_upload_confirm), name='direct_upload_confirm'),
+    path('search/', login_required(views.search), name='search'),
+    path('healthz/', views.liveness, name='liveness'),
+    path('readyz/', views.readiness, name='readiness'),
+]
@@ -1,8 +1,173 @@
-from django.shortcuts import render
+import json
+import logging
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.shortcuts import render, get_object_or_404
+from django.http import JsonResponse, HttpResponse
+from django.urls import reverse
+from django.views.decorators.http import require_POST
+from infinity_fire_solutions.aws_helper import generate_presigned_url
+from infinity_fire_solutions.shared_cache import is_shared_cache
+from .direct_uploads import DirectUploadError, create_upload_grants, confirm_uploads
+from .import_jobs import import_job_errors_csv
+from .models import PDFRenderJob, ImportJob
+from .search import SEARCH_ENTITIES, search as search_index
+
+logger = logging.getLogger(__name__)
 
 # Create your views here.
-from django.shortcuts import render
 
 def dashboard(request):
     # Add logic to fetch and process data for the dashboard if needed
     return render(request, 'dashboard.html')
+
+
+def pdf_job_status(request, pk):
+    """
+    Return the status of a PDF rendering job queued by the current user, for the UI to poll.
+    """
+    job = get_object_or_404(PDFRenderJob, pk=pk, created_by=request.user)
+    return JsonResponse({
+        'id': job.id,
+        'document_type': job.document_type,
+        'object_id': job.object_id,
+        'status': job.status,
+        'pdf_url': generate_presigned_url(job.pdf_path) if job.status == 'completed' else None,
+        'error': job.error if job.status == 'failed' else None,
+    })
+
+
+def import_job_status(request, pk):
+    """
+    Return the progress of an import job queued by the current user, for the UI to poll.
+    """
+    job = get_object_or_404(ImportJob, pk=pk, created_by=request.user)
+    return JsonResponse({
+        'id': job.id,
+        'import_type': job.import_type,
+        'file_name': job.file_name,
+        'status': job.status,
+        'rows_processed': job.rows_processed,
+        'rows_failed': job.rows_failed,
+        'rows_created': job.rows_created,
+        'rows_updated': job.rows_updated,
+        'rolled_back': job.rolled_back,
+        'error': job.error if job.status == 'failed' else None,
+        'errors_url': reverse('import_job_errors', kwargs={'pk': job.id}) if job.errors else None,
+    })
+
+
+def import_job_errors(request, pk):
+    """
+    Download the rows rejected by an import job of the current user as CSV.
+    """
+    job = get_object_or_404(ImportJob, pk=pk, created_by=request.user)
+    response = HttpResponse(import_job_errors_csv(job), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="import_{job.id}_errors.csv"'
+    return response
+
+
+def _json_body(request):
+    try:
+        data = json.loads(request.body or b'{}')
+    except ValueError:
+        data = None
+    return data if isinstance(data, dict) else {}
+
+
+@require_POST
+def direct_upload_grants(request):
+    """
+    Issue presigned POST grants for the browser to upload documents straight to S3.
+
+    Expects JSON: {"target": "requirement", "object_id": 1, "files": [{"name", "content_type", "size"}]}.
+    """
+    data = _json_body(request)
+    try:
+        grants = create_upload_grants(request.user, data.get('target'), data.get('object_id'), data.get('files') or [])
+    except DirectUploadError as e:
+        return JsonResponse({'message': str(e)}, status=400)
+    return JsonResponse({'grants': grants})
+
+
+@require_POST
+def direct_upload_confirm(request):
+    """
+    Create the document rows of files uploaded with grants from direct_upload_grants.
+
+    Expects JSON: {"tokens": ["<grant token>", ...]}.
+    """
+    data = _json_body(request)
+    try:
+        documents = confirm_uploads(request.user, data.get('tokens') or [])
+    except DirectUploadError as e:
+        return JsonResponse({'message': str(e)}, status=400)
+    return JsonResponse({
+        'created': len(documents),
+        'documents': [
+            {'document_path': document.document_path, 'presigned_url': generate_presigned_url(document.document_path)}
+            for document in documents
+        ],
+    })
+
+
+def search(request):
+    """
+    Ranked search across customers, FRAs, quotations, jobs, stock items and vendors,
+    limited to the modules the user may list.
+
+    Query params: q, entity (repeatable, all entities by default) and limit.
+    """
+    entities = request.GET.getlist('entity')
+    unknown = [entity for entity in entities if entity not in SEARCH_ENTITIES]
+    if unknown:
+        return JsonResponse({'message': f"Unknown search entity: {', '.join(unknown)}."}, status=400)
+
+    try:
+        limit = int(request.GET.get('limit', settings.SEARCH_RESULTS_LIMIT))
+    except ValueError:
+        limit = settings.SEARCH_RESULTS_LIMIT
+    limit = max(1, min(limit, settings.SEARCH_MAX_RESULTS))
+
+    results = search_index(request.user, request.GET.get('q', ''), entities or None, limit)
+    return JsonResponse({'results': results})
+
+
+def liveness(request):
+    """
+    Liveness probe: the worker process is up and serving requests.
+    """
+    return JsonResponse({'status': 'ok'})
+
+
+def readiness(request):
+    """
+    Readiness probe: the database can be reached, so the worker can take traffic.
+
+    The cache is reported but does not fail the probe: it runs as a single replica and
+    every page still works without it, only slower.
+    """
+    checks = {}
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        checks['database'] = 'ok'
+    except Exception:
+        logger.exception("Readiness check: the database cannot be reached")
+        checks['database'] = 'error'
+
+    try:
+        cache.set('readiness_check', 1, 10)
+        checks['cache'] = 'ok' if cache.get('readiness_check') == 1 else 'degraded'
+    except Exception:
+        logger.warning("Readiness check: the cache cannot be reached", exc_info=True)
+        checks['cache'] = 'degraded'
+
+    ready = checks['database'] == 'ok'
+    # A per-process cache passes the check; permissions and menus then lag other workers'
+    # changes by up to LOCAL_CACHE_TIMEOUT seconds.
+    return JsonResponse(
+        {'status': 'ok' if ready else 'error', 'checks': checks, 'cache_shared': is_shared_cache()},
+        status=200 if ready else 503,
+    )
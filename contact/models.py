@@ -2,7 +2,7 @@ from django.db import models
 from cities_light.models import City, Country, Region
 from authentication.models import User
 from ckeditor.fields import RichTextField
-from customer_management.constants import POST_CODE_LIST
+from customer_management.post_codes import validate_post_code
 
 class ConversationType(models.Model):
     """
@@ -43,7 +43,7 @@ class Contact(models.Model):
     country = models.CharField(max_length=255, null=True, blank=True)
     town = models.CharField(max_length=255, null=True, blank=True)
     county = models.CharField(max_length=255, null=True, blank=True)
-    post_code = models.CharField(max_length=10, choices=POST_CODE_LIST, null=True, blank=True)
+    post_code = models.CharField(max_length=10, validators=[validate_post_code], null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -16,7 +16,7 @@ from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.custom_form_validation import *
 import re
 from bs4 import BeautifulSoup
-from customer_management.constants import POST_CODE_LIST
+from customer_management.post_codes import PostCodeField
 
 
 
@@ -241,15 +241,14 @@ class ContactSerializer(serializers.ModelSerializer):
     )
 
     
-    post_code = serializers.ChoiceField(
+    post_code = PostCodeField(
         label=('Post Code'),
         required=False,        
-        choices=POST_CODE_LIST,
         style={
             "input_type": "text",
             "autofocus": False,
             "autocomplete": "off",
-            'base_template': 'custom_select_without_search.html'
+            'base_template': 'custom_post_code.html'
         },
           error_messages={
             "required": "This field is required.",
@@ -1,4 +1,3 @@
-from django.core.paginator import Paginator
 from django.contrib import messages
 from django.urls import reverse
 from django.shortcuts import render, redirect
@@ -8,6 +7,7 @@ from drf_yasg.utils import swagger_auto_schema
 
 from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.permission import *
+from infinity_fire_solutions.pagination import PaginatedListMixin
 from .models import *
 from .serializers import ContactSerializer, ConversationSerializer, ConversationViewSerializer
 from infinity_fire_solutions.response_schemas import create_api_response, convert_serializer_errors, render_html_response
@@ -92,7 +92,7 @@ class SubContractorSearchAPIView(CustomAuthenticationMixin, generics.RetrieveAPI
         )
 
 
-class ContactListView(CustomAuthenticationMixin,generics.ListAPIView):
+class ContactListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     """
     View to get the listing of all contacts.
     Supports both HTML and JSON response formats.
@@ -193,8 +193,7 @@ class ContactListView(CustomAuthenticationMixin,generics.ListAPIView):
         contact_type_filter = self.request.GET.get('contact_type', '')
         if request.accepted_renderer.format == 'html':
             queryset = self.get_searched_queryset(queryset)
-            page_number = request.GET.get('page', 1)
-            context = {'contacts': Paginator(queryset, 20).get_page(page_number),
+            context = {'contacts': self.get_paginated_queryset(queryset),
                        'contact_types': contact_types,
                        'search_fields': ['name', 'email'],
                        'search_value': request.query_params.get('q', '') if isinstance(request.query_params.get('q', []), str) else ', '.join(request.query_params.get('q', [])),
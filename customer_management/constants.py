@@ -1,5714 +0,0 @@
-POST_CODE_LIST = (
-    ("AB10", "AB10"),
-    ("AB11", "AB11"),
-    ("AB12", "AB12"),
-    ("AB13", "AB13"),
-    ("AB14", "AB14"),
-    ("AB15", "AB15"),
-    ("AB16", "AB16"),
-    ("AB21", "AB21"),
-    ("AB22", "AB22"),
-    ("AB23", "AB23"),
-    ("AB24", "AB24"),
-    ("AB25", "AB25"),
-    ("AB30", "AB30"),
-    ("AB31", "AB31"),
-    ("AB32", "AB32"),
-    ("AB33", "AB33"),
-    ("AB34", "AB34"),
-    ("AB35", "AB35"),
-    ("AB36", "AB36"),
-    ("AB37", "AB37"),
-    ("AB38", "AB38"),
-    ("AB39", "AB39"),
-    ("AB41", "AB41"),
-    ("AB42", "AB42"),
-    ("AB43", "AB43"),
-    ("AB44", "AB44"),
-    ("AB45", "AB45"),
-    ("AB51", "AB51"),
-    ("AB52", "AB52"),
-    ("AB53", "AB53"),
-    ("AB54", "AB54"),
-    ("AB55", "AB55"),
-    ("AB56", "AB56"),
-    ("AL1", "AL1"),
-    ("AL10", "AL10"),
-    ("AL2", "AL2"),
-    ("AL3", "AL3"),
-    ("AL4", "AL4"),
-    ("AL5", "AL5"),
-    ("AL6", "AL6"),
-    ("AL7", "AL7"),
-    ("AL8", "AL8"),
-    ("AL9", "AL9"),
-    ("B1", "B1"),
-    ("B10", "B10"),
-    ("B11", "B11"),
-    ("B12", "B12"),
-    ("B13", "B13"),
-    ("B14", "B14"),
-    ("B15", "B15"),
-    ("B16", "B16"),
-    ("B17", "B17"),
-    ("B18", "B18"),
-    ("B19", "B19"),
-    ("B2", "B2"),
-    ("B20", "B20"),
-    ("B21", "B21"),
-    ("B23", "B23"),
-    ("B24", "B24"),
-    ("B25", "B25"),
-    ("B26", "B26"),
-    ("B27", "B27"),
-    ("B28", "B28"),
-    ("B29", "B29"),
-    ("B3", "B3"),
-    ("B30", "B30"),
-    ("B31", "B31"),
-    ("B32", "B32"),
-    ("B33", "B33"),
-    ("B34", "B34"),
-    ("B35", "B35"),
-    ("B36", "B36"),
-    ("B37", "B37"),
-    ("B38", "B38"),
-    ("B4", "B4"),
-    ("B40", "B40"),
-    ("B42", "B42"),
-    ("B43", "B43"),
-    ("B44", "B44"),
-    ("B45", "B45"),
-    ("B46", "B46"),
-    ("B47", "B47"),
-    ("B48", "B48"),
-    ("B49", "B49"),
-    ("B5", "B5"),
-    ("B50", "B50"),
-    ("B6", "B6"),
-    ("B60", "B60"),
-    ("B61", "B61"),
-    ("B62", "B62"),
-    ("B63", "B63"),
-    ("B64", "B64"),
-    ("B65", "B65"),
-    ("B66", "B66"),
-    ("B67", "B67"),
-    ("B68", "B68"),
-    ("B69", "B69"),
-    ("B7", "B7"),
-    ("B70", "B70"),
-    ("B71", "B71"),
-    ("B72", "B72"),
-    ("B73", "B73"),
-    ("B74", "B74"),
-    ("B75", "B75"),
-    ("B76", "B76"),
-    ("B77", "B77"),
-    ("B78", "B78"),
-    ("B79", "B79"),
-    ("B8", "B8"),
-    ("B80", "B80"),
-    ("B9", "B9"),
-    ("B90", "B90"),
-    ("B91", "B91"),
-    ("B92", "B92"),
-    ("B93", "B93"),
-    ("B94", "B94"),
-    ("B95", "B95"),
-    ("B96", "B96"),
-    ("B97", "B97"),
-    ("B98", "B98"),
-    ("BA1", "BA1"),
-    ("BA10", "BA10"),
-    ("BA11", "BA11"),
-    ("BA12", "BA12"),
-    ("BA13", "BA13"),
-    ("BA14", "BA14"),
-    ("BA15", "BA15"),
-    ("BA16", "BA16"),
-    ("BA2", "BA2"),
-    ("BA20", "BA20"),
-    ("BA21", "BA21"),
-    ("BA22", "BA22"),
-    ("BA3", "BA3"),
-    ("BA4", "BA4"),
-    ("BA5", "BA5"),
-    ("BA6", "BA6"),
-    ("BA7", "BA7"),
-    ("BA8", "BA8"),
-    ("BA9", "BA9"),
-    ("BB1", "BB1"),
-    ("BB10", "BB10"),
-    ("BB11", "BB11"),
-    ("BB12", "BB12"),
-    ("BB18", "BB18"),
-    ("BB2", "BB2"),
-    ("BB3", "BB3"),
-    ("BB4", "BB4"),
-    ("BB5", "BB5"),
-    ("BB6", "BB6"),
-    ("BB7", "BB7"),
-    ("BB8", "BB8"),
-    ("BB9", "BB9"),
-    ("BD1", "BD1"),
-    ("BD10", "BD10"),
-    ("BD11", "BD11"),
-    ("BD12", "BD12"),
-    ("BD13", "BD13"),
-    ("BD14", "BD14"),
-    ("BD15", "BD15"),
-    ("BD16", "BD16"),
-    ("BD17", "BD17"),
-    ("BD18", "BD18"),
-    ("BD19", "BD19"),
-    ("BD2", "BD2"),
-    ("BD20", "BD20"),
-    ("BD21", "BD21"),
-    ("BD22", "BD22"),
-    ("BD23", "BD23"),
-    ("BD24", "BD24"),
-    ("BD3", "BD3"),
-    ("BD4", "BD4"),
-    ("BD5", "BD5"),
-    ("BD6", "BD6"),
-    ("BD7", "BD7"),
-    ("BD8", "BD8"),
-    ("BD9", "BD9"),
-    ("BH1", "BH1"),
-    ("BH10", "BH10"),
-    ("BH11", "BH11"),
-    ("BH12", "BH12"),
-    ("BH13", "BH13"),
-    ("BH14", "BH14"),
-    ("BH15", "BH15"),
-    ("BH16", "BH16"),
-    ("BH17", "BH17"),
-    ("BH18", "BH18"),
-    ("BH19", "BH19"),
-    ("BH2", "BH2"),
-    ("BH20", "BH20"),
-    ("BH21", "BH21"),
-    ("BH22", "BH22"),
-    ("BH23", "BH23"),
-    ("BH24", "BH24"),
-    ("BH25", "BH25"),
-    ("BH3", "BH3"),
-    ("BH31", "BH31"),
-    ("BH4", "BH4"),
-    ("BH5", "BH5"),
-    ("BH6", "BH6"),
-    ("BH7", "BH7"),
-    ("BH8", "BH8"),
-    ("BH9", "BH9"),
-    ("BL0", "BL0"),
-    ("BL1", "BL1"),
-    ("BL2", "BL2"),
-    ("BL3", "BL3"),
-    ("BL4", "BL4"),
-    ("BL5", "BL5"),
-    ("BL6", "BL6"),
-    ("BL7", "BL7"),
-    ("BL8", "BL8"),
-    ("BL9", "BL9"),
-    ("BN1", "BN1"),
-    ("BN10", "BN10"),
-    ("BN11", "BN11"),
-    ("BN12", "BN12"),
-    ("BN13", "BN13"),
-    ("BN14", "BN14"),
-    ("BN15", "BN15"),
-    ("BN16", "BN16"),
-    ("BN17", "BN17"),
-    ("BN18", "BN18"),
-    ("BN2", "BN2"),
-    ("BN20", "BN20"),
-    ("BN21", "BN21"),
-    ("BN22", "BN22"),
-    ("BN23", "BN23"),
-    ("BN24", "BN24"),
-    ("BN25", "BN25"),
-    ("BN26", "BN26"),
-    ("BN27", "BN27"),
-    ("BN3", "BN3"),
-    ("BN41", "BN41"),
-    ("BN42", "BN42"),
-    ("BN43", "BN43"),
-    ("BN44", "BN44"),
-    ("BN45", "BN45"),
-    ("BN5", "BN5"),
-    ("BN6", "BN6"),
-    ("BN7", "BN7"),
-    ("BN8", "BN8"),
-    ("BN9", "BN9"),
-    ("BR1", "BR1"),
-    ("BR2", "BR2"),
-    ("BR3", "BR3"),
-    ("BR4", "BR4"),
-    ("BR5", "BR5"),
-    ("BR6", "BR6"),
-    ("BR7", "BR7"),
-    ("BR8", "BR8"),
-    ("BS1", "BS1"),
-    ("BS10", "BS10"),
-    ("BS11", "BS11"),
-    ("BS13", "BS13"),
-    ("BS14", "BS14"),
-    ("BS15", "BS15"),
-    ("BS16", "BS16"),
-    ("BS2", "BS2"),
-    ("BS20", "BS20"),
-    ("BS21", "BS21"),
-    ("BS22", "BS22"),
-    ("BS23", "BS23"),
-    ("BS24", "BS24"),
-    ("BS25", "BS25"),
-    ("BS26", "BS26"),
-    ("BS27", "BS27"),
-    ("BS28", "BS28"),
-    ("BS29", "BS29"),
-    ("BS3", "BS3"),
-    ("BS30", "BS30"),
-    ("BS31", "BS31"),
-    ("BS32", "BS32"),
-    ("BS34", "BS34"),
-    ("BS35", "BS35"),
-    ("BS36", "BS36"),
-    ("BS37", "BS37"),
-    ("BS39", "BS39"),
-    ("BS4", "BS4"),
-    ("BS40", "BS40"),
-    ("BS41", "BS41"),
-    ("BS48", "BS48"),
-    ("BS49", "BS49"),
-    ("BS5", "BS5"),
-    ("BS6", "BS6"),
-    ("BS7", "BS7"),
-    ("BS8", "BS8"),
-    ("BS9", "BS9"),
-    ("BS99", "BS99"),
-    ("BT1", "BT1"),
-    ("BT10", "BT10"),
-    ("BT11", "BT11"),
-    ("BT12", "BT12"),
-    ("BT13", "BT13"),
-    ("BT14", "BT14"),
-    ("BT15", "BT15"),
-    ("BT16", "BT16"),
-    ("BT17", "BT17"),
-    ("BT18", "BT18"),
-    ("BT19", "BT19"),
-    ("BT2", "BT2"),
-    ("BT20", "BT20"),
-    ("BT21", "BT21"),
-    ("BT22", "BT22"),
-    ("BT23", "BT23"),
-    ("BT24", "BT24"),
-    ("BT25", "BT25"),
-    ("BT26", "BT26"),
-    ("BT27", "BT27"),
-    ("BT28", "BT28"),
-    ("BT29", "BT29"),
-    ("BT3", "BT3"),
-    ("BT30", "BT30"),
-    ("BT31", "BT31"),
-    ("BT32", "BT32"),
-    ("BT33", "BT33"),
-    ("BT34", "BT34"),
-    ("BT35", "BT35"),
-    ("BT36", "BT36"),
-    ("BT37", "BT37"),
-    ("BT38", "BT38"),
-    ("BT39", "BT39"),
-    ("BT4", "BT4"),
-    ("BT40", "BT40"),
-    ("BT41", "BT41"),
-    ("BT42", "BT42"),
-    ("BT43", "BT43"),
-    ("BT44", "BT44"),
-    ("BT45", "BT45"),
-    ("BT46", "BT46"),
-    ("BT47", "BT47"),
-    ("BT48", "BT48"),
-    ("BT49", "BT49"),
-    ("BT5", "BT5"),
-    ("BT51", "BT51"),
-    ("BT52", "BT52"),
-    ("BT53", "BT53"),
-    ("BT54", "BT54"),
-    ("BT55", "BT55"),
-    ("BT56", "BT56"),
-    ("BT57", "BT57"),
-    ("BT6", "BT6"),
-    ("BT60", "BT60"),
-    ("BT61", "BT61"),
-    ("BT62", "BT62"),
-    ("BT63", "BT63"),
-    ("BT64", "BT64"),
-    ("BT65", "BT65"),
-    ("BT66", "BT66"),
-    ("BT67", "BT67"),
-    ("BT68", "BT68"),
-    ("BT69", "BT69"),
-    ("BT7", "BT7"),
-    ("BT70", "BT70"),
-    ("BT71", "BT71"),
-    ("BT74", "BT74"),
-    ("BT75", "BT75"),
-    ("BT76", "BT76"),
-    ("BT77", "BT77"),
-    ("BT78", "BT78"),
-    ("BT79", "BT79"),
-    ("BT8", "BT8"),
-    ("BT80", "BT80"),
-    ("BT81", "BT81"),
-    ("BT82", "BT82"),
-    ("BT9", "BT9"),
-    ("BT92", "BT92"),
-    ("BT93", "BT93"),
-    ("BT94", "BT94"),
-    ("CA1", "CA1"),
-    ("CA10", "CA10"),
-    ("CA11", "CA11"),
-    ("CA12", "CA12"),
-    ("CA13", "CA13"),
-    ("CA14", "CA14"),
-    ("CA15", "CA15"),
-    ("CA16", "CA16"),
-    ("CA17", "CA17"),
-    ("CA18", "CA18"),
-    ("CA19", "CA19"),
-    ("CA2", "CA2"),
-    ("CA20", "CA20"),
-    ("CA21", "CA21"),
-    ("CA22", "CA22"),
-    ("CA23", "CA23"),
-    ("CA24", "CA24"),
-    ("CA25", "CA25"),
-    ("CA26", "CA26"),
-    ("CA27", "CA27"),
-    ("CA28", "CA28"),
-    ("CA3", "CA3"),
-    ("CA4", "CA4"),
-    ("CA5", "CA5"),
-    ("CA6", "CA6"),
-    ("CA7", "CA7"),
-    ("CA8", "CA8"),
-    ("CA9", "CA9"),
-    ("CB1", "CB1"),
-    ("CB10", "CB10"),
-    ("CB11", "CB11"),
-    ("CB2", "CB2"),
-    ("CB21", "CB21"),
-    ("CB22", "CB22"),
-    ("CB23", "CB23"),
-    ("CB24", "CB24"),
-    ("CB25", "CB25"),
-    ("CB3", "CB3"),
-    ("CB4", "CB4"),
-    ("CB5", "CB5"),
-    ("CB6", "CB6"),
-    ("CB7", "CB7"),
-    ("CB8", "CB8"),
-    ("CB9", "CB9"),
-    ("CF10", "CF10"),
-    ("CF11", "CF11"),
-    ("CF14", "CF14"),
-    ("CF15", "CF15"),
-    ("CF23", "CF23"),
-    ("CF24", "CF24"),
-    ("CF3", "CF3"),
-    ("CF31", "CF31"),
-    ("CF32", "CF32"),
-    ("CF33", "CF33"),
-    ("CF34", "CF34"),
-    ("CF35", "CF35"),
-    ("CF36", "CF36"),
-    ("CF37", "CF37"),
-    ("CF38", "CF38"),
-    ("CF39", "CF39"),
-    ("CF40", "CF40"),
-    ("CF41", "CF41"),
-    ("CF42", "CF42"),
-    ("CF43", "CF43"),
-    ("CF44", "CF44"),
-    ("CF45", "CF45"),
-    ("CF46", "CF46"),
-    ("CF47", "CF47"),
-    ("CF48", "CF48"),
-    ("CF5", "CF5"),
-    ("CF61", "CF61"),
-    ("CF62", "CF62"),
-    ("CF63", "CF63"),
-    ("CF64", "CF64"),
-    ("CF71", "CF71"),
-    ("CF72", "CF72"),
-    ("CF81", "CF81"),
-    ("CF82", "CF82"),
-    ("CF83", "CF83"),
-    ("CH1", "CH1"),
-    ("CH2", "CH2"),
-    ("CH3", "CH3"),
-    ("CH4", "CH4"),
-    ("CH41", "CH41"),
-    ("CH42", "CH42"),
-    ("CH43", "CH43"),
-    ("CH44", "CH44"),
-    ("CH45", "CH45"),
-    ("CH46", "CH46"),
-    ("CH47", "CH47"),
-    ("CH48", "CH48"),
-    ("CH49", "CH49"),
-    ("CH5", "CH5"),
-    ("CH6", "CH6"),
-    ("CH60", "CH60"),
-    ("CH61", "CH61"),
-    ("CH62", "CH62"),
-    ("CH63", "CH63"),
-    ("CH64", "CH64"),
-    ("CH65", "CH65"),
-    ("CH66", "CH66"),
-    ("CH7", "CH7"),
-    ("CH8", "CH8"),
-    ("CM0", "CM0"),
-    ("CM1", "CM1"),
-    ("CM11", "CM11"),
-    ("CM12", "CM12"),
-    ("CM13", "CM13"),
-    ("CM14", "CM14"),
-    ("CM15", "CM15"),
-    ("CM16", "CM16"),
-    ("CM17", "CM17"),
-    ("CM18", "CM18"),
-    ("CM19", "CM19"),
-    ("CM2", "CM2"),
-    ("CM20", "CM20"),
-    ("CM21", "CM21"),
-    ("CM22", "CM22"),
-    ("CM23", "CM23"),
-    ("CM24", "CM24"),
-    ("CM3", "CM3"),
-    ("CM4", "CM4"),
-    ("CM5", "CM5"),
-    ("CM6", "CM6"),
-    ("CM7", "CM7"),
-    ("CM77", "CM77"),
-    ("CM8", "CM8"),
-    ("CM9", "CM9"),
-    ("CO1", "CO1"),
-    ("CO10", "CO10"),
-    ("CO11", "CO11"),
-    ("CO12", "CO12"),
-    ("CO13", "CO13"),
-    ("CO14", "CO14"),
-    ("CO15", "CO15"),
-    ("CO16", "CO16"),
-    ("CO2", "CO2"),
-    ("CO3", "CO3"),
-    ("CO4", "CO4"),
-    ("CO5", "CO5"),
-    ("CO6", "CO6"),
-    ("CO7", "CO7"),
-    ("CO8", "CO8"),
-    ("CO9", "CO9"),
-    ("CR0", "CR0"),
-    ("CR2", "CR2"),
-    ("CR3", "CR3"),
-    ("CR4", "CR4"),
-    ("CR5", "CR5"),
-    ("CR6", "CR6"),
-    ("CR7", "CR7"),
-    ("CR8", "CR8"),
-    ("CR9", "CR9"),
-    ("CT1", "CT1"),
-    ("CT10", "CT10"),
-    ("CT11", "CT11"),
-    ("CT12", "CT12"),
-    ("CT13", "CT13"),
-    ("CT14", "CT14"),
-    ("CT15", "CT15"),
-    ("CT16", "CT16"),
-    ("CT17", "CT17"),
-    ("CT18", "CT18"),
-    ("CT19", "CT19"),
-    ("CT2", "CT2"),
-    ("CT20", "CT20"),
-    ("CT21", "CT21"),
-    ("CT3", "CT3"),
-    ("CT4", "CT4"),
-    ("CT5", "CT5"),
-    ("CT6", "CT6"),
-    ("CT7", "CT7"),
-    ("CT8", "CT8"),
-    ("CT9", "CT9"),
-    ("CV1", "CV1"),
-    ("CV10", "CV10"),
-    ("CV11", "CV11"),
-    ("CV12", "CV12"),
-    ("CV13", "CV13"),
-    ("CV2", "CV2"),
-    ("CV21", "CV21"),
-    ("CV22", "CV22"),
-    ("CV23", "CV23"),
-    ("CV3", "CV3"),
-    ("CV31", "CV31"),
-    ("CV32", "CV32"),
-    ("CV33", "CV33"),
-    ("CV34", "CV34"),
-    ("CV35", "CV35"),
-    ("CV36", "CV36"),
-    ("CV37", "CV37"),
-    ("CV4", "CV4"),
-    ("CV47", "CV47"),
-    ("CV5", "CV5"),
-    ("CV6", "CV6"),
-    ("CV7", "CV7"),
-    ("CV8", "CV8"),
-    ("CV9", "CV9"),
-    ("CW1", "CW1"),
-    ("CW10", "CW10"),
-    ("CW11", "CW11"),
-    ("CW12", "CW12"),
-    ("CW2", "CW2"),
-    ("CW3", "CW3"),
-    ("CW4", "CW4"),
-    ("CW5", "CW5"),
-    ("CW6", "CW6"),
-    ("CW7", "CW7"),
-    ("CW8", "CW8"),
-    ("CW9", "CW9"),
-    ("DA1", "DA1"),
-    ("DA10", "DA10"),
-    ("DA11", "DA11"),
-    ("DA12", "DA12"),
-    ("DA13", "DA13"),
-    ("DA14", "DA14"),
-    ("DA15", "DA15"),
-    ("DA16", "DA16"),
-    ("DA17", "DA17"),
-    ("DA18", "DA18"),
-    ("DA2", "DA2"),
-    ("DA3", "DA3"),
-    ("DA4", "DA4"),
-    ("DA5", "DA5"),
-    ("DA6", "DA6"),
-    ("DA7", "DA7"),
-    ("DA8", "DA8"),
-    ("DA9", "DA9"),
-    ("DD1", "DD1"),
-    ("DD10", "DD10"),
-    ("DD11", "DD11"),
-    ("DD2", "DD2"),
-    ("DD3", "DD3"),
-    ("DD4", "DD4"),
-    ("DD5", "DD5"),
-    ("DD6", "DD6"),
-    ("DD7", "DD7"),
-    ("DD8", "DD8"),
-    ("DD9", "DD9"),
-    ("DE1", "DE1"),
-    ("DE11", "DE11"),
-    ("DE12", "DE12"),
-    ("DE13", "DE13"),
-    ("DE14", "DE14"),
-    ("DE15", "DE15"),
-    ("DE21", "DE21"),
-    ("DE22", "DE22"),
-    ("DE23", "DE23"),
-    ("DE24", "DE24"),
-    ("DE3", "DE3"),
-    ("DE4", "DE4"),
-    ("DE45", "DE45"),
-    ("DE5", "DE5"),
-    ("DE55", "DE55"),
-    ("DE56", "DE56"),
-    ("DE6", "DE6"),
-    ("DE65", "DE65"),
-    ("DE7", "DE7"),
-    ("DE72", "DE72"),
-    ("DE73", "DE73"),
-    ("DE74", "DE74"),
-    ("DE75", "DE75"),
-    ("DG1", "DG1"),
-    ("DG10", "DG10"),
-    ("DG11", "DG11"),
-    ("DG12", "DG12"),
-    ("DG13", "DG13"),
-    ("DG14", "DG14"),
-    ("DG16", "DG16"),
-    ("DG2", "DG2"),
-    ("DG3", "DG3"),
-    ("DG4", "DG4"),
-    ("DG5", "DG5"),
-    ("DG6", "DG6"),
-    ("DG7", "DG7"),
-    ("DG8", "DG8"),
-    ("DG9", "DG9"),
-    ("DH1", "DH1"),
-    ("DH2", "DH2"),
-    ("DH3", "DH3"),
-    ("DH4", "DH4"),
-    ("DH5", "DH5"),
-    ("DH6", "DH6"),
-    ("DH7", "DH7"),
-    ("DH8", "DH8"),
-    ("DH9", "DH9"),
-    ("DL1", "DL1"),
-    ("DL10", "DL10"),
-    ("DL11", "DL11"),
-    ("DL12", "DL12"),
-    ("DL13", "DL13"),
-    ("DL14", "DL14"),
-    ("DL15", "DL15"),
-    ("DL16", "DL16"),
-    ("DL17", "DL17"),
-    ("DL2", "DL2"),
-    ("DL3", "DL3"),
-    ("DL4", "DL4"),
-    ("DL5", "DL5"),
-    ("DL6", "DL6"),
-    ("DL7", "DL7"),
-    ("DL8", "DL8"),
-    ("DL9", "DL9"),
-    ("DN1", "DN1"),
-    ("DN10", "DN10"),
-    ("DN11", "DN11"),
-    ("DN12", "DN12"),
-    ("DN14", "DN14"),
-    ("DN15", "DN15"),
-    ("DN16", "DN16"),
-    ("DN17", "DN17"),
-    ("DN18", "DN18"),
-    ("DN19", "DN19"),
-    ("DN2", "DN2"),
-    ("DN20", "DN20"),
-    ("DN21", "DN21"),
-    ("DN22", "DN22"),
-    ("DN3", "DN3"),
-    ("DN31", "DN31"),
-    ("DN32", "DN32"),
-    ("DN33", "DN33"),
-    ("DN34", "DN34"),
-    ("DN35", "DN35"),
-    ("DN36", "DN36"),
-    ("DN37", "DN37"),
-    ("DN38", "DN38"),
-    ("DN39", "DN39"),
-    ("DN4", "DN4"),
-    ("DN40", "DN40"),
-    ("DN41", "DN41"),
-    ("DN5", "DN5"),
-    ("DN6", "DN6"),
-    ("DN7", "DN7"),
-    ("DN8", "DN8"),
-    ("DN9", "DN9"),
-    ("DT1", "DT1"),
-    ("DT10", "DT10"),
-    ("DT11", "DT11"),
-    ("DT2", "DT2"),
-    ("DT3", "DT3"),
-    ("DT4", "DT4"),
-    ("DT5", "DT5"),
-    ("DT6", "DT6"),
-    ("DT7", "DT7"),
-    ("DT8", "DT8"),
-    ("DT9", "DT9"),
-    ("DY1", "DY1"),
-    ("DY10", "DY10"),
-    ("DY11", "DY11"),
-    ("DY12", "DY12"),
-    ("DY13", "DY13"),
-    ("DY14", "DY14"),
-    ("DY2", "DY2"),
-    ("DY3", "DY3"),
-    ("DY4", "DY4"),
-    ("DY5", "DY5"),
-    ("DY6", "DY6"),
-    ("DY7", "DY7"),
-    ("DY8", "DY8"),
-    ("DY9", "DY9"),
-    ("E1", "E1"),
-    ("E10", "E10"),
-    ("E11", "E11"),
-    ("E12", "E12"),
-    ("E13", "E13"),
-    ("E14", "E14"),
-    ("E15", "E15"),
-    ("E16", "E16"),
-    ("E17", "E17"),
-    ("E18", "E18"),
-    ("E1W", "E1W"),
-    ("E2", "E2"),
-    ("E3", "E3"),
-    ("E4", "E4"),
-    ("E5", "E5"),
-    ("E6", "E6"),
-    ("E7", "E7"),
-    ("E8", "E8"),
-    ("E9", "E9"),
-    ("EC1", "EC1"),
-    ("EC1A", "EC1A"),
-    ("EC1M", "EC1M"),
-    ("EC1N", "EC1N"),
-    ("EC1R", "EC1R"),
-    ("EC1V", "EC1V"),
-    ("EC1Y", "EC1Y"),
-    ("EC2", "EC2"),
-    ("EC2A", "EC2A"),
-    ("EC2M", "EC2M"),
-    ("EC2N", "EC2N"),
-    ("EC2P", "EC2P"),
-    ("EC2R", "EC2R"),
-    ("EC2V", "EC2V"),
-    ("EC2Y", "EC2Y"),
-    ("EC3", "EC3"),
-    ("EC3A", "EC3A"),
-    ("EC3M", "EC3M"),
-    ("EC3N", "EC3N"),
-    ("EC3P", "EC3P"),
-    ("EC3R", "EC3R"),
-    ("EC3V", "EC3V"),
-    ("EC4", "EC4"),
-    ("EC4A", "EC4A"),
-    ("EC4M", "EC4M"),
-    ("EC4N", "EC4N"),
-    ("EC4R", "EC4R"),
-    ("EC4V", "EC4V"),
-    ("EC4Y", "EC4Y"),
-    ("EH1", "EH1"),
-    ("EH10", "EH10"),
-    ("EH11", "EH11"),
-    ("EH12", "EH12"),
-    ("EH13", "EH13"),
-    ("EH14", "EH14"),
-    ("EH15", "EH15"),
-    ("EH16", "EH16"),
-    ("EH17", "EH17"),
-    ("EH18", "EH18"),
-    ("EH19", "EH19"),
-    ("EH2", "EH2"),
-    ("EH20", "EH20"),
-    ("EH21", "EH21"),
-    ("EH22", "EH22"),
-    ("EH23", "EH23"),
-    ("EH24", "EH24"),
-    ("EH25", "EH25"),
-    ("EH26", "EH26"),
-    ("EH27", "EH27"),
-    ("EH28", "EH28"),
-    ("EH29", "EH29"),
-    ("EH3", "EH3"),
-    ("EH30", "EH30"),
-    ("EH31", "EH31"),
-    ("EH32", "EH32"),
-    ("EH33", "EH33"),
-    ("EH34", "EH34"),
-    ("EH35", "EH35"),
-    ("EH36", "EH36"),
-    ("EH37", "EH37"),
-    ("EH38", "EH38"),
-    ("EH39", "EH39"),
-    ("EH4", "EH4"),
-    ("EH40", "EH40"),
-    ("EH41", "EH41"),
-    ("EH42", "EH42"),
-    ("EH43", "EH43"),
-    ("EH44", "EH44"),
-    ("EH45", "EH45"),
-    ("EH46", "EH46"),
-    ("EH47", "EH47"),
-    ("EH48", "EH48"),
-    ("EH49", "EH49"),
-    ("EH5", "EH5"),
-    ("EH51", "EH51"),
-    ("EH52", "EH52"),
-    ("EH53", "EH53"),
-    ("EH54", "EH54"),
-    ("EH55", "EH55"),
-    ("EH6", "EH6"),
-    ("EH7", "EH7"),
-    ("EH8", "EH8"),
-    ("EH9", "EH9"),
-    ("EN1", "EN1"),
-    ("EN10", "EN10"),
-    ("EN11", "EN11"),
-    ("EN2", "EN2"),
-    ("EN3", "EN3"),
-    ("EN4", "EN4"),
-    ("EN5", "EN5"),
-    ("EN6", "EN6"),
-    ("EN7", "EN7"),
-    ("EN8", "EN8"),
-    ("EN9", "EN9"),
-    ("EX1", "EX1"),
-    ("EX10", "EX10"),
-    ("EX11", "EX11"),
-    ("EX12", "EX12"),
-    ("EX13", "EX13"),
-    ("EX14", "EX14"),
-    ("EX15", "EX15"),
-    ("EX16", "EX16"),
-    ("EX17", "EX17"),
-    ("EX18", "EX18"),
-    ("EX19", "EX19"),
-    ("EX2", "EX2"),
-    ("EX20", "EX20"),
-    ("EX21", "EX21"),
-    ("EX22", "EX22"),
-    ("EX23", "EX23"),
-    ("EX24", "EX24"),
-    ("EX3", "EX3"),
-    ("EX31", "EX31"),
-    ("EX32", "EX32"),
-    ("EX33", "EX33"),
-    ("EX34", "EX34"),
-    ("EX35", "EX35"),
-    ("EX36", "EX36"),
-    ("EX37", "EX37"),
-    ("EX38", "EX38"),
-    ("EX39", "EX39"),
-    ("EX4", "EX4"),
-    ("EX5", "EX5"),
-    ("EX6", "EX6"),
-    ("EX7", "EX7"),
-    ("EX8", "EX8"),
-    ("EX9", "EX9"),
-    ("FK1", "FK1"),
-    ("FK10", "FK10"),
-    ("FK11", "FK11"),
-    ("FK12", "FK12"),
-    ("FK13", "FK13"),
-    ("FK14", "FK14"),
-    ("FK15", "FK15"),
-    ("FK16", "FK16"),
-    ("FK17", "FK17"),
-    ("FK18", "FK18"),
-    ("FK19", "FK19"),
-    ("FK2", "FK2"),
-    ("FK20", "FK20"),
-    ("FK21", "FK21"),
-    ("FK3", "FK3"),
-    ("FK4", "FK4"),
-    ("FK5", "FK5"),
-    ("FK6", "FK6"),
-    ("FK7", "FK7"),
-    ("FK8", "FK8"),
-    ("FK9", "FK9"),
-    ("FY1", "FY1"),
-    ("FY2", "FY2"),
-    ("FY3", "FY3"),
-    ("FY4", "FY4"),
-    ("FY5", "FY5"),
-    ("FY6", "FY6"),
-    ("FY7", "FY7"),
-    ("FY8", "FY8"),
-    ("G1", "G1"),
-    ("G11", "G11"),
-    ("G12", "G12"),
-    ("G13", "G13"),
-    ("G14", "G14"),
-    ("G15", "G15"),
-    ("G2", "G2"),
-    ("G20", "G20"),
-    ("G21", "G21"),
-    ("G22", "G22"),
-    ("G23", "G23"),
-    ("G3", "G3"),
-    ("G31", "G31"),
-    ("G32", "G32"),
-    ("G33", "G33"),
-    ("G34", "G34"),
-    ("G4", "G4"),
-    ("G40", "G40"),
-    ("G41", "G41"),
-    ("G42", "G42"),
-    ("G43", "G43"),
-    ("G44", "G44"),
-    ("G45", "G45"),
-    ("G46", "G46"),
-    ("G5", "G5"),
-    ("G51", "G51"),
-    ("G52", "G52"),
-    ("G53", "G53"),
-    ("G60", "G60"),
-    ("G61", "G61"),
-    ("G62", "G62"),
-    ("G63", "G63"),
-    ("G64", "G64"),
-    ("G65", "G65"),
-    ("G66", "G66"),
-    ("G67", "G67"),
-    ("G68", "G68"),
-    ("G69", "G69"),
-    ("G71", "G71"),
-    ("G72", "G72"),
-    ("G73", "G73"),
-    ("G74", "G74"),
-    ("G76", "G76"),
-    ("G77", "G77"),
-    ("G78", "G78"),
-    ("G81", "G81"),
-    ("G82", "G82"),
-    ("G83", "G83"),
-    ("G84", "G84"),
-    ("GL1", "GL1"),
-    ("GL10", "GL10"),
-    ("GL11", "GL11"),
-    ("GL12", "GL12"),
-    ("GL13", "GL13"),
-    ("GL14", "GL14"),
-    ("GL15", "GL15"),
-    ("GL16", "GL16"),
-    ("GL17", "GL17"),
-    ("GL18", "GL18"),
-    ("GL19", "GL19"),
-    ("GL2", "GL2"),
-    ("GL20", "GL20"),
-    ("GL3", "GL3"),
-    ("GL4", "GL4"),
-    ("GL5", "GL5"),
-    ("GL50", "GL50"),
-    ("GL51", "GL51"),
-    ("GL52", "GL52"),
-    ("GL53", "GL53"),
-    ("GL54", "GL54"),
-    ("GL55", "GL55"),
-    ("GL56", "GL56"),
-    ("GL6", "GL6"),
-    ("GL7", "GL7"),
-    ("GL8", "GL8"),
-    ("GL9", "GL9"),
-    ("GU1", "GU1"),
-    ("GU10", "GU10"),
-    ("GU11", "GU11"),
-    ("GU12", "GU12"),
-    ("GU13", "GU13"),
-    ("GU14", "GU14"),
-    ("GU15", "GU15"),
-    ("GU16", "GU16"),
-    ("GU17", "GU17"),
-    ("GU18", "GU18"),
-    ("GU19", "GU19"),
-    ("GU2", "GU2"),
-    ("GU20", "GU20"),
-    ("GU21", "GU21"),
-    ("GU22", "GU22"),
-    ("GU23", "GU23"),
-    ("GU24", "GU24"),
-    ("GU25", "GU25"),
-    ("GU26", "GU26"),
-    ("GU27", "GU27"),
-    ("GU28", "GU28"),
-    ("GU29", "GU29"),
-    ("GU3", "GU3"),
-    ("GU30", "GU30"),
-    ("GU31", "GU31"),
-    ("GU32", "GU32"),
-    ("GU33", "GU33"),
-    ("GU34", "GU34"),
-    ("GU35", "GU35"),
-    ("GU4", "GU4"),
-    ("GU46", "GU46"),
-    ("GU47", "GU47"),
-    ("GU5", "GU5"),
-    ("GU51", "GU51"),
-    ("GU52", "GU52"),
-    ("GU6", "GU6"),
-    ("GU7", "GU7"),
-    ("GU8", "GU8"),
-    ("GU9", "GU9"),
-    ("GY1", "GY1"),
-    ("GY2", "GY2"),
-    ("GY3", "GY3"),
-    ("GY4", "GY4"),
-    ("GY5", "GY5"),
-    ("GY6", "GY6"),
-    ("GY7", "GY7"),
-    ("GY8", "GY8"),
-    ("GY9", "GY9"),
-    ("HA0", "HA0"),
-    ("HA1", "HA1"),
-    ("HA2", "HA2"),
-    ("HA3", "HA3"),
-    ("HA4", "HA4"),
-    ("HA5", "HA5"),
-    ("HA6", "HA6"),
-    ("HA7", "HA7"),
-    ("HA8", "HA8"),
-    ("HA9", "HA9"),
-    ("HD1", "HD1"),
-    ("HD2", "HD2"),
-    ("HD3", "HD3"),
-    ("HD4", "HD4"),
-    ("HD5", "HD5"),
-    ("HD6", "HD6"),
-    ("HD7", "HD7"),
-    ("HD8", "HD8"),
-    ("HD9", "HD9"),
-    ("HG1", "HG1"),
-    ("HG2", "HG2"),
-    ("HG3", "HG3"),
-    ("HG4", "HG4"),
-    ("HG5", "HG5"),
-    ("HP1", "HP1"),
-    ("HP10", "HP10"),
-    ("HP11", "HP11"),
-    ("HP12", "HP12"),
-    ("HP13", "HP13"),
-    ("HP14", "HP14"),
-    ("HP15", "HP15"),
-    ("HP16", "HP16"),
-    ("HP17", "HP17"),
-    ("HP18", "HP18"),
-    ("HP19", "HP19"),
-    ("HP2", "HP2"),
-    ("HP20", "HP20"),
-    ("HP21", "HP21"),
-    ("HP22", "HP22"),
-    ("HP23", "HP23"),
-    ("HP27", "HP27"),
-    ("HP3", "HP3"),
-    ("HP4", "HP4"),
-    ("HP5", "HP5"),
-    ("HP6", "HP6"),
-    ("HP7", "HP7"),
-    ("HP8", "HP8"),
-    ("HP9", "HP9"),
-    ("HR1", "HR1"),
-    ("HR2", "HR2"),
-    ("HR3", "HR3"),
-    ("HR4", "HR4"),
-    ("HR5", "HR5"),
-    ("HR6", "HR6"),
-    ("HR7", "HR7"),
-    ("HR8", "HR8"),
-    ("HR9", "HR9"),
-    ("HS1", "HS1"),
-    ("HS2", "HS2"),
-    ("HS3", "HS3"),
-    ("HS4", "HS4"),
-    ("HS5", "HS5"),
-    ("HS6", "HS6"),
-    ("HS7", "HS7"),
-    ("HS8", "HS8"),
-    ("HS9", "HS9"),
-    ("HU1", "HU1"),
-    ("HU10", "HU10"),
-    ("HU11", "HU11"),
-    ("HU12", "HU12"),
-    ("HU13", "HU13"),
-    ("HU14", "HU14"),
-    ("HU15", "HU15"),
-    ("HU16", "HU16"),
-    ("HU17", "HU17"),
-    ("HU18", "HU18"),
-    ("HU19", "HU19"),
-    ("HU2", "HU2"),
-    ("HU20", "HU20"),
-    ("HU3", "HU3"),
-    ("HU4", "HU4"),
-    ("HU5", "HU5"),
-    ("HU6", "HU6"),
-    ("HU7", "HU7"),
-    ("HU8", "HU8"),
-    ("HU9", "HU9"),
-    ("HX1", "HX1"),
-    ("HX2", "HX2"),
-    ("HX3", "HX3"),
-    ("HX4", "HX4"),
-    ("HX5", "HX5"),
-    ("HX6", "HX6"),
-    ("HX7", "HX7"),
-    ("IG1", "IG1"),
-    ("IG10", "IG10"),
-    ("IG11", "IG11"),
-    ("IG2", "IG2"),
-    ("IG3", "IG3"),
-    ("IG4", "IG4"),
-    ("IG5", "IG5"),
-    ("IG6", "IG6"),
-    ("IG7", "IG7"),
-    ("IG8", "IG8"),
-    ("IG9", "IG9"),
-    ("IM1", "IM1"),
-    ("IM2", "IM2"),
-    ("IM3", "IM3"),
-    ("IM4", "IM4"),
-    ("IM5", "IM5"),
-    ("IM6", "IM6"),
-    ("IM7", "IM7"),
-    ("IM8", "IM8"),
-    ("IM9", "IM9"),
-    ("IP1", "IP1"),
-    ("IP10", "IP10"),
-    ("IP11", "IP11"),
-    ("IP12", "IP12"),
-    ("IP13", "IP13"),
-    ("IP14", "IP14"),
-    ("IP15", "IP15"),
-    ("IP16", "IP16"),
-    ("IP17", "IP17"),
-    ("IP18", "IP18"),
-    ("IP19", "IP19"),
-    ("IP2", "IP2"),
-    ("IP20", "IP20"),
-    ("IP21", "IP21"),
-    ("IP22", "IP22"),
-    ("IP23", "IP23"),
-    ("IP24", "IP24"),
-    ("IP25", "IP25"),
-    ("IP26", "IP26"),
-    ("IP27", "IP27"),
-    ("IP28", "IP28"),
-    ("IP29", "IP29"),
-    ("IP3", "IP3"),
-    ("IP30", "IP30"),
-    ("IP31", "IP31"),
-    ("IP32", "IP32"),
-    ("IP33", "IP33"),
-    ("IP4", "IP4"),
-    ("IP5", "IP5"),
-    ("IP6", "IP6"),
-    ("IP7", "IP7"),
-    ("IP8", "IP8"),
-    ("IP9", "IP9"),
-    ("IV1", "IV1"),
-    ("IV10", "IV10"),
-    ("IV11", "IV11"),
-    ("IV12", "IV12"),
-    ("IV13", "IV13"),
-    ("IV14", "IV14"),
-    ("IV15", "IV15"),
-    ("IV16", "IV16"),
-    ("IV17", "IV17"),
-    ("IV18", "IV18"),
-    ("IV19", "IV19"),
-    ("IV2", "IV2"),
-    ("IV20", "IV20"),
-    ("IV21", "IV21"),
-    ("IV22", "IV22"),
-    ("IV23", "IV23"),
-    ("IV24", "IV24"),
-    ("IV25", "IV25"),
-    ("IV26", "IV26"),
-    ("IV27", "IV27"),
-    ("IV28", "IV28"),
-    ("IV3", "IV3"),
-    ("IV30", "IV30"),
-    ("IV31", "IV31"),
-    ("IV32", "IV32"),
-    ("IV36", "IV36"),
-    ("IV4", "IV4"),
-    ("IV40", "IV40"),
-    ("IV41", "IV41"),
-    ("IV42", "IV42"),
-    ("IV43", "IV43"),
-    ("IV44", "IV44"),
-    ("IV45", "IV45"),
-    ("IV46", "IV46"),
-    ("IV47", "IV47"),
-    ("IV48", "IV48"),
-    ("IV49", "IV49"),
-    ("IV5", "IV5"),
-    ("IV51", "IV51"),
-    ("IV52", "IV52"),
-    ("IV53", "IV53"),
-    ("IV54", "IV54"),
-    ("IV55", "IV55"),
-    ("IV56", "IV56"),
-    ("IV6", "IV6"),
-    ("IV63", "IV63"),
-    ("IV7", "IV7"),
-    ("IV8", "IV8"),
-    ("IV9", "IV9"),
-    ("JE1", "JE1"),
-    ("JE2", "JE2"),
-    ("JE3", "JE3"),
-    ("JE4", "JE4"),
-    ("KA1", "KA1"),
-    ("KA10", "KA10"),
-    ("KA11", "KA11"),
-    ("KA12", "KA12"),
-    ("KA13", "KA13"),
-    ("KA14", "KA14"),
-    ("KA15", "KA15"),
-    ("KA16", "KA16"),
-    ("KA17", "KA17"),
-    ("KA18", "KA18"),
-    ("KA19", "KA19"),
-    ("KA2", "KA2"),
-    ("KA20", "KA20"),
-    ("KA21", "KA21"),
-    ("KA22", "KA22"),
-    ("KA23", "KA23"),
-    ("KA24", "KA24"),
-    ("KA25", "KA25"),
-    ("KA26", "KA26"),
-    ("KA27", "KA27"),
-    ("KA28", "KA28"),
-    ("KA29", "KA29"),
-    ("KA3", "KA3"),
-    ("KA30", "KA30"),
-    ("KA4", "KA4"),
-    ("KA5", "KA5"),
-    ("KA6", "KA6"),
-    ("KA7", "KA7"),
-    ("KA8", "KA8"),
-    ("KA9", "KA9"),
-    ("KT1", "KT1"),
-    ("KT10", "KT10"),
-    ("KT11", "KT11"),
-    ("KT12", "KT12"),
-    ("KT13", "KT13"),
-    ("KT14", "KT14"),
-    ("KT15", "KT15"),
-    ("KT16", "KT16"),
-    ("KT17", "KT17"),
-    ("KT18", "KT18"),
-    ("KT19", "KT19"),
-    ("KT2", "KT2"),
-    ("KT20", "KT20"),
-    ("KT21", "KT21"),
-    ("KT22", "KT22"),
-    ("KT23", "KT23"),
-    ("KT24", "KT24"),
-    ("KT3", "KT3"),
-    ("KT4", "KT4"),
-    ("KT5", "KT5"),
-    ("KT6", "KT6"),
-    ("KT7", "KT7"),
-    ("KT8", "KT8"),
-    ("KT9", "KT9"),
-    ("KW1", "KW1"),
-    ("KW10", "KW10"),
-    ("KW11", "KW11"),
-    ("KW12", "KW12"),
-    ("KW13", "KW13"),
-    ("KW14", "KW14"),
-    ("KW15", "KW15"),
-    ("KW16", "KW16"),
-    ("KW17", "KW17"),
-    ("KW2", "KW2"),
-    ("KW3", "KW3"),
-    ("KW5", "KW5"),
-    ("KW6", "KW6"),
-    ("KW7", "KW7"),
-    ("KW8", "KW8"),
-    ("KW9", "KW9"),
-    ("KY1", "KY1"),
-    ("KY10", "KY10"),
-    ("KY11", "KY11"),
-    ("KY12", "KY12"),
-    ("KY13", "KY13"),
-    ("KY14", "KY14"),
-    ("KY15", "KY15"),
-    ("KY16", "KY16"),
-    ("KY2", "KY2"),
-    ("KY3", "KY3"),
-    ("KY4", "KY4"),
-    ("KY5", "KY5"),
-    ("KY6", "KY6"),
-    ("KY7", "KY7"),
-    ("KY8", "KY8"),
-    ("KY9", "KY9"),
-    ("L1", "L1"),
-    ("L10", "L10"),
-    ("L11", "L11"),
-    ("L12", "L12"),
-    ("L13", "L13"),
-    ("L14", "L14"),
-    ("L15", "L15"),
-    ("L16", "L16"),
-    ("L17", "L17"),
-    ("L18", "L18"),
-    ("L19", "L19"),
-    ("L2", "L2"),
-    ("L20", "L20"),
-    ("L21", "L21"),
-    ("L22", "L22"),
-    ("L23", "L23"),
-    ("L24", "L24"),
-    ("L25", "L25"),
-    ("L26", "L26"),
-    ("L27", "L27"),
-    ("L28", "L28"),
-    ("L29", "L29"),
-    ("L3", "L3"),
-    ("L30", "L30"),
-    ("L31", "L31"),
-    ("L32", "L32"),
-    ("L33", "L33"),
-    ("L34", "L34"),
-    ("L35", "L35"),
-    ("L36", "L36"),
-    ("L37", "L37"),
-    ("L38", "L38"),
-    ("L39", "L39"),
-    ("L4", "L4"),
-    ("L40", "L40"),
-    ("L5", "L5"),
-    ("L6", "L6"),
-    ("L69", "L69"),
-    ("L7", "L7"),
-    ("L70", "L70"),
-    ("L8", "L8"),
-    ("L9", "L9"),
-    ("LA1", "LA1"),
-    ("LA10", "LA10"),
-    ("LA11", "LA11"),
-    ("LA12", "LA12"),
-    ("LA13", "LA13"),
-    ("LA14", "LA14"),
-    ("LA15", "LA15"),
-    ("LA16", "LA16"),
-    ("LA17", "LA17"),
-    ("LA18", "LA18"),
-    ("LA19", "LA19"),
-    ("LA2", "LA2"),
-    ("LA20", "LA20"),
-    ("LA21", "LA21"),
-    ("LA22", "LA22"),
-    ("LA23", "LA23"),
-    ("LA3", "LA3"),
-    ("LA4", "LA4"),
-    ("LA5", "LA5"),
-    ("LA6", "LA6"),
-    ("LA7", "LA7"),
-    ("LA8", "LA8"),
-    ("LA9", "LA9"),
-    ("LD1", "LD1"),
-    ("LD2", "LD2"),
-    ("LD3", "LD3"),
-    ("LD4", "LD4"),
-    ("LD5", "LD5"),
-    ("LD6", "LD6"),
-    ("LD7", "LD7"),
-    ("LD8", "LD8"),
-    ("LE1", "LE1"),
-    ("LE10", "LE10"),
-    ("LE11", "LE11"),
-    ("LE12", "LE12"),
-    ("LE13", "LE13"),
-    ("LE14", "LE14"),
-    ("LE15", "LE15"),
-    ("LE16", "LE16"),
-    ("LE17", "LE17"),
-    ("LE18", "LE18"),
-    ("LE19", "LE19"),
-    ("LE2", "LE2"),
-    ("LE3", "LE3"),
-    ("LE4", "LE4"),
-    ("LE5", "LE5"),
-    ("LE6", "LE6"),
-    ("LE65", "LE65"),
-    ("LE67", "LE67"),
-    ("LE7", "LE7"),
-    ("LE8", "LE8"),
-    ("LE9", "LE9"),
-    ("LL11", "LL11"),
-    ("LL12", "LL12"),
-    ("LL13", "LL13"),
-    ("LL14", "LL14"),
-    ("LL15", "LL15"),
-    ("LL16", "LL16"),
-    ("LL17", "LL17"),
-    ("LL18", "LL18"),
-    ("LL19", "LL19"),
-    ("LL20", "LL20"),
-    ("LL21", "LL21"),
-    ("LL22", "LL22"),
-    ("LL23", "LL23"),
-    ("LL24", "LL24"),
-    ("LL25", "LL25"),
-    ("LL26", "LL26"),
-    ("LL27", "LL27"),
-    ("LL28", "LL28"),
-    ("LL29", "LL29"),
-    ("LL30", "LL30"),
-    ("LL31", "LL31"),
-    ("LL32", "LL32"),
-    ("LL33", "LL33"),
-    ("LL34", "LL34"),
-    ("LL35", "LL35"),
-    ("LL36", "LL36"),
-    ("LL37", "LL37"),
-    ("LL38", "LL38"),
-    ("LL39", "LL39"),
-    ("LL40", "LL40"),
-    ("LL41", "LL41"),
-    ("LL42", "LL42"),
-    ("LL43", "LL43"),
-    ("LL44", "LL44"),
-    ("LL45", "LL45"),
-    ("LL46", "LL46"),
-    ("LL47", "LL47"),
-    ("LL48", "LL48"),
-    ("LL49", "LL49"),
-    ("LL51", "LL51"),
-    ("LL52", "LL52"),
-    ("LL53", "LL53"),
-    ("LL54", "LL54"),
-    ("LL55", "LL55"),
-    ("LL56", "LL56"),
-    ("LL57", "LL57"),
-    ("LL58", "LL58"),
-    ("LL59", "LL59"),
-    ("LL60", "LL60"),
-    ("LL61", "LL61"),
-    ("LL62", "LL62"),
-    ("LL63", "LL63"),
-    ("LL64", "LL64"),
-    ("LL65", "LL65"),
-    ("LL66", "LL66"),
-    ("LL67", "LL67"),
-    ("LL68", "LL68"),
-    ("LL69", "LL69"),
-    ("LL70", "LL70"),
-    ("LL71", "LL71"),
-    ("LL72", "LL72"),
-    ("LL73", "LL73"),
-    ("LL74", "LL74"),
-    ("LL75", "LL75"),
-    ("LL76", "LL76"),
-    ("LL77", "LL77"),
-    ("LL78", "LL78"),
-    ("LN1", "LN1"),
-    ("LN10", "LN10"),
-    ("LN11", "LN11"),
-    ("LN12", "LN12"),
-    ("LN13", "LN13"),
-    ("LN2", "LN2"),
-    ("LN3", "LN3"),
-    ("LN4", "LN4"),
-    ("LN5", "LN5"),
-    ("LN6", "LN6"),
-    ("LN7", "LN7"),
-    ("LN8", "LN8"),
-    ("LN9", "LN9"),
-    ("LS1", "LS1"),
-    ("LS10", "LS10"),
-    ("LS11", "LS11"),
-    ("LS12", "LS12"),
-    ("LS13", "LS13"),
-    ("LS14", "LS14"),
-    ("LS15", "LS15"),
-    ("LS16", "LS16"),
-    ("LS17", "LS17"),
-    ("LS18", "LS18"),
-    ("LS19", "LS19"),
-    ("LS2", "LS2"),
-    ("LS20", "LS20"),
-    ("LS21", "LS21"),
-    ("LS22", "LS22"),
-    ("LS23", "LS23"),
-    ("LS24", "LS24"),
-    ("LS25", "LS25"),
-    ("LS26", "LS26"),
-    ("LS27", "LS27"),
-    ("LS28", "LS28"),
-    ("LS29", "LS29"),
-    ("LS3", "LS3"),
-    ("LS4", "LS4"),
-    ("LS5", "LS5"),
-    ("LS6", "LS6"),
-    ("LS7", "LS7"),
-    ("LS8", "LS8"),
-    ("LS9", "LS9"),
-    ("LU1", "LU1"),
-    ("LU2", "LU2"),
-    ("LU3", "LU3"),
-    ("LU4", "LU4"),
-    ("LU5", "LU5"),
-    ("LU6", "LU6"),
-    ("LU7", "LU7"),
-    ("M1", "M1"),
-    ("M11", "M11"),
-    ("M12", "M12"),
-    ("M13", "M13"),
-    ("M14", "M14"),
-    ("M15", "M15"),
-    ("M16", "M16"),
-    ("M17", "M17"),
-    ("M18", "M18"),
-    ("M19", "M19"),
-    ("M2", "M2"),
-    ("M20", "M20"),
-    ("M21", "M21"),
-    ("M22", "M22"),
-    ("M23", "M23"),
-    ("M24", "M24"),
-    ("M25", "M25"),
-    ("M26", "M26"),
-    ("M27", "M27"),
-    ("M28", "M28"),
-    ("M29", "M29"),
-    ("M3", "M3"),
-    ("M30", "M30"),
-    ("M31", "M31"),
-    ("M32", "M32"),
-    ("M33", "M33"),
-    ("M34", "M34"),
-    ("M35", "M35"),
-    ("M38", "M38"),
-    ("M4", "M4"),
-    ("M40", "M40"),
-    ("M41", "M41"),
-    ("M43", "M43"),
-    ("M44", "M44"),
-    ("M45", "M45"),
-    ("M46", "M46"),
-    ("M5", "M5"),
-    ("M6", "M6"),
-    ("M60", "M60"),
-    ("M7", "M7"),
-    ("M8", "M8"),
-    ("M9", "M9"),
-    ("M90", "M90"),
-    ("ME1", "ME1"),
-    ("ME10", "ME10"),
-    ("ME11", "ME11"),
-    ("ME12", "ME12"),
-    ("ME13", "ME13"),
-    ("ME14", "ME14"),
-    ("ME15", "ME15"),
-    ("ME16", "ME16"),
-    ("ME17", "ME17"),
-    ("ME18", "ME18"),
-    ("ME19", "ME19"),
-    ("ME2", "ME2"),
-    ("ME20", "ME20"),
-    ("ME3", "ME3"),
-    ("ME4", "ME4"),
-    ("ME5", "ME5"),
-    ("ME6", "ME6"),
-    ("ME7", "ME7"),
-    ("ME8", "ME8"),
-    ("ME9", "ME9"),
-    ("MK1", "MK1"),
-    ("MK10", "MK10"),
-    ("MK11", "MK11"),
-    ("MK12", "MK12"),
-    ("MK13", "MK13"),
-    ("MK14", "MK14"),
-    ("MK15", "MK15"),
-    ("MK16", "MK16"),
-    ("MK17", "MK17"),
-    ("MK18", "MK18"),
-    ("MK19", "MK19"),
-    ("MK2", "MK2"),
-    ("MK3", "MK3"),
-    ("MK4", "MK4"),
-    ("MK40", "MK40"),
-    ("MK41", "MK41"),
-    ("MK42", "MK42"),
-    ("MK43", "MK43"),
-    ("MK44", "MK44"),
-    ("MK45", "MK45"),
-    ("MK46", "MK46"),
-    ("MK5", "MK5"),
-    ("MK6", "MK6"),
-    ("MK7", "MK7"),
-    ("MK8", "MK8"),
-    ("MK9", "MK9"),
-    ("ML1", "ML1"),
-    ("ML10", "ML10"),
-    ("ML11", "ML11"),
-    ("ML12", "ML12"),
-    ("ML2", "ML2"),
-    ("ML3", "ML3"),
-    ("ML4", "ML4"),
-    ("ML5", "ML5"),
-    ("ML6", "ML6"),
-    ("ML7", "ML7"),
-    ("ML8", "ML8"),
-    ("ML9", "ML9"),
-    ("N1", "N1"),
-    ("N10", "N10"),
-    ("N11", "N11"),
-    ("N12", "N12"),
-    ("N13", "N13"),
-    ("N14", "N14"),
-    ("N15", "N15"),
-    ("N16", "N16"),
-    ("N17", "N17"),
-    ("N18", "N18"),
-    ("N19", "N19"),
-    ("N2", "N2"),
-    ("N20", "N20"),
-    ("N21", "N21"),
-    ("N22", "N22"),
-    ("N3", "N3"),
-    ("N4", "N4"),
-    ("N5", "N5"),
-    ("N6", "N6"),
-    ("N7", "N7"),
-    ("N8", "N8"),
-    ("N9", "N9"),
-    ("NE1", "NE1"),
-    ("NE10", "NE10"),
-    ("NE11", "NE11"),
-    ("NE12", "NE12"),
-    ("NE13", "NE13"),
-    ("NE15", "NE15"),
-    ("NE16", "NE16"),
-    ("NE17", "NE17"),
-    ("NE18", "NE18"),
-    ("NE19", "NE19"),
-    ("NE2", "NE2"),
-    ("NE20", "NE20"),
-    ("NE21", "NE21"),
-    ("NE22", "NE22"),
-    ("NE23", "NE23"),
-    ("NE24", "NE24"),
-    ("NE25", "NE25"),
-    ("NE26", "NE26"),
-    ("NE27", "NE27"),
-    ("NE28", "NE28"),
-    ("NE29", "NE29"),
-    ("NE3", "NE3"),
-    ("NE30", "NE30"),
-    ("NE31", "NE31"),
-    ("NE32", "NE32"),
-    ("NE33", "NE33"),
-    ("NE34", "NE34"),
-    ("NE35", "NE35"),
-    ("NE36", "NE36"),
-    ("NE37", "NE37"),
-    ("NE38", "NE38"),
-    ("NE39", "NE39"),
-    ("NE4", "NE4"),
-    ("NE40", "NE40"),
-    ("NE41", "NE41"),
-    ("NE42", "NE42"),
-    ("NE43", "NE43"),
-    ("NE44", "NE44"),
-    ("NE45", "NE45"),
-    ("NE46", "NE46"),
-    ("NE47", "NE47"),
-    ("NE48", "NE48"),
-    ("NE49", "NE49"),
-    ("NE5", "NE5"),
-    ("NE6", "NE6"),
-    ("NE61", "NE61"),
-    ("NE62", "NE62"),
-    ("NE63", "NE63"),
-    ("NE64", "NE64"),
-    ("NE65", "NE65"),
-    ("NE66", "NE66"),
-    ("NE67", "NE67"),
-    ("NE68", "NE68"),
-    ("NE69", "NE69"),
-    ("NE7", "NE7"),
-    ("NE70", "NE70"),
-    ("NE71", "NE71"),
-    ("NE8", "NE8"),
-    ("NE9", "NE9"),
-    ("NE99", "NE99"),
-    ("NG1", "NG1"),
-    ("NG10", "NG10"),
-    ("NG11", "NG11"),
-    ("NG12", "NG12"),
-    ("NG13", "NG13"),
-    ("NG14", "NG14"),
-    ("NG15", "NG15"),
-    ("NG16", "NG16"),
-    ("NG17", "NG17"),
-    ("NG18", "NG18"),
-    ("NG19", "NG19"),
-    ("NG2", "NG2"),
-    ("NG20", "NG20"),
-    ("NG21", "NG21"),
-    ("NG22", "NG22"),
-    ("NG23", "NG23"),
-    ("NG24", "NG24"),
-    ("NG25", "NG25"),
-    ("NG3", "NG3"),
-    ("NG31", "NG31"),
-    ("NG32", "NG32"),
-    ("NG33", "NG33"),
-    ("NG34", "NG34"),
-    ("NG4", "NG4"),
-    ("NG5", "NG5"),
-    ("NG6", "NG6"),
-    ("NG7", "NG7"),
-    ("NG8", "NG8"),
-    ("NG9", "NG9"),
-    ("NN1", "NN1"),
-    ("NN10", "NN10"),
-    ("NN11", "NN11"),
-    ("NN12", "NN12"),
-    ("NN13", "NN13"),
-    ("NN14", "NN14"),
-    ("NN15", "NN15"),
-    ("NN16", "NN16"),
-    ("NN17", "NN17"),
-    ("NN18", "NN18"),
-    ("NN2", "NN2"),
-    ("NN29", "NN29"),
-    ("NN3", "NN3"),
-    ("NN4", "NN4"),
-    ("NN5", "NN5"),
-    ("NN6", "NN6"),
-    ("NN7", "NN7"),
-    ("NN8", "NN8"),
-    ("NN9", "NN9"),
-    ("NP10", "NP10"),
-    ("NP11", "NP11"),
-    ("NP12", "NP12"),
-    ("NP13", "NP13"),
-    ("NP15", "NP15"),
-    ("NP16", "NP16"),
-    ("NP18", "NP18"),
-    ("NP19", "NP19"),
-    ("NP20", "NP20"),
-    ("NP22", "NP22"),
-    ("NP23", "NP23"),
-    ("NP24", "NP24"),
-    ("NP25", "NP25"),
-    ("NP26", "NP26"),
-    ("NP4", "NP4"),
-    ("NP44", "NP44"),
-    ("NP7", "NP7"),
-    ("NP8", "NP8"),
-    ("NR1", "NR1"),
-    ("NR10", "NR10"),
-    ("NR11", "NR11"),
-    ("NR12", "NR12"),
-    ("NR13", "NR13"),
-    ("NR14", "NR14"),
-    ("NR15", "NR15"),
-    ("NR16", "NR16"),
-    ("NR17", "NR17"),
-    ("NR18", "NR18"),
-    ("NR19", "NR19"),
-    ("NR2", "NR2"),
-    ("NR20", "NR20"),
-    ("NR21", "NR21"),
-    ("NR22", "NR22"),
-    ("NR23", "NR23"),
-    ("NR24", "NR24"),
-    ("NR25", "NR25"),
-    ("NR26", "NR26"),
-    ("NR27", "NR27"),
-    ("NR28", "NR28"),
-    ("NR29", "NR29"),
-    ("NR3", "NR3"),
-    ("NR30", "NR30"),
-    ("NR31", "NR31"),
-    ("NR32", "NR32"),
-    ("NR33", "NR33"),
-    ("NR34", "NR34"),
-    ("NR35", "NR35"),
-    ("NR4", "NR4"),
-    ("NR5", "NR5"),
-    ("NR6", "NR6"),
-    ("NR7", "NR7"),
-    ("NR8", "NR8"),
-    ("NR9", "NR9"),
-    ("NW1", "NW1"),
-    ("NW10", "NW10"),
-    ("NW11", "NW11"),
-    ("NW2", "NW2"),
-    ("NW3", "NW3"),
-    ("NW4", "NW4"),
-    ("NW5", "NW5"),
-    ("NW6", "NW6"),
-    ("NW7", "NW7"),
-    ("NW8", "NW8"),
-    ("NW9", "NW9"),
-    ("OL1", "OL1"),
-    ("OL10", "OL10"),
-    ("OL11", "OL11"),
-    ("OL12", "OL12"),
-    ("OL13", "OL13"),
-    ("OL14", "OL14"),
-    ("OL15", "OL15"),
-    ("OL16", "OL16"),
-    ("OL2", "OL2"),
-    ("OL3", "OL3"),
-    ("OL4", "OL4"),
-    ("OL5", "OL5"),
-    ("OL6", "OL6"),
-    ("OL7", "OL7"),
-    ("OL8", "OL8"),
-    ("OL9", "OL9"),
-    ("OX1", "OX1"),
-    ("OX10", "OX10"),
-    ("OX11", "OX11"),
-    ("OX12", "OX12"),
-    ("OX13", "OX13"),
-    ("OX14", "OX14"),
-    ("OX15", "OX15"),
-    ("OX16", "OX16"),
-    ("OX17", "OX17"),
-    ("OX18", "OX18"),
-    ("OX2", "OX2"),
-    ("OX20", "OX20"),
-    ("OX25", "OX25"),
-    ("OX26", "OX26"),
-    ("OX27", "OX27"),
-    ("OX28", "OX28"),
-    ("OX29", "OX29"),
-    ("OX3", "OX3"),
-    ("OX33", "OX33"),
-    ("OX39", "OX39"),
-    ("OX4", "OX4"),
-    ("OX44", "OX44"),
-    ("OX49", "OX49"),
-    ("OX5", "OX5"),
-    ("OX6", "OX6"),
-    ("OX7", "OX7"),
-    ("OX8", "OX8"),
-    ("OX9", "OX9"),
-    ("PA1", "PA1"),
-    ("PA10", "PA10"),
-    ("PA11", "PA11"),
-    ("PA12", "PA12"),
-    ("PA13", "PA13"),
-    ("PA14", "PA14"),
-    ("PA15", "PA15"),
-    ("PA16", "PA16"),
-    ("PA17", "PA17"),
-    ("PA18", "PA18"),
-    ("PA19", "PA19"),
-    ("PA2", "PA2"),
-    ("PA20", "PA20"),
-    ("PA21", "PA21"),
-    ("PA22", "PA22"),
-    ("PA23", "PA23"),
-    ("PA24", "PA24"),
-    ("PA25", "PA25"),
-    ("PA26", "PA26"),
-    ("PA27", "PA27"),
-    ("PA28", "PA28"),
-    ("PA29", "PA29"),
-    ("PA3", "PA3"),
-    ("PA30", "PA30"),
-    ("PA31", "PA31"),
-    ("PA32", "PA32"),
-    ("PA33", "PA33"),
-    ("PA34", "PA34"),
-    ("PA35", "PA35"),
-    ("PA36", "PA36"),
-    ("PA37", "PA37"),
-    ("PA38", "PA38"),
-    ("PA4", "PA4"),
-    ("PA41", "PA41"),
-    ("PA42", "PA42"),
-    ("PA43", "PA43"),
-    ("PA44", "PA44"),
-    ("PA45", "PA45"),
-    ("PA46", "PA46"),
-    ("PA47", "PA47"),
-    ("PA48", "PA48"),
-    ("PA49", "PA49"),
-    ("PA5", "PA5"),
-    ("PA6", "PA6"),
-    ("PA60", "PA60"),
-    ("PA61", "PA61"),
-    ("PA62", "PA62"),
-    ("PA63", "PA63"),
-    ("PA64", "PA64"),
-    ("PA65", "PA65"),
-    ("PA66", "PA66"),
-    ("PA67", "PA67"),
-    ("PA68", "PA68"),
-    ("PA69", "PA69"),
-    ("PA7", "PA7"),
-    ("PA70", "PA70"),
-    ("PA71", "PA71"),
-    ("PA72", "PA72"),
-    ("PA73", "PA73"),
-    ("PA74", "PA74"),
-    ("PA75", "PA75"),
-    ("PA76", "PA76"),
-    ("PA77", "PA77"),
-    ("PA78", "PA78"),
-    ("PA8", "PA8"),
-    ("PA9", "PA9"),
-    ("PE1", "PE1"),
-    ("PE10", "PE10"),
-    ("PE11", "PE11"),
-    ("PE12", "PE12"),
-    ("PE13", "PE13"),
-    ("PE14", "PE14"),
-    ("PE15", "PE15"),
-    ("PE16", "PE16"),
-    ("PE19", "PE19"),
-    ("PE2", "PE2"),
-    ("PE20", "PE20"),
-    ("PE21", "PE21"),
-    ("PE22", "PE22"),
-    ("PE23", "PE23"),
-    ("PE24", "PE24"),
-    ("PE25", "PE25"),
-    ("PE26", "PE26"),
-    ("PE27", "PE27"),
-    ("PE28", "PE28"),
-    ("PE29", "PE29"),
-    ("PE3", "PE3"),
-    ("PE30", "PE30"),
-    ("PE31", "PE31"),
-    ("PE32", "PE32"),
-    ("PE33", "PE33"),
-    ("PE34", "PE34"),
-    ("PE35", "PE35"),
-    ("PE36", "PE36"),
-    ("PE37", "PE37"),
-    ("PE38", "PE38"),
-    ("PE4", "PE4"),
-    ("PE5", "PE5"),
-    ("PE6", "PE6"),
-    ("PE7", "PE7"),
-    ("PE8", "PE8"),
-    ("PE9", "PE9"),
-    ("PH1", "PH1"),
-    ("PH10", "PH10"),
-    ("PH11", "PH11"),
-    ("PH12", "PH12"),
-    ("PH13", "PH13"),
-    ("PH14", "PH14"),
-    ("PH15", "PH15"),
-    ("PH16", "PH16"),
-    ("PH17", "PH17"),
-    ("PH18", "PH18"),
-    ("PH19", "PH19"),
-    ("PH2", "PH2"),
-    ("PH20", "PH20"),
-    ("PH21", "PH21"),
-    ("PH22", "PH22"),
-    ("PH23", "PH23"),
-    ("PH24", "PH24"),
-    ("PH25", "PH25"),
-    ("PH26", "PH26"),
-    ("PH3", "PH3"),
-    ("PH30", "PH30"),
-    ("PH31", "PH31"),
-    ("PH32", "PH32"),
-    ("PH33", "PH33"),
-    ("PH34", "PH34"),
-    ("PH35", "PH35"),
-    ("PH36", "PH36"),
-    ("PH38", "PH38"),
-    ("PH39", "PH39"),
-    ("PH4", "PH4"),
-    ("PH40", "PH40"),
-    ("PH41", "PH41"),
-    ("PH42", "PH42"),
-    ("PH43", "PH43"),
-    ("PH44", "PH44"),
-    ("PH49", "PH49"),
-    ("PH5", "PH5"),
-    ("PH50", "PH50"),
-    ("PH6", "PH6"),
-    ("PH7", "PH7"),
-    ("PH8", "PH8"),
-    ("PH9", "PH9"),
-    ("PL1", "PL1"),
-    ("PL10", "PL10"),
-    ("PL11", "PL11"),
-    ("PL12", "PL12"),
-    ("PL13", "PL13"),
-    ("PL14", "PL14"),
-    ("PL15", "PL15"),
-    ("PL16", "PL16"),
-    ("PL17", "PL17"),
-    ("PL18", "PL18"),
-    ("PL19", "PL19"),
-    ("PL2", "PL2"),
-    ("PL20", "PL20"),
-    ("PL21", "PL21"),
-    ("PL22", "PL22"),
-    ("PL23", "PL23"),
-    ("PL24", "PL24"),
-    ("PL25", "PL25"),
-    ("PL26", "PL26"),
-    ("PL27", "PL27"),
-    ("PL28", "PL28"),
-    ("PL29", "PL29"),
-    ("PL3", "PL3"),
-    ("PL30", "PL30"),
-    ("PL31", "PL31"),
-    ("PL32", "PL32"),
-    ("PL33", "PL33"),
-    ("PL34", "PL34"),
-    ("PL35", "PL35"),
-    ("PL4", "PL4"),
-    ("PL5", "PL5"),
-    ("PL6", "PL6"),
-    ("PL7", "PL7"),
-    ("PL8", "PL8"),
-    ("PL9", "PL9"),
-    ("PO1", "PO1"),
-    ("PO10", "PO10"),
-    ("PO11", "PO11"),
-    ("PO12", "PO12"),
-    ("PO13", "PO13"),
-    ("PO14", "PO14"),
-    ("PO15", "PO15"),
-    ("PO16", "PO16"),
-    ("PO17", "PO17"),
-    ("PO18", "PO18"),
-    ("PO19", "PO19"),
-    ("PO2", "PO2"),
-    ("PO20", "PO20"),
-    ("PO21", "PO21"),
-    ("PO22", "PO22"),
-    ("PO3", "PO3"),
-    ("PO30", "PO30"),
-    ("PO31", "PO31"),
-    ("PO32", "PO32"),
-    ("PO33", "PO33"),
-    ("PO34", "PO34"),
-    ("PO35", "PO35"),
-    ("PO36", "PO36"),
-    ("PO37", "PO37"),
-    ("PO38", "PO38"),
-    ("PO39", "PO39"),
-    ("PO4", "PO4"),
-    ("PO40", "PO40"),
-    ("PO41", "PO41"),
-    ("PO5", "PO5"),
-    ("PO6", "PO6"),
-    ("PO7", "PO7"),
-    ("PO8", "PO8"),
-    ("PO9", "PO9"),
-    ("PR1", "PR1"),
-    ("PR2", "PR2"),
-    ("PR25", "PR25"),
-    ("PR26", "PR26"),
-    ("PR3", "PR3"),
-    ("PR4", "PR4"),
-    ("PR5", "PR5"),
-    ("PR6", "PR6"),
-    ("PR7", "PR7"),
-    ("PR8", "PR8"),
-    ("PR9", "PR9"),
-    ("RG1", "RG1"),
-    ("RG10", "RG10"),
-    ("RG12", "RG12"),
-    ("RG14", "RG14"),
-    ("RG17", "RG17"),
-    ("RG18", "RG18"),
-    ("RG19", "RG19"),
-    ("RG2", "RG2"),
-    ("RG20", "RG20"),
-    ("RG21", "RG21"),
-    ("RG22", "RG22"),
-    ("RG23", "RG23"),
-    ("RG24", "RG24"),
-    ("RG25", "RG25"),
-    ("RG26", "RG26"),
-    ("RG27", "RG27"),
-    ("RG28", "RG28"),
-    ("RG29", "RG29"),
-    ("RG30", "RG30"),
-    ("RG31", "RG31"),
-    ("RG4", "RG4"),
-    ("RG40", "RG40"),
-    ("RG41", "RG41"),
-    ("RG42", "RG42"),
-    ("RG45", "RG45"),
-    ("RG5", "RG5"),
-    ("RG6", "RG6"),
-    ("RG7", "RG7"),
-    ("RG8", "RG8"),
-    ("RG9", "RG9"),
-    ("RH1", "RH1"),
-    ("RH10", "RH10"),
-    ("RH11", "RH11"),
-    ("RH12", "RH12"),
-    ("RH13", "RH13"),
-    ("RH14", "RH14"),
-    ("RH15", "RH15"),
-    ("RH16", "RH16"),
-    ("RH17", "RH17"),
-    ("RH18", "RH18"),
-    ("RH19", "RH19"),
-    ("RH2", "RH2"),
-    ("RH20", "RH20"),
-    ("RH3", "RH3"),
-    ("RH4", "RH4"),
-    ("RH5", "RH5"),
-    ("RH6", "RH6"),
-    ("RH7", "RH7"),
-    ("RH8", "RH8"),
-    ("RH9", "RH9"),
-    ("RM1", "RM1"),
-    ("RM10", "RM10"),
-    ("RM11", "RM11"),
-    ("RM12", "RM12"),
-    ("RM13", "RM13"),
-    ("RM14", "RM14"),
-    ("RM15", "RM15"),
-    ("RM16", "RM16"),
-    ("RM17", "RM17"),
-    ("RM18", "RM18"),
-    ("RM19", "RM19"),
-    ("RM2", "RM2"),
-    ("RM20", "RM20"),
-    ("RM3", "RM3"),
-    ("RM4", "RM4"),
-    ("RM5", "RM5"),
-    ("RM6", "RM6"),
-    ("RM7", "RM7"),
-    ("RM8", "RM8"),
-    ("RM9", "RM9"),
-    ("S1", "S1"),
-    ("S10", "S10"),
-    ("S11", "S11"),
-    ("S12", "S12"),
-    ("S13", "S13"),
-    ("S14", "S14"),
-    ("S17", "S17"),
-    ("S18", "S18"),
-    ("S2", "S2"),
-    ("S20", "S20"),
-    ("S21", "S21"),
-    ("S25", "S25"),
-    ("S26", "S26"),
-    ("S3", "S3"),
-    ("S32", "S32"),
-    ("S33", "S33"),
-    ("S35", "S35"),
-    ("S36", "S36"),
-    ("S4", "S4"),
-    ("S40", "S40"),
-    ("S41", "S41"),
-    ("S42", "S42"),
-    ("S43", "S43"),
-    ("S44", "S44"),
-    ("S45", "S45"),
-    ("S5", "S5"),
-    ("S6", "S6"),
-    ("S60", "S60"),
-    ("S61", "S61"),
-    ("S62", "S62"),
-    ("S63", "S63"),
-    ("S64", "S64"),
-    ("S65", "S65"),
-    ("S66", "S66"),
-    ("S7", "S7"),
-    ("S70", "S70"),
-    ("S71", "S71"),
-    ("S72", "S72"),
-    ("S73", "S73"),
-    ("S74", "S74"),
-    ("S75", "S75"),
-    ("S8", "S8"),
-    ("S80", "S80"),
-    ("S81", "S81"),
-    ("S9", "S9"),
-    ("SA1", "SA1"),
-    ("SA10", "SA10"),
-    ("SA11", "SA11"),
-    ("SA12", "SA12"),
-    ("SA13", "SA13"),
-    ("SA14", "SA14"),
-    ("SA15", "SA15"),
-    ("SA16", "SA16"),
-    ("SA17", "SA17"),
-    ("SA18", "SA18"),
-    ("SA19", "SA19"),
-    ("SA2", "SA2"),
-    ("SA20", "SA20"),
-    ("SA3", "SA3"),
-    ("SA31", "SA31"),
-    ("SA32", "SA32"),
-    ("SA33", "SA33"),
-    ("SA34", "SA34"),
-    ("SA35", "SA35"),
-    ("SA36", "SA36"),
-    ("SA37", "SA37"),
-    ("SA38", "SA38"),
-    ("SA39", "SA39"),
-    ("SA4", "SA4"),
-    ("SA40", "SA40"),
-    ("SA41", "SA41"),
-    ("SA42", "SA42"),
-    ("SA43", "SA43"),
-    ("SA44", "SA44"),
-    ("SA45", "SA45"),
-    ("SA46", "SA46"),
-    ("SA47", "SA47"),
-    ("SA48", "SA48"),
-    ("SA5", "SA5"),
-    ("SA6", "SA6"),
-    ("SA61", "SA61"),
-    ("SA62", "SA62"),
-    ("SA63", "SA63"),
-    ("SA64", "SA64"),
-    ("SA65", "SA65"),
-    ("SA66", "SA66"),
-    ("SA67", "SA67"),
-    ("SA68", "SA68"),
-    ("SA69", "SA69"),
-    ("SA7", "SA7"),
-    ("SA70", "SA70"),
-    ("SA71", "SA71"),
-    ("SA72", "SA72"),
-    ("SA73", "SA73"),
-    ("SA8", "SA8"),
-    ("SA9", "SA9"),
-    ("SE1", "SE1"),
-    ("SE10", "SE10"),
-    ("SE11", "SE11"),
-    ("SE12", "SE12"),
-    ("SE13", "SE13"),
-    ("SE14", "SE14"),
-    ("SE15", "SE15"),
-    ("SE16", "SE16"),
-    ("SE17", "SE17"),
-    ("SE18", "SE18"),
-    ("SE19", "SE19"),
-    ("SE2", "SE2"),
-    ("SE20", "SE20"),
-    ("SE21", "SE21"),
-    ("SE22", "SE22"),
-    ("SE23", "SE23"),
-    ("SE24", "SE24"),
-    ("SE25", "SE25"),
-    ("SE26", "SE26"),
-    ("SE27", "SE27"),
-    ("SE28", "SE28"),
-    ("SE3", "SE3"),
-    ("SE4", "SE4"),
-    ("SE5", "SE5"),
-    ("SE6", "SE6"),
-    ("SE7", "SE7"),
-    ("SE8", "SE8"),
-    ("SE9", "SE9"),
-    ("SG1", "SG1"),
-    ("SG10", "SG10"),
-    ("SG11", "SG11"),
-    ("SG12", "SG12"),
-    ("SG13", "SG13"),
-    ("SG14", "SG14"),
-    ("SG15", "SG15"),
-    ("SG16", "SG16"),
-    ("SG17", "SG17"),
-    ("SG18", "SG18"),
-    ("SG19", "SG19"),
-    ("SG2", "SG2"),
-    ("SG3", "SG3"),
-    ("SG4", "SG4"),
-    ("SG5", "SG5"),
-    ("SG6", "SG6"),
-    ("SG7", "SG7"),
-    ("SG8", "SG8"),
-    ("SG9", "SG9"),
-    ("SK1", "SK1"),
-    ("SK10", "SK10"),
-    ("SK11", "SK11"),
-    ("SK12", "SK12"),
-    ("SK13", "SK13"),
-    ("SK14", "SK14"),
-    ("SK15", "SK15"),
-    ("SK16", "SK16"),
-    ("SK17", "SK17"),
-    ("SK2", "SK2"),
-    ("SK22", "SK22"),
-    ("SK23", "SK23"),
-    ("SK3", "SK3"),
-    ("SK4", "SK4"),
-    ("SK5", "SK5"),
-    ("SK6", "SK6"),
-    ("SK7", "SK7"),
-    ("SK8", "SK8"),
-    ("SK9", "SK9"),
-    ("SL0", "SL0"),
-    ("SL1", "SL1"),
-    ("SL2", "SL2"),
-    ("SL3", "SL3"),
-    ("SL4", "SL4"),
-    ("SL5", "SL5"),
-    ("SL6", "SL6"),
-    ("SL7", "SL7"),
-    ("SL8", "SL8"),
-    ("SL9", "SL9"),
-    ("SM1", "SM1"),
-    ("SM2", "SM2"),
-    ("SM3", "SM3"),
-    ("SM4", "SM4"),
-    ("SM5", "SM5"),
-    ("SM6", "SM6"),
-    ("SM7", "SM7"),
-    ("SN1", "SN1"),
-    ("SN10", "SN10"),
-    ("SN11", "SN11"),
-    ("SN12", "SN12"),
-    ("SN13", "SN13"),
-    ("SN14", "SN14"),
-    ("SN15", "SN15"),
-    ("SN16", "SN16"),
-    ("SN2", "SN2"),
-    ("SN25", "SN25"),
-    ("SN26", "SN26"),
-    ("SN3", "SN3"),
-    ("SN4", "SN4"),
-    ("SN5", "SN5"),
-    ("SN6", "SN6"),
-    ("SN7", "SN7"),
-    ("SN8", "SN8"),
-    ("SN9", "SN9"),
-    ("SO14", "SO14"),
-    ("SO15", "SO15"),
-    ("SO16", "SO16"),
-    ("SO17", "SO17"),
-    ("SO18", "SO18"),
-    ("SO19", "SO19"),
-    ("SO20", "SO20"),
-    ("SO21", "SO21"),
-    ("SO22", "SO22"),
-    ("SO23", "SO23"),
-    ("SO24", "SO24"),
-    ("SO30", "SO30"),
-    ("SO31", "SO31"),
-    ("SO32", "SO32"),
-    ("SO40", "SO40"),
-    ("SO41", "SO41"),
-    ("SO42", "SO42"),
-    ("SO43", "SO43"),
-    ("SO45", "SO45"),
-    ("SO50", "SO50"),
-    ("SO51", "SO51"),
-    ("SO52", "SO52"),
-    ("SO53", "SO53"),
-    ("SP1", "SP1"),
-    ("SP10", "SP10"),
-    ("SP11", "SP11"),
-    ("SP2", "SP2"),
-    ("SP3", "SP3"),
-    ("SP4", "SP4"),
-    ("SP5", "SP5"),
-    ("SP6", "SP6"),
-    ("SP7", "SP7"),
-    ("SP8", "SP8"),
-    ("SP9", "SP9"),
-    ("SR1", "SR1"),
-    ("SR2", "SR2"),
-    ("SR3", "SR3"),
-    ("SR4", "SR4"),
-    ("SR5", "SR5"),
-    ("SR6", "SR6"),
-    ("SR7", "SR7"),
-    ("SR8", "SR8"),
-    ("SR9", "SR9"),
-    ("SS0", "SS0"),
-    ("SS1", "SS1"),
-    ("SS11", "SS11"),
-    ("SS12", "SS12"),
-    ("SS13", "SS13"),
-    ("SS14", "SS14"),
-    ("SS15", "SS15"),
-    ("SS16", "SS16"),
-    ("SS17", "SS17"),
-    ("SS2", "SS2"),
-    ("SS3", "SS3"),
-    ("SS4", "SS4"),
-    ("SS5", "SS5"),
-    ("SS6", "SS6"),
-    ("SS7", "SS7"),
-    ("SS8", "SS8"),
-    ("SS9", "SS9"),
-    ("ST1", "ST1"),
-    ("ST10", "ST10"),
-    ("ST11", "ST11"),
-    ("ST12", "ST12"),
-    ("ST13", "ST13"),
-    ("ST14", "ST14"),
-    ("ST15", "ST15"),
-    ("ST16", "ST16"),
-    ("ST17", "ST17"),
-    ("ST18", "ST18"),
-    ("ST19", "ST19"),
-    ("ST2", "ST2"),
-    ("ST20", "ST20"),
-    ("ST21", "ST21"),
-    ("ST3", "ST3"),
-    ("ST4", "ST4"),
-    ("ST5", "ST5"),
-    ("ST6", "ST6"),
-    ("ST7", "ST7"),
-    ("ST8", "ST8"),
-    ("ST9", "ST9"),
-    ("SW1", "SW1"),
-    ("SW10", "SW10"),
-    ("SW11", "SW11"),
-    ("SW12", "SW12"),
-    ("SW13", "SW13"),
-    ("SW14", "SW14"),
-    ("SW15", "SW15"),
-    ("SW16", "SW16"),
-    ("SW17", "SW17"),
-    ("SW18", "SW18"),
-    ("SW19", "SW19"),
-    ("SW1A", "SW1A"),
-    ("SW1E", "SW1E"),
-    ("SW1H", "SW1H"),
-    ("SW1P", "SW1P"),
-    ("SW1V", "SW1V"),
-    ("SW1W", "SW1W"),
-    ("SW1X", "SW1X"),
-    ("SW1Y", "SW1Y"),
-    ("SW2", "SW2"),
-    ("SW20", "SW20"),
-    ("SW3", "SW3"),
-    ("SW4", "SW4"),
-    ("SW5", "SW5"),
-    ("SW6", "SW6"),
-    ("SW7", "SW7"),
-    ("SW8", "SW8"),
-    ("SW9", "SW9"),
-    ("SY1", "SY1"),
-    ("SY10", "SY10"),
-    ("SY11", "SY11"),
-    ("SY12", "SY12"),
-    ("SY13", "SY13"),
-    ("SY14", "SY14"),
-    ("SY15", "SY15"),
-    ("SY16", "SY16"),
-    ("SY17", "SY17"),
-    ("SY18", "SY18"),
-    ("SY19", "SY19"),
-    ("SY2", "SY2"),
-    ("SY20", "SY20"),
-    ("SY21", "SY21"),
-    ("SY22", "SY22"),
-    ("SY23", "SY23"),
-    ("SY24", "SY24"),
-    ("SY25", "SY25"),
-    ("SY3", "SY3"),
-    ("SY4", "SY4"),
-    ("SY5", "SY5"),
-    ("SY6", "SY6"),
-    ("SY7", "SY7"),
-    ("SY8", "SY8"),
-    ("SY9", "SY9"),
-    ("TA1", "TA1"),
-    ("TA10", "TA10"),
-    ("TA11", "TA11"),
-    ("TA12", "TA12"),
-    ("TA13", "TA13"),
-    ("TA14", "TA14"),
-    ("TA15", "TA15"),
-    ("TA16", "TA16"),
-    ("TA17", "TA17"),
-    ("TA18", "TA18"),
-    ("TA19", "TA19"),
-    ("TA2", "TA2"),
-    ("TA20", "TA20"),
-    ("TA21", "TA21"),
-    ("TA22", "TA22"),
-    ("TA23", "TA23"),
-    ("TA24", "TA24"),
-    ("TA3", "TA3"),
-    ("TA4", "TA4"),
-    ("TA5", "TA5"),
-    ("TA6", "TA6"),
-    ("TA7", "TA7"),
-    ("TA8", "TA8"),
-    ("TA9", "TA9"),
-    ("TD1", "TD1"),
-    ("TD10", "TD10"),
-    ("TD11", "TD11"),
-    ("TD12", "TD12"),
-    ("TD13", "TD13"),
-    ("TD14", "TD14"),
-    ("TD15", "TD15"),
-    ("TD2", "TD2"),
-    ("TD3", "TD3"),
-    ("TD4", "TD4"),
-    ("TD5", "TD5"),
-    ("TD6", "TD6"),
-    ("TD7", "TD7"),
-    ("TD8", "TD8"),
-    ("TD9", "TD9"),
-    ("TF1", "TF1"),
-    ("TF10", "TF10"),
-    ("TF11", "TF11"),
-    ("TF12", "TF12"),
-    ("TF13", "TF13"),
-    ("TF2", "TF2"),
-    ("TF3", "TF3"),
-    ("TF4", "TF4"),
-    ("TF5", "TF5"),
-    ("TF6", "TF6"),
-    ("TF7", "TF7"),
-    ("TF8", "TF8"),
-    ("TF9", "TF9"),
-    ("TN1", "TN1"),
-    ("TN10", "TN10"),
-    ("TN11", "TN11"),
-    ("TN12", "TN12"),
-    ("TN13", "TN13"),
-    ("TN14", "TN14"),
-    ("TN15", "TN15"),
-    ("TN16", "TN16"),
-    ("TN17", "TN17"),
-    ("TN18", "TN18"),
-    ("TN19", "TN19"),
-    ("TN2", "TN2"),
-    ("TN20", "TN20"),
-    ("TN21", "TN21"),
-    ("TN22", "TN22"),
-    ("TN23", "TN23"),
-    ("TN24", "TN24"),
-    ("TN25", "TN25"),
-    ("TN26", "TN26"),
-    ("TN27", "TN27"),
-    ("TN28", "TN28"),
-    ("TN29", "TN29"),
-    ("TN3", "TN3"),
-    ("TN30", "TN30"),
-    ("TN31", "TN31"),
-    ("TN32", "TN32"),
-    ("TN33", "TN33"),
-    ("TN34", "TN34"),
-    ("TN35", "TN35"),
-    ("TN36", "TN36"),
-    ("TN37", "TN37"),
-    ("TN38", "TN38"),
-    ("TN39", "TN39"),
-    ("TN4", "TN4"),
-    ("TN40", "TN40"),
-    ("TN5", "TN5"),
-    ("TN6", "TN6"),
-    ("TN7", "TN7"),
-    ("TN8", "TN8"),
-    ("TN9", "TN9"),
-    ("TQ1", "TQ1"),
-    ("TQ10", "TQ10"),
-    ("TQ11", "TQ11"),
-    ("TQ12", "TQ12"),
-    ("TQ13", "TQ13"),
-    ("TQ14", "TQ14"),
-    ("TQ2", "TQ2"),
-    ("TQ3", "TQ3"),
-    ("TQ4", "TQ4"),
-    ("TQ5", "TQ5"),
-    ("TQ6", "TQ6"),
-    ("TQ7", "TQ7"),
-    ("TQ8", "TQ8"),
-    ("TQ9", "TQ9"),
-    ("TR1", "TR1"),
-    ("TR10", "TR10"),
-    ("TR11", "TR11"),
-    ("TR12", "TR12"),
-    ("TR13", "TR13"),
-    ("TR14", "TR14"),
-    ("TR15", "TR15"),
-    ("TR16", "TR16"),
-    ("TR17", "TR17"),
-    ("TR18", "TR18"),
-    ("TR19", "TR19"),
-    ("TR2", "TR2"),
-    ("TR20", "TR20"),
-    ("TR21", "TR21"),
-    ("TR22", "TR22"),
-    ("TR23", "TR23"),
-    ("TR24", "TR24"),
-    ("TR25", "TR25"),
-    ("TR26", "TR26"),
-    ("TR27", "TR27"),
-    ("TR3", "TR3"),
-    ("TR4", "TR4"),
-    ("TR5", "TR5"),
-    ("TR6", "TR6"),
-    ("TR7", "TR7"),
-    ("TR8", "TR8"),
-    ("TR9", "TR9"),
-    ("TS1", "TS1"),
-    ("TS10", "TS10"),
-    ("TS11", "TS11"),
-    ("TS12", "TS12"),
-    ("TS13", "TS13"),
-    ("TS14", "TS14"),
-    ("TS15", "TS15"),
-    ("TS16", "TS16"),
-    ("TS17", "TS17"),
-    ("TS18", "TS18"),
-    ("TS19", "TS19"),
-    ("TS2", "TS2"),
-    ("TS20", "TS20"),
-    ("TS21", "TS21"),
-    ("TS22", "TS22"),
-    ("TS23", "TS23"),
-    ("TS24", "TS24"),
-    ("TS25", "TS25"),
-    ("TS26", "TS26"),
-    ("TS27", "TS27"),
-    ("TS28", "TS28"),
-    ("TS29", "TS29"),
-    ("TS3", "TS3"),
-    ("TS4", "TS4"),
-    ("TS5", "TS5"),
-    ("TS6", "TS6"),
-    ("TS7", "TS7"),
-    ("TS8", "TS8"),
-    ("TS9", "TS9"),
-    ("TW1", "TW1"),
-    ("TW10", "TW10"),
-    ("TW11", "TW11"),
-    ("TW12", "TW12"),
-    ("TW13", "TW13"),
-    ("TW14", "TW14"),
-    ("TW15", "TW15"),
-    ("TW16", "TW16"),
-    ("TW17", "TW17"),
-    ("TW18", "TW18"),
-    ("TW19", "TW19"),
-    ("TW2", "TW2"),
-    ("TW20", "TW20"),
-    ("TW3", "TW3"),
-    ("TW4", "TW4"),
-    ("TW5", "TW5"),
-    ("TW6", "TW6"),
-    ("TW7", "TW7"),
-    ("TW8", "TW8"),
-    ("TW9", "TW9"),
-    ("UB1", "UB1"),
-    ("UB10", "UB10"),
-    ("UB11", "UB11"),
-    ("UB2", "UB2"),
-    ("UB3", "UB3"),
-    ("UB4", "UB4"),
-    ("UB5", "UB5"),
-    ("UB6", "UB6"),
-    ("UB7", "UB7"),
-    ("UB8", "UB8"),
-    ("UB9", "UB9"),
-    ("W1", "W1"),
-    ("W10", "W10"),
-    ("W11", "W11"),
-    ("W12", "W12"),
-    ("W13", "W13"),
-    ("W14", "W14"),
-    ("W1B", "W1B"),
-    ("W1C", "W1C"),
-    ("W1D", "W1D"),
-    ("W1F", "W1F"),
-    ("W1G", "W1G"),
-    ("W1H", "W1H"),
-    ("W1J", "W1J"),
-    ("W1K", "W1K"),
-    ("W1M", "W1M"),
-    ("W1S", "W1S"),
-    ("W1T", "W1T"),
-    ("W1U", "W1U"),
-    ("W1W", "W1W"),
-    ("W2", "W2"),
-    ("W3", "W3"),
-    ("W4", "W4"),
-    ("W5", "W5"),
-    ("W6", "W6"),
-    ("W7", "W7"),
-    ("W8", "W8"),
-    ("W9", "W9"),
-    ("WA1", "WA1"),
-    ("WA10", "WA10"),
-    ("WA11", "WA11"),
-    ("WA12", "WA12"),
-    ("WA13", "WA13"),
-    ("WA14", "WA14"),
-    ("WA15", "WA15"),
-    ("WA16", "WA16"),
-    ("WA2", "WA2"),
-    ("WA3", "WA3"),
-    ("WA4", "WA4"),
-    ("WA5", "WA5"),
-    ("WA6", "WA6"),
-    ("WA7", "WA7"),
-    ("WA8", "WA8"),
-    ("WA9", "WA9"),
-    ("WC1", "WC1"),
-    ("WC1A", "WC1A"),
-    ("WC1B", "WC1B"),
-    ("WC1E", "WC1E"),
-    ("WC1H", "WC1H"),
-    ("WC1N", "WC1N"),
-    ("WC1R", "WC1R"),
-    ("WC1V", "WC1V"),
-    ("WC1X", "WC1X"),
-    ("WC2", "WC2"),
-    ("WC2A", "WC2A"),
-    ("WC2B", "WC2B"),
-    ("WC2E", "WC2E"),
-    ("WC2H", "WC2H"),
-    ("WC2N", "WC2N"),
-    ("WC2R", "WC2R"),
-    ("WD1", "WD1"),
-    ("WD17", "WD17"),
-    ("WD18", "WD18"),
-    ("WD19", "WD19"),
-    ("WD2", "WD2"),
-    ("WD23", "WD23"),
-    ("WD24", "WD24"),
-    ("WD25", "WD25"),
-    ("WD3", "WD3"),
-    ("WD4", "WD4"),
-    ("WD5", "WD5"),
-    ("WD6", "WD6"),
-    ("WD7", "WD7"),
-    ("WF1", "WF1"),
-    ("WF10", "WF10"),
-    ("WF11", "WF11"),
-    ("WF12", "WF12"),
-    ("WF13", "WF13"),
-    ("WF14", "WF14"),
-    ("WF15", "WF15"),
-    ("WF16", "WF16"),
-    ("WF17", "WF17"),
-    ("WF2", "WF2"),
-    ("WF3", "WF3"),
-    ("WF4", "WF4"),
-    ("WF5", "WF5"),
-    ("WF6", "WF6"),
-    ("WF7", "WF7"),
-    ("WF8", "WF8"),
-    ("WF9", "WF9"),
-    ("WN1", "WN1"),
-    ("WN2", "WN2"),
-    ("WN3", "WN3"),
-    ("WN4", "WN4"),
-    ("WN5", "WN5"),
-    ("WN6", "WN6"),
-    ("WN7", "WN7"),
-    ("WN8", "WN8"),
-    ("WR1", "WR1"),
-    ("WR10", "WR10"),
-    ("WR11", "WR11"),
-    ("WR12", "WR12"),
-    ("WR13", "WR13"),
-    ("WR14", "WR14"),
-    ("WR15", "WR15"),
-    ("WR2", "WR2"),
-    ("WR3", "WR3"),
-    ("WR4", "WR4"),
-    ("WR5", "WR5"),
-    ("WR6", "WR6"),
-    ("WR7", "WR7"),
-    ("WR8", "WR8"),
-    ("WR9", "WR9"),
-    ("WS1", "WS1"),
-    ("WS10", "WS10"),
-    ("WS11", "WS11"),
-    ("WS12", "WS12"),
-    ("WS13", "WS13"),
-    ("WS14", "WS14"),
-    ("WS15", "WS15"),
-    ("WS2", "WS2"),
-    ("WS3", "WS3"),
-    ("WS4", "WS4"),
-    ("WS5", "WS5"),
-    ("WS6", "WS6"),
-    ("WS7", "WS7"),
-    ("WS8", "WS8"),
-    ("WS9", "WS9"),
-    ("WV1", "WV1"),
-    ("WV10", "WV10"),
-    ("WV11", "WV11"),
-    ("WV12", "WV12"),
-    ("WV13", "WV13"),
-    ("WV14", "WV14"),
-    ("WV15", "WV15"),
-    ("WV16", "WV16"),
-    ("WV2", "WV2"),
-    ("WV3", "WV3"),
-    ("WV4", "WV4"),
-    ("WV5", "WV5"),
-    ("WV6", "WV6"),
-    ("WV7", "WV7"),
-    ("WV8", "WV8"),
-    ("WV9", "WV9"),
-    ("YO1", "YO1"),
-    ("YO10", "YO10"),
-    ("YO11", "YO11"),
-    ("YO12", "YO12"),
-    ("YO13", "YO13"),
-    ("YO14", "YO14"),
-    ("YO15", "YO15"),
-    ("YO16", "YO16"),
-    ("YO17", "YO17"),
-    ("YO18", "YO18"),
-    ("YO19", "YO19"),
-    ("YO21", "YO21"),
-    ("YO22", "YO22"),
-    ("YO23", "YO23"),
-    ("YO24", "YO24"),
-    ("YO25", "YO25"),
-    ("YO26", "YO26"),
-    ("YO30", "YO30"),
-    ("YO31", "YO31"),
-    ("YO32", "YO32"),
-    ("YO41", "YO41"),
-    ("YO42", "YO42"),
-    ("YO43", "YO43"),
-    ("YO51", "YO51"),
-    ("YO60", "YO60"),
-    ("YO61", "YO61"),
-    ("YO62", "YO62"),
-    ("YO7", "YO7"),
-    ("YO8", "YO8"),
-    ("ZE1", "ZE1"),
-    ("ZE2", "ZE2"),
-    ("ZE3", "ZE3"),
-)
-
-
-POST_CODES_INFO = {
-    "AB10": ("Aberdeen", "Aberdeen City", "Scotland"),
-    "AB11": ("Aberdeen", "Aberdeen City", "Scotland"),
-    "AB12": ("Aberdeen", "Aberdeen City", "Scotland"),
-    "AB13": ("Milltimber", "Aberdeen City", "Scotland"),
-    "AB14": ("Peterculter", "Aberdeen City", "Scotland"),
-    "AB15": ("Aberdeen", "Aberdeen City", "Scotland"),
-    "AB16": ("Aberdeen", "Aberdeen City", "Scotland"),
-    "AB21": ("Aberdeen Airport", "Aberdeen City", "Scotland"),
-    "AB22": ("Bridge Of Don", "Aberdeen City", "Scotland"),
-    "AB23": ("Aberdeen", "Aberdeen City", "Scotland"),
-    "AB24": ("Aberdeen", "Aberdeen City", "Scotland"),
-    "AB25": ("Aberdeen", "Aberdeen City", "Scotland"),
-    "AB30": ("Laurencekirk", "Aberdeenshire", "Scotland"),
-    "AB31": ("Banchory", "Aberdeenshire", "Scotland"),
-    "AB32": ("Westhill", "Aberdeenshire", "Scotland"),
-    "AB33": ("Alford", "Aberdeenshire", "Scotland"),
-    "AB34": ("Aboyne", "Aberdeenshire", "Scotland"),
-    "AB35": ("Ballatar", "Aberdeenshire", "Scotland"),
-    "AB36": ("Strathdon", "Aberdeenshire", "Scotland"),
-    "AB37": ("Ballindalloch", "Moray", "Scotland"),
-    "AB38": ("Aberlour", "Moray", "Scotland"),
-    "AB39": ("Stonehaven", "Aberdeenshire", "Scotland"),
-    "AB41": ("Ellon", "Aberdeenshire", "Scotland"),
-    "AB42": ("Peterhead", "Aberdeenshire", "Scotland"),
-    "AB43": ("Fraserburgh", "Aberdeenshire", "Scotland"),
-    "AB44": ("Macduff", "Aberdeenshire", "Scotland"),
-    "AB45": ("Banff", "Aberdeenshire", "Scotland"),
-    "AB51": ("Inverurie", "Aberdeenshire", "Scotland"),
-    "AB52": ("Insch", "Aberdeenshire", "Scotland"),
-    "AB53": ("Turriff", "Aberdeenshire", "Scotland"),
-    "AB54": ("Huntly", "Aberdeenshire", "Scotland"),
-    "AB55": ("", "Moray", "Scotland"),
-    "AB56": ("", "Moray", "Scotland"),
-    "AL1": ("St Albans", "Hertfordshire", "England"),
-    "AL10": ("Hatfield", "Hertfordshire", "England"),
-    "AL2": ("St Albans", "Hertfordshire", "England"),
-    "AL3": ("Redbourn", "Hertfordshire", "England"),
-    "AL4": ("Sandridge", "Hertfordshire", "England"),
-    "AL5": ("Harpenden", "Hertfordshire", "England"),
-    "AL6": ("Welwyn", "Hertfordshire", "England"),
-    "AL7": ("Welwyn Garden City", "Hertfordshire", "England"),
-    "AL8": ("Welwyn Garden City", "Hertfordshire", "England"),
-    "AL9": ("Hatfield", "Hertfordshire", "England"),
-    "B1": ("", "Birmingham", "England"),
-    "B10": ("", "Birmingham", "England"),
-    "B11": ("", "Birmingham", "England"),
-    "B12": ("", "Birmingham", "England"),
-    "B13": ("", "Birmingham", "England"),
-    "B14": ("", "Birmingham", "England"),
-    "B15": ("", "Birmingham", "England"),
-    "B16": ("", "Birmingham", "England"),
-    "B17": ("", "Birmingham", "England"),
-    "B18": ("", "Birmingham", "England"),
-    "B19": ("", "Birmingham", "England"),
-    "B2": ("", "Birmingham", "England"),
-    "B20": ("", "Birmingham", "England"),
-    "B21": ("", "Birmingham", "England"),
-    "B23": ("", "Birmingham", "England"),
-    "B24": ("", "Birmingham", "England"),
-    "B25": ("", "Birmingham", "England"),
-    "B26": ("", "Birmingham", "England"),
-    "B27": ("", "Birmingham", "England"),
-    "B28": ("", "Birmingham", "England"),
-    "B29": ("", "Birmingham", "England"),
-    "B3": ("", "Birmingham", "England"),
-    "B30": ("", "Birmingham", "England"),
-    "B31": ("", "Birmingham", "England"),
-    "B32": ("", "Birmingham", "England"),
-    "B33": ("", "Birmingham", "England"),
-    "B34": ("", "Birmingham", "England"),
-    "B35": ("", "Birmingham", "England"),
-    "B36": ("Castle Bromwich", "Solihull", "England"),
-    "B37": ("Chelmsley Wood", "Solihull", "England"),
-    "B38": ("Tees Grove", "Birmingham", "England"),
-    "B4": ("", "Birmingham", "England"),
-    "B40": ("Bickenhill", "Solihull", "England"),
-    "B42": ("", "Birmingham", "England"),
-    "B43": ("West Bromwich", "Sandwell", "England"),
-    "B44": ("", "Birmingham", "England"),
-    "B45": ("", "Birmingham", "England"),
-    "B46": ("Coleshill", "Warwickshire", "England"),
-    "B47": ("Wythall", "Worcestershire", "England"),
-    "B48": ("Alvechurch", "Worcestershire", "England"),
-    "B49": ("Alcester", "Warwickshire", "England"),
-    "B5": ("", "Birmingham", "England"),
-    "B50": ("Bidford-on-Avon", "Warwickshire", "England"),
-    "B6": ("", "Birmingham", "England"),
-    "B60": ("Bromsgrove", "Worcestershire", "England"),
-    "B61": ("Bromsgrove", "Worcestershire", "England"),
-    "B62": ("Hurst Green", "Dudley", "England"),
-    "B63": ("Hurst Green", "Dudley", "England"),
-    "B64": ("West Bromwich", "Sandwell", "England"),
-    "B65": ("West Bromwich", "Sandwell", "England"),
-    "B66": ("West Bromwich", "Sandwell", "England"),
-    "B67": ("West Bromwich", "Sandwell", "England"),
-    "B68": ("West Bromwich", "Sandwell", "England"),
-    "B69": ("West Bromwich", "Sandwell", "England"),
-    "B7": ("", "Birmingham", "England"),
-    "B70": ("West Bromwich", "Sandwell", "England"),
-    "B71": ("West Bromwich", "Sandwell", "England"),
-    "B72": ("", "Birmingham", "England"),
-    "B73": ("", "Birmingham", "England"),
-    "B74": ("", "Birmingham", "England"),
-    "B75": ("", "Birmingham", "England"),
-    "B76": ("", "Birmingham", "England"),
-    "B77": ("Tamworth", "Staffordshire", "England"),
-    "B78": ("Tamworth", "Staffordshire", "England"),
-    "B79": ("Wigginton", "Staffordshire", "England"),
-    "B8": ("", "Birmingham", "England"),
-    "B80": ("Studley", "Warwickshire", "England"),
-    "B9": ("", "Birmingham", "England"),
-    "B90": ("", "Solihull", "England"),
-    "B91": ("", "Solihull", "England"),
-    "B92": ("", "Solihull", "England"),
-    "B93": ("Dorridge", "Solihull", "England"),
-    "B94": ("Tanworth-in-Arden", "Warwickshire", "England"),
-    "B95": ("Henley-in-Arden", "Warwickshire", "England"),
-    "B96": ("Redditch", "Worcestershire", "England"),
-    "B97": ("Redditch", "Worcestershire", "England"),
-    "B98": ("Redditch", "Worcestershire", "England"),
-    "BA1": ("Bath", "Bath and North East Somerset", "England"),
-    "BA10": ("Bruton", "Somerset", "England"),
-    "BA11": ("Frome", "Somerset", "England"),
-    "BA12": ("Longbridge Deverill", "Wiltshire", "England"),
-    "BA13": ("Westbury", "Wiltshire", "England"),
-    "BA14": ("Trowbridge", "Wiltshire", "England"),
-    "BA15": ("Bradford-on-Avon", "Wiltshire", "England"),
-    "BA16": ("Street", "Somerset", "England"),
-    "BA2": ("Bath", "Bath and North East Somerset", "England"),
-    "BA20": ("Yeovil", "Somerset", "England"),
-    "BA21": ("Yeovil", "Somerset", "England"),
-    "BA22": ("Mudford", "Somerset", "England"),
-    "BA3": ("Kilmersdon", "Somerset", "England"),
-    "BA4": ("Shepton Mallet", "Somerset", "England"),
-    "BA5": ("St Cuthbert Out", "Somerset", "England"),
-    "BA6": ("Glastonbury", "Somerset", "England"),
-    "BA7": ("Castle Cary", "Somerset", "England"),
-    "BA8": ("Templecombe", "Somerset", "England"),
-    "BA9": ("Wincanton", "Somerset", "England"),
-    "BB1": ("Darwen", "Blackburn with Darwen", "England"),
-    "BB10": ("Burnley", "Lancashire", "England"),
-    "BB11": ("Burnley", "Lancashire", "England"),
-    "BB12": ("Ightenhill", "Lancashire", "England"),
-    "BB18": ("Salterforth", "Lancashire", "England"),
-    "BB2": ("Darwen", "Blackburn with Darwen", "England"),
-    "BB3": ("Darwen", "Blackburn with Darwen", "England"),
-    "BB4": ("Rawtenstall", "Lancashire", "England"),
-    "BB5": ("Accrington", "Lancashire", "England"),
-    "BB6": ("Accrington", "Lancashire", "England"),
-    "BB7": ("Clitheroe", "Lancashire", "England"),
-    "BB8": ("Newchurch", "Lancashire", "England"),
-    "BB9": ("Newchurch", "Lancashire", "England"),
-    "BD1": ("Queensbury", "Bradford", "England"),
-    "BD10": ("Queensbury", "Bradford", "England"),
-    "BD11": ("Dewsbury", "Kirklees", "England"),
-    "BD12": ("Queensbury", "Bradford", "England"),
-    "BD13": ("Queensbury", "Bradford", "England"),
-    "BD14": ("Queensbury", "Bradford", "England"),
-    "BD15": ("Queensbury", "Bradford", "England"),
-    "BD16": ("Bingley", "Bradford", "England"),
-    "BD17": ("Queensbury", "Bradford", "England"),
-    "BD18": ("Queensbury", "Bradford", "England"),
-    "BD19": ("Dewsbury", "Kirklees", "England"),
-    "BD2": ("Queensbury", "Bradford", "England"),
-    "BD20": ("Steeton", "Bradford", "England"),
-    "BD21": ("Keighley", "Bradford", "England"),
-    "BD22": ("Keighley", "Bradford", "England"),
-    "BD23": ("Thorlby", "North Yorkshire", "England"),
-    "BD24": ("Langcliffe", "North Yorkshire", "England"),
-    "BD3": ("Queensbury", "Bradford", "England"),
-    "BD4": ("Queensbury", "Bradford", "England"),
-    "BD5": ("Queensbury", "Bradford", "England"),
-    "BD6": ("Queensbury", "Bradford", "England"),
-    "BD7": ("Queensbury", "Bradford", "England"),
-    "BD8": ("Queensbury", "Bradford", "England"),
-    "BD9": ("Queensbury", "Bradford", "England"),
-    "BH1": ("", "Bournemouth", "England"),
-    "BH10": ("", "Bournemouth", "England"),
-    "BH11": ("", "Bournemouth", "England"),
-    "BH12": ("", "Poole", "England"),
-    "BH13": ("", "Poole", "England"),
-    "BH14": ("", "Poole", "England"),
-    "BH15": ("", "Poole", "England"),
-    "BH16": ("Upton", "Dorset", "England"),
-    "BH17": ("", "Poole", "England"),
-    "BH18": ("", "Poole", "England"),
-    "BH19": ("Swanage", "Dorset", "England"),
-    "BH2": ("", "Bournemouth", "England"),
-    "BH20": ("Wareham", "Dorset", "England"),
-    "BH21": ("Colehill", "Dorset", "England"),
-    "BH22": ("Ferndown", "Dorset", "England"),
-    "BH23": ("Burton", "Dorset", "England"),
-    "BH24": ("Ringwood", "Hampshire", "England"),
-    "BH25": ("New Milton", "Hampshire", "England"),
-    "BH3": ("", "Bournemouth", "England"),
-    "BH31": ("Verwood", "Dorset", "England"),
-    "BH4": ("", "Bournemouth", "England"),
-    "BH5": ("", "Bournemouth", "England"),
-    "BH6": ("", "Bournemouth", "England"),
-    "BH7": ("", "Bournemouth", "England"),
-    "BH8": ("", "Bournemouth", "England"),
-    "BH9": ("", "Bournemouth", "England"),
-    "BL0": ("Ramsbottom", "Bury", "England"),
-    "BL1": ("", "Bolton", "England"),
-    "BL2": ("", "Bolton", "England"),
-    "BL3": ("", "Bolton", "England"),
-    "BL4": ("", "Bolton", "England"),
-    "BL5": ("Westhoughton", "Bolton", "England"),
-    "BL6": ("Horwich", "Bolton", "England"),
-    "BL7": ("", "Bolton", "England"),
-    "BL8": ("", "Bury", "England"),
-    "BL9": ("", "Bury", "England"),
-    "BN1": ("Brighton", "Brighton and Hove", "England"),
-    "BN10": ("Peacehaven", "East Sussex", "England"),
-    "BN11": ("Worthing", "West Sussex", "England"),
-    "BN12": ("Worthing", "West Sussex", "England"),
-    "BN13": ("Worthing", "West Sussex", "England"),
-    "BN14": ("Worthing", "West Sussex", "England"),
-    "BN15": ("Lancing", "West Sussex", "England"),
-    "BN16": ("Rustington", "West Sussex", "England"),
-    "BN17": ("Littlehampton", "West Sussex", "England"),
-    "BN18": ("Arundel", "West Sussex", "England"),
-    "BN2": ("Brighton", "Brighton and Hove", "England"),
-    "BN20": ("Eastbourne", "East Sussex", "England"),
-    "BN21": ("Eastbourne", "East Sussex", "England"),
-    "BN22": ("", "East Sussex", "England"),
-    "BN23": ("Eastbourne", "East Sussex", "England"),
-    "BN24": ("Westham", "East Sussex", "England"),
-    "BN25": ("Seaford", "East Sussex", "England"),
-    "BN26": ("Long Man", "East Sussex", "England"),
-    "BN27": ("Hailsham", "East Sussex", "England"),
-    "BN3": ("Brighton", "Brighton and Hove", "England"),
-    "BN41": ("Brighton", "Brighton and Hove", "England"),
-    "BN42": ("Shoreham-by-Sea", "West Sussex", "England"),
-    "BN43": ("Shoreham-by-Sea", "West Sussex", "England"),
-    "BN44": ("Steyning", "West Sussex", "England"),
-    "BN45": ("Newtimber", "West Sussex", "England"),
-    "BN5": ("Henfield", "West Sussex", "England"),
-    "BN6": ("Clayton", "West Sussex", "England"),
-    "BN7": ("Lewes", "East Sussex", "England"),
-    "BN8": ("Ringmer", "East Sussex", "England"),
-    "BN9": ("Newhaven", "East Sussex", "England"),
-    "BR1": ("Bromley", "Greater London", "England"),
-    "BR2": ("Bromley", "Greater London", "England"),
-    "BR3": ("Bromley", "Greater London", "England"),
-    "BR4": ("Bromley", "Greater London", "England"),
-    "BR5": ("Bromley", "Greater London", "England"),
-    "BR6": ("Bromley", "Greater London", "England"),
-    "BR7": ("Bromley", "Greater London", "England"),
-    "BR8": ("Swanley", "Kent", "England"),
-    "BS1": ("Bristol", "City of Bristol", "England"),
-    "BS10": ("Bristol", "City of Bristol", "England"),
-    "BS11": ("Bristol", "City of Bristol", "England"),
-    "BS13": ("Bristol", "City of Bristol", "England"),
-    "BS14": ("Bristol", "City of Bristol", "England"),
-    "BS15": ("Kingswood", "South Gloucestershire", "England"),
-    "BS16": ("Kingswood", "South Gloucestershire", "England"),
-    "BS2": ("Bristol", "City of Bristol", "England"),
-    "BS20": ("Portbury", "North Somerset", "England"),
-    "BS21": ("Clevedon", "North Somerset", "England"),
-    "BS22": ("Weston-Super-Mare", "North Somerset", "England"),
-    "BS23": ("Weston-Super-Mare", "North Somerset", "England"),
-    "BS24": ("Hutton", "North Somerset", "England"),
-    "BS25": ("Winscombe", "North Somerset", "England"),
-    "BS26": ("Weare", "Somerset", "England"),
-    "BS27": ("Cheddar", "Somerset", "England"),
-    "BS28": ("Wedmore", "Somerset", "England"),
-    "BS29": ("Banwell", "North Somerset", "England"),
-    "BS3": ("Bristol", "City of Bristol", "England"),
-    "BS30": ("Bitton", "South Gloucestershire", "England"),
-    "BS31": ("Keynsham", "Bath and North East Somerset", "England"),
-    "BS32": ("Bradley Stoke", "South Gloucestershire", "England"),
-    "BS34": ("Stoke Gifford", "South Gloucestershire", "England"),
-    "BS35": ("Aust", "South Gloucestershire", "England"),
-    "BS36": ("Frampton Cotterell", "South Gloucestershire", "England"),
-    "BS37": ("Yate", "South Gloucestershire", "England"),
-    "BS39": ("Clutton", "Bath and North East Somerset", "England"),
-    "BS4": ("Bristol", "City of Bristol", "England"),
-    "BS40": ("Nempnett Thrubwell", "Bath and North East Somerset", "England"),
-    "BS41": ("Long Ashton", "North Somerset", "England"),
-    "BS48": ("Nailsea", "North Somerset", "England"),
-    "BS49": ("Yatton", "North Somerset", "England"),
-    "BS5": ("Bristol", "City of Bristol", "England"),
-    "BS6": ("Bristol", "City of Bristol", "England"),
-    "BS7": ("Bristol", "City of Bristol", "England"),
-    "BS8": ("Bristol", "City of Bristol", "England"),
-    "BS9": ("Bristol", "City of Bristol", "England"),
-    "BS99": ("Bristol", "City of Bristol", "England"),
-    "BT1": ("", "Belfast", "Northern Ireland"),
-    "BT10": ("", "Belfast", "Northern Ireland"),
-    "BT11": ("", "Belfast", "Northern Ireland"),
-    "BT12": ("", "Belfast", "Northern Ireland"),
-    "BT13": ("", "Belfast", "Northern Ireland"),
-    "BT14": ("", "Belfast", "Northern Ireland"),
-    "BT15": ("", "Belfast", "Northern Ireland"),
-    "BT16": ("Dundonald", "Castlereagh", "Northern Ireland"),
-    "BT17": ("Dunmurry", "Lisburn", "Northern Ireland"),
-    "BT18": ("Holywood", "North Down", "Northern Ireland"),
-    "BT19": ("Bangor", "North Down", "Northern Ireland"),
-    "BT2": ("", "Belfast", "Northern Ireland"),
-    "BT20": ("Bangor", "North Down", "Northern Ireland"),
-    "BT21": ("Donaghadee", "Ards", "Northern Ireland"),
-    "BT22": ("", "Ards", "Northern Ireland"),
-    "BT23": ("", "Ards", "Northern Ireland"),
-    "BT24": ("", "Down", "Northern Ireland"),
-    "BT25": ("", "Banbridge", "Northern Ireland"),
-    "BT26": ("", "Lisburn", "Northern Ireland"),
-    "BT27": ("", "Lisburn", "Northern Ireland"),
-    "BT28": ("", "Lisburn", "Northern Ireland"),
-    "BT29": ("", "Antrim", "Northern Ireland"),
-    "BT3": ("", "Belfast", "Northern Ireland"),
-    "BT30": ("Downpatrick", "Down", "Northern Ireland"),
-    "BT31": ("", "Banbridge", "Northern Ireland"),
-    "BT32": ("", "Banbridge", "Northern Ireland"),
-    "BT33": ("Newcastle", "Down", "Northern Ireland"),
-    "BT34": ("", "Newry and Mourne", "Northern Ireland"),
-    "BT35": ("", "Newry and Mourne", "Northern Ireland"),
-    "BT36": ("", "Newtownabbey", "Northern Ireland"),
-    "BT37": ("Whiteabbey", "Newtownabbey", "Northern Ireland"),
-    "BT38": ("", "Carrickfergus", "Northern Ireland"),
-    "BT39": ("", "Newtownabbey", "Northern Ireland"),
-    "BT4": ("", "Belfast", "Northern Ireland"),
-    "BT40": ("", "Larne", "Northern Ireland"),
-    "BT41": ("Mill Town", "Antrim", "Northern Ireland"),
-    "BT42": ("", "Ballymena", "Northern Ireland"),
-    "BT43": ("", "Ballymena", "Northern Ireland"),
-    "BT44": ("", "Ballymena", "Northern Ireland"),
-    "BT45": ("", "Magherafelt", "Northern Ireland"),
-    "BT46": ("", "Magherafelt", "Northern Ireland"),
-    "BT47": ("", "Derry", "Northern Ireland"),
-    "BT48": ("Londonderry", "Derry", "Northern Ireland"),
-    "BT49": ("", "Limavady", "Northern Ireland"),
-    "BT5": ("", "Belfast", "Northern Ireland"),
-    "BT51": ("", "Coleraine", "Northern Ireland"),
-    "BT52": ("", "Coleraine", "Northern Ireland"),
-    "BT53": ("", "Ballymoney", "Northern Ireland"),
-    "BT54": ("Ballycastle", "Moyle", "Northern Ireland"),
-    "BT55": ("Portstewart", "Coleraine", "Northern Ireland"),
-    "BT56": ("Portrush", "Coleraine", "Northern Ireland"),
-    "BT57": ("Bushmills", "Moyle", "Northern Ireland"),
-    "BT6": ("", "Belfast", "Northern Ireland"),
-    "BT60": ("", "County Armagh", "Northern Ireland"),
-    "BT61": ("", "County Armagh", "Northern Ireland"),
-    "BT62": ("Portadown", "Craigavon", "Northern Ireland"),
-    "BT63": ("", "Craigavon", "Northern Ireland"),
-    "BT64": ("", "Craigavon", "Northern Ireland"),
-    "BT65": ("", "Craigavon", "Northern Ireland"),
-    "BT66": ("Lurgan", "Craigavon", "Northern Ireland"),
-    "BT67": ("", "Craigavon", "Northern Ireland"),
-    "BT68": ("", "Dungannon", "Northern Ireland"),
-    "BT69": ("", "Dungannon", "Northern Ireland"),
-    "BT7": ("", "Belfast", "Northern Ireland"),
-    "BT70": ("", "Dungannon", "Northern Ireland"),
-    "BT71": ("", "Dungannon", "Northern Ireland"),
-    "BT74": ("", "County Fermanagh", "Northern Ireland"),
-    "BT75": ("Fivemiletown", "Dungannon", "Northern Ireland"),
-    "BT76": ("", "Dungannon", "Northern Ireland"),
-    "BT77": ("", "Dungannon", "Northern Ireland"),
-    "BT78": ("", "Omagh", "Northern Ireland"),
-    "BT79": ("", "Omagh", "Northern Ireland"),
-    "BT8": ("Carryduff", "Castlereagh", "Northern Ireland"),
-    "BT80": ("", "Cookstown", "Northern Ireland"),
-    "BT81": ("", "Strabane", "Northern Ireland"),
-    "BT82": ("", "Strabane", "Northern Ireland"),
-    "BT9": ("", "Belfast", "Northern Ireland"),
-    "BT92": ("", "County Fermanagh", "Northern Ireland"),
-    "BT93": ("", "County Fermanagh", "Northern Ireland"),
-    "BT94": ("", "County Fermanagh", "Northern Ireland"),
-    "CA1": ("Carlisle", "Cumbria", "England"),
-    "CA10": ("Cliburn", "Cumbria", "England"),
-    "CA11": ("Catterlen", "Cumbria", "England"),
-    "CA12": ("Keswick", "Cumbria", "England"),
-    "CA13": ("Cockermouth", "Cumbria", "England"),
-    "CA14": ("Workington", "Cumbria", "England"),
-    "CA15": ("Maryport", "Cumbria", "England"),
-    "CA16": ("Appleby-in-Westmorland", "Cumbria", "England"),
-    "CA17": ("Kirkby Stephen", "Cumbria", "England"),
-    "CA18": ("Muncaster", "Cumbria", "England"),
-    "CA19": ("Muncaster", "Cumbria", "England"),
-    "CA2": ("Carlisle", "Cumbria", "England"),
-    "CA20": ("Gosforth", "Cumbria", "England"),
-    "CA21": ("Beckermet", "Cumbria", "England"),
-    "CA22": ("Egremont", "Cumbria", "England"),
-    "CA23": ("Cleator Moor", "Cumbria", "England"),
-    "CA24": ("Egremont", "Cumbria", "England"),
-    "CA25": ("Cleator Moor", "Cumbria", "England"),
-    "CA26": ("Arlecdon", "Cumbria", "England"),
-    "CA27": ("St Bees", "Cumbria", "England"),
-    "CA28": ("Whitehaven", "Cumbria", "England"),
-    "CA3": ("Carlisle", "Cumbria", "England"),
-    "CA4": ("Wetheral", "Cumbria", "England"),
-    "CA5": ("Orton", "Cumbria", "England"),
-    "CA6": ("Kirklinton", "Cumbria", "England"),
-    "CA7": ("Waverton", "Cumbria", "England"),
-    "CA8": ("Brampton", "Cumbria", "England"),
-    "CA9": ("Alston", "Cumbria", "England"),
-    "CB1": ("Fulbourn", "Cambridgeshire", "England"),
-    "CB10": ("Saffron Walden", "Essex", "England"),
-    "CB11": ("Newport", "Essex", "England"),
-    "CB2": ("Great Shelford", "Cambridgeshire", "England"),
-    "CB21": ("Balsham", "Cambridgeshire", "England"),
-    "CB22": ("Little Shelford", "Cambridgeshire", "England"),
-    "CB23": ("Highfields", "Cambridgeshire", "England"),
-    "CB24": ("Over", "Cambridgeshire", "England"),
-    "CB25": ("Lode", "Cambridgeshire", "England"),
-    "CB3": ("Hardwick", "Cambridgeshire", "England"),
-    "CB4": ("Impington", "Cambridgeshire", "England"),
-    "CB5": ("Stow cum Quy", "Cambridgeshire", "England"),
-    "CB6": ("Downham", "Cambridgeshire", "England"),
-    "CB7": ("Soham", "Cambridgeshire", "England"),
-    "CB8": ("Woodditton", "Cambridgeshire", "England"),
-    "CB9": ("Haverhill", "Suffolk", "England"),
-    "CF10": ("Butetown", "Cardiff", "Wales"),
-    "CF11": ("Grangetown", "Cardiff", "Wales"),
-    "CF14": ("Rhiwbina", "Cardiff", "Wales"),
-    "CF15": ("Pentyrch", "Cardiff", "Wales"),
-    "CF23": ("Pentwyn", "Cardiff", "Wales"),
-    "CF24": ("Adamsdown", "Cardiff", "Wales"),
-    "CF3": ("Trowbridge", "Cardiff", "Wales"),
-    "CF31": ("", "Bridgend", "Wales"),
-    "CF32": ("Garw Valley", "Bridgend", "Wales"),
-    "CF33": ("Cynffig", "Bridgend", "Wales"),
-    "CF34": ("Maesteg", "Bridgend", "Wales"),
-    "CF35": ("Pencoed", "Bridgend", "Wales"),
-    "CF36": ("Porthcawl", "Bridgend", "Wales"),
-    "CF37": ("Pontypridd", "Rhondda Cynon Taff", "Wales"),
-    "CF38": ("Llantwit Fardre", "Rhondda Cynon Taff", "Wales"),
-    "CF39": ("Cymmer", "Rhondda Cynon Taff", "Wales"),
-    "CF40": ("Tonypandy", "Rhondda Cynon Taff", "Wales"),
-    "CF41": ("Ystrad", "Rhondda Cynon Taff", "Wales"),
-    "CF42": ("Treorchy", "Rhondda Cynon Taff", "Wales"),
-    "CF43": ("Ferndale", "Rhondda Cynon Taff", "Wales"),
-    "CF44": ("Aberdare", "Rhondda Cynon Taff", "Wales"),
-    "CF45": ("Penrhiwceiber", "Rhondda Cynon Taff", "Wales"),
-    "CF46": ("Treharris", "Merthyr Tydfil", "Wales"),
-    "CF47": ("Town", "Merthyr Tydfil", "Wales"),
-    "CF48": ("Town", "Merthyr Tydfil", "Wales"),
-    "CF5": ("Ely", "Cardiff", "Wales"),
-    "CF61": ("Llantwit Major", "The Vale of Glamorgan", "Wales"),
-    "CF62": ("Barry", "The Vale of Glamorgan", "Wales"),
-    "CF63": ("Barry", "The Vale of Glamorgan", "Wales"),
-    "CF64": ("Penarth", "The Vale of Glamorgan", "Wales"),
-    "CF71": ("Cowbridge", "The Vale of Glamorgan", "Wales"),
-    "CF72": ("Llanharan", "Rhondda Cynon Taff", "Wales"),
-    "CF81": ("Bargoed", "Caerphilly", "Wales"),
-    "CF82": ("Gelligaer", "Caerphilly", "Wales"),
-    "CF83": ("", "Caerphilly", "Wales"),
-    "CH1": ("Chester", "Cheshire West and Chester", "England"),
-    "CH2": ("Upton", "Cheshire West and Chester", "England"),
-    "CH3": ("Waverton", "Cheshire West and Chester", "England"),
-    "CH4": ("Saltney", "Flintshire", "England"),
-    "CH41": ("Birkenhead", "Wirral", "England"),
-    "CH42": ("Birkenhead", "Wirral", "England"),
-    "CH43": ("Birkenhead", "Wirral", "England"),
-    "CH44": ("Wallasey", "Wirral", "England"),
-    "CH45": ("Wallasey", "Wirral", "England"),
-    "CH46": ("Birkenhead", "Wirral", "England"),
-    "CH47": ("Hoylake", "Wirral", "England"),
-    "CH48": ("Hoylake", "Wirral", "England"),
-    "CH49": ("Birkenhead", "Wirral", "England"),
-    "CH5": ("Shotton", "Flintshire", "England"),
-    "CH6": ("Flint", "Flintshire", "England"),
-    "CH60": ("Heswall", "Wirral", "England"),
-    "CH61": ("Heswall", "Wirral", "England"),
-    "CH62": ("Birkenhead", "Wirral", "England"),
-    "CH63": ("Birkenhead", "Wirral", "England"),
-    "CH64": ("Ellesmere Port", "Cheshire West and Chester", "England"),
-    "CH65": ("Ellesmere Port", "Cheshire West and Chester", "England"),
-    "CH66": ("Ellesmere Port", "Cheshire West and Chester", "England"),
-    "CH7": ("Mold", "Flintshire", "England"),
-    "CH8": ("Holywell", "Flintshire", "England"),
-    "CM0": ("Southminster", "Essex", "England"),
-    "CM1": ("Chelmsford", "Essex", "England"),
-    "CM11": ("", "Essex", "England"),
-    "CM12": ("Billericay", "Essex", "England"),
-    "CM13": ("Brentwood", "Essex", "England"),
-    "CM14": ("Brentwood", "Essex", "England"),
-    "CM15": ("Brentwood", "Essex", "England"),
-    "CM16": ("Epping", "Essex", "England"),
-    "CM17": ("Harlow", "Essex", "England"),
-    "CM18": ("Harlow", "Essex", "England"),
-    "CM19": ("Harlow", "Essex", "England"),
-    "CM2": ("Great Baddow", "Essex", "England"),
-    "CM20": ("Harlow", "Essex", "England"),
-    "CM21": ("Sawbridgeworth", "Hertfordshire", "England"),
-    "CM22": ("Great Hallingbury", "Essex", "England"),
-    "CM23": ("Bishops Stortford", "Hertfordshire", "England"),
-    "CM24": ("Stansted Mountfitchet", "Essex", "England"),
-    "CM3": ("Danbury", "Essex", "England"),
-    "CM4": ("Ingatestone", "Essex", "England"),
-    "CM5": ("Ongar", "Essex", "England"),
-    "CM6": ("Great Dunmow", "Essex", "England"),
-    "CM7": ("Braintree", "Essex", "England"),
-    "CM77": ("Braintree", "Essex", "England"),
-    "CM8": ("Witham", "Essex", "England"),
-    "CM9": ("Heybridge", "Essex", "England"),
-    "CO1": ("Colchester", "Essex", "England"),
-    "CO10": ("Sudbury", "Suffolk", "England"),
-    "CO11": ("Mistley", "Essex", "England"),
-    "CO12": ("Harwich", "Essex", "England"),
-    "CO13": ("Frinton and Walton", "Essex", "England"),
-    "CO14": ("Frinton and Walton", "Essex", "England"),
-    "CO15": ("Clacton-on-Sea", "Essex", "England"),
-    "CO16": ("Little Clacton", "Essex", "England"),
-    "CO2": ("Colchester", "Essex", "England"),
-    "CO3": ("Colchester", "Essex", "England"),
-    "CO4": ("Colchester", "Essex", "England"),
-    "CO5": ("Layer Breton", "Essex", "England"),
-    "CO6": ("Fordham", "Essex", "England"),
-    "CO7": ("Elmstead", "Essex", "England"),
-    "CO8": ("Bures Hamlet", "Essex", "England"),
-    "CO9": ("Sible Hedingham", "Essex", "England"),
-    "CR0": ("Croydon", "Greater London", "England"),
-    "CR2": ("Croydon", "Greater London", "England"),
-    "CR3": ("Whyteleafe", "Surrey", "England"),
-    "CR4": ("Merton", "Greater London", "England"),
-    "CR5": ("Croydon", "Greater London", "England"),
-    "CR6": ("Whyteleafe", "Surrey", "England"),
-    "CR7": ("Croydon", "Greater London", "England"),
-    "CR8": ("Croydon", "Greater London", "England"),
-    "CR9": ("Croydon", "Greater London", "England"),
-    "CT1": ("Canterbury", "Kent", "England"),
-    "CT10": ("Broadstairs", "Kent", "England"),
-    "CT11": ("Margate", "Kent", "England"),
-    "CT12": ("Manston", "Kent", "England"),
-    "CT13": ("Sandwich", "Kent", "England"),
-    "CT14": ("Dover", "Kent", "England"),
-    "CT15": ("Whitfield", "Kent", "England"),
-    "CT16": ("Dover", "Kent", "England"),
-    "CT17": ("Dover", "Kent", "England"),
-    "CT18": ("Hawkinge", "Kent", "England"),
-    "CT19": ("Folkestone", "Kent", "England"),
-    "CT2": ("Canterbury", "Kent", "England"),
-    "CT20": ("Folkestone", "Kent", "England"),
-    "CT21": ("Hythe", "Kent", "England"),
-    "CT3": ("Wingham", "Kent", "England"),
-    "CT4": ("Lower Hardres", "Kent", "England"),
-    "CT5": ("Canterbury", "Kent", "England"),
-    "CT6": ("Canterbury", "Kent", "England"),
-    "CT7": ("Birchington", "Kent", "England"),
-    "CT8": ("Margate", "Kent", "England"),
-    "CT9": ("Margate", "Kent", "England"),
-    "CV1": ("", "Coventry", "England"),
-    "CV10": ("Nuneaton", "Warwickshire", "England"),
-    "CV11": ("Nuneaton", "Warwickshire", "England"),
-    "CV12": ("Bedworth", "Warwickshire", "England"),
-    "CV13": ("Market Bosworth", "Leicestershire", "England"),
-    "CV2": ("", "Coventry", "England"),
-    "CV21": ("Rugby", "Warwickshire", "England"),
-    "CV22": ("Rugby", "Warwickshire", "England"),
-    "CV23": ("Dunchurch", "Warwickshire", "England"),
-    "CV3": ("", "Coventry", "England"),
-    "CV31": ("Leamington Spa", "Warwickshire", "England"),
-    "CV32": ("Leamington Spa", "Warwickshire", "England"),
-    "CV33": ("Radford Semele", "Warwickshire", "England"),
-    "CV34": ("Warwick", "Warwickshire", "England"),
-    "CV35": ("Wasperton", "Warwickshire", "England"),
-    "CV36": ("Shipston-on-Stour", "Warwickshire", "England"),
-    "CV37": ("Stratford-Upon-Avon", "Warwickshire", "England"),
-    "CV4": ("", "Coventry", "England"),
-    "CV47": ("Ladbroke", "Warwickshire", "England"),
-    "CV5": ("", "Coventry", "England"),
-    "CV6": ("", "Coventry", "England"),
-    "CV7": ("Hawkes End", "Coventry", "England"),
-    "CV8": ("Kenilworth", "Warwickshire", "England"),
-    "CV9": ("Atherstone", "Warwickshire", "England"),
-    "CW1": ("Crewe", "Cheshire East", "England"),
-    "CW10": ("Middlewich", "Cheshire East", "England"),
-    "CW11": ("Sandbach", "Cheshire East", "England"),
-    "CW12": ("Congleton", "Cheshire East", "England"),
-    "CW2": ("Crewe", "Cheshire East", "England"),
-    "CW3": ("Bridgemere", "Cheshire East", "England"),
-    "CW4": ("Holmes Chapel", "Cheshire East", "England"),
-    "CW5": ("Nantwich", "Cheshire East", "England"),
-    "CW6": ("Tarporley", "Cheshire West and Chester", "England"),
-    "CW7": ("Winsford", "Cheshire West and Chester", "England"),
-    "CW8": ("Weaverham", "Cheshire West and Chester", "England"),
-    "CW9": ("Northwich", "Cheshire West and Chester", "England"),
-    "DA1": ("Dartford", "Kent", "England"),
-    "DA10": ("Swanscombe", "Kent", "England"),
-    "DA11": ("Gravesend", "Kent", "England"),
-    "DA12": ("Gravesend", "Kent", "England"),
-    "DA13": ("Meopham Station", "Kent", "England"),
-    "DA14": ("Bexley", "Greater London", "England"),
-    "DA15": ("Bexley", "Greater London", "England"),
-    "DA16": ("Bexley", "Greater London", "England"),
-    "DA17": ("Crayford", "Greater London", "England"),
-    "DA18": ("Crayford", "Greater London", "England"),
-    "DA2": ("Darenth", "Kent", "England"),
-    "DA3": ("Hartley", "Kent", "England"),
-    "DA4": ("Horton Kirby", "Kent", "England"),
-    "DA5": ("Bexley", "Greater London", "England"),
-    "DA6": ("Bexley", "Greater London", "England"),
-    "DA7": ("Crayford", "Greater London", "England"),
-    "DA8": ("Crayford", "Greater London", "England"),
-    "DA9": ("Stone", "Kent", "England"),
-    "DD1": ("Dundee", "Dundee City", "Scotland"),
-    "DD10": ("", "Aberdeenshire", "Scotland"),
-    "DD11": ("Kirkton", "Angus", "Scotland"),
-    "DD2": ("Dundee", "Dundee City", "Scotland"),
-    "DD3": ("Dundee", "Dundee City", "Scotland"),
-    "DD4": ("Dundee", "Dundee City", "Scotland"),
-    "DD5": ("Dundee", "Dundee City", "Scotland"),
-    "DD6": ("", "Fife", "Scotland"),
-    "DD7": ("Carnoustie", "Angus", "Scotland"),
-    "DD8": ("", "Angus", "Scotland"),
-    "DD9": ("", "Angus", "Scotland"),
-    "DE1": ("", "Derby", "England"),
-    "DE11": ("Swadlincote", "Derbyshire", "England"),
-    "DE12": ("Overseal", "Derbyshire", "England"),
-    "DE13": ("Branston", "Staffordshire", "England"),
-    "DE14": ("Burton upon Trent", "Staffordshire", "England"),
-    "DE15": ("Burton upon Trent", "Staffordshire", "England"),
-    "DE21": ("", "Derby", "England"),
-    "DE22": ("", "Derby", "England"),
-    "DE23": ("", "Derby", "England"),
-    "DE24": ("", "Derby", "England"),
-    "DE3": ("Mickleover", "Derby", "England"),
-    "DE4": ("Matlock Bath", "Derbyshire", "England"),
-    "DE45": ("Bakewell", "Derbyshire", "England"),
-    "DE5": ("Ripley", "Derbyshire", "England"),
-    "DE55": ("Alfreton", "Derbyshire", "England"),
-    "DE56": ("Belper", "Derbyshire", "England"),
-    "DE6": ("Osmaston", "Derbyshire", "England"),
-    "DE65": ("Hilton", "Derbyshire", "England"),
-    "DE7": ("Ilkeston", "Derbyshire", "England"),
-    "DE72": ("Draycott", "Derbyshire", "England"),
-    "DE73": ("Swarkestone", "Derbyshire", "England"),
-    "DE74": ("Lockington", "Leicestershire", "England"),
-    "DE75": ("Heanor", "Derbyshire", "England"),
-    "DG1": ("", "Dumfries and Galloway", "Scotland"),
-    "DG10": ("", "Dumfries and Galloway", "Scotland"),
-    "DG11": ("", "Dumfries and Galloway", "Scotland"),
-    "DG12": ("Annan", "Dumfries and Galloway", "Scotland"),
-    "DG13": ("", "Dumfries and Galloway", "Scotland"),
-    "DG14": ("", "Dumfries and Galloway", "Scotland"),
-    "DG16": ("Gretna", "Dumfries and Galloway", "Scotland"),
-    "DG2": ("", "Dumfries and Galloway", "Scotland"),
-    "DG3": ("", "Dumfries and Galloway", "Scotland"),
-    "DG4": ("", "Dumfries and Galloway", "Scotland"),
-    "DG5": ("Dalbeattie", "Dumfries and Galloway", "Scotland"),
-    "DG6": ("Kirkcudbright", "Dumfries and Galloway", "Scotland"),
-    "DG7": ("", "Dumfries and Galloway", "Scotland"),
-    "DG8": ("", "Dumfries and Galloway", "Scotland"),
-    "DG9": ("", "Dumfries and Galloway", "Scotland"),
-    "DH1": ("Durham", "County Durham", "England"),
-    "DH2": ("Chester-le-Street", "County Durham", "England"),
-    "DH3": ("North Lodge", "County Durham", "England"),
-    "DH4": ("Houghton-le-Spring", "Sunderland", "England"),
-    "DH5": ("Hetton", "Sunderland", "England"),
-    "DH6": ("Shadforth", "County Durham", "England"),
-    "DH7": ("Esh", "County Durham", "England"),
-    "DH8": ("Burnhope", "County Durham", "England"),
-    "DH9": ("Stanley", "County Durham", "England"),
-    "DL1": ("", "Darlington", "England"),
-    "DL10": ("Skeeby", "North Yorkshire", "England"),
-    "DL11": ("Marske", "North Yorkshire", "England"),
-    "DL12": ("Cotherstone", "County Durham", "England"),
-    "DL13": ("Stanhope", "County Durham", "England"),
-    "DL14": ("Lcp Stanhope and Wolsingham Parishes And", "County Durham", "England"),
-    "DL15": ("Lcp Stanhope and Wolsingham Parishes And", "County Durham", "England"),
-    "DL16": ("Spennymoor", "County Durham", "England"),
-    "DL17": ("Ferryhill", "County Durham", "England"),
-    "DL2": ("Halnaby Ave", "Darlington", "England"),
-    "DL3": ("", "Darlington", "England"),
-    "DL4": ("Shildon", "County Durham", "England"),
-    "DL5": ("Great Aycliffe", "County Durham", "England"),
-    "DL6": ("Winton", "North Yorkshire", "England"),
-    "DL7": ("Yafforth", "North Yorkshire", "England"),
-    "DL8": ("Spennithorne", "North Yorkshire", "England"),
-    "DL9": ("Colburn", "North Yorkshire", "England"),
-    "DN1": ("", "Doncaster", "England"),
-    "DN10": ("Everton", "Nottinghamshire", "England"),
-    "DN11": ("Tickhill", "Doncaster", "England"),
-    "DN12": ("Conisbrough", "Doncaster", "England"),
-    "DN14": ("Airmyn", "East Riding of Yorkshire", "England"),
-    "DN15": ("", "North Lincolnshire", "England"),
-    "DN16": ("", "North Lincolnshire", "England"),
-    "DN17": ("Burringham", "North Lincolnshire", "England"),
-    "DN18": ("Barton-Upon-Humber", "North Lincolnshire", "England"),
-    "DN19": ("Barrow-Upon-Humber", "North Lincolnshire", "England"),
-    "DN2": ("", "Doncaster", "England"),
-    "DN20": ("Broughton", "North Lincolnshire", "England"),
-    "DN21": ("Corringham", "Lincolnshire", "England"),
-    "DN22": ("Clumber and Hardwick", "Nottinghamshire", "England"),
-    "DN3": ("Edenthorpe", "Doncaster", "England"),
-    "DN31": ("", "North East Lincolnshire", "England"),
-    "DN32": ("", "North East Lincolnshire", "England"),
-    "DN33": ("", "North East Lincolnshire", "England"),
-    "DN34": ("", "North East Lincolnshire", "England"),
-    "DN35": ("Cleethorpes", "North East Lincolnshire", "England"),
-    "DN36": ("Tetney", "Lincolnshire", "England"),
-    "DN37": ("Bradley", "North East Lincolnshire", "England"),
-    "DN38": ("Bigby", "Lincolnshire", "England"),
-    "DN39": ("Ulceby", "North Lincolnshire", "England"),
-    "DN4": ("", "Doncaster", "England"),
-    "DN40": ("Immingham", "North East Lincolnshire", "England"),
-    "DN41": ("Stallingborough", "North East Lincolnshire", "England"),
-    "DN5": ("Brodsworth", "Doncaster", "England"),
-    "DN6": ("Owston", "Doncaster", "England"),
-    "DN7": ("Hatfield", "Doncaster", "England"),
-    "DN8": ("Thorne", "Doncaster", "England"),
-    "DN9": ("Haxey", "North Lincolnshire", "England"),
-    "DT1": ("Dorchester", "Dorset", "England"),
-    "DT10": ("Sturminster Newton", "Dorset", "England"),
-    "DT11": ("Bryanston", "Dorset", "England"),
-    "DT2": ("Charminster", "Dorset", "England"),
-    "DT3": ("Weymouth", "Dorset", "England"),
-    "DT4": ("Weymouth", "Dorset", "England"),
-    "DT5": ("Portland", "Dorset", "England"),
-    "DT6": ("Allington", "Dorset", "England"),
-    "DT7": ("Lyme Regis", "Dorset", "England"),
-    "DT8": ("Beaminster", "Dorset", "England"),
-    "DT9": ("Castleton", "Dorset", "England"),
-    "DY1": ("", "Dudley", "England"),
-    "DY10": ("Kidderminster", "Worcestershire", "England"),
-    "DY11": ("Kidderminster", "Worcestershire", "England"),
-    "DY12": ("Upper Arley", "Worcestershire", "England"),
-    "DY13": ("Stourport-on-Severn", "Worcestershire", "England"),
-    "DY14": ("Cleobury Mortimer", "Shropshire", "England"),
-    "DY2": ("", "Dudley", "England"),
-    "DY3": ("", "Dudley", "England"),
-    "DY4": ("West Bromwich", "Sandwell", "England"),
-    "DY5": ("", "Dudley", "England"),
-    "DY6": ("", "Dudley", "England"),
-    "DY7": ("Kinver", "Staffordshire", "England"),
-    "DY8": ("", "Dudley", "England"),
-    "DY9": ("", "Dudley", "England"),
-    "E1": ("Poplar", "Greater London", "England"),
-    "E10": ("Walthamstow", "Greater London", "England"),
-    "E11": ("Walthamstow", "Greater London", "England"),
-    "E12": ("Stratford", "Greater London", "England"),
-    "E13": ("East Ham", "Greater London", "England"),
-    "E14": ("Poplar", "Greater London", "England"),
-    "E15": ("Stratford", "Greater London", "England"),
-    "E16": ("East Ham", "Greater London", "England"),
-    "E17": ("Walthamstow", "Greater London", "England"),
-    "E18": ("Ilford", "Greater London", "England"),
-    "E1W": ("Poplar", "Greater London", "England"),
-    "E2": ("Poplar", "Greater London", "England"),
-    "E3": ("Poplar", "Greater London", "England"),
-    "E4": ("Walthamstow", "Greater London", "England"),
-    "E5": ("Hackney", "Greater London", "England"),
-    "E6": ("East Ham", "Greater London", "England"),
-    "E7": ("Stratford", "Greater London", "England"),
-    "E8": ("Hackney", "Greater London", "England"),
-    "E9": ("Hackney", "Greater London", "England"),
-    "EC1": ("Islington", "Greater London", "England"),
-    "EC1A": ("Islington", "Greater London", "England"),
-    "EC1M": ("Islington", "Greater London", "England"),
-    "EC1N": ("Camden Town", "Greater London", "England"),
-    "EC1R": ("Islington", "Greater London", "England"),
-    "EC1V": ("Islington", "Greater London", "England"),
-    "EC1Y": ("Islington", "Greater London", "England"),
-    "EC2": ("Islington", "Greater London", "England"),
-    "EC2A": ("Islington", "Greater London", "England"),
-    "EC2M": ("", "City of London", "England"),
-    "EC2N": ("", "City of London", "England"),
-    "EC2P": ("", "City of London", "England"),
-    "EC2R": ("", "City of London", "England"),
-    "EC2V": ("", "City of London", "England"),
-    "EC2Y": ("", "City of London", "England"),
-    "EC3": ("", "City of London", "England"),
-    "EC3A": ("", "City of London", "England"),
-    "EC3M": ("", "City of London", "England"),
-    "EC3N": ("", "City of London", "England"),
-    "EC3P": ("Islington", "Greater London", "England"),
-    "EC3R": ("", "City of London", "England"),
-    "EC3V": ("", "City of London", "England"),
-    "EC4": ("", "City of London", "England"),
-    "EC4A": ("", "City of London", "England"),
-    "EC4M": ("", "City of London", "England"),
-    "EC4N": ("", "City of London", "England"),
-    "EC4R": ("", "City of London", "England"),
-    "EC4V": ("", "City of London", "England"),
-    "EC4Y": ("", "City of London", "England"),
-    "EH1": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EH10": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EH11": ("Juniper Green", "City of Edinburgh", "Scotland"),
-    "EH12": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EH13": ("Juniper Green", "City of Edinburgh", "Scotland"),
-    "EH14": ("Juniper Green", "City of Edinburgh", "Scotland"),
-    "EH15": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EH16": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EH17": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EH18": ("Bonnyrigg and Lasswade", "Midlothian", "Scotland"),
-    "EH19": ("Bonnyrigg and Lasswade", "Midlothian", "Scotland"),
-    "EH2": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EH20": ("Loanhead", "Midlothian", "Scotland"),
-    "EH21": ("Musselburgh", "East Lothian", "Scotland"),
-    "EH22": ("Dalkeith", "Midlothian", "Scotland"),
-    "EH23": ("Arniston", "Midlothian", "Scotland"),
-    "EH24": ("", "Midlothian", "Scotland"),
-    "EH25": ("Roslin", "Midlothian", "Scotland"),
-    "EH26": ("Penicuik", "Midlothian", "Scotland"),
-    "EH27": ("Kirknewton", "West Lothian", "Scotland"),
-    "EH28": ("", "City of Edinburgh", "Scotland"),
-    "EH29": ("Kirkliston", "City of Edinburgh", "Scotland"),
-    "EH3": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EH30": ("Queensferry", "City of Edinburgh", "Scotland"),
-    "EH31": ("Gullane", "East Lothian", "Scotland"),
-    "EH32": ("Cockenzie and Port Seton", "East Lothian", "Scotland"),
-    "EH33": ("Tranent", "East Lothian", "Scotland"),
-    "EH34": ("Pencaitland", "East Lothian", "Scotland"),
-    "EH35": ("Ormiston", "East Lothian", "Scotland"),
-    "EH36": ("", "East Lothian", "Scotland"),
-    "EH37": ("", "Midlothian", "Scotland"),
-    "EH38": ("", "The Scottish Borders", "Scotland"),
-    "EH39": ("North Berwick", "East Lothian", "Scotland"),
-    "EH4": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EH40": ("", "East Lothian", "Scotland"),
-    "EH41": ("", "East Lothian", "Scotland"),
-    "EH42": ("", "East Lothian", "Scotland"),
-    "EH43": ("Walkerburn", "The Scottish Borders", "Scotland"),
-    "EH44": ("", "The Scottish Borders", "Scotland"),
-    "EH45": ("Peebles", "The Scottish Borders", "Scotland"),
-    "EH46": ("", "The Scottish Borders", "Scotland"),
-    "EH47": ("", "West Lothian", "Scotland"),
-    "EH48": ("Bathgate", "West Lothian", "Scotland"),
-    "EH49": ("Linlithgow", "West Lothian", "Scotland"),
-    "EH5": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EH51": ("Grangepans", "Falkirk", "Scotland"),
-    "EH52": ("Broxburn", "West Lothian", "Scotland"),
-    "EH53": ("Livingston", "West Lothian", "Scotland"),
-    "EH54": ("Livingston", "West Lothian", "Scotland"),
-    "EH55": ("West Calder", "West Lothian", "Scotland"),
-    "EH6": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EH7": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EH8": ("", "City of Edinburgh", "Scotland"),
-    "EH9": ("Edinburgh", "City of Edinburgh", "Scotland"),
-    "EN1": ("Enfield", "Greater London", "England"),
-    "EN10": ("Broxbourne", "Hertfordshire", "England"),
-    "EN11": ("Hoddesdon", "Hertfordshire", "England"),
-    "EN2": ("Enfield", "Greater London", "England"),
-    "EN3": ("Enfield", "Greater London", "England"),
-    "EN4": ("Barnet", "Greater London", "England"),
-    "EN5": ("Barnet", "Greater London", "England"),
-    "EN6": ("Potters Bar", "Hertfordshire", "England"),
-    "EN7": ("Broxbourne", "Hertfordshire", "England"),
-    "EN8": ("Broxbourne", "Hertfordshire", "England"),
-    "EN9": ("Waltham Abbey", "Essex", "England"),
-    "EX1": ("Exeter", "Devon", "England"),
-    "EX10": ("Sidmouth", "Devon", "England"),
-    "EX11": ("Ottery St Mary", "Devon", "England"),
-    "EX12": ("Seaton", "Devon", "England"),
-    "EX13": ("Axminster", "Devon", "England"),
-    "EX14": ("Honiton", "Devon", "England"),
-    "EX15": ("Kentisbeare", "Devon", "England"),
-    "EX16": ("Tiverton", "Devon", "England"),
-    "EX17": ("Sandford", "Devon", "England"),
-    "EX18": ("Chawleigh", "Devon", "England"),
-    "EX19": ("Dowland", "Devon", "England"),
-    "EX2": ("Exeter", "Devon", "England"),
-    "EX20": ("Okehampton Hamlets", "Devon", "England"),
-    "EX21": ("Black Torrington", "Devon", "England"),
-    "EX22": ("Holsworthy Hamlets", "Devon", "England"),
-    "EX23": ("Bude", "Cornwall", "England"),
-    "EX24": ("Colyton", "Devon", "England"),
-    "EX3": ("Exeter", "Devon", "England"),
-    "EX31": ("Barnstaple", "Devon", "England"),
-    "EX32": ("Barnstaple", "Devon", "England"),
-    "EX33": ("Braunton", "Devon", "England"),
-    "EX34": ("Ilfracombe", "Devon", "England"),
-    "EX35": ("Lynton", "Devon", "England"),
-    "EX36": ("Bishops Nympton", "Devon", "England"),
-    "EX37": ("High Bickington", "Devon", "England"),
-    "EX38": ("Little Torrington", "Devon", "England"),
-    "EX39": ("Abbotsham", "Devon", "England"),
-    "EX4": ("Exeter", "Devon", "England"),
-    "EX5": ("Broad Clyst", "Devon", "England"),
-    "EX6": ("Doddiscombsleigh", "Devon", "England"),
-    "EX7": ("Dawlish", "Devon", "England"),
-    "EX8": ("Exmouth", "Devon", "England"),
-    "EX9": ("Budleigh Salterton", "Devon", "England"),
-    "FK1": ("", "Falkirk", "Scotland"),
-    "FK10": ("Alloa", "Clackmannanshire", "Scotland"),
-    "FK11": ("Menstrie", "Clackmannanshire", "Scotland"),
-    "FK12": ("Alva", "Clackmannanshire", "Scotland"),
-    "FK13": ("Tillicoultry", "Clackmannanshire", "Scotland"),
-    "FK14": ("", "Clackmannanshire", "Scotland"),
-    "FK15": ("", "Stirling", "Scotland"),
-    "FK16": ("Doune", "Stirling", "Scotland"),
-    "FK17": ("Callander", "Stirling", "Scotland"),
-    "FK18": ("Strathyre", "Stirling", "Scotland"),
-    "FK19": ("", "Stirling", "Scotland"),
-    "FK2": ("Hope St", "Falkirk", "Scotland"),
-    "FK20": ("", "Stirling", "Scotland"),
-    "FK21": ("Killin", "Stirling", "Scotland"),
-    "FK3": ("Grangemouth", "Falkirk", "Scotland"),
-    "FK4": ("Dennyloanhead", "Falkirk", "Scotland"),
-    "FK5": ("", "Falkirk", "Scotland"),
-    "FK6": ("Stoneywood", "Falkirk", "Scotland"),
-    "FK7": ("", "Stirling", "Scotland"),
-    "FK8": ("", "Stirling", "Scotland"),
-    "FK9": ("Bridge Of Allan", "Stirling", "Scotland"),
-    "FY1": ("", "Blackpool", "England"),
-    "FY2": ("", "Blackpool", "England"),
-    "FY3": ("", "Blackpool", "England"),
-    "FY4": ("", "Blackpool", "England"),
-    "FY5": ("Hardhorn and Thornton", "Lancashire", "England"),
-    "FY6": ("Hardhorn and Thornton", "Lancashire", "England"),
-    "FY7": ("Hardhorn and Thornton", "Lancashire", "England"),
-    "FY8": ("Lytham Saint Annes", "Lancashire", "England"),
-    "G1": ("Glasgow", "Glasgow City", "Scotland"),
-    "G11": ("Glasgow", "Glasgow City", "Scotland"),
-    "G12": ("Glasgow", "Glasgow City", "Scotland"),
-    "G13": ("Glasgow", "Glasgow City", "Scotland"),
-    "G14": ("Glasgow", "Glasgow City", "Scotland"),
-    "G15": ("Glasgow", "Glasgow City", "Scotland"),
-    "G2": ("Glasgow", "Glasgow City", "Scotland"),
-    "G20": ("Glasgow", "Glasgow City", "Scotland"),
-    "G21": ("Glasgow", "Glasgow City", "Scotland"),
-    "G22": ("Glasgow", "Glasgow City", "Scotland"),
-    "G23": ("Glasgow", "Glasgow City", "Scotland"),
-    "G3": ("Glasgow", "Glasgow City", "Scotland"),
-    "G31": ("Glasgow", "Glasgow City", "Scotland"),
-    "G32": ("Glasgow", "Glasgow City", "Scotland"),
-    "G33": ("Glasgow", "Glasgow City", "Scotland"),
-    "G34": ("Glasgow", "Glasgow City", "Scotland"),
-    "G4": ("Glasgow", "Glasgow City", "Scotland"),
-    "G40": ("Glasgow", "Glasgow City", "Scotland"),
-    "G41": ("Glasgow", "Glasgow City", "Scotland"),
-    "G42": ("Glasgow", "Glasgow City", "Scotland"),
-    "G43": ("Glasgow", "Glasgow City", "Scotland"),
-    "G44": ("Glasgow", "Glasgow City", "Scotland"),
-    "G45": ("Glasgow", "Glasgow City", "Scotland"),
-    "G46": ("Thornliebank", "East Renfrewshire", "Scotland"),
-    "G5": ("Glasgow", "Glasgow City", "Scotland"),
-    "G51": ("Glasgow", "Glasgow City", "Scotland"),
-    "G52": ("Glasgow", "Glasgow City", "Scotland"),
-    "G53": ("Glasgow", "Glasgow City", "Scotland"),
-    "G60": ("Clydebank", "West Dunbartonshire", "Scotland"),
-    "G61": ("Milngavie", "East Dunbartonshire", "Scotland"),
-    "G62": ("Milngavie", "East Dunbartonshire", "Scotland"),
-    "G63": ("Killearn", "Stirling", "Scotland"),
-    "G64": ("Bishopbriggs", "East Dunbartonshire", "Scotland"),
-    "G65": ("Kilsyth", "North Lanarkshire", "Scotland"),
-    "G66": ("Kirkintilloch", "East Dunbartonshire", "Scotland"),
-    "G67": ("Cumbernauld", "North Lanarkshire", "Scotland"),
-    "G68": ("Balloch", "North Lanarkshire", "Scotland"),
-    "G69": ("Glasgow", "Glasgow City", "Scotland"),
-    "G71": ("", "South Lanarkshire", "Scotland"),
-    "G72": ("", "South Lanarkshire", "Scotland"),
-    "G73": ("Cambuslang", "South Lanarkshire", "Scotland"),
-    "G74": ("East Kilbride", "South Lanarkshire", "Scotland"),
-    "G76": ("Thornliebank", "East Renfrewshire", "Scotland"),
-    "G77": ("Newton Mearns", "East Renfrewshire", "Scotland"),
-    "G78": ("", "East Renfrewshire", "Scotland"),
-    "G81": ("Clydebank", "West Dunbartonshire", "Scotland"),
-    "G82": ("Dumbarton", "West Dunbartonshire", "Scotland"),
-    "G83": ("Alexandria", "West Dunbartonshire", "Scotland"),
-    "G84": ("Helensburgh", "Argyll and Bute", "Scotland"),
-    "GL1": ("Gloucester", "Gloucestershire", "England"),
-    "GL10": ("Stonehouse", "Gloucestershire", "England"),
-    "GL11": ("Dursley", "Gloucestershire", "England"),
-    "GL12": ("Kingswood", "Gloucestershire", "England"),
-    "GL13": ("Berkeley", "Gloucestershire", "England"),
-    "GL14": ("Littledean", "Gloucestershire", "England"),
-    "GL15": ("Lydney", "Gloucestershire", "England"),
-    "GL16": ("Coleford", "Gloucestershire", "England"),
-    "GL17": ("Drybrook", "Gloucestershire", "England"),
-    "GL18": ("Oxenhall", "Gloucestershire", "England"),
-    "GL19": ("Ashleworth", "Gloucestershire", "England"),
-    "GL2": ("Gloucester", "Gloucestershire", "England"),
-    "GL20": ("Ashchurch", "Gloucestershire", "England"),
-    "GL3": ("Hucclecote", "Gloucestershire", "England"),
-    "GL4": ("Gloucester", "Gloucestershire", "England"),
-    "GL5": ("Rodborough", "Gloucestershire", "England"),
-    "GL50": ("Cheltenham", "Gloucestershire", "England"),
-    "GL51": ("Cheltenham", "Gloucestershire", "England"),
-    "GL52": ("Prestbury", "Gloucestershire", "England"),
-    "GL53": ("Cheltenham", "Gloucestershire", "England"),
-    "GL54": ("Naunton", "Gloucestershire", "England"),
-    "GL55": ("Chipping Campden", "Gloucestershire", "England"),
-    "GL56": ("Moreton-in-Marsh", "Gloucestershire", "England"),
-    "GL6": ("Thrupp", "Gloucestershire", "England"),
-    "GL7": ("Ampney St Mary", "Gloucestershire", "England"),
-    "GL8": ("Tetbury", "Gloucestershire", "England"),
-    "GL9": ("Hawkesbury", "South Gloucestershire", "England"),
-    "GU1": ("Guildford", "Surrey", "England"),
-    "GU10": ("Farnham", "Surrey", "England"),
-    "GU11": ("Aldershot", "Hampshire", "England"),
-    "GU12": ("Ash", "Surrey", "England"),
-    "GU13": ("Fleet", "Hampshire", "England"),
-    "GU14": ("Farnborough", "Hampshire", "England"),
-    "GU15": ("Camberley", "Surrey", "England"),
-    "GU16": ("Camberley", "Surrey", "England"),
-    "GU17": ("Blackwater and Hawley", "Hampshire", "England"),
-    "GU18": ("Windlesham", "Surrey", "England"),
-    "GU19": ("Windlesham", "Surrey", "England"),
-    "GU2": ("Guildford", "Surrey", "England"),
-    "GU20": ("Windlesham", "Surrey", "England"),
-    "GU21": ("Woking", "Surrey", "England"),
-    "GU22": ("Woking", "Surrey", "England"),
-    "GU23": ("Ripley", "Surrey", "England"),
-    "GU24": ("Bisley", "Surrey", "England"),
-    "GU25": ("Virginia Water", "Surrey", "England"),
-    "GU26": ("Haslemere", "Surrey", "England"),
-    "GU27": ("Haslemere", "Surrey", "England"),
-    "GU28": ("Tillington", "West Sussex", "England"),
-    "GU29": ("Midhurst", "West Sussex", "England"),
-    "GU3": ("Worplesdon", "Surrey", "England"),
-    "GU30": ("Liphook", "Hampshire", "England"),
-    "GU31": ("Petersfield", "Hampshire", "England"),
-    "GU32": ("Stroud", "Hampshire", "England"),
-    "GU33": ("Liss", "Hampshire", "England"),
-    "GU34": ("Alton", "Hampshire", "England"),
-    "GU35": ("Lindford", "Hampshire", "England"),
-    "GU4": ("Guildford", "Surrey", "England"),
-    "GU46": ("Yateley", "Hampshire", "England"),
-    "GU47": ("Sandhurst", "Bracknell Forest", "England"),
-    "GU5": ("Wonersh", "Surrey", "England"),
-    "GU51": ("Fleet", "Hampshire", "England"),
-    "GU52": ("Fleet", "Hampshire", "England"),
-    "GU6": ("Cranleigh", "Surrey", "England"),
-    "GU7": ("Godalming", "Surrey", "England"),
-    "GU8": ("Witley", "Surrey", "England"),
-    "GU9": ("Farnham", "Surrey", "England"),
-    "GY1": ("St Peter Port", "Guernsey", "Guernsey"),
-    "GY2": ("St Sampson", "Guernsey", "Guernsey"),
-    "GY3": ("St Sampson", "Guernsey", "Guernsey"),
-    "GY4": ("Carmel", "Guernsey", "Guernsey"),
-    "GY5": ("ALBecq", "Guernsey", "Guernsey"),
-    "GY6": ("L'Islet", "Guernsey", "Guernsey"),
-    "GY7": ("Richmond", "Guernsey", "Guernsey"),
-    "GY8": ("Mouilpied", "Guernsey", "Guernsey"),
-    "GY9": ("nr Mouilpied", "Guernsey", "Guernsey"),
-    "HA0": ("Brent", "Greater London", "England"),
-    "HA1": ("Harrow", "Greater London", "England"),
-    "HA2": ("Harrow", "Greater London", "England"),
-    "HA3": ("Harrow", "Greater London", "England"),
-    "HA4": ("Hillingdon", "Greater London", "England"),
-    "HA5": ("Harrow", "Greater London", "England"),
-    "HA6": ("Hillingdon", "Greater London", "England"),
-    "HA7": ("Harrow", "Greater London", "England"),
-    "HA8": ("Barnet", "Greater London", "England"),
-    "HA9": ("Brent", "Greater London", "England"),
-    "HD1": ("Huddersfield", "Kirklees", "England"),
-    "HD2": ("Huddersfield", "Kirklees", "England"),
-    "HD3": ("Huddersfield", "Kirklees", "England"),
-    "HD4": ("Huddersfield", "Kirklees", "England"),
-    "HD5": ("Huddersfield", "Kirklees", "England"),
-    "HD6": ("Halifax", "Calderdale", "England"),
-    "HD7": ("Huddersfield", "Kirklees", "England"),
-    "HD8": ("Kirkburton", "Kirklees", "England"),
-    "HD9": ("Holme", "Kirklees", "England"),
-    "HG1": ("Harrogate", "North Yorkshire", "England"),
-    "HG2": ("Harrogate", "North Yorkshire", "England"),
-    "HG3": ("Clint", "North Yorkshire", "England"),
-    "HG4": ("North Stainley", "North Yorkshire", "England"),
-    "HG5": ("Knaresborough", "North Yorkshire", "England"),
-    "HP1": ("Hemel Hempstead", "Hertfordshire", "England"),
-    "HP10": ("Chepping Wycombe", "Buckinghamshire", "England"),
-    "HP11": ("High Wycombe", "Buckinghamshire", "England"),
-    "HP12": ("High Wycombe", "Buckinghamshire", "England"),
-    "HP13": ("High Wycombe", "Buckinghamshire", "England"),
-    "HP14": ("Bledlow-cum-Saunderton", "Buckinghamshire", "England"),
-    "HP15": ("Hazlemere", "Buckinghamshire", "England"),
-    "HP16": ("Great Missenden", "Buckinghamshire", "England"),
-    "HP17": ("Dinton", "Buckinghamshire", "England"),
-    "HP18": ("Ashendon", "Buckinghamshire", "England"),
-    "HP19": ("Aylesbury", "Buckinghamshire", "England"),
-    "HP2": ("Hemel Hempstead", "Hertfordshire", "England"),
-    "HP20": ("Aylesbury", "Buckinghamshire", "England"),
-    "HP21": ("Aylesbury", "Buckinghamshire", "England"),
-    "HP22": ("Weston Turville", "Buckinghamshire", "England"),
-    "HP23": ("Tring", "Hertfordshire", "England"),
-    "HP27": ("Princes Risborough", "Buckinghamshire", "England"),
-    "HP3": ("Hemel Hempstead", "Hertfordshire", "England"),
-    "HP4": ("Berkhamsted", "Hertfordshire", "England"),
-    "HP5": ("Chesham", "Buckinghamshire", "England"),
-    "HP6": ("Amersham", "Buckinghamshire", "England"),
-    "HP7": ("Amersham", "Buckinghamshire", "England"),
-    "HP8": ("Chalfont St Giles", "Buckinghamshire", "England"),
-    "HP9": ("Beaconsfield", "Buckinghamshire", "England"),
-    "HR1": ("Hampton Bishop", "Herefordshire", "England"),
-    "HR2": ("Allensmore", "Herefordshire", "England"),
-    "HR3": ("Clifford", "Herefordshire", "England"),
-    "HR4": ("Burghill", "Herefordshire", "England"),
-    "HR5": ("Kington Rural", "Herefordshire", "England"),
-    "HR6": ("Leominster", "Herefordshire", "England"),
-    "HR7": ("Bromyard", "Herefordshire", "England"),
-    "HR8": ("Ledbury", "Herefordshire", "England"),
-    "HR9": ("Ross-on-Wye", "Herefordshire", "England"),
-    "HS1": ("Stornoway", "Eilean Siar", "Scotland"),
-    "HS2": ("", "Eilean Siar", "Scotland"),
-    "HS3": ("", "Eilean Siar", "Scotland"),
-    "HS4": ("", "Eilean Siar", "Scotland"),
-    "HS5": ("Leverburgh", "Eilean Siar", "Scotland"),
-    "HS6": ("", "Eilean Siar", "Scotland"),
-    "HS7": ("", "Eilean Siar", "Scotland"),
-    "HS8": ("", "Eilean Siar", "Scotland"),
-    "HS9": ("", "Eilean Siar", "Scotland"),
-    "HU1": ("Hull", "City of Kingston-upon-Hull", "England"),
-    "HU10": ("Cottingham", "East Riding of Yorkshire", "England"),
-    "HU11": ("Ellerby", "East Riding of Yorkshire", "England"),
-    "HU12": ("Burstwick", "East Riding of Yorkshire", "England"),
-    "HU13": ("Hessle", "East Riding of Yorkshire", "England"),
-    "HU14": ("North Ferriby", "East Riding of Yorkshire", "England"),
-    "HU15": ("Ellerker", "East Riding of Yorkshire", "England"),
-    "HU16": ("Cottingham", "East Riding of Yorkshire", "England"),
-    "HU17": ("Cottingham", "East Riding of Yorkshire", "England"),
-    "HU18": ("Hornsea", "East Riding of Yorkshire", "England"),
-    "HU19": ("Withernsea", "East Riding of Yorkshire", "England"),
-    "HU2": ("Hull", "City of Kingston-upon-Hull", "England"),
-    "HU20": ("Rowley", "East Riding of Yorkshire", "England"),
-    "HU3": ("Hull", "City of Kingston-upon-Hull", "England"),
-    "HU4": ("Hull", "City of Kingston-upon-Hull", "England"),
-    "HU5": ("Hull", "City of Kingston-upon-Hull", "England"),
-    "HU6": ("Hull", "City of Kingston-upon-Hull", "England"),
-    "HU7": ("Hull", "City of Kingston-upon-Hull", "England"),
-    "HU8": ("Hull", "City of Kingston-upon-Hull", "England"),
-    "HU9": ("Hull", "City of Kingston-upon-Hull", "England"),
-    "HX1": ("Halifax", "Calderdale", "England"),
-    "HX2": ("Halifax", "Calderdale", "England"),
-    "HX3": ("Halifax", "Calderdale", "England"),
-    "HX4": ("Halifax", "Calderdale", "England"),
-    "HX5": ("Halifax", "Calderdale", "England"),
-    "HX6": ("Halifax", "Calderdale", "England"),
-    "HX7": ("Hebden Royd", "Calderdale", "England"),
-    "IG1": ("Ilford", "Greater London", "England"),
-    "IG10": ("Loughton", "Essex", "England"),
-    "IG11": ("Barking", "Greater London", "England"),
-    "IG2": ("Ilford", "Greater London", "England"),
-    "IG3": ("Ilford", "Greater London", "England"),
-    "IG4": ("Ilford", "Greater London", "England"),
-    "IG5": ("Ilford", "Greater London", "England"),
-    "IG6": ("Ilford", "Greater London", "England"),
-    "IG7": ("Loughton", "Essex", "England"),
-    "IG8": ("Ilford", "Greater London", "England"),
-    "IG9": ("Loughton", "Essex", "England"),
-    "IM1": ("Douglas, Braddan", "IOM", "Isle of Man"),
-    "IM2": ("Douglas, Braddan", "IOM", "Isle of Man"),
-    "IM3": ("Onchan", "IOM", "Isle of Man"),
-    "IM4": ("Peel, German", "IOM", "Isle of Man"),
-    "IM5": ("Baldrine, Loman", "IOM", "Isle of Man"),
-    "IM6": ("Kirk Michael", "IOM", "Isle of Man"),
-    "IM7": ("St Judes, Andreas", "IOM", "Isle of Man"),
-    "IM8": ("Ramsay", "IOM", "Isle of Man"),
-    "IM9": ("Arbory", "IOM", "Isle of Man"),
-    "IP1": ("Ipswich", "Suffolk", "England"),
-    "IP10": ("Levington", "Suffolk", "England"),
-    "IP11": ("Felixstowe", "Suffolk", "England"),
-    "IP12": ("Bromeswell", "Suffolk", "England"),
-    "IP13": ("Kettleburgh", "Suffolk", "England"),
-    "IP14": ("Stowupland", "Suffolk", "England"),
-    "IP15": ("Aldeburgh", "Suffolk", "England"),
-    "IP16": ("Leiston", "Suffolk", "England"),
-    "IP17": ("Kelsale", "Suffolk", "England"),
-    "IP18": ("Southwold", "Suffolk", "England"),
-    "IP19": ("Halesworth", "Suffolk", "England"),
-    "IP2": ("Ipswich", "Suffolk", "England"),
-    "IP20": ("Harleston", "Norfolk", "England"),
-    "IP21": ("Syleham", "Suffolk", "England"),
-    "IP22": ("Wortham", "Suffolk", "England"),
-    "IP23": ("Eye", "Suffolk", "England"),
-    "IP24": ("Thetford", "Norfolk", "England"),
-    "IP25": ("Ovington", "Norfolk", "England"),
-    "IP26": ("Methwold", "Norfolk", "England"),
-    "IP27": ("Brandon", "Suffolk", "England"),
-    "IP28": ("Tuddenham", "Suffolk", "England"),
-    "IP29": ("Whepstead", "Suffolk", "England"),
-    "IP3": ("Ipswich", "Suffolk", "England"),
-    "IP30": ("Hessett", "Suffolk", "England"),
-    "IP31": ("Pakenham", "Suffolk", "England"),
-    "IP32": ("Bury St Edmunds", "Suffolk", "England"),
-    "IP33": ("Bury St Edmunds", "Suffolk", "England"),
-    "IP4": ("Ipswich", "Suffolk", "England"),
-    "IP5": ("Kesgrave", "Suffolk", "England"),
-    "IP6": ("Hemingstone", "Suffolk", "England"),
-    "IP7": ("Aldham", "Suffolk", "England"),
-    "IP8": ("Sproughton", "Suffolk", "England"),
-    "IP9": ("Holbrook", "Suffolk", "England"),
-    "IV1": ("Inverness", "Highland", "Scotland"),
-    "IV10": ("", "Highland", "Scotland"),
-    "IV11": ("Cromarty", "Highland", "Scotland"),
-    "IV12": ("Nairn", "Highland", "Scotland"),
-    "IV13": ("", "Highland", "Scotland"),
-    "IV14": ("Strathpeffer", "Highland", "Scotland"),
-    "IV15": ("Dingwall", "Highland", "Scotland"),
-    "IV16": ("Evanton", "Highland", "Scotland"),
-    "IV17": ("Alness", "Highland", "Scotland"),
-    "IV18": ("Invergordon", "Highland", "Scotland"),
-    "IV19": ("Tain", "Highland", "Scotland"),
-    "IV2": ("", "Highland", "Scotland"),
-    "IV20": ("", "Highland", "Scotland"),
-    "IV21": ("Gairloch", "Highland", "Scotland"),
-    "IV22": ("", "Highland", "Scotland"),
-    "IV23": ("", "Highland", "Scotland"),
-    "IV24": ("", "Highland", "Scotland"),
-    "IV25": ("", "Highland", "Scotland"),
-    "IV26": ("", "Highland", "Scotland"),
-    "IV27": ("", "Highland", "Scotland"),
-    "IV28": ("Rogart", "Highland", "Scotland"),
-    "IV3": ("Inverness", "Highland", "Scotland"),
-    "IV30": ("Elgin", "Moray", "Scotland"),
-    "IV31": ("Lossiemouth", "Moray", "Scotland"),
-    "IV32": ("Mosstodloch", "Moray", "Scotland"),
-    "IV36": ("Forres", "Moray", "Scotland"),
-    "IV4": ("", "Highland", "Scotland"),
-    "IV40": ("", "Highland", "Scotland"),
-    "IV41": ("Kyleakin", "Highland", "Scotland"),
-    "IV42": ("", "Highland", "Scotland"),
-    "IV43": ("", "Highland", "Scotland"),
-    "IV44": ("Saasaig", "Highland", "Scotland"),
-    "IV45": ("", "Highland", "Scotland"),
-    "IV46": ("Ferrindonald", "Highland", "Scotland"),
-    "IV47": ("", "Highland", "Scotland"),
-    "IV48": ("", "Highland", "Scotland"),
-    "IV49": ("", "Highland", "Scotland"),
-    "IV5": ("", "Highland", "Scotland"),
-    "IV51": ("", "Highland", "Scotland"),
-    "IV52": ("Plockton", "Highland", "Scotland"),
-    "IV53": ("", "Highland", "Scotland"),
-    "IV54": ("", "Highland", "Scotland"),
-    "IV55": ("", "Highland", "Scotland"),
-    "IV56": ("Isle of Skye", "Highland", "Scotland"),
-    "IV6": ("Muir Of Ord", "Highland", "Scotland"),
-    "IV63": ("Lewiston", "Highland", "Scotland"),
-    "IV7": ("", "Highland", "Scotland"),
-    "IV8": ("", "Highland", "Scotland"),
-    "IV9": ("Avoch", "Highland", "Scotland"),
-    "JE1": ("St Helier", "Jersey", "Jersey"),
-    "JE2": ("St Helier", "Jersey", "Jersey"),
-    "JE3": ("St+F2813 Ouen", "Jersey", "Jersey"),
-    "JE4": ("St Helier", "Jersey", "Jersey"),
-    "KA1": ("Kilmarnock", "East Ayrshire", "Scotland"),
-    "KA10": ("Troon", "South Ayrshire", "Scotland"),
-    "KA11": ("Irvine", "North Ayrshire", "Scotland"),
-    "KA12": ("Irvine", "North Ayrshire", "Scotland"),
-    "KA13": ("Kilwinning", "North Ayrshire", "Scotland"),
-    "KA14": ("Glengarnock", "North Ayrshire", "Scotland"),
-    "KA15": ("Beith", "North Ayrshire", "Scotland"),
-    "KA16": ("Newmilns", "East Ayrshire", "Scotland"),
-    "KA17": ("Darvel", "East Ayrshire", "Scotland"),
-    "KA18": ("Cumnock", "East Ayrshire", "Scotland"),
-    "KA19": ("", "South Ayrshire", "Scotland"),
-    "KA2": ("Gatehead", "East Ayrshire", "Scotland"),
-    "KA20": ("Stevenston", "North Ayrshire", "Scotland"),
-    "KA21": ("Ardrossan", "North Ayrshire", "Scotland"),
-    "KA22": ("Ardrossan", "North Ayrshire", "Scotland"),
-    "KA23": ("West Kilbride", "North Ayrshire", "Scotland"),
-    "KA24": ("Dalry", "North Ayrshire", "Scotland"),
-    "KA25": ("Kilbirnie", "North Ayrshire", "Scotland"),
-    "KA26": ("", "South Ayrshire", "Scotland"),
-    "KA27": ("", "North Ayrshire", "Scotland"),
-    "KA28": ("Millport", "North Ayrshire", "Scotland"),
-    "KA29": ("Fairlie", "North Ayrshire", "Scotland"),
-    "KA3": ("", "East Ayrshire", "Scotland"),
-    "KA30": ("Largs", "North Ayrshire", "Scotland"),
-    "KA4": ("Galston", "East Ayrshire", "Scotland"),
-    "KA5": ("Mauchline", "East Ayrshire", "Scotland"),
-    "KA6": ("", "South Ayrshire", "Scotland"),
-    "KA7": ("Ayr", "South Ayrshire", "Scotland"),
-    "KA8": ("Ayr", "South Ayrshire", "Scotland"),
-    "KA9": ("Ayr", "South Ayrshire", "Scotland"),
-    "KT1": ("Kingston Upon Thames", "Greater London", "England"),
-    "KT10": ("Esher", "Surrey", "England"),
-    "KT11": ("Cobham", "Surrey", "England"),
-    "KT12": ("West Molesey", "Surrey", "England"),
-    "KT13": ("West Molesey", "Surrey", "England"),
-    "KT14": ("", "Surrey", "England"),
-    "KT15": ("Addlestone", "Surrey", "England"),
-    "KT16": ("", "Surrey", "England"),
-    "KT17": ("Epsom", "Surrey", "England"),
-    "KT18": ("", "Surrey", "England"),
-    "KT19": ("Epsom", "Surrey", "England"),
-    "KT2": ("Kingston Upon Thames", "Greater London", "England"),
-    "KT20": ("Reigate and Banstead", "Surrey", "England"),
-    "KT21": ("Leatherhead", "Surrey", "England"),
-    "KT22": ("Leatherhead", "Surrey", "England"),
-    "KT23": ("Dorking", "Surrey", "England"),
-    "KT24": ("East Horsley", "Surrey", "England"),
-    "KT3": ("Kingston Upon Thames", "Greater London", "England"),
-    "KT4": ("Sutton", "Greater London", "England"),
-    "KT5": ("Kingston Upon Thames", "Greater London", "England"),
-    "KT6": ("Kingston Upon Thames", "Greater London", "England"),
-    "KT7": ("Esher", "Surrey", "England"),
-    "KT8": ("West Molesey", "Surrey", "England"),
-    "KT9": ("Kingston Upon Thames", "Greater London", "England"),
-    "KW1": ("", "Highland", "Scotland"),
-    "KW10": ("Golspie", "Highland", "Scotland"),
-    "KW11": ("", "Highland", "Scotland"),
-    "KW12": ("Halkirk", "Highland", "Scotland"),
-    "KW13": ("", "Highland", "Scotland"),
-    "KW14": ("Thurso", "Highland", "Scotland"),
-    "KW15": ("Kirkwall", "Orkney Islands", "Scotland"),
-    "KW16": ("Stromness", "Orkney Islands", "Scotland"),
-    "KW17": ("Gorseness", "Orkney Islands", "Scotland"),
-    "KW2": ("Whaligoe", "Highland", "Scotland"),
-    "KW3": ("Lybster", "Highland", "Scotland"),
-    "KW5": ("", "Highland", "Scotland"),
-    "KW6": ("", "Highland", "Scotland"),
-    "KW7": ("", "Highland", "Scotland"),
-    "KW8": ("", "Highland", "Scotland"),
-    "KW9": ("Brora", "Highland", "Scotland"),
-    "KY1": ("Kirkcaldy", "Fife", "Scotland"),
-    "KY10": ("", "Fife", "Scotland"),
-    "KY11": ("", "Fife", "Scotland"),
-    "KY12": ("Dunfermline", "Fife", "Scotland"),
-    "KY13": ("Kinross", "Perth and Kinross", "Scotland"),
-    "KY14": ("", "Fife", "Scotland"),
-    "KY15": ("", "Fife", "Scotland"),
-    "KY16": ("", "Fife", "Scotland"),
-    "KY2": ("Kirkcaldy", "Fife", "Scotland"),
-    "KY3": ("Burntisland", "Fife", "Scotland"),
-    "KY4": ("", "Fife", "Scotland"),
-    "KY5": ("", "Fife", "Scotland"),
-    "KY6": ("Glenrothes", "Fife", "Scotland"),
-    "KY7": ("Glenrothes", "Fife", "Scotland"),
-    "KY8": ("Leven", "Fife", "Scotland"),
-    "KY9": ("Kilconquhar", "Fife", "Scotland"),
-    "L1": ("", "Liverpool", "England"),
-    "L10": ("Aintree", "Sefton", "England"),
-    "L11": ("", "Liverpool", "England"),
-    "L12": ("", "Liverpool", "England"),
-    "L13": ("", "Liverpool", "England"),
-    "L14": ("", "Liverpool", "England"),
-    "L15": ("", "Liverpool", "England"),
-    "L16": ("", "Liverpool", "England"),
-    "L17": ("", "Liverpool", "England"),
-    "L18": ("Garston", "Liverpool", "England"),
-    "L19": ("Garston", "Liverpool", "England"),
-    "L2": ("", "Liverpool", "England"),
-    "L20": ("Southport", "Sefton", "England"),
-    "L21": ("Southport", "Sefton", "England"),
-    "L22": ("Southport", "Sefton", "England"),
-    "L23": ("Crosby", "Liverpool", "England"),
-    "L24": ("Garston", "Liverpool", "England"),
-    "L25": ("Garston", "Liverpool", "England"),
-    "L26": ("Halewood", "Knowsley", "England"),
-    "L27": ("", "Liverpool", "England"),
-    "L28": ("", "Knowsley", "England"),
-    "L29": ("", "Sefton", "England"),
-    "L3": ("", "Liverpool", "England"),
-    "L30": ("Southport", "Sefton", "England"),
-    "L31": ("Maghull", "Sefton", "England"),
-    "L32": ("Kirkby", "Knowsley", "England"),
-    "L33": ("Kirkby", "Knowsley", "England"),
-    "L34": ("", "Knowsley", "England"),
-    "L35": ("Rainhill", "St Helens", "England"),
-    "L36": ("Hyton", "Knowsley", "England"),
-    "L37": ("Southport", "Sefton", "England"),
-    "L38": ("Southport", "Sefton", "England"),
-    "L39": ("Ormskirk", "Lancashire", "England"),
-    "L4": ("", "Liverpool", "England"),
-    "L40": ("Burscough", "Lancashire", "England"),
-    "L5": ("", "Liverpool", "England"),
-    "L6": ("", "Liverpool", "England"),
-    "L69": ("", "Liverpool", "England"),
-    "L7": ("", "Liverpool", "England"),
-    "L70": ("", "Liverpool", "England"),
-    "L8": ("", "Liverpool", "England"),
-    "L9": ("", "Liverpool", "England"),
-    "LA1": ("Lancaster", "Lancashire", "England"),
-    "LA10": ("Sedbergh", "Cumbria", "England"),
-    "LA11": ("Grange-over-Sands", "Cumbria", "England"),
-    "LA12": ("Ulverston", "Cumbria", "England"),
-    "LA13": ("Dalton-in-Furness", "Cumbria", "England"),
-    "LA14": ("Dalton-in-Furness", "Cumbria", "England"),
-    "LA15": ("Dalton Town with Newton", "Cumbria", "England"),
-    "LA16": ("Ireleth", "Cumbria", "England"),
-    "LA17": ("Kirkby Ireleth", "Cumbria", "England"),
-    "LA18": ("Millom", "Cumbria", "England"),
-    "LA19": ("Bootle", "Cumbria", "England"),
-    "LA2": ("Caton", "Lancashire", "England"),
-    "LA20": ("Broughton West", "Cumbria", "England"),
-    "LA21": ("Coniston", "Cumbria", "England"),
-    "LA22": ("Lakes", "Cumbria", "England"),
-    "LA23": ("Windermere", "Cumbria", "England"),
-    "LA3": ("Lancaster", "Lancashire", "England"),
-    "LA4": ("Lancaster", "Lancashire", "England"),
-    "LA5": ("Warton", "Lancashire", "England"),
-    "LA6": ("Whittingham", "Lancashire", "England"),
-    "LA7": ("Milnthorpe", "Cumbria", "England"),
-    "LA8": ("Kendal", "Cumbria", "England"),
-    "LA9": ("Kendal", "Cumbria", "England"),
-    "LD1": ("Llandrindod Wells", "Powys", "Wales"),
-    "LD2": ("Duhonw", "Powys", "Wales"),
-    "LD3": ("Llanddew", "Powys", "Wales"),
-    "LD4": ("Llangamarch", "Powys", "Wales"),
-    "LD5": ("Treflys", "Powys", "Wales"),
-    "LD6": ("Rhayader", "Powys", "Wales"),
-    "LD7": ("Knighton", "Powys", "Wales"),
-    "LD8": ("Presteigne", "Powys", "Wales"),
-    "LE1": ("Leicester", "Leicester", "England"),
-    "LE10": ("Hinckley", "Leicestershire", "England"),
-    "LE11": ("Loughborough", "Leicestershire", "England"),
-    "LE12": ("Loughborough", "Leicestershire", "England"),
-    "LE13": ("Melton Mowbray", "Leicestershire", "England"),
-    "LE14": ("Melton Mowbray", "Leicestershire", "England"),
-    "LE15": ("Hambleton", "Rutland", "England"),
-    "LE16": ("Dingley", "Northamptonshire", "England"),
-    "LE17": ("Gilmorton", "Leicestershire", "England"),
-    "LE18": ("Wigston", "Leicestershire", "England"),
-    "LE19": ("Narborough", "Leicestershire", "England"),
-    "LE2": ("Oadby", "Leicester", "England"),
-    "LE3": ("Leicester", "Leicester", "England"),
-    "LE4": ("Leicester", "Leicester", "England"),
-    "LE5": ("Leicester", "Leicester", "England"),
-    "LE6": ("Groby", "Leicestershire", "England"),
-    "LE65": ("Ashby-de-la-Zouch", "Leicestershire", "England"),
-    "LE67": ("Coalville", "Leicestershire", "England"),
-    "LE7": ("Barkby", "Leicestershire", "England"),
-    "LE8": ("Kilby", "Leicestershire", "England"),
-    "LE9": ("Hinckley", "Leicestershire", "England"),
-    "LL11": ("Broughton", "Wrexham", "Wales"),
-    "LL12": ("Gresford", "Wrexham", "Wales"),
-    "LL13": ("Abenbury", "Wrexham", "Wales"),
-    "LL14": ("Ruabon", "Wrexham", "Wales"),
-    "LL15": ("Ruthin", "Denbighshire", "Wales"),
-    "LL16": ("Denbigh", "Denbighshire", "Wales"),
-    "LL17": ("St Asaph", "Denbighshire", "Wales"),
-    "LL18": ("Rhyl", "Denbighshire", "Wales"),
-    "LL19": ("Prestatyn", "Denbighshire", "Wales"),
-    "LL20": ("Llangollen", "Denbighshire", "Wales"),
-    "LL21": ("Corwen", "Denbighshire", "Wales"),
-    "LL22": ("Betws-yn-Rhos", "Conwy", "Wales"),
-    "LL23": ("Bala", "Gwynedd", "Wales"),
-    "LL24": ("Bro Machno", "Conwy", "Wales"),
-    "LL25": ("Dolwyddelan", "Conwy", "Wales"),
-    "LL26": ("Llanrwst", "Conwy", "Wales"),
-    "LL27": ("Trefriw", "Conwy", "Wales"),
-    "LL28": ("Mochdre", "Conwy", "Wales"),
-    "LL29": ("Old Colwyn", "Conwy", "Wales"),
-    "LL30": ("Llandudno", "Conwy", "Wales"),
-    "LL31": ("Deganwy", "Conwy", "Wales"),
-    "LL32": ("Henryd", "Conwy", "Wales"),
-    "LL33": ("Llanfairfechan", "Conwy", "Wales"),
-    "LL34": ("Penmaenmawr", "Conwy", "Wales"),
-    "LL35": ("Aberdovey", "Gwynedd", "Wales"),
-    "LL36": ("Bryncrug", "Gwynedd", "Wales"),
-    "LL37": ("Llangelynin", "Gwynedd", "Wales"),
-    "LL38": ("Arthog", "Gwynedd", "Wales"),
-    "LL39": ("Arthog", "Gwynedd", "Wales"),
-    "LL40": ("Brithdir", "Gwynedd", "Wales"),
-    "LL41": ("Ffestiniog", "Gwynedd", "Wales"),
-    "LL42": ("Barmouth", "Gwynedd", "Wales"),
-    "LL43": ("Dyffryn Ardudwy", "Gwynedd", "Wales"),
-    "LL44": ("Dyffryn Ardudwy", "Gwynedd", "Wales"),
-    "LL45": ("Llanbedr", "Gwynedd", "Wales"),
-    "LL46": ("Harlech", "Gwynedd", "Wales"),
-    "LL47": ("Talsarnau", "Gwynedd", "Wales"),
-    "LL48": ("Penrhyndeudraeth", "Gwynedd", "Wales"),
-    "LL49": ("Porthmadog", "Gwynedd", "Wales"),
-    "LL51": ("Dolbenmaen", "Gwynedd", "Wales"),
-    "LL52": ("Criccieth", "Gwynedd", "Wales"),
-    "LL53": ("Buan", "Gwynedd", "Wales"),
-    "LL54": ("Llanllyfni", "Gwynedd", "Wales"),
-    "LL55": ("Llanrug", "Gwynedd", "Wales"),
-    "LL56": ("Y Felinheli", "Gwynedd", "Wales"),
-    "LL57": ("Llandygai", "Gwynedd", "Wales"),
-    "LL58": ("Beaumaris", "Isle of Anglesey", "Wales"),
-    "LL59": ("Cwm Cadnant", "Isle of Anglesey", "Wales"),
-    "LL60": ("Llanfihangel Ysgeifiog", "Isle of Anglesey", "Wales"),
-    "LL61": ("Llanidan", "Isle of Anglesey", "Wales"),
-    "LL62": ("Bodorgan", "Isle of Anglesey", "Wales"),
-    "LL63": ("Aberffraw", "Isle of Anglesey", "Wales"),
-    "LL64": ("Rhosneigr", "Isle of Anglesey", "Wales"),
-    "LL65": ("Valley", "Isle of Anglesey", "Wales"),
-    "LL66": ("Rhosybol", "Isle of Anglesey", "Wales"),
-    "LL67": ("Llanbadrig", "Isle of Anglesey", "Wales"),
-    "LL68": ("Amlwch", "Isle of Anglesey", "Wales"),
-    "LL69": ("Penysarn", "Isle of Anglesey", "Wales"),
-    "LL70": ("Moelfre", "Isle of Anglesey", "Wales"),
-    "LL71": ("Llannerch-Y-Medd", "Isle of Anglesey", "Wales"),
-    "LL72": ("Moelfre", "Isle of Anglesey", "Wales"),
-    "LL73": ("Llaneugrad", "Isle of Anglesey", "Wales"),
-    "LL74": ("Llanfair-Mathafarn-Eithaf", "Isle of Anglesey", "Wales"),
-    "LL75": ("Pentraeth", "Isle of Anglesey", "Wales"),
-    "LL76": ("Llanfair-Mathafarn-Eithaf", "Isle of Anglesey", "Wales"),
-    "LL77": ("Llangefni", "Isle of Anglesey", "Wales"),
-    "LL78": ("Llanfair-Mathafarn-Eithaf", "Isle of Anglesey", "Wales"),
-    "LN1": ("Burton", "Lincolnshire", "England"),
-    "LN10": ("Woodhall Spa", "Lincolnshire", "England"),
-    "LN11": ("Louth", "Lincolnshire", "England"),
-    "LN12": ("Mablethorpe", "Lincolnshire", "England"),
-    "LN13": ("Alford", "Lincolnshire", "England"),
-    "LN2": ("Nettleham", "Lincolnshire", "England"),
-    "LN3": ("Fiskerton", "Lincolnshire", "England"),
-    "LN4": ("Dunston", "Lincolnshire", "England"),
-    "LN5": ("Waddington", "Lincolnshire", "England"),
-    "LN6": ("Lincoln", "Lincolnshire", "England"),
-    "LN7": ("Caistor", "Lincolnshire", "England"),
-    "LN8": ("Linwood", "Lincolnshire", "England"),
-    "LN9": ("Horncastle", "Lincolnshire", "England"),
-    "LS1": ("", "Leeds", "England"),
-    "LS10": ("", "Leeds", "England"),
-    "LS11": ("", "Leeds", "England"),
-    "LS12": ("", "Leeds", "England"),
-    "LS13": ("", "Leeds", "England"),
-    "LS14": ("", "Leeds", "England"),
-    "LS15": ("", "Leeds", "England"),
-    "LS16": ("", "Leeds", "England"),
-    "LS17": ("Harewood", "Leeds", "England"),
-    "LS18": ("", "Leeds", "England"),
-    "LS19": ("Guiseley", "Leeds", "England"),
-    "LS2": ("", "Leeds", "England"),
-    "LS20": ("Guiseley", "Leeds", "England"),
-    "LS21": ("Otley", "Leeds", "England"),
-    "LS22": ("Wetherby", "Leeds", "England"),
-    "LS23": ("Boston Spa", "Leeds", "England"),
-    "LS24": ("Grimston", "North Yorkshire", "England"),
-    "LS25": ("Micklefield", "Leeds", "England"),
-    "LS26": ("Rothwell", "Leeds", "England"),
-    "LS27": ("Gildersome", "Leeds", "England"),
-    "LS28": ("", "Leeds", "England"),
-    "LS29": ("Ilkley", "Bradford", "England"),
-    "LS3": ("", "Leeds", "England"),
-    "LS4": ("", "Leeds", "England"),
-    "LS5": ("", "Leeds", "England"),
-    "LS6": ("", "Leeds", "England"),
-    "LS7": ("", "Leeds", "England"),
-    "LS8": ("", "Leeds", "England"),
-    "LS9": ("", "Leeds", "England"),
-    "LU1": ("", "Luton", "England"),
-    "LU2": ("", "Luton", "England"),
-    "LU3": ("", "Luton", "England"),
-    "LU4": ("", "Luton", "England"),
-    "LU5": ("Thorn", "Central Bedfordshire", "England"),
-    "LU6": ("Dunstable", "Central Bedfordshire", "England"),
-    "LU7": ("Leighton-Linslade", "Central Bedfordshire", "England"),
-    "M1": ("Manchester", "Greater Manchester", "England"),
-    "M11": ("Manchester", "Greater Manchester", "England"),
-    "M12": ("Manchester", "Greater Manchester", "England"),
-    "M13": ("Manchester", "Greater Manchester", "England"),
-    "M14": ("Manchester", "Greater Manchester", "England"),
-    "M15": ("Manchester", "Greater Manchester", "England"),
-    "M16": ("Manchester", "Greater Manchester", "England"),
-    "M17": ("Urmston", "Trafford", "England"),
-    "M18": ("Manchester", "Greater Manchester", "England"),
-    "M19": ("Manchester", "Greater Manchester", "England"),
-    "M2": ("Manchester", "Greater Manchester", "England"),
-    "M20": ("Manchester", "Greater Manchester", "England"),
-    "M21": ("Manchester", "Greater Manchester", "England"),
-    "M22": ("Manchester", "Greater Manchester", "England"),
-    "M23": ("Manchester", "Greater Manchester", "England"),
-    "M24": ("Middleton", "Rochdale", "England"),
-    "M25": ("", "Bury", "England"),
-    "M26": ("", "Bury", "England"),
-    "M27": ("", "Salford", "England"),
-    "M28": ("Walkden", "Salford", "England"),
-    "M29": ("Pemberton", "Wigan", "England"),
-    "M3": ("", "Salford", "England"),
-    "M30": ("", "Salford", "England"),
-    "M31": ("Partington", "Trafford", "England"),
-    "M32": ("Urmston", "Trafford", "England"),
-    "M33": ("", "Trafford", "England"),
-    "M34": ("Ashton-under-Lyne", "Tameside", "England"),
-    "M35": ("", "Oldham", "England"),
-    "M38": ("Walkden", "Salford", "England"),
-    "M4": ("Manchester", "Greater Manchester", "England"),
-    "M40": ("Manchester", "Greater Manchester", "England"),
-    "M41": ("Urmston", "Trafford", "England"),
-    "M43": ("Ashton-under-Lyne", "Tameside", "England"),
-    "M44": ("", "Salford", "England"),
-    "M45": ("", "Bury", "England"),
-    "M46": ("Pemberton", "Wigan", "England"),
-    "M5": ("", "Salford", "England"),
-    "M6": ("", "Salford", "England"),
-    "M60": ("Manchester", "Greater Manchester", "England"),
-    "M7": ("", "Salford", "England"),
-    "M8": ("Manchester", "Greater Manchester", "England"),
-    "M9": ("Manchester", "Greater Manchester", "England"),
-    "M90": ("Ringway", "Greater Manchester", "England"),
-    "ME1": ("Rochester", "Medway", "England"),
-    "ME10": ("Sittingbourne", "Kent", "England"),
-    "ME11": ("Queenborough", "Kent", "England"),
-    "ME12": ("Sittingbourne", "Kent", "England"),
-    "ME13": ("Faversham", "Kent", "England"),
-    "ME14": ("Maidstone", "Kent", "England"),
-    "ME15": ("Maidstone", "Kent", "England"),
-    "ME16": ("Maidstone", "Kent", "England"),
-    "ME17": ("Leeds", "Kent", "England"),
-    "ME18": ("West Farleigh", "Kent", "England"),
-    "ME19": ("West Malling", "Kent", "England"),
-    "ME2": ("Strood", "Medway", "England"),
-    "ME20": ("Ditton", "Kent", "England"),
-    "ME3": ("Hoo St Werburgh", "Medway", "England"),
-    "ME4": ("Rochester", "Medway", "England"),
-    "ME5": ("Rochester", "Medway", "England"),
-    "ME6": ("Snodland", "Kent", "England"),
-    "ME7": ("Gillingham", "Medway", "England"),
-    "ME8": ("Gillingham", "Medway", "England"),
-    "ME9": ("Sittingbourne", "Kent", "England"),
-    "MK1": ("Bletchley", "Milton Keynes", "England"),
-    "MK10": ("", "Milton Keynes", "England"),
-    "MK11": ("Stony Stratford", "Milton Keynes", "England"),
-    "MK12": ("Stony Stratford", "Milton Keynes", "England"),
-    "MK13": ("Bradwell", "Milton Keynes", "England"),
-    "MK14": ("Stantonbury", "Milton Keynes", "England"),
-    "MK15": ("Willen", "Milton Keynes", "England"),
-    "MK16": ("Newport Pagnell", "Milton Keynes", "England"),
-    "MK17": ("Bow Brickhill", "Milton Keynes", "England"),
-    "MK18": ("Buckingham", "Buckinghamshire", "England"),
-    "MK19": ("Cosgrove", "Northamptonshire", "England"),
-    "MK2": ("Bletchley", "Milton Keynes", "England"),
-    "MK3": ("Bletchley", "Milton Keynes", "England"),
-    "MK4": ("Shenley Brook End", "Milton Keynes", "England"),
-    "MK40": ("Bedford", "Bedford Borough", "England"),
-    "MK41": ("Bedford", "Bedford Borough", "England"),
-    "MK42": ("Kempston", "Bedford Borough", "England"),
-    "MK43": ("Kempston Rural", "Bedford Borough", "England"),
-    "MK44": ("Wilden", "Bedford Borough", "England"),
-    "MK45": ("Maulden", "Central Bedfordshire", "England"),
-    "MK46": ("Clifton Reynes", "Milton Keynes", "England"),
-    "MK5": ("Shenley Church End", "Milton Keynes", "England"),
-    "MK6": ("Woughton On The Green", "Milton Keynes", "England"),
-    "MK7": ("Walton", "Milton Keynes", "England"),
-    "MK8": ("Bradwell Abbey", "Milton Keynes", "England"),
-    "MK9": ("", "Milton Keynes", "England"),
-    "ML1": ("Motherwell", "North Lanarkshire", "Scotland"),
-    "ML10": ("Strathaven", "South Lanarkshire", "Scotland"),
-    "ML11": ("New Lanark", "South Lanarkshire", "Scotland"),
-    "ML12": ("", "South Lanarkshire", "Scotland"),
-    "ML2": ("Wishaw", "North Lanarkshire", "Scotland"),
-    "ML3": ("Hamilton", "South Lanarkshire", "Scotland"),
-    "ML4": ("Motherwell", "North Lanarkshire", "Scotland"),
-    "ML5": ("Coatbridge", "North Lanarkshire", "Scotland"),
-    "ML6": ("Airdrie", "North Lanarkshire", "Scotland"),
-    "ML7": ("", "North Lanarkshire", "Scotland"),
-    "ML8": ("Carluke", "South Lanarkshire", "Scotland"),
-    "ML9": ("Larkhall", "South Lanarkshire", "Scotland"),
-    "N1": ("Islington", "Greater London", "England"),
-    "N10": ("Tottenham", "Greater London", "England"),
-    "N11": ("Enfield", "Greater London", "England"),
-    "N12": ("Barnet", "Greater London", "England"),
-    "N13": ("Enfield", "Greater London", "England"),
-    "N14": ("Enfield", "Greater London", "England"),
-    "N15": ("Tottenham", "Greater London", "England"),
-    "N16": ("Hackney", "Greater London", "England"),
-    "N17": ("Tottenham", "Greater London", "England"),
-    "N18": ("Enfield", "Greater London", "England"),
-    "N19": ("Islington", "Greater London", "England"),
-    "N2": ("Barnet", "Greater London", "England"),
-    "N20": ("Barnet", "Greater London", "England"),
-    "N21": ("Enfield", "Greater London", "England"),
-    "N22": ("Tottenham", "Greater London", "England"),
-    "N3": ("Barnet", "Greater London", "England"),
-    "N4": ("Hackney", "Greater London", "England"),
-    "N5": ("Islington", "Greater London", "England"),
-    "N6": ("Tottenham", "Greater London", "England"),
-    "N7": ("Islington", "Greater London", "England"),
-    "N8": ("Tottenham", "Greater London", "England"),
-    "N9": ("Enfield", "Greater London", "England"),
-    "NE1": ("", "Newcastle Upon Tyne", "England"),
-    "NE10": ("", "Gateshead", "England"),
-    "NE11": ("Wickham and Dunston", "Gateshead", "England"),
-    "NE12": ("Longbenton", "North Tyneside", "England"),
-    "NE13": ("Brunswick", "Newcastle Upon Tyne", "England"),
-    "NE15": ("Newburn", "Newcastle Upon Tyne", "England"),
-    "NE16": ("Wickham and Dunston", "Gateshead", "England"),
-    "NE17": ("Blaydon", "Gateshead", "England"),
-    "NE18": ("Stamfordham", "Northumberland", "England"),
-    "NE19": ("Elsdon", "Northumberland", "England"),
-    "NE2": ("Byker", "Newcastle Upon Tyne", "England"),
-    "NE20": ("Ponteland", "Northumberland", "England"),
-    "NE21": ("Blaydon", "Gateshead", "England"),
-    "NE22": ("Wansbeck", "Northumberland", "England"),
-    "NE23": ("Blyth", "Northumberland", "England"),
-    "NE24": ("Blyth", "Northumberland", "England"),
-    "NE25": ("", "North Tyneside", "England"),
-    "NE26": ("", "North Tyneside", "England"),
-    "NE27": ("", "North Tyneside", "England"),
-    "NE28": ("", "North Tyneside", "England"),
-    "NE29": ("", "North Tyneside", "England"),
-    "NE3": ("", "Newcastle Upon Tyne", "England"),
-    "NE30": ("", "North Tyneside", "England"),
-    "NE31": ("", "South Tyneside", "England"),
-    "NE32": ("", "South Tyneside", "England"),
-    "NE33": ("", "South Tyneside", "England"),
-    "NE34": ("", "South Tyneside", "England"),
-    "NE35": ("", "South Tyneside", "England"),
-    "NE36": ("", "South Tyneside", "England"),
-    "NE37": ("Washington", "Sunderland", "England"),
-    "NE38": ("Washington", "Sunderland", "England"),
-    "NE39": ("Blaydon", "Gateshead", "England"),
-    "NE4": ("", "Newcastle Upon Tyne", "England"),
-    "NE40": ("Blaydon", "Gateshead", "England"),
-    "NE41": ("Wylam", "Northumberland", "England"),
-    "NE42": ("Prudhoe", "Northumberland", "England"),
-    "NE43": ("Stocksfield", "Northumberland", "England"),
-    "NE44": ("Broomhaugh and Riding", "Northumberland", "England"),
-    "NE45": ("Corbridge", "Northumberland", "England"),
-    "NE46": ("Hexham", "Northumberland", "England"),
-    "NE47": ("Allendale", "Northumberland", "England"),
-    "NE48": ("Bellingham", "Northumberland", "England"),
-    "NE49": ("Haltwhistle", "Northumberland", "England"),
-    "NE5": ("Newburn", "Newcastle Upon Tyne", "England"),
-    "NE6": ("Byker", "Newcastle Upon Tyne", "England"),
-    "NE61": ("Morpeth", "Northumberland", "England"),
-    "NE62": ("Wansbeck", "Northumberland", "England"),
-    "NE63": ("Wansbeck", "Northumberland", "England"),
-    "NE64": ("Wansbeck", "Northumberland", "England"),
-    "NE65": ("Newton on the Moor", "Northumberland", "England"),
-    "NE66": ("Denwick", "Northumberland", "England"),
-    "NE67": ("Ellingham", "Northumberland", "England"),
-    "NE68": ("North Sunderland", "Northumberland", "England"),
-    "NE69": ("Bamburgh", "Northumberland", "England"),
-    "NE7": ("Byker", "Newcastle Upon Tyne", "England"),
-    "NE70": ("Belford", "Northumberland", "England"),
-    "NE71": ("Akeld", "Northumberland", "England"),
-    "NE8": ("", "Gateshead", "England"),
-    "NE9": ("", "Gateshead", "England"),
-    "NE99": ("", "Newcastle Upon Tyne", "England"),
-    "NG1": ("", "Nottingham", "England"),
-    "NG10": ("Ilkeston", "Derbyshire", "England"),
-    "NG11": ("Clifton", "Nottingham", "England"),
-    "NG12": ("Cotgrave", "Nottinghamshire", "England"),
-    "NG13": ("Bingham", "Nottinghamshire", "England"),
-    "NG14": ("Lowdham", "Nottinghamshire", "England"),
-    "NG15": ("Sutton in Ashfield", "Nottinghamshire", "England"),
-    "NG16": ("Greasley", "Nottinghamshire", "England"),
-    "NG17": ("Sutton in Ashfield", "Nottinghamshire", "England"),
-    "NG18": ("Mansfield", "Nottinghamshire", "England"),
-    "NG19": ("Mansfield", "Nottinghamshire", "England"),
-    "NG2": ("West Bridgford", "Nottinghamshire", "England"),
-    "NG20": ("Warsop", "Nottinghamshire", "England"),
-    "NG21": ("Rainworth", "Nottinghamshire", "England"),
-    "NG22": ("Ompton", "Nottinghamshire", "England"),
-    "NG23": ("North Muskham", "Nottinghamshire", "England"),
-    "NG24": ("Newark-on-Trent", "Nottinghamshire", "England"),
-    "NG25": ("Southwell", "Nottinghamshire", "England"),
-    "NG3": ("", "Nottingham", "England"),
-    "NG31": ("Grantham", "Lincolnshire", "England"),
-    "NG32": ("Great Gonerby", "Lincolnshire", "England"),
-    "NG33": ("Burton Coggles", "Lincolnshire", "England"),
-    "NG34": ("Sleaford", "Lincolnshire", "England"),
-    "NG4": ("Carlton", "Nottinghamshire", "England"),
-    "NG5": ("", "Nottingham", "England"),
-    "NG6": ("", "Nottingham", "England"),
-    "NG7": ("", "Nottingham", "England"),
-    "NG8": ("", "Nottingham", "England"),
-    "NG9": ("Beeston", "Nottinghamshire", "England"),
-    "NN1": ("Northampton", "Northamptonshire", "England"),
-    "NN10": ("Rushden", "Northamptonshire", "England"),
-    "NN11": ("Badby", "Northamptonshire", "England"),
-    "NN12": ("Towcester", "Northamptonshire", "England"),
-    "NN13": ("Brackley", "Northamptonshire", "England"),
-    "NN14": ("Warkton", "Northamptonshire", "England"),
-    "NN15": ("Kettering", "Northamptonshire", "England"),
-    "NN16": ("Kettering", "Northamptonshire", "England"),
-    "NN17": ("Corby", "Northamptonshire", "England"),
-    "NN18": ("Corby", "Northamptonshire", "England"),
-    "NN2": ("Northampton", "Northamptonshire", "England"),
-    "NN29": ("Wollaston", "Northamptonshire", "England"),
-    "NN3": ("Northampton", "Northamptonshire", "England"),
-    "NN4": ("Northampton", "Northamptonshire", "England"),
-    "NN5": ("Duston", "Northamptonshire", "England"),
-    "NN6": ("Spratton", "Northamptonshire", "England"),
-    "NN7": ("Northampton", "Northamptonshire", "England"),
-    "NN8": ("Wellingborough", "Northamptonshire", "England"),
-    "NN9": ("Irthlingborough", "Northamptonshire", "England"),
-    "NP10": ("Graig", "Newport", "Wales"),
-    "NP11": ("Abercarn", "Caerphilly", "Wales"),
-    "NP12": ("Blackwood", "Caerphilly", "Wales"),
-    "NP13": ("Abertillery", "Blaenau Gwent", "Wales"),
-    "NP15": ("Gwehelog Fawr", "Monmouthshire", "Wales"),
-    "NP16": ("St Arvans", "Monmouthshire", "Wales"),
-    "NP18": ("Caerleon", "Newport", "Wales"),
-    "NP19": ("Alway", "Newport", "Wales"),
-    "NP20": ("Allt-yr-yn", "Newport", "Wales"),
-    "NP22": ("Tredegar", "Blaenau Gwent", "Wales"),
-    "NP23": ("Ebbw Vale", "Blaenau Gwent", "Wales"),
-    "NP24": ("New Tredegar", "Caerphilly", "Wales"),
-    "NP25": ("Monmouth", "Monmouthshire", "Wales"),
-    "NP26": ("Rogiet", "Monmouthshire", "Wales"),
-    "NP4": ("Trevethin", "Torfaen", "Wales"),
-    "NP44": ("Cwmbran", "Torfaen", "Wales"),
-    "NP7": ("Abergavenny", "Monmouthshire", "Wales"),
-    "NP8": ("Llangattock", "Powys", "Wales"),
-    "NR1": ("Norwich", "Norfolk", "England"),
-    "NR10": ("Hevingham", "Norfolk", "England"),
-    "NR11": ("Erpingham", "Norfolk", "England"),
-    "NR12": ("Smallburgh", "Norfolk", "England"),
-    "NR13": ("Blofield", "Norfolk", "England"),
-    "NR14": ("Alpington", "Norfolk", "England"),
-    "NR15": ("Hempnall", "Norfolk", "England"),
-    "NR16": ("Old Buckenham", "Norfolk", "England"),
-    "NR17": ("Attleborough", "Norfolk", "England"),
-    "NR18": ("Wymondham", "Norfolk", "England"),
-    "NR19": ("Scarning", "Norfolk", "England"),
-    "NR2": ("Norwich", "Norfolk", "England"),
-    "NR20": ("Swanton Morley", "Norfolk", "England"),
-    "NR21": ("Fakenham", "Norfolk", "England"),
-    "NR22": ("Walsingham", "Norfolk", "England"),
-    "NR23": ("Wells-next-the-Sea", "Norfolk", "England"),
-    "NR24": ("Briston", "Norfolk", "England"),
-    "NR25": ("Holt", "Norfolk", "England"),
-    "NR26": ("Sheringham", "Norfolk", "England"),
-    "NR27": ("Cromer", "Norfolk", "England"),
-    "NR28": ("North Walsham", "Norfolk", "England"),
-    "NR29": ("Great Yarmouth", "Norfolk", "England"),
-    "NR3": ("Norwich", "Norfolk", "England"),
-    "NR30": ("Great Yarmouth", "Norfolk", "England"),
-    "NR31": ("Great Yarmouth", "Norfolk", "England"),
-    "NR32": ("Oulton Broad", "Suffolk", "England"),
-    "NR33": ("Oulton Broad", "Suffolk", "England"),
-    "NR34": ("Weston", "Suffolk", "England"),
-    "NR35": ("Bungay", "Suffolk", "England"),
-    "NR4": ("Norwich", "Norfolk", "England"),
-    "NR5": ("Norwich", "Norfolk", "England"),
-    "NR6": ("Norwich", "Norfolk", "England"),
-    "NR7": ("Norwich", "Norfolk", "England"),
-    "NR8": ("Taverham", "Norfolk", "England"),
-    "NR9": ("Marlingford", "Norfolk", "England"),
-    "NW1": ("Camden Town", "Greater London", "England"),
-    "NW10": ("Brent", "Greater London", "England"),
-    "NW11": ("Barnet", "Greater London", "England"),
-    "NW2": ("Brent", "Greater London", "England"),
-    "NW3": ("Camden Town", "Greater London", "England"),
-    "NW4": ("Barnet", "Greater London", "England"),
-    "NW5": ("Camden Town", "Greater London", "England"),
-    "NW6": ("Camden Town", "Greater London", "England"),
-    "NW7": ("Barnet", "Greater London", "England"),
-    "NW8": ("Paddington", "Greater London", "England"),
-    "NW9": ("Brent", "Greater London", "England"),
-    "OL1": ("", "Oldham", "England"),
-    "OL10": ("Heywood", "Rochdale", "England"),
-    "OL11": ("", "Rochdale", "England"),
-    "OL12": ("", "Rochdale", "England"),
-    "OL13": ("Rawtenstall", "Lancashire", "England"),
-    "OL14": ("Todmorden", "Calderdale", "England"),
-    "OL15": ("", "Rochdale", "England"),
-    "OL16": ("", "Rochdale", "England"),
-    "OL2": ("Shaw", "Oldham", "England"),
-    "OL3": ("Saddleworth", "Oldham", "England"),
-    "OL4": ("", "Oldham", "England"),
-    "OL5": ("Mossley", "Tameside", "England"),
-    "OL6": ("Ashton-under-Lyne", "Tameside", "England"),
-    "OL7": ("Ashton-under-Lyne", "Tameside", "England"),
-    "OL8": ("", "Oldham", "England"),
-    "OL9": ("", "Oldham", "England"),
-    "OX1": ("Oxford", "Oxfordshire", "England"),
-    "OX10": ("Wallingford", "Oxfordshire", "England"),
-    "OX11": ("Didcot", "Oxfordshire", "England"),
-    "OX12": ("Wantage", "Oxfordshire", "England"),
-    "OX13": ("Marcham", "Oxfordshire", "England"),
-    "OX14": ("Culham", "Oxfordshire", "England"),
-    "OX15": ("Tadmarton", "Oxfordshire", "England"),
-    "OX16": ("Banbury", "Oxfordshire", "England"),
-    "OX17": ("Middleton Cheney", "Northamptonshire", "England"),
-    "OX18": ("Carterton", "Oxfordshire", "England"),
-    "OX2": ("Oxford", "Oxfordshire", "England"),
-    "OX20": ("Woodstock", "Oxfordshire", "England"),
-    "OX25": ("Chesterton", "Oxfordshire", "England"),
-    "OX26": ("Bicester", "Oxfordshire", "England"),
-    "OX27": ("Fringford", "Oxfordshire", "England"),
-    "OX28": ("Witney", "Oxfordshire", "England"),
-    "OX29": ("Eynsham", "Oxfordshire", "England"),
-    "OX3": ("Oxford", "Oxfordshire", "England"),
-    "OX33": ("Holton", "Oxfordshire", "England"),
-    "OX39": ("Chinnor", "Oxfordshire", "England"),
-    "OX4": ("Oxford", "Oxfordshire", "England"),
-    "OX44": ("Cuddesdon", "Oxfordshire", "England"),
-    "OX49": ("Watlington", "Oxfordshire", "England"),
-    "OX5": ("Kidlington", "Oxfordshire", "England"),
-    "OX6": ("Bicester", "Oxfordshire", "England"),
-    "OX7": ("Chadlington", "Oxfordshire", "England"),
-    "OX8": ("South Leigh", "Oxfordshire", "England"),
-    "OX9": ("Thame", "Oxfordshire", "England"),
-    "PA1": ("Paisley", "Renfrewshire", "Scotland"),
-    "PA10": ("Kilbarchan", "Renfrewshire", "Scotland"),
-    "PA11": ("Ranfurly", "Renfrewshire", "Scotland"),
-    "PA12": ("Lochwinnoch", "Renfrewshire", "Scotland"),
-    "PA13": ("Kilmacolm", "Inverclyde", "Scotland"),
-    "PA14": ("Greenock", "Inverclyde", "Scotland"),
-    "PA15": ("Greenock", "Inverclyde", "Scotland"),
-    "PA16": ("Greenock", "Inverclyde", "Scotland"),
-    "PA17": ("Skelmorlie", "North Ayrshire", "Scotland"),
-    "PA18": ("Wemyss Bay", "Inverclyde", "Scotland"),
-    "PA19": ("Greenock", "Inverclyde", "Scotland"),
-    "PA2": ("Paisley", "Renfrewshire", "Scotland"),
-    "PA20": ("Rothesay", "Argyll and Bute", "Scotland"),
-    "PA21": ("Tighnabruaich", "Argyll and Bute", "Scotland"),
-    "PA22": ("", "Argyll and Bute", "Scotland"),
-    "PA23": ("Port Riddell", "Argyll and Bute", "Scotland"),
-    "PA24": ("Lochgoilhead", "Argyll and Bute", "Scotland"),
-    "PA25": ("", "Argyll and Bute", "Scotland"),
-    "PA26": ("Cairndow", "Argyll and Bute", "Scotland"),
-    "PA27": ("Strachur", "Argyll and Bute", "Scotland"),
-    "PA28": ("", "Argyll and Bute", "Scotland"),
-    "PA29": ("", "Argyll and Bute", "Scotland"),
-    "PA3": ("Paisley", "Renfrewshire", "Scotland"),
-    "PA30": ("Ardrishaig", "Argyll and Bute", "Scotland"),
-    "PA31": ("", "Argyll and Bute", "Scotland"),
-    "PA32": ("", "Argyll and Bute", "Scotland"),
-    "PA33": ("", "Argyll and Bute", "Scotland"),
-    "PA34": ("", "Argyll and Bute", "Scotland"),
-    "PA35": ("", "Argyll and Bute", "Scotland"),
-    "PA36": ("Bridge of Orchy", "Argyll and Bute", "Scotland"),
-    "PA37": ("", "Argyll and Bute", "Scotland"),
-    "PA38": ("", "Argyll and Bute", "Scotland"),
-    "PA4": ("Renfrew", "Renfrewshire", "Scotland"),
-    "PA41": ("", "Argyll and Bute", "Scotland"),
-    "PA42": ("Port Ellen", "Argyll and Bute", "Scotland"),
-    "PA43": ("Bowmore", "Argyll and Bute", "Scotland"),
-    "PA44": ("Blackrock", "Argyll and Bute", "Scotland"),
-    "PA45": ("Ballygrant", "Argyll and Bute", "Scotland"),
-    "PA46": ("Port Askaig", "Argyll and Bute", "Scotland"),
-    "PA47": ("Portnahaven", "Argyll and Bute", "Scotland"),
-    "PA48": ("Port Charlotte", "Argyll and Bute", "Scotland"),
-    "PA49": ("", "Argyll and Bute", "Scotland"),
-    "PA5": ("Johnstone", "Renfrewshire", "Scotland"),
-    "PA6": ("", "Renfrewshire", "Scotland"),
-    "PA60": ("", "Argyll and Bute", "Scotland"),
-    "PA61": ("Scalasaig", "Argyll and Bute", "Scotland"),
-    "PA62": ("", "Argyll and Bute", "Scotland"),
-    "PA63": ("", "Argyll and Bute", "Scotland"),
-    "PA64": ("Lochdon", "Argyll and Bute", "Scotland"),
-    "PA65": ("", "Argyll and Bute", "Scotland"),
-    "PA66": ("", "Argyll and Bute", "Scotland"),
-    "PA67": ("Bunessan", "Argyll and Bute", "Scotland"),
-    "PA68": ("", "Argyll and Bute", "Scotland"),
-    "PA69": ("", "Argyll and Bute", "Scotland"),
-    "PA7": ("Bishopton", "Renfrewshire", "Scotland"),
-    "PA70": ("", "Argyll and Bute", "Scotland"),
-    "PA71": ("", "Argyll and Bute", "Scotland"),
-    "PA72": ("", "Argyll and Bute", "Scotland"),
-    "PA73": ("", "Argyll and Bute", "Scotland"),
-    "PA74": ("", "Argyll and Bute", "Scotland"),
-    "PA75": ("", "Argyll and Bute", "Scotland"),
-    "PA76": ("", "Argyll and Bute", "Scotland"),
-    "PA77": ("Crossapol", "Argyll and Bute", "Scotland"),
-    "PA78": ("", "Argyll and Bute", "Scotland"),
-    "PA8": ("", "Renfrewshire", "Scotland"),
-    "PA9": ("Howwood", "Renfrewshire", "Scotland"),
-    "PE1": ("", "Peterborough", "England"),
-    "PE10": ("Bourne", "Lincolnshire", "England"),
-    "PE11": ("Pinchbeck", "Lincolnshire", "England"),
-    "PE12": ("Fleet", "Lincolnshire", "England"),
-    "PE13": ("Wisbech", "Cambridgeshire", "England"),
-    "PE14": ("Emneth", "Norfolk", "England"),
-    "PE15": ("March", "Cambridgeshire", "England"),
-    "PE16": ("Chatteris", "Cambridgeshire", "England"),
-    "PE19": ("St Neots", "Cambridgeshire", "England"),
-    "PE2": ("", "Peterborough", "England"),
-    "PE20": ("Swineshead", "Lincolnshire", "England"),
-    "PE21": ("Boston", "Lincolnshire", "England"),
-    "PE22": ("Old Leake", "Lincolnshire", "England"),
-    "PE23": ("Spilsby", "Lincolnshire", "England"),
-    "PE24": ("Burgh Le Marsh", "Lincolnshire", "England"),
-    "PE25": ("Skegness", "Lincolnshire", "England"),
-    "PE26": ("Ramsey", "Cambridgeshire", "England"),
-    "PE27": ("St Ives", "Cambridgeshire", "England"),
-    "PE28": ("The Stukeleys", "Cambridgeshire", "England"),
-    "PE29": ("Huntingdon", "Cambridgeshire", "England"),
-    "PE3": ("", "Peterborough", "England"),
-    "PE30": ("King's Lynn", "Norfolk", "England"),
-    "PE31": ("Snettisham", "Norfolk", "England"),
-    "PE32": ("West Acre", "Norfolk", "England"),
-    "PE33": ("Shouldham", "Norfolk", "England"),
-    "PE34": ("Wiggenhall St Germans", "Norfolk", "England"),
-    "PE35": ("Sandringham", "Norfolk", "England"),
-    "PE36": ("Old Hunstanton", "Norfolk", "England"),
-    "PE37": ("Swaffham", "Norfolk", "England"),
-    "PE38": ("Denver", "Norfolk", "England"),
-    "PE4": ("", "Peterborough", "England"),
-    "PE5": ("Ailsworth", "Peterborough", "England"),
-    "PE6": ("Deeping St James", "Lincolnshire", "England"),
-    "PE7": ("Farcet", "Cambridgeshire", "England"),
-    "PE8": ("Tansor", "Northamptonshire", "England"),
-    "PE9": ("Stamford", "Lincolnshire", "England"),
-    "PH1": ("", "Perth and Kinross", "Scotland"),
-    "PH10": ("", "Perth and Kinross", "Scotland"),
-    "PH11": ("", "Perth and Kinross", "Scotland"),
-    "PH12": ("", "Perth and Kinross", "Scotland"),
-    "PH13": ("", "Perth and Kinross", "Scotland"),
-    "PH14": ("", "Perth and Kinross", "Scotland"),
-    "PH15": ("", "Perth and Kinross", "Scotland"),
-    "PH16": ("", "Perth and Kinross", "Scotland"),
-    "PH17": ("Killichonan", "Perth and Kinross", "Scotland"),
-    "PH18": ("", "Perth and Kinross", "Scotland"),
-    "PH19": ("Dalwhinnie", "Highland", "Scotland"),
-    "PH2": ("", "Perth and Kinross", "Scotland"),
-    "PH20": ("", "Highland", "Scotland"),
-    "PH21": ("", "Highland", "Scotland"),
-    "PH22": ("Aviemore", "Highland", "Scotland"),
-    "PH23": ("", "Highland", "Scotland"),
-    "PH24": ("Boat Of Garten", "Highland", "Scotland"),
-    "PH25": ("Nethy Bridge", "Highland", "Scotland"),
-    "PH26": ("Grantown-on-Spey", "Highland", "Scotland"),
-    "PH3": ("Auchterarder", "Perth and Kinross", "Scotland"),
-    "PH30": ("", "Highland", "Scotland"),
-    "PH31": ("", "Highland", "Scotland"),
-    "PH32": ("Fort Augustus", "Highland", "Scotland"),
-    "PH33": ("Fort William", "Highland", "Scotland"),
-    "PH34": ("", "Highland", "Scotland"),
-    "PH35": ("", "Highland", "Scotland"),
-    "PH36": ("Kentra", "Highland", "Scotland"),
-    "PH38": ("", "Highland", "Scotland"),
-    "PH39": ("Arisaig", "Highland", "Scotland"),
-    "PH4": ("Blackford", "Perth and Kinross", "Scotland"),
-    "PH40": ("", "Highland", "Scotland"),
-    "PH41": ("Mallaig", "Highland", "Scotland"),
-    "PH42": ("Isle Of Eigg", "Highland", "Scotland"),
-    "PH43": ("Isle Of Rum", "Highland", "Scotland"),
-    "PH44": ("Isle Of Canna", "Highland", "Scotland"),
-    "PH49": ("Glencoe", "Highland", "Scotland"),
-    "PH5": ("Muthill", "Perth and Kinross", "Scotland"),
-    "PH50": ("Kinlochleven", "Highland", "Scotland"),
-    "PH6": ("Comrie", "Perth and Kinross", "Scotland"),
-    "PH7": ("Crieff", "Perth and Kinross", "Scotland"),
-    "PH8": ("", "Perth and Kinross", "Scotland"),
-    "PH9": ("", "Perth and Kinross", "Scotland"),
-    "PL1": ("", "Plymouth", "England"),
-    "PL10": ("Rame", "Cornwall", "England"),
-    "PL11": ("Antony", "Cornwall", "England"),
-    "PL12": ("Saltash", "Cornwall", "England"),
-    "PL13": ("Looe", "Cornwall", "England"),
-    "PL14": ("Liskeard", "Cornwall", "England"),
-    "PL15": ("South Petherwin", "Cornwall", "England"),
-    "PL16": ("Lifton", "Devon", "England"),
-    "PL17": ("Callington", "Cornwall", "England"),
-    "PL18": ("Calstock", "Cornwall", "England"),
-    "PL19": ("Tavistock", "Devon", "England"),
-    "PL2": ("", "Plymouth", "England"),
-    "PL20": ("Horrabridge", "Devon", "England"),
-    "PL21": ("Ivybridge", "Devon", "England"),
-    "PL22": ("Lostwithiel", "Cornwall", "England"),
-    "PL23": ("Fowey", "Cornwall", "England"),
-    "PL24": ("St Blaise", "Cornwall", "England"),
-    "PL25": ("St Austell", "Cornwall", "England"),
-    "PL26": ("St Mewan", "Cornwall", "England"),
-    "PL27": ("St Breock", "Cornwall", "England"),
-    "PL28": ("Padstow", "Cornwall", "England"),
-    "PL29": ("St Endellion", "Cornwall", "England"),
-    "PL3": ("", "Plymouth", "England"),
-    "PL30": ("Helland", "Cornwall", "England"),
-    "PL31": ("Bodmin", "Cornwall", "England"),
-    "PL32": ("Camelford", "Cornwall", "England"),
-    "PL33": ("St Teath", "Cornwall", "England"),
-    "PL34": ("Tintagel", "Cornwall", "England"),
-    "PL35": ("Forrabury and Minster", "Cornwall", "England"),
-    "PL4": ("", "Plymouth", "England"),
-    "PL5": ("", "Plymouth", "England"),
-    "PL6": ("", "Plymouth", "England"),
-    "PL7": ("Plympton", "Plymouth", "England"),
-    "PL8": ("Yealmpton", "Devon", "England"),
-    "PL9": ("Plymstock", "Plymouth", "England"),
-    "PO1": ("", "Portsmouth", "England"),
-    "PO10": ("Hermitage", "West Sussex", "England"),
-    "PO11": ("South Hayling", "Hampshire", "England"),
-    "PO12": ("Gosport", "Hampshire", "England"),
-    "PO13": ("Gosport", "Hampshire", "England"),
-    "PO14": ("", "Hampshire", "England"),
-    "PO15": ("", "Hampshire", "England"),
-    "PO16": ("", "Hampshire", "England"),
-    "PO17": ("Wickham", "Hampshire", "England"),
-    "PO18": ("Funtington", "West Sussex", "England"),
-    "PO19": ("Chichester", "West Sussex", "England"),
-    "PO2": ("", "Portsmouth", "England"),
-    "PO20": ("Sidlesham", "West Sussex", "England"),
-    "PO21": ("Aldwick", "West Sussex", "England"),
-    "PO22": ("Felpham", "West Sussex", "England"),
-    "PO3": ("", "Portsmouth", "England"),
-    "PO30": ("Newport", "Isle Of Wight", "England"),
-    "PO31": ("Cowes", "Isle Of Wight", "England"),
-    "PO32": ("Newport", "Isle Of Wight", "England"),
-    "PO33": ("Newport", "Isle Of Wight", "England"),
-    "PO34": ("Nettlestone", "Isle Of Wight", "England"),
-    "PO35": ("Bembridge", "Isle Of Wight", "England"),
-    "PO36": ("Sandown", "Isle Of Wight", "England"),
-    "PO37": ("Shanklin", "Isle Of Wight", "England"),
-    "PO38": ("Ventnor", "Isle Of Wight", "England"),
-    "PO39": ("Totland", "Isle Of Wight", "England"),
-    "PO4": ("", "Portsmouth", "England"),
-    "PO40": ("Freshwater", "Isle Of Wight", "England"),
-    "PO41": ("Yarmouth", "Isle Of Wight", "England"),
-    "PO5": ("", "Portsmouth", "England"),
-    "PO6": ("", "Portsmouth", "England"),
-    "PO7": ("Southwick", "Hampshire", "England"),
-    "PO8": ("Horndean", "Hampshire", "England"),
-    "PO9": ("Havant", "Hampshire", "England"),
-    "PR1": ("Preston", "Lancashire", "England"),
-    "PR2": ("Preston", "Lancashire", "England"),
-    "PR25": ("Leyland", "Lancashire", "England"),
-    "PR26": ("Leyland", "Lancashire", "England"),
-    "PR3": ("Claughton", "Lancashire", "England"),
-    "PR4": ("Freckleton", "Lancashire", "England"),
-    "PR5": ("Bamber Bridge", "Lancashire", "England"),
-    "PR6": ("Chorley", "Lancashire", "England"),
-    "PR7": ("Chorley", "Lancashire", "England"),
-    "PR8": ("Southport", "Sefton", "England"),
-    "PR9": ("Southport", "Sefton", "England"),
-    "RG1": ("", "Reading", "England"),
-    "RG10": ("Twyford", "Wokingham", "England"),
-    "RG12": ("Bracknell", "Bracknell Forest", "England"),
-    "RG14": ("Newbury", "West Berkshire", "England"),
-    "RG17": ("Hungerford", "West Berkshire", "England"),
-    "RG18": ("Bucklebury", "West Berkshire", "England"),
-    "RG19": ("Thatcham", "West Berkshire", "England"),
-    "RG2": ("", "Reading", "England"),
-    "RG20": ("Newbury", "West Berkshire", "England"),
-    "RG21": ("Basingstoke", "Hampshire", "England"),
-    "RG22": ("Basingstoke", "Hampshire", "England"),
-    "RG23": ("Basingstoke", "Hampshire", "England"),
-    "RG24": ("Basingstoke", "Hampshire", "England"),
-    "RG25": ("Dummer", "Hampshire", "England"),
-    "RG26": ("Pamber", "Hampshire", "England"),
-    "RG27": ("Hook", "Hampshire", "England"),
-    "RG28": ("Whitchurch", "Hampshire", "England"),
-    "RG29": ("Odiham", "Hampshire", "England"),
-    "RG30": ("", "Reading", "England"),
-    "RG31": ("", "Reading", "England"),
-    "RG4": ("", "Reading", "England"),
-    "RG40": ("", "Wokingham", "England"),
-    "RG41": ("", "Wokingham", "England"),
-    "RG42": ("Warfield", "Bracknell Forest", "England"),
-    "RG45": ("Wokingham Without", "Wokingham", "England"),
-    "RG5": ("Woodley", "Wokingham", "England"),
-    "RG6": ("Earley", "Wokingham", "England"),
-    "RG7": ("Sulhamstead", "West Berkshire", "England"),
-    "RG8": ("Whitchurch-on-Thames", "Oxfordshire", "England"),
-    "RG9": ("Rotherfield Greys", "Oxfordshire", "England"),
-    "RH1": ("Reigate and Banstead", "Surrey", "England"),
-    "RH10": ("Crawley", "West Sussex", "England"),
-    "RH11": ("Crawley", "West Sussex", "England"),
-    "RH12": ("Horsham", "West Sussex", "England"),
-    "RH13": ("Southwater", "West Sussex", "England"),
-    "RH14": ("Wisborough Green", "West Sussex", "England"),
-    "RH15": ("Burgess Hill", "West Sussex", "England"),
-    "RH16": ("Haywards Heath", "West Sussex", "England"),
-    "RH17": ("Cuckfield Rural", "West Sussex", "England"),
-    "RH18": ("Forest Row", "East Sussex", "England"),
-    "RH19": ("East Grinstead", "West Sussex", "England"),
-    "RH2": ("Reigate and Banstead", "Surrey", "England"),
-    "RH20": ("Storrington", "West Sussex", "England"),
-    "RH3": ("Brockham", "Surrey", "England"),
-    "RH4": ("Dorking", "Surrey", "England"),
-    "RH5": ("Capel", "Surrey", "England"),
-    "RH6": ("Horley", "Surrey", "England"),
-    "RH7": ("Lingfield", "Surrey", "England"),
-    "RH8": ("Limpsfield", "Surrey", "England"),
-    "RH9": ("Godstone", "Surrey", "England"),
-    "RM1": ("Romford", "Greater London", "England"),
-    "RM10": ("Barking", "Greater London", "England"),
-    "RM11": ("Romford", "Greater London", "England"),
-    "RM12": ("Romford", "Greater London", "England"),
-    "RM13": ("Romford", "Greater London", "England"),
-    "RM14": ("Romford", "Greater London", "England"),
-    "RM15": ("", "Thurrock", "England"),
-    "RM16": ("", "Thurrock", "England"),
-    "RM17": ("", "Thurrock", "England"),
-    "RM18": ("", "Thurrock", "England"),
-    "RM19": ("", "Thurrock", "England"),
-    "RM2": ("Romford", "Greater London", "England"),
-    "RM20": ("", "Thurrock", "England"),
-    "RM3": ("Romford", "Greater London", "England"),
-    "RM4": ("Stapleford Abbotts", "Essex", "England"),
-    "RM5": ("Romford", "Greater London", "England"),
-    "RM6": ("Barking", "Greater London", "England"),
-    "RM7": ("Romford", "Greater London", "England"),
-    "RM8": ("Barking", "Greater London", "England"),
-    "RM9": ("Barking", "Greater London", "England"),
-    "S1": ("Norton", "Sheffield", "England"),
-    "S10": ("Norton", "Sheffield", "England"),
-    "S11": ("Norton", "Sheffield", "England"),
-    "S12": ("Norton", "Sheffield", "England"),
-    "S13": ("Norton", "Sheffield", "England"),
-    "S14": ("Norton", "Sheffield", "England"),
-    "S17": ("Norton", "Sheffield", "England"),
-    "S18": ("Dronfield", "Derbyshire", "England"),
-    "S2": ("Norton", "Sheffield", "England"),
-    "S20": ("Norton", "Sheffield", "England"),
-    "S21": ("Eckington", "Derbyshire", "England"),
-    "S25": ("Dinnington", "Rotherham", "England"),
-    "S26": ("Todwick", "Rotherham", "England"),
-    "S3": ("Norton", "Sheffield", "England"),
-    "S32": ("Grindleford", "Derbyshire", "England"),
-    "S33": ("Aston", "Derbyshire", "England"),
-    "S35": ("Ecclesfield", "Sheffield", "England"),
-    "S36": ("Hunshelf", "Barnsley", "England"),
-    "S4": ("Norton", "Sheffield", "England"),
-    "S40": ("Chesterfield", "Derbyshire", "England"),
-    "S41": ("Chesterfield", "Derbyshire", "England"),
-    "S42": ("Wingerworth", "Derbyshire", "England"),
-    "S43": ("Staveley", "Derbyshire", "England"),
-    "S44": ("Bolsover", "Derbyshire", "England"),
-    "S45": ("Clay Cross", "Derbyshire", "England"),
-    "S5": ("Norton", "Sheffield", "England"),
-    "S6": ("Norton", "Sheffield", "England"),
-    "S60": ("", "Rotherham", "England"),
-    "S61": ("", "Rotherham", "England"),
-    "S62": ("Rawmarsh", "Rotherham", "England"),
-    "S63": ("", "Barnsley", "England"),
-    "S64": ("", "Rotherham", "England"),
-    "S65": ("", "Rotherham", "England"),
-    "S66": ("Bramley", "Rotherham", "England"),
-    "S7": ("Norton", "Sheffield", "England"),
-    "S70": ("", "Barnsley", "England"),
-    "S71": ("", "Barnsley", "England"),
-    "S72": ("Brierley", "Barnsley", "England"),
-    "S73": ("Darfield", "Barnsley", "England"),
-    "S74": ("Hoyland", "Barnsley", "England"),
-    "S75": ("", "Barnsley", "England"),
-    "S8": ("Norton", "Sheffield", "England"),
-    "S80": ("Clumber and Hardwick", "Nottinghamshire", "England"),
-    "S81": ("Carlton in Lindrick", "Nottinghamshire", "England"),
-    "S9": ("Norton", "Sheffield", "England"),
-    "SA1": ("Landore", "Swansea", "Wales"),
-    "SA10": ("Blaenhonddan", "Neath Port Talbot", "Wales"),
-    "SA11": ("Tonna", "Neath Port Talbot", "Wales"),
-    "SA12": ("Baglan", "Neath Port Talbot", "Wales"),
-    "SA13": ("Bryn", "Neath Port Talbot", "Wales"),
-    "SA14": ("Llannon", "Carmarthenshire", "Wales"),
-    "SA15": ("Llanelli Rural", "Carmarthenshire", "Wales"),
-    "SA16": ("Cefn Sidan", "Carmarthenshire", "Wales"),
-    "SA17": ("Kidwelly", "Carmarthenshire", "Wales"),
-    "SA18": ("Betws", "Carmarthenshire", "Wales"),
-    "SA19": ("Talley", "Carmarthenshire", "Wales"),
-    "SA2": ("Sketty", "Swansea", "Wales"),
-    "SA20": ("Llandovery", "Carmarthenshire", "Wales"),
-    "SA3": ("Bishopston", "Swansea", "Wales"),
-    "SA31": ("Carmarthen", "Carmarthenshire", "Wales"),
-    "SA32": ("Llanegwad", "Carmarthenshire", "Wales"),
-    "SA33": ("Meidrim", "Carmarthenshire", "Wales"),
-    "SA34": ("Llanfallteg", "Carmarthenshire", "Wales"),
-    "SA35": ("Clydau", "Pembrokeshire", "Wales"),
-    "SA36": ("Crymych", "Pembrokeshire", "Wales"),
-    "SA37": ("Boncath", "Pembrokeshire", "Wales"),
-    "SA38": ("Newcastle Emlyn", "Carmarthenshire", "Wales"),
-    "SA39": ("Llanfihangel-Ar-Arth", "Carmarthenshire", "Wales"),
-    "SA4": ("Gorseinon", "Swansea", "Wales"),
-    "SA40": ("Llanwenog", "Ceredigion", "Wales"),
-    "SA41": ("Eglwyswrw", "Pembrokeshire", "Wales"),
-    "SA42": ("Newport", "Pembrokeshire", "Wales"),
-    "SA43": ("Llangoedmor", "Ceredigion", "Wales"),
-    "SA44": ("Troedyraur", "Ceredigion", "Wales"),
-    "SA45": ("New Quay", "Ceredigion", "Wales"),
-    "SA46": ("Aberaeron", "Ceredigion", "Wales"),
-    "SA47": ("Llanarth", "Ceredigion", "Wales"),
-    "SA48": ("Llangybi", "Ceredigion", "Wales"),
-    "SA5": ("Penderry", "Swansea", "Wales"),
-    "SA6": ("Morriston", "Swansea", "Wales"),
-    "SA61": ("Haverfordwest", "Pembrokeshire", "Wales"),
-    "SA62": ("Nolton", "Pembrokeshire", "Wales"),
-    "SA63": ("Wiston", "Pembrokeshire", "Wales"),
-    "SA64": ("Pencaer", "Pembrokeshire", "Wales"),
-    "SA65": ("Fishguard", "Pembrokeshire", "Wales"),
-    "SA66": ("Maenclochog", "Pembrokeshire", "Wales"),
-    "SA67": ("Narberth", "Pembrokeshire", "Wales"),
-    "SA68": ("Jeffreyston", "Pembrokeshire", "Wales"),
-    "SA69": ("Saundersfoot", "Pembrokeshire", "Wales"),
-    "SA7": ("Llansamlet", "Swansea", "Wales"),
-    "SA70": ("Penally", "Pembrokeshire", "Wales"),
-    "SA71": ("Pembroke", "Pembrokeshire", "Wales"),
-    "SA72": ("Pembroke Dock", "Pembrokeshire", "Wales"),
-    "SA73": ("Milford Haven", "Pembrokeshire", "Wales"),
-    "SA8": ("Pontardawe", "Neath Port Talbot", "Wales"),
-    "SA9": ("Ystradgynlais", "Powys", "Wales"),
-    "SE1": ("Camberwell", "Greater London", "England"),
-    "SE10": ("Greenwich", "Greater London", "England"),
-    "SE11": ("Lambeth", "Greater London", "England"),
-    "SE12": ("Greenwich", "Greater London", "England"),
-    "SE13": ("Lewisham", "Greater London", "England"),
-    "SE14": ("Lewisham", "Greater London", "England"),
-    "SE15": ("Camberwell", "Greater London", "England"),
-    "SE16": ("Camberwell", "Greater London", "England"),
-    "SE17": ("Camberwell", "Greater London", "England"),
-    "SE18": ("Eltham", "Greater London", "England"),
-    "SE19": ("Croydon", "Greater London", "England"),
-    "SE2": ("Eltham", "Greater London", "England"),
-    "SE20": ("Bromley", "Greater London", "England"),
-    "SE21": ("Camberwell", "Greater London", "England"),
-    "SE22": ("Camberwell", "Greater London", "England"),
-    "SE23": ("Lewisham", "Greater London", "England"),
-    "SE24": ("Camberwell", "Greater London", "England"),
-    "SE25": ("Croydon", "Greater London", "England"),
-    "SE26": ("Lewisham", "Greater London", "England"),
-    "SE27": ("Lambeth", "Greater London", "England"),
-    "SE28": ("Eltham", "Greater London", "England"),
-    "SE3": ("Greenwich", "Greater London", "England"),
-    "SE4": ("Lewisham", "Greater London", "England"),
-    "SE5": ("Camberwell", "Greater London", "England"),
-    "SE6": ("Lewisham", "Greater London", "England"),
-    "SE7": ("Greenwich", "Greater London", "England"),
-    "SE8": ("Lewisham", "Greater London", "England"),
-    "SE9": ("Eltham", "Greater London", "England"),
-    "SG1": ("Stevenage", "Hertfordshire", "England"),
-    "SG10": ("Much Hadham", "Hertfordshire", "England"),
-    "SG11": ("Standon", "Hertfordshire", "England"),
-    "SG12": ("Ware", "Hertfordshire", "England"),
-    "SG13": ("Hertford", "Hertfordshire", "England"),
-    "SG14": ("Hertford", "Hertfordshire", "England"),
-    "SG15": ("Arlesey", "Central Bedfordshire", "England"),
-    "SG16": ("Henlow", "Central Bedfordshire", "England"),
-    "SG17": ("Shefford", "Central Bedfordshire", "England"),
-    "SG18": ("Biggleswade", "Central Bedfordshire", "England"),
-    "SG19": ("Everton", "Central Bedfordshire", "England"),
-    "SG2": ("Stevenage", "Hertfordshire", "England"),
-    "SG3": ("Knebworth", "Hertfordshire", "England"),
-    "SG4": ("Ippollitts", "Hertfordshire", "England"),
-    "SG5": ("Ickleford", "Hertfordshire", "England"),
-    "SG6": ("Hitchin", "Hertfordshire", "England"),
-    "SG7": ("Bygrave", "Hertfordshire", "England"),
-    "SG8": ("Melbourn", "Cambridgeshire", "England"),
-    "SG9": ("Buntingford", "Hertfordshire", "England"),
-    "SK1": ("", "Stockport", "England"),
-    "SK10": ("Macclesfield", "Cheshire East", "England"),
-    "SK11": ("Macclesfield", "Cheshire East", "England"),
-    "SK12": ("Poynton", "Cheshire East", "England"),
-    "SK13": ("Glossop", "Derbyshire", "England"),
-    "SK14": ("Ashton-under-Lyne", "Tameside", "England"),
-    "SK15": ("", "Tameside", "England"),
-    "SK16": ("Ashton-under-Lyne", "Tameside", "England"),
-    "SK17": ("King Sterndale", "Derbyshire", "England"),
-    "SK2": ("", "Stockport", "England"),
-    "SK22": ("New Mills", "Derbyshire", "England"),
-    "SK23": ("Chapel-en-le-Frith", "Derbyshire", "England"),
-    "SK3": ("", "Stockport", "England"),
-    "SK4": ("", "Stockport", "England"),
-    "SK5": ("", "Stockport", "England"),
-    "SK6": ("", "Stockport", "England"),
-    "SK7": ("Cheadle", "Stockport", "England"),
-    "SK8": ("", "Stockport", "England"),
-    "SK9": ("Macclesfield", "Cheshire East", "England"),
-    "SL0": ("Iver", "Buckinghamshire", "England"),
-    "SL1": ("Colnbrook with Poyle", "Slough", "England"),
-    "SL2": ("Colnbrook with Poyle", "Slough", "England"),
-    "SL3": ("Colnbrook with Poyle", "Slough", "England"),
-    "SL4": ("Windsor", "Windsor and Maidenhead", "England"),
-    "SL5": ("Sunninghill", "Windsor and Maidenhead", "England"),
-    "SL6": ("Maidenhead", "Windsor and Maidenhead", "England"),
-    "SL7": ("Marlow", "Buckinghamshire", "England"),
-    "SL8": ("Wooburn", "Buckinghamshire", "England"),
-    "SL9": ("Chalfont St Peter", "Buckinghamshire", "England"),
-    "SM1": ("Sutton", "Greater London", "England"),
-    "SM2": ("Sutton", "Greater London", "England"),
-    "SM3": ("Sutton", "Greater London", "England"),
-    "SM4": ("Merton", "Greater London", "England"),
-    "SM5": ("Sutton", "Greater London", "England"),
-    "SM6": ("Sutton", "Greater London", "England"),
-    "SM7": ("Reigate and Banstead", "Surrey", "England"),
-    "SN1": ("", "Swindon", "England"),
-    "SN10": ("Roundway", "Wiltshire", "England"),
-    "SN11": ("Calne", "Wiltshire", "England"),
-    "SN12": ("Melksham", "Wiltshire", "England"),
-    "SN13": ("Corsham", "Wiltshire", "England"),
-    "SN14": ("Yatton Keynell", "Wiltshire", "England"),
-    "SN15": ("Bremhill", "Wiltshire", "England"),
-    "SN16": ("Malmesbury", "Wiltshire", "England"),
-    "SN2": ("", "Swindon", "England"),
-    "SN25": ("Haydon Wick", "Swindon", "England"),
-    "SN26": ("Blunsdon St Andrew", "Swindon", "England"),
-    "SN3": ("", "Swindon", "England"),
-    "SN4": ("Wroughton", "Swindon", "England"),
-    "SN5": ("", "Swindon", "England"),
-    "SN6": ("Stanton Fitzwarren", "Swindon", "England"),
-    "SN7": ("Shellingford", "Oxfordshire", "England"),
-    "SN8": ("Savernake", "Wiltshire", "England"),
-    "SN9": ("Manningford", "Wiltshire", "England"),
-    "SO14": ("", "Southampton", "England"),
-    "SO15": ("", "Southampton", "England"),
-    "SO16": ("", "Southampton", "England"),
-    "SO17": ("", "Southampton", "England"),
-    "SO18": ("", "Southampton", "England"),
-    "SO19": ("", "Southampton", "England"),
-    "SO20": ("Longstock", "Hampshire", "England"),
-    "SO21": ("Winchester", "Hampshire", "England"),
-    "SO22": ("Winchester", "Hampshire", "England"),
-    "SO23": ("Winchester", "Hampshire", "England"),
-    "SO24": ("Bishops Sutton", "Hampshire", "England"),
-    "SO30": ("Hedge End", "Hampshire", "England"),
-    "SO31": ("Locks Heath", "Hampshire", "England"),
-    "SO32": ("Bishops Waltham", "Hampshire", "England"),
-    "SO40": ("Totton", "Hampshire", "England"),
-    "SO41": ("Lymington", "Hampshire", "England"),
-    "SO42": ("Denny Lodge", "Hampshire", "England"),
-    "SO43": ("Lyndhurst", "Hampshire", "England"),
-    "SO45": ("Hythe", "Hampshire", "England"),
-    "SO50": ("Eastleigh", "Hampshire", "England"),
-    "SO51": ("Romsey", "Hampshire", "England"),
-    "SO52": ("North Baddesley", "Hampshire", "England"),
-    "SO53": ("Eastleigh", "Hampshire", "England"),
-    "SP1": ("Salisbury", "Wiltshire", "England"),
-    "SP10": ("Andover", "Hampshire", "England"),
-    "SP11": ("Charlton", "Hampshire", "England"),
-    "SP2": ("Salisbury", "Wiltshire", "England"),
-    "SP3": ("Dinton", "Wiltshire", "England"),
-    "SP4": ("Amesbury", "Wiltshire", "England"),
-    "SP5": ("Downton", "Wiltshire", "England"),
-    "SP6": ("Fordingbridge", "Hampshire", "England"),
-    "SP7": ("Shaftesbury", "Dorset", "England"),
-    "SP8": ("Gillingham", "Dorset", "England"),
-    "SP9": ("South Tidworth", "Hampshire", "England"),
-    "SR1": ("", "Sunderland", "England"),
-    "SR2": ("", "Sunderland", "England"),
-    "SR3": ("Houghton-le-Spring", "Sunderland", "England"),
-    "SR4": ("Houghton-le-Spring", "Sunderland", "England"),
-    "SR5": ("Castletown", "Sunderland", "England"),
-    "SR6": ("", "Sunderland", "England"),
-    "SR7": ("Dalton-le-Dale", "County Durham", "England"),
-    "SR8": ("Peterlee", "County Durham", "England"),
-    "SR9": ("", "Sunderland", "England"),
-    "SS0": ("", "Southend-on-Sea", "England"),
-    "SS1": ("", "Southend-on-Sea", "England"),
-    "SS11": ("Wickford", "Essex", "England"),
-    "SS12": ("Wickford", "Essex", "England"),
-    "SS13": ("Basildon", "Essex", "England"),
-    "SS14": ("Basildon", "Essex", "England"),
-    "SS15": ("Basildon", "Essex", "England"),
-    "SS16": ("Basildon", "Essex", "England"),
-    "SS17": ("Corringham", "Thurrock", "England"),
-    "SS2": ("", "Southend-on-Sea", "England"),
-    "SS3": ("", "Southend-on-Sea", "England"),
-    "SS4": ("Rochford", "Essex", "England"),
-    "SS5": ("Hockley", "Essex", "England"),
-    "SS6": ("Rayleigh", "Essex", "England"),
-    "SS7": ("Canvey Island", "Essex", "England"),
-    "SS8": ("Canvey Island", "Essex", "England"),
-    "SS9": ("", "Southend-on-Sea", "England"),
-    "ST1": ("", "Stoke-on-Trent", "England"),
-    "ST10": ("Cheadle", "Staffordshire", "England"),
-    "ST11": ("Forsbrook", "Staffordshire", "England"),
-    "ST12": ("Barlaston", "Staffordshire", "England"),
-    "ST13": ("Leek", "Staffordshire", "England"),
-    "ST14": ("Uttoxeter", "Staffordshire", "England"),
-    "ST15": ("Stone", "Staffordshire", "England"),
-    "ST16": ("Stafford", "Staffordshire", "England"),
-    "ST17": ("Stafford", "Staffordshire", "England"),
-    "ST18": ("Hopton", "Staffordshire", "England"),
-    "ST19": ("Penkridge", "Staffordshire", "England"),
-    "ST2": ("", "Stoke-on-Trent", "England"),
-    "ST20": ("Gnosall", "Staffordshire", "England"),
-    "ST21": ("Eccleshall", "Staffordshire", "England"),
-    "ST3": ("", "Stoke-on-Trent", "England"),
-    "ST4": ("", "Stoke-on-Trent", "England"),
-    "ST5": ("Newcastle-under-Lyme", "Staffordshire", "England"),
-    "ST6": ("", "Stoke-on-Trent", "England"),
-    "ST7": ("Kidsgrove", "Staffordshire", "England"),
-    "ST8": ("Biddulph", "Staffordshire", "England"),
-    "ST9": ("Bagnall", "Staffordshire", "England"),
-    "SW1": ("", "Westminster", "England"),
-    "SW10": ("Kensington", "Greater London", "England"),
-    "SW11": ("Wandsworth", "Greater London", "England"),
-    "SW12": ("Wandsworth", "Greater London", "England"),
-    "SW13": ("Richmond", "Greater London", "England"),
-    "SW14": ("Richmond", "Greater London", "England"),
-    "SW15": ("Wandsworth", "Greater London", "England"),
-    "SW16": ("Lambeth", "Greater London", "England"),
-    "SW17": ("Wandsworth", "Greater London", "England"),
-    "SW18": ("Wandsworth", "Greater London", "England"),
-    "SW19": ("Merton", "Greater London", "England"),
-    "SW1A": ("", "Westminster", "England"),
-    "SW1E": ("", "Westminster", "England"),
-    "SW1H": ("", "Westminster", "England"),
-    "SW1P": ("", "Westminster", "England"),
-    "SW1V": ("", "Westminster", "England"),
-    "SW1W": ("", "Westminster", "England"),
-    "SW1X": ("", "Westminster", "England"),
-    "SW1Y": ("", "Westminster", "England"),
-    "SW2": ("Lambeth", "Greater London", "England"),
-    "SW20": ("Merton", "Greater London", "England"),
-    "SW3": ("Kensington", "Greater London", "England"),
-    "SW4": ("Lambeth", "Greater London", "England"),
-    "SW5": ("Kensington", "Greater London", "England"),
-    "SW6": ("Hammersmith", "Greater London", "England"),
-    "SW7": ("Kensington", "Greater London", "England"),
-    "SW8": ("Lambeth", "Greater London", "England"),
-    "SW9": ("Lambeth", "Greater London", "England"),
-    "SY1": ("Shrewsbury", "Shropshire", "England"),
-    "SY10": ("Oswestry Rural", "Shropshire", "England"),
-    "SY11": ("Oswestry", "Shropshire", "England"),
-    "SY12": ("Ellesmere", "Shropshire", "England"),
-    "SY13": ("Whitchurch Rural", "Shropshire", "England"),
-    "SY14": ("Malpas", "Cheshire West and Chester", "England"),
-    "SY15": ("Montgomery", "Powys", "Wales"),
-    "SY16": ("Llanllwchaiarn", "Powys", "Wales"),
-    "SY17": ("Caersws", "Powys", "Wales"),
-    "SY18": ("Llanidloes", "Powys", "Wales"),
-    "SY19": ("Llanbrynmair", "Powys", "Wales"),
-    "SY2": ("Shrewsbury", "Shropshire", "England"),
-    "SY20": ("Glantwymyn", "Powys", "Wales"),
-    "SY21": ("Castle Caereinion", "Powys", "Wales"),
-    "SY22": ("Llansantffraid", "Powys", "Wales"),
-    "SY23": ("Llanfarian", "Ceredigion", "Wales"),
-    "SY24": ("Geneur Glyn", "Ceredigion", "Wales"),
-    "SY25": ("Tregaron", "Ceredigion", "Wales"),
-    "SY3": ("Shrewsbury", "Shropshire", "England"),
-    "SY4": ("Myddle", "Shropshire", "England"),
-    "SY5": ("Longden", "Shropshire", "England"),
-    "SY6": ("Church Stretton", "Shropshire", "England"),
-    "SY7": ("Hopesay", "Shropshire", "England"),
-    "SY8": ("Ludlow", "Shropshire", "England"),
-    "SY9": ("Lydham", "Shropshire", "England"),
-    "TA1": ("Taunton", "Somerset", "England"),
-    "TA10": ("Langport", "Somerset", "England"),
-    "TA11": ("Somerton", "Somerset", "England"),
-    "TA12": ("Martock", "Somerset", "England"),
-    "TA13": ("South Petherton", "Somerset", "England"),
-    "TA14": ("Norton Sub Hamdon", "Somerset", "England"),
-    "TA15": ("Montacute", "Somerset", "England"),
-    "TA16": ("Merriott", "Somerset", "England"),
-    "TA17": ("Hinton St George", "Somerset", "England"),
-    "TA18": ("Crewkerne", "Somerset", "England"),
-    "TA19": ("Ilminster", "Somerset", "England"),
-    "TA2": ("Staplegrove", "Somerset", "England"),
-    "TA20": ("Chard", "Somerset", "England"),
-    "TA21": ("Wellington", "Somerset", "England"),
-    "TA22": ("Dulverton", "Somerset", "England"),
-    "TA23": ("Williton", "Somerset", "England"),
-    "TA24": ("Wootton Courtenay", "Somerset", "England"),
-    "TA3": ("Stoke St Mary", "Somerset", "England"),
-    "TA4": ("Lydeard St Lawrence", "Somerset", "England"),
-    "TA5": ("Spaxton", "Somerset", "England"),
-    "TA6": ("Bridgwater", "Somerset", "England"),
-    "TA7": ("Stawell", "Somerset", "England"),
-    "TA8": ("Burnham-on-Sea", "Somerset", "England"),
-    "TA9": ("Burnham Without", "Somerset", "England"),
-    "TD1": ("Galashiels", "The Scottish Borders", "Scotland"),
-    "TD10": ("Greenlaw", "The Scottish Borders", "Scotland"),
-    "TD11": ("", "The Scottish Borders", "Scotland"),
-    "TD12": ("Cornhill-on-Tweed", "Northumberland", "Scotland"),
-    "TD13": ("Cockburnspath", "The Scottish Borders", "Scotland"),
-    "TD14": ("", "The Scottish Borders", "Scotland"),
-    "TD15": ("Berwick-upon-Tweed", "Northumberland", "Scotland"),
-    "TD2": ("", "The Scottish Borders", "Scotland"),
-    "TD3": ("", "The Scottish Borders", "Scotland"),
-    "TD4": ("Earlston", "The Scottish Borders", "Scotland"),
-    "TD5": ("", "The Scottish Borders", "Scotland"),
-    "TD6": ("Newtown St Boswells", "The Scottish Borders", "Scotland"),
-    "TD7": ("", "The Scottish Borders", "Scotland"),
-    "TD8": ("Jedburgh", "The Scottish Borders", "Scotland"),
-    "TD9": ("", "The Scottish Borders", "Scotland"),
-    "TF1": ("Wellington", "Telford and Wrekin", "England"),
-    "TF10": ("Newport", "Telford and Wrekin", "England"),
-    "TF11": ("Shifnal", "Shropshire", "England"),
-    "TF12": ("Broseley", "Shropshire", "England"),
-    "TF13": ("Much Wenlock", "Shropshire", "England"),
-    "TF2": ("St Georges and Priorslee", "Telford and Wrekin", "England"),
-    "TF3": ("Hollinswood", "Telford and Wrekin", "England"),
-    "TF4": ("Telford", "Telford and Wrekin", "England"),
-    "TF5": ("Wellington", "Telford and Wrekin", "England"),
-    "TF6": ("Rodington", "Telford and Wrekin", "England"),
-    "TF7": ("Madeley", "Telford and Wrekin", "England"),
-    "TF8": ("The Gorge", "Telford and Wrekin", "England"),
-    "TF9": ("Sutton upon Tern", "Shropshire", "England"),
-    "TN1": ("Royal Tunbridge Wells", "Kent", "England"),
-    "TN10": ("Tonbridge", "Kent", "England"),
-    "TN11": ("Tonbridge", "Kent", "England"),
-    "TN12": ("Yalding", "Kent", "England"),
-    "TN13": ("Sevenoaks", "Kent", "England"),
-    "TN14": ("Dunton Green", "Kent", "England"),
-    "TN15": ("Wrotham", "Kent", "England"),
-    "TN16": ("", "Greater London", "England"),
-    "TN17": ("Cranbrook", "Kent", "England"),
-    "TN18": ("Four Throws", "Kent", "England"),
-    "TN19": ("Burwash", "East Sussex", "England"),
-    "TN2": ("Royal Tunbridge Wells", "Kent", "England"),
-    "TN20": ("Mayfield", "East Sussex", "England"),
-    "TN21": ("Heathfield", "East Sussex", "England"),
-    "TN22": ("Uckfield", "East Sussex", "England"),
-    "TN23": ("Ashford", "Kent", "England"),
-    "TN24": ("Ashford", "Kent", "England"),
-    "TN25": ("Wye", "Kent", "England"),
-    "TN26": ("Shadoxhurst", "Kent", "England"),
-    "TN27": ("Smarden", "Kent", "England"),
-    "TN28": ("New Romney", "Kent", "England"),
-    "TN29": ("St Mary In The Marsh", "Kent", "England"),
-    "TN3": ("Royal Tunbridge Wells", "Kent", "England"),
-    "TN30": ("Tenterden", "Kent", "England"),
-    "TN31": ("Peasmarsh", "East Sussex", "England"),
-    "TN32": ("Salehurst", "East Sussex", "England"),
-    "TN33": ("Battle", "East Sussex", "England"),
-    "TN34": ("Hastings", "East Sussex", "England"),
-    "TN35": ("Hastings", "East Sussex", "England"),
-    "TN36": ("Icklesham", "East Sussex", "England"),
-    "TN37": ("Hastings", "East Sussex", "England"),
-    "TN38": ("Hastings", "East Sussex", "England"),
-    "TN39": ("Bexhill", "East Sussex", "England"),
-    "TN4": ("Royal Tunbridge Wells", "Kent", "England"),
-    "TN40": ("Bexhill", "East Sussex", "England"),
-    "TN5": ("Wadhurst", "East Sussex", "England"),
-    "TN6": ("Crowborough", "East Sussex", "England"),
-    "TN7": ("Hartfield", "East Sussex", "England"),
-    "TN8": ("Edenbridge", "Kent", "England"),
-    "TN9": ("Tonbridge", "Kent", "England"),
-    "TQ1": ("Torquay", "Torbay", "England"),
-    "TQ10": ("South Brent", "Devon", "England"),
-    "TQ11": ("Buckfast", "Devon", "England"),
-    "TQ12": ("Newton Abbot", "Devon", "England"),
-    "TQ13": ("Bovey Tracey", "Devon", "England"),
-    "TQ14": ("Teignmouth", "Devon", "England"),
-    "TQ2": ("Torquay", "Torbay", "England"),
-    "TQ3": ("Torquay", "Torbay", "England"),
-    "TQ4": ("Torquay", "Torbay", "England"),
-    "TQ5": ("", "Torbay", "England"),
-    "TQ6": ("Dartmouth", "Devon", "England"),
-    "TQ7": ("Kingsbridge", "Devon", "England"),
-    "TQ8": ("Salcombe", "Devon", "England"),
-    "TQ9": ("Totnes", "Devon", "England"),
-    "TR1": ("Truro", "Cornwall", "England"),
-    "TR10": ("Penryn", "Cornwall", "England"),
-    "TR11": ("Falmouth", "Cornwall", "England"),
-    "TR12": ("St Keverne", "Cornwall", "England"),
-    "TR13": ("Helston", "Cornwall", "England"),
-    "TR14": ("Camborne", "Cornwall", "England"),
-    "TR15": ("Redruth", "Cornwall", "England"),
-    "TR16": ("Redruth", "Cornwall", "England"),
-    "TR17": ("Marazion", "Cornwall", "England"),
-    "TR18": ("Penzance", "Cornwall", "England"),
-    "TR19": ("Sancreed", "Cornwall", "England"),
-    "TR2": ("Tregoney", "Cornwall", "England"),
-    "TR20": ("Ludgvan", "Cornwall", "England"),
-    "TR21": ("Isles of Scilly", "Isles Of Scilly", "England"),
-    "TR22": ("Isles of Scilly", "Isles Of Scilly", "England"),
-    "TR23": ("Isles of Scilly", "Isles Of Scilly", "England"),
-    "TR24": ("Isles of Scilly", "Isles Of Scilly", "England"),
-    "TR25": ("Isles of Scilly", "Isles Of Scilly", "England"),
-    "TR26": ("St Ives", "Cornwall", "England"),
-    "TR27": ("Hayle", "Cornwall", "England"),
-    "TR3": ("Perranarworthal", "Cornwall", "England"),
-    "TR4": ("Kenwyn", "Cornwall", "England"),
-    "TR5": ("St Agnes", "Cornwall", "England"),
-    "TR6": ("Perranporth", "Cornwall", "England"),
-    "TR7": ("Newquay", "Cornwall", "England"),
-    "TR8": ("Colan", "Cornwall", "England"),
-    "TR9": ("St Columb Major", "Cornwall", "England"),
-    "TS1": ("", "Middlesbrough", "England"),
-    "TS10": ("Redcar", "Redcar and Cleveland", "England"),
-    "TS11": ("Saltburn Marske and New Marske", "Redcar and Cleveland", "England"),
-    "TS12": ("Skelton", "Redcar and Cleveland", "England"),
-    "TS13": ("Loftus", "Redcar and Cleveland", "England"),
-    "TS14": ("Guisborough", "Redcar and Cleveland", "England"),
-    "TS15": ("Kirklevington", "Stockton-on-Tees", "England"),
-    "TS16": ("Egglescliffe", "Stockton-on-Tees", "England"),
-    "TS17": ("Thornaby", "Stockton-on-Tees", "England"),
-    "TS18": ("", "Stockton-on-Tees", "England"),
-    "TS19": ("", "Stockton-on-Tees", "England"),
-    "TS2": ("", "Middlesbrough", "England"),
-    "TS20": ("Norton", "Stockton-on-Tees", "England"),
-    "TS21": ("Sedgefield", "County Durham", "England"),
-    "TS22": ("Trindon", "Stockton-on-Tees", "England"),
-    "TS23": ("Billingham", "Stockton-on-Tees", "England"),
-    "TS24": ("", "Hartlepool", "England"),
-    "TS25": ("", "Hartlepool", "England"),
-    "TS26": ("", "Hartlepool", "England"),
-    "TS27": ("Monk Hesleden", "County Durham", "England"),
-    "TS28": ("Hutton Henry", "County Durham", "England"),
-    "TS29": ("Trimdon", "County Durham", "England"),
-    "TS3": ("", "Middlesbrough", "England"),
-    "TS4": ("", "Middlesbrough", "England"),
-    "TS5": ("", "Middlesbrough", "England"),
-    "TS6": ("Redcar", "Redcar and Cleveland", "England"),
-    "TS7": ("", "Middlesbrough", "England"),
-    "TS8": ("Stainton", "Middlesbrough", "England"),
-    "TS9": ("Great and Little Broughton", "North Yorkshire", "England"),
-    "TW1": ("Richmond", "Greater London", "England"),
-    "TW10": ("Richmond", "Greater London", "England"),
-    "TW11": ("Richmond", "Greater London", "England"),
-    "TW12": ("Richmond", "Greater London", "England"),
-    "TW13": ("Hounslow", "Greater London", "England"),
-    "TW14": ("Hounslow", "Greater London", "England"),
-    "TW15": ("Staines", "Surrey", "England"),
-    "TW16": ("Staines", "Surrey", "England"),
-    "TW17": ("Staines", "Surrey", "England"),
-    "TW18": ("Staines", "Surrey", "England"),
-    "TW19": ("", "Surrey", "England"),
-    "TW2": ("Richmond", "Greater London", "England"),
-    "TW20": ("Egham", "Surrey", "England"),
-    "TW3": ("Hounslow", "Greater London", "England"),
-    "TW4": ("Hounslow", "Greater London", "England"),
-    "TW5": ("Hounslow", "Greater London", "England"),
-    "TW6": ("Hillingdon", "Greater London", "England"),
-    "TW7": ("Hounslow", "Greater London", "England"),
-    "TW8": ("Hounslow", "Greater London", "England"),
-    "TW9": ("Richmond", "Greater London", "England"),
-    "UB1": ("Southall", "Greater London", "England"),
-    "UB10": ("Hillingdon", "Greater London", "England"),
-    "UB11": ("Hillingdon", "Greater London", "England"),
-    "UB2": ("Southall", "Greater London", "England"),
-    "UB3": ("Hillingdon", "Greater London", "England"),
-    "UB4": ("Hillingdon", "Greater London", "England"),
-    "UB5": ("Southall", "Greater London", "England"),
-    "UB6": ("Southall", "Greater London", "England"),
-    "UB7": ("Hillingdon", "Greater London", "England"),
-    "UB8": ("Hillingdon", "Greater London", "England"),
-    "UB9": ("Denham Green", "Buckinghamshire", "England"),
-    "W1": ("", "Westminster", "England"),
-    "W10": ("Kensington", "Greater London", "England"),
-    "W11": ("Kensington", "Greater London", "England"),
-    "W12": ("Hammersmith", "Greater London", "England"),
-    "W13": ("Ealing", "Greater London", "England"),
-    "W14": ("Hammersmith", "Greater London", "England"),
-    "W1B": ("", "Westminster", "England"),
-    "W1C": ("", "Westminster", "England"),
-    "W1D": ("", "Westminster", "England"),
-    "W1F": ("", "Westminster", "England"),
-    "W1G": ("Paddington", "Greater London", "England"),
-    "W1H": ("Paddington", "Greater London", "England"),
-    "W1J": ("", "Westminster", "England"),
-    "W1K": ("", "Westminster", "England"),
-    "W1M": ("Paddington", "Greater London", "England"),
-    "W1S": ("", "Westminster", "England"),
-    "W1T": ("Camden Town", "Greater London", "England"),
-    "W1U": ("Paddington", "Greater London", "England"),
-    "W1W": ("Paddington", "Greater London", "England"),
-    "W2": ("Paddington", "Greater London", "England"),
-    "W3": ("Ealing", "Greater London", "England"),
-    "W4": ("Hounslow", "Greater London", "England"),
-    "W5": ("Ealing", "Greater London", "England"),
-    "W6": ("Hammersmith", "Greater London", "England"),
-    "W7": ("Ealing", "Greater London", "England"),
-    "W8": ("Kensington", "Greater London", "England"),
-    "W9": ("Paddington", "Greater London", "England"),
-    "WA1": ("Birchwood", "Warrington", "England"),
-    "WA10": ("", "St Helens", "England"),
-    "WA11": ("", "St Helens", "England"),
-    "WA12": ("", "St Helens", "England"),
-    "WA13": ("Lymm", "Warrington", "England"),
-    "WA14": ("", "Trafford", "England"),
-    "WA15": ("", "Trafford", "England"),
-    "WA16": ("Knutsford", "Cheshire East", "England"),
-    "WA2": ("Birchwood", "Warrington", "England"),
-    "WA3": ("Croft", "Warrington", "England"),
-    "WA4": ("Appleton", "Warrington", "England"),
-    "WA5": ("Great Sankey", "Warrington", "England"),
-    "WA6": ("Frodsham", "Cheshire West and Chester", "England"),
-    "WA7": ("Runcorn", "Halton", "England"),
-    "WA8": ("Runcorn", "Halton", "England"),
-    "WA9": ("", "St Helens", "England"),
-    "WC1": ("Camden Town", "Greater London", "England"),
-    "WC1A": ("Camden Town", "Greater London", "England"),
-    "WC1B": ("Camden Town", "Greater London", "England"),
-    "WC1E": ("Camden Town", "Greater London", "England"),
-    "WC1H": ("Camden Town", "Greater London", "England"),
-    "WC1N": ("Camden Town", "Greater London", "England"),
-    "WC1R": ("Camden Town", "Greater London", "England"),
-    "WC1V": ("Camden Town", "Greater London", "England"),
-    "WC1X": ("Camden Town", "Greater London", "England"),
-    "WC2": ("", "Westminster", "England"),
-    "WC2A": ("Camden Town", "Greater London", "England"),
-    "WC2B": ("", "Westminster", "England"),
-    "WC2E": ("", "Westminster", "England"),
-    "WC2H": ("Camden Town", "Greater London", "England"),
-    "WC2N": ("", "Westminster", "England"),
-    "WC2R": ("", "Westminster", "England"),
-    "WD1": ("Watford", "Hertfordshire", "England"),
-    "WD17": ("Watford", "Hertfordshire", "England"),
-    "WD18": ("Watford", "Hertfordshire", "England"),
-    "WD19": ("Watford Rural", "Hertfordshire", "England"),
-    "WD2": ("Potters Bar", "Hertfordshire", "England"),
-    "WD23": ("Potters Bar", "Hertfordshire", "England"),
-    "WD24": ("Watford", "Hertfordshire", "England"),
-    "WD25": ("Watford", "Hertfordshire", "England"),
-    "WD3": ("Chorleywood", "Hertfordshire", "England"),
-    "WD4": ("Kings Langley", "Hertfordshire", "England"),
-    "WD5": ("Abbots Langley", "Hertfordshire", "England"),
-    "WD6": ("Borehamwood", "Hertfordshire", "England"),
-    "WD7": ("Radlett", "Hertfordshire", "England"),
-    "WF1": ("", "Wakefield", "England"),
-    "WF10": ("", "Wakefield", "England"),
-    "WF11": ("", "Wakefield", "England"),
-    "WF12": ("Dewsbury", "Kirklees", "England"),
-    "WF13": ("Dewsbury", "Kirklees", "England"),
-    "WF14": ("Mirfield", "Kirklees", "England"),
-    "WF15": ("Dewsbury", "Kirklees", "England"),
-    "WF16": ("Dewsbury", "Kirklees", "England"),
-    "WF17": ("Dewsbury", "Kirklees", "England"),
-    "WF2": ("", "Wakefield", "England"),
-    "WF3": ("", "Leeds", "England"),
-    "WF4": ("Crigglestone", "Wakefield", "England"),
-    "WF5": ("", "Wakefield", "England"),
-    "WF6": ("Normanton", "Wakefield", "England"),
-    "WF7": ("Featherstone", "Wakefield", "England"),
-    "WF8": ("", "Wakefield", "England"),
-    "WF9": ("North Elmsall", "Wakefield", "England"),
-    "WN1": ("Pemberton", "Wigan", "England"),
-    "WN2": ("Pemberton", "Wigan", "England"),
-    "WN3": ("Pemberton", "Wigan", "England"),
-    "WN4": ("Pemberton", "Wigan", "England"),
-    "WN5": ("Pemberton", "Wigan", "England"),
-    "WN6": ("Pemberton", "Wigan", "England"),
-    "WN7": ("Leigh", "Wigan", "England"),
-    "WN8": ("Ormskirk", "Lancashire", "England"),
-    "WR1": ("Worcester", "Worcestershire", "England"),
-    "WR10": ("Wick", "Worcestershire", "England"),
-    "WR11": ("Evesham", "Worcestershire", "England"),
-    "WR12": ("Broadway", "Worcestershire", "England"),
-    "WR13": ("Colwall", "Herefordshire", "England"),
-    "WR14": ("Great Malvern", "Worcestershire", "England"),
-    "WR15": ("Tenbury", "Worcestershire", "England"),
-    "WR2": ("Worcester", "Worcestershire", "England"),
-    "WR3": ("Worcester", "Worcestershire", "England"),
-    "WR4": ("Worcester", "Worcestershire", "England"),
-    "WR5": ("Worcester", "Worcestershire", "England"),
-    "WR6": ("Martley", "Worcestershire", "England"),
-    "WR7": ("North Piddle", "Worcestershire", "England"),
-    "WR8": ("Worcester", "Worcestershire", "England"),
-    "WR9": ("Droitwich", "Worcestershire", "England"),
-    "WS1": ("", "Walsall", "England"),
-    "WS10": ("West Bromwich", "Sandwell", "England"),
-    "WS11": ("Cannock", "Staffordshire", "England"),
-    "WS12": ("Cannock", "Staffordshire", "England"),
-    "WS13": ("Lichfield", "Staffordshire", "England"),
-    "WS14": ("Swinfen and Packington", "Staffordshire", "England"),
-    "WS15": ("Brereton", "Staffordshire", "England"),
-    "WS2": ("", "Walsall", "England"),
-    "WS3": ("Willenhall", "Walsall", "England"),
-    "WS4": ("", "Walsall", "England"),
-    "WS5": ("", "Walsall", "England"),
-    "WS6": ("Great Wyrley", "Staffordshire", "England"),
-    "WS7": ("Burntwood", "Staffordshire", "England"),
-    "WS8": ("Brownhills", "Walsall", "England"),
-    "WS9": ("Aldridge", "Walsall", "England"),
-    "WV1": ("", "Wolverhampton", "England"),
-    "WV10": ("Wednesfield", "Wolverhampton", "England"),
-    "WV11": ("Wednesfield", "Wolverhampton", "England"),
-    "WV12": ("Willenhall", "Walsall", "England"),
-    "WV13": ("Willenhall", "Walsall", "England"),
-    "WV14": ("Wednesfield", "Wolverhampton", "England"),
-    "WV15": ("Bridgnorth", "Shropshire", "England"),
-    "WV16": ("Chetton", "Shropshire", "England"),
-    "WV2": ("", "Wolverhampton", "England"),
-    "WV3": ("", "Wolverhampton", "England"),
-    "WV4": ("", "Wolverhampton", "England"),
-    "WV5": ("Wombourne", "Staffordshire", "England"),
-    "WV6": ("", "Wolverhampton", "England"),
-    "WV7": ("Albrighton", "Shropshire", "England"),
-    "WV8": ("Bilbrook", "Staffordshire", "England"),
-    "WV9": ("", "Wolverhampton", "England"),
-    "YO1": ("", "York", "England"),
-    "YO10": ("Heslington", "York", "England"),
-    "YO11": ("Scarborough", "North Yorkshire", "England"),
-    "YO12": ("Scarborough", "North Yorkshire", "England"),
-    "YO13": ("Stainton Dale", "North Yorkshire", "England"),
-    "YO14": ("Muston", "North Yorkshire", "England"),
-    "YO15": ("Bridlington", "East Riding of Yorkshire", "England"),
-    "YO16": ("Bridlington", "East Riding of Yorkshire", "England"),
-    "YO17": ("Settrington", "North Yorkshire", "England"),
-    "YO18": ("Pickering", "North Yorkshire", "England"),
-    "YO19": ("Wheldrake", "York", "England"),
-    "YO21": ("Hutton Mulgrave", "North Yorkshire", "England"),
-    "YO22": ("Snainton", "North Yorkshire", "England"),
-    "YO23": ("Copmanthorpe", "York", "England"),
-    "YO24": ("", "York", "England"),
-    "YO25": ("Driffield", "East Riding of Yorkshire", "England"),
-    "YO26": ("Upper Poppleton", "York", "England"),
-    "YO30": ("Rawcliffe", "York", "England"),
-    "YO31": ("", "York", "England"),
-    "YO32": ("Earswick", "York", "England"),
-    "YO41": ("Catton", "East Riding of Yorkshire", "England"),
-    "YO42": ("Barmby Moor", "East Riding of Yorkshire", "England"),
-    "YO43": ("Market Weighton", "East Riding of Yorkshire", "England"),
-    "YO51": ("Boroughbridge", "North Yorkshire", "England"),
-    "YO60": ("Thornton-le-Clay", "North Yorkshire", "England"),
-    "YO61": ("Easingwold", "North Yorkshire", "England"),
-    "YO62": ("Nawton", "North Yorkshire", "England"),
-    "YO7": ("Sowerby", "North Yorkshire", "England"),
-    "YO8": ("Selby", "North Yorkshire", "England"),
-    "ZE1": ("Sound", "Shetland Islands", "Scotland"),
-    "ZE2": ("", "Shetland Islands", "Scotland"),
-    "ZE3": ("Toab", "Shetland Islands", "Scotland"),
-}
\ No newline at end of file
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:00
+
+import customer_management.post_codes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customer_management', '0016_alter_customermeta_unique_together'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customermeta',
+            name='registered_post_code',
+            field=models.CharField(blank=True, max_length=10, null=True, validators=[customer_management.post_codes.validate_post_code], verbose_name='Registered Post Code'),
+        ),
+        migrations.AlterField(
+            model_name='customermeta',
+            name='trading_post_code',
+            field=models.CharField(blank=True, max_length=10, null=True, validators=[customer_management.post_codes.validate_post_code], verbose_name='Trading Post Code'),
+        ),
+        migrations.AlterField(
+            model_name='billingaddress',
+            name='post_code',
+            field=models.CharField(blank=True, max_length=10, null=True, validators=[customer_management.post_codes.validate_post_code]),
+        ),
+        migrations.AlterField(
+            model_name='siteaddress',
+            name='post_code',
+            field=models.CharField(blank=True, max_length=10, null=True, validators=[customer_management.post_codes.validate_post_code]),
+        ),
+    ]
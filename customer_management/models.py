@@ -4,7 +4,7 @@ from django.utils.translation import gettext_lazy as _
 from cities_light.models import City, Country, Region
 
 from authentication.models import User
-from customer_management.constants import POST_CODE_LIST
+from customer_management.post_codes import validate_post_code
 
 TAX_PREFERENCE_CHOICES = (
     ('taxable', 'Taxable'),
@@ -67,13 +67,13 @@ class CustomerMeta(models.Model):
     registered_country = models.CharField(max_length=255, null=True, blank=True, verbose_name=_("Registered Country"))
     registered_town = models.CharField(max_length=255, null=True, blank=True, verbose_name=_("Registered Town"))
     registered_county = models.CharField(max_length=255, null=True, blank=True, verbose_name=_("Registered County"))
-    registered_post_code = models.CharField(max_length=10, choices=POST_CODE_LIST, null=True, blank=True, verbose_name=_("Registered Post Code"))
+    registered_post_code = models.CharField(max_length=10, validators=[validate_post_code], null=True, blank=True, verbose_name=_("Registered Post Code"))
 
     trading_address = models.CharField(max_length=255, null=True, blank=True, verbose_name=_("Trading Address"))
     trading_country = models.CharField(max_length=255, null=True, blank=True, verbose_name=_("Trading Country"))
     trading_town = models.CharField(max_length=255, null=True, blank=True, verbose_name=_("Trading Town"))
     trading_county = models.CharField(max_length=255, null=True, blank=True, verbose_name=_("Trading County"))
-    trading_post_code = models.CharField(max_length=10, choices=POST_CODE_LIST, null=True, blank=True, verbose_name=_("Trading Post Code"))
+    trading_post_code = models.CharField(max_length=10, validators=[validate_post_code], null=True, blank=True, verbose_name=_("Trading Post Code"))
 
     utr_number = models.CharField(max_length=255, verbose_name=_("UTR Number"), null=True)
     main_telephone_number = models.CharField(max_length=125, verbose_name=_("Main Telephone Number"))
@@ -108,7 +108,7 @@ class BillingAddress(models.Model):
     country = models.CharField(max_length=255, null=True, blank=True)
     town = models.CharField(max_length=255, null=True, blank=True)
     county = models.CharField(max_length=255, null=True, blank=True)
-    post_code = models.CharField(max_length=10, choices=POST_CODE_LIST, null=True, blank=True)
+    post_code = models.CharField(max_length=10, validators=[validate_post_code], null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     contact_name = models.CharField(max_length=127,null=True)
@@ -140,7 +140,7 @@ class SiteAddress(models.Model):
     country = models.CharField(max_length=255, null=True, blank=True)
     town = models.CharField(max_length=255, null=True, blank=True)
     county = models.CharField(max_length=255, null=True, blank=True)
-    post_code = models.CharField(max_length=10, choices=POST_CODE_LIST, null=True, blank=True)
+    post_code = models.CharField(max_length=10, validators=[validate_post_code], null=True, blank=True)
     UPRN = models.CharField(max_length=10 , null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -0,0 +1,102 @@
+import os
+import csv
+from bisect import bisect_left
+from functools import lru_cache
+from django.core.exceptions import ValidationError
+from rest_framework import serializers
+
+POST_CODES_FILE = os.path.join(os.path.dirname(__file__), 'data', 'post_codes.csv')
+
+
+@lru_cache(maxsize=None)
+def _post_codes():
+    """
+    Load the postcode districts once per process, on first use.
+
+    Returns:
+        tuple: (codes, info) with the codes sorted, the prefix index searched by
+               search_post_codes, and info as {code: (town, county, country)}.
+    """
+    with open(POST_CODES_FILE, newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        next(reader)
+        info = {code: (town, county, country) for code, town, county, country in reader}
+    return tuple(sorted(info)), info
+
+
+def normalise_post_code(value):
+    """
+    Upper-case a postcode district and strip its spaces, e.g. " ab10 " -> "AB10".
+    """
+    return ''.join(str(value or '').split()).upper()
+
+
+def is_valid_post_code(value):
+    """
+    Whether a value is a known postcode district.
+    """
+    return value in _post_codes()[1]
+
+
+def post_code_info(value):
+    """
+    The (town, county, country) of a postcode district, None if it is not known.
+    """
+    return _post_codes()[1].get(normalise_post_code(value))
+
+
+def search_post_codes(prefix, limit=10):
+    """
+    The postcode districts starting with a prefix, in order, found by bisecting the
+    sorted codes.
+
+    Args:
+        prefix (str): The typed prefix, case and spaces are ignored.
+        limit (int): Maximum number of codes returned.
+
+    Returns:
+        list: The matching codes.
+    """
+    codes = _post_codes()[0]
+    prefix = normalise_post_code(prefix)
+    if not prefix:
+        return []
+
+    matches = []
+    for code in codes[bisect_left(codes, prefix):]:
+        if not code.startswith(prefix) or len(matches) >= limit:
+            break
+        matches.append(code)
+    return matches
+
+
+def validate_post_code(value):
+    """
+    Model field validator of postcode districts.
+    """
+    if value and not is_valid_post_code(value):
+        raise ValidationError(f'"{value}" is not a valid post code.')
+
+
+class PostCodeField(serializers.CharField):
+    """
+    Serializer field of a postcode district.
+
+    The value is checked against the postcode data instead of being a ChoiceField, so
+    forms render an autocomplete input backed by the postcode autocomplete view rather
+    than embedding every district.
+    """
+    default_error_messages = {
+        'invalid_choice': '"{input}" is not a valid post code.',
+    }
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('max_length', 10)
+        kwargs.setdefault('style', {}).setdefault('base_template', 'custom_post_code.html')
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        value = normalise_post_code(super().to_internal_value(data))
+        if value and not is_valid_post_code(value):
+            self.fail('invalid_choice', input=value)
+        return value
@@ -10,7 +10,7 @@ from authentication.serializers import SignupSerializer, UserRole
 from rest_framework.validators import UniqueValidator, UniqueTogetherValidator
 from .models import *
 import re
-from customer_management.constants import POST_CODE_LIST
+from customer_management.post_codes import PostCodeField
 import uuid
 from customer_management.models import SiteAddress
 from django.db import transaction
@@ -242,13 +242,12 @@ class CustomerSerializer(serializers.ModelSerializer):
             'custom_class': 'col-4'
         },
     )
-    registered_post_code = serializers.ChoiceField(
+    registered_post_code = PostCodeField(
         label=_('Registered Post Code'),
         required = True,
-        choices=POST_CODE_LIST,
 
         style={
-            'base_template': 'custom_select_without_search.html',
+            'base_template': 'custom_post_code.html',
             'custom_class': 'col-4'
         },
         error_messages={
@@ -310,13 +309,12 @@ class CustomerSerializer(serializers.ModelSerializer):
             'custom_class': 'col-4'
         },
     )
-    trading_post_code = serializers.ChoiceField(
+    trading_post_code = PostCodeField(
         label=_('Trading Post Code'),
         required=False,
-        choices=POST_CODE_LIST,
 
         style={
-            'base_template': 'custom_select_without_search.html',
+            'base_template': 'custom_post_code.html',
             'custom_class': 'col-4'
         },
         error_messages={
@@ -607,13 +605,12 @@ class BillingAddressSerializer(serializers.ModelSerializer):
         },
     )
     
-    post_code = serializers.ChoiceField(
+    post_code = PostCodeField(
         label=_('Post Code'),
         required = True,
-        choices=POST_CODE_LIST,
 
         style={
-            'base_template': 'custom_select_without_search.html',
+            'base_template': 'custom_post_code.html',
             'custom_class': 'col-4'
         },
         error_messages={
@@ -781,13 +778,12 @@ class SiteAddressSerializer(serializers.ModelSerializer):
         },
     )
     
-    post_code = serializers.ChoiceField(
+    post_code = PostCodeField(
         label=_('Post Code'),
         required = True,
-        choices=POST_CODE_LIST,
 
         style={
-            'base_template': 'custom_select_without_search.html',
+            'base_template': 'custom_post_code.html',
             'custom_class': 'col-4'
         },
         error_messages={
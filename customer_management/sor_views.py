@@ -1,9 +1,9 @@
-from io import BytesIO
 from django.shortcuts import render, redirect
 from django.conf import settings
 from django.http import Http404
 from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.permission import *
+from infinity_fire_solutions.pagination import PaginatedListMixin
 from requirement_management.models import *
 from .serializers import *
 from requirement_management.views import get_customer_data
@@ -13,9 +13,8 @@ from rest_framework import generics, status, filters
 from rest_framework.renderers import TemplateHTMLRenderer, JSONRenderer
 from drf_yasg.utils import swagger_auto_schema
 from infinity_fire_solutions.utils import docs_schema_response_new
-import pandas as pd
+from common_app.import_jobs import queue_import
 from common_app.models import UpdateWindowConfiguration
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 
 from requirement_management.serializers import RequirementCustomerSerializer
 
@@ -77,7 +76,7 @@ class CSSORCustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
                                     message="Data retrieved",
                                     data=serializer.data)
 
-class CSSORListView(CustomAuthenticationMixin, generics.ListAPIView):
+class CSSORListView(PaginatedListMixin, CustomAuthenticationMixin, generics.ListAPIView):
     """
     View to get the listing of Service Order Requests (SOR).
     Supports both HTML and JSON response formats.
@@ -88,6 +87,7 @@ class CSSORListView(CustomAuthenticationMixin, generics.ListAPIView):
     filter_backends = [filters.SearchFilter]
     search_fields = ['name']
     template_name = 'sor_list.html'
+    paginate_by = 10
     ordering_fields = ['-created_at']
 
     common_get_response = {
@@ -107,22 +107,6 @@ class CSSORListView(CustomAuthenticationMixin, generics.ListAPIView):
             queryset = User.objects.filter(is_active=False,  roles__name__icontains='customer').exclude(pk=self.request.user.id)
             return queryset
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 10
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
-    
     def get_searched_queryset(self, queryset):
         search_params = self.request.query_params.get('q', '')
         if search_params:
@@ -716,62 +700,6 @@ class SorBulkUploadView(CustomAuthenticationMixin, generics.CreateAPIView):
     """
     serializer_class = BulkSorAddSerializer  # Replace with the actual serializer for sorBulkUpload
     default_fieldset = ['name', 'reference_number', 'category_id', 'price', 'description', 'units']
-    EXCEL = ['xlsx', 'xls', 'ods']
-    CSV = ['csv',]
-
-    # File operation Functions ----------------------------------------------
-
-    def get_file_ext(self, file_name: str) -> str:
-        """
-        Get the file extension for a given file name.
-
-        Args:
-            file_name (str): The name of the file.
-
-        Returns:
-            str: The file extension in lowercase.
-        """
-        ext = file_name.split('.')[-1].lower()
-        return ext
-
-    def get_excel_engine(self, file_ext: str) -> str or None:
-        """
-        Get the engine to use for reading an Excel file based on its extension.
-
-        Args:
-            file_ext (str): The file extension in lowercase.
-
-        Returns:
-            str or None: The engine to use, or None if the file is not an Excel file.
-        """
-        engines = {'xlsx': 'openpyxl', 'xls': 'xlrd', 'ods': 'odf'}
-        return engines[file_ext]
-
-    def read_file_to_df(self, file) -> pd.DataFrame:
-        """
-        Read a file from an in-memory upload and convert it into a DataFrame.
-
-        Parameters:
-        - file (InMemoryUploadedFile): The in-memory uploaded file.
-
-        Returns:
-        - pd.DataFrame or None: The DataFrame containing the data from the file, or None if an error occurs.
-        """
-        ext = self.get_file_ext(file.name)
-
-        # Convert the in-memory file to a BytesIO object
-        content = BytesIO(file.read())
-
-        if ext in self.EXCEL:
-            engine = self.get_excel_engine(ext)
-            data_frame = pd.read_excel(content, engine=engine)
-            return data_frame
-        
-        if ext in self.CSV:
-            data_frame = pd.read_csv(content)
-            return data_frame
-
-        raise ValueError('The file type is not supported.')
 
     def post(self, request, *args, **kwargs):
         
@@ -800,55 +728,19 @@ class SorBulkUploadView(CustomAuthenticationMixin, generics.CreateAPIView):
             messages.error(request, 'Please select correct headers to upload bulk item file')
             return redirect(reverse('cs_customer_sor_list', kwargs={'customer_id': kwargs.get('customer_id')}))
         
-        df = self.read_file_to_df(request.FILES.get('excel_file'))
-
-        items_data_list = []
-        for index, row in df.iterrows():
-            items_data = {}
-            for key, value in mapping_dict.items():
-                items_data[key] = row[value].strip() if isinstance(row[value], str) else row[value]
-                
-            items_data['customer_id'] = customer_data.id
-            items_data_list.append(items_data)
+        excel_file = request.FILES.get('excel_file')
+        if not excel_file:
+            messages.error(request, "Please select a file to import")
+            return redirect(reverse('cs_customer_sor_list', kwargs={'customer_id': kwargs['customer_id']}))
 
-        serializer = self.serializer_class(data=items_data_list, many=True)
-        if serializer.is_valid():
-            serializer.save(user_id=request.user)
-            messages.success(request, 'Bulk SOR uploaded successfully.')
+        # SOR codes that already exist for the customer update the existing SOR items.
+        try:
+            job = queue_import(
+                request.user, excel_file, 'sor', mapping_dict, coercions={'price': 'decimal'}, customer_id=customer_data.id
+            )
+        except ValueError as e:
+            messages.error(request, str(e))
             return redirect(reverse('cs_customer_sor_list', kwargs={'customer_id': kwargs['customer_id']}))
-        else:
-            update_instances = []
-            errors = []
-            instances = None
-            items_data_list_copy = items_data_list.copy()
-            if serializer.errors:
-                indexes_with_unique_errors = list(map(lambda x: x[0], filter(lambda x: 'non_field_errors' in x[1], enumerate(serializer.errors))))
-                update_instances_ids = list(map(lambda i: items_data_list_copy[i]['reference_number'], indexes_with_unique_errors))
-                items_data_list_copy = items_data_list.copy()
-                update_instances = list(map(lambda i: items_data_list_copy[i], indexes_with_unique_errors))
-            
-                if update_instances_ids:
-                    instances = SORItem.objects.filter(reference_number__in=update_instances_ids, customer_id=customer_data).all()
-
-                if instances and update_instances_ids:
-                    for instance in update_instances:
-                        sor_instance = instances.filter(reference_number=instance.get('reference_number')).first()
-                        if sor_instance:
-                            serializer = self.serializer_class(data=instance, instance=sor_instance)
-                            if serializer.is_valid():
-                                serializer.update(
-                                    sor_instance,
-                                    serializer.validated_data
-                                )
-                    serializer = self.serializer_class(data=[data for idx, data in enumerate(items_data_list) if idx not in indexes_with_unique_errors], many=True)
-                    if serializer.is_valid():
-                        serializer.save(user_id=request.user)
-                        messages.success(request, 'Bulk SOR uploaded successfully.')
-                        return redirect(reverse('cs_customer_sor_list', kwargs={'customer_id': kwargs['customer_id']}))
-                    else:
-                        messages.error(request, 'Some SOR Updated Successfully, But others was having irrelevant data.')
-                        return redirect(reverse('cs_customer_sor_list', kwargs={'customer_id': kwargs['customer_id']}))
-            
-            messages.error(request, 'The file contains irrelevant data. Please review the data and try again.')
-        
-        return redirect(reverse('cs_customer_sor_list', kwargs={'customer_id': kwargs['customer_id']}))
\ No newline at end of file
+
+        messages.success(request, 'The SOR file has been uploaded and is being imported.')
+        return redirect(f"{reverse('cs_customer_sor_list', kwargs={'customer_id': kwargs['customer_id']})}?import_job={job.id}")
@@ -30,6 +30,7 @@ urlpatterns = [
     path('contact_person/view/<int:customer_id>/<int:address_id>/', CustomerContactPersonDetailView.as_view(), name='customer_contact_person_view'),
     path('contact_person/delete/<int:customer_id>/<int:address_id>/', CustomerRemoveContactPersonView.as_view(), name='customer_contact_person_delete'),
     path('billing_address_info/', BillingAddressInfoView.as_view(), name="billing_address_info"),
+    path('post_codes/', PostCodeAutocompleteView.as_view(), name="postcode-autocomplete"),
     path('export_csv/', ExportCSVView.as_view(), name='export_csv'),
 
     path('customers/sor/', CSSORCustomerListView.as_view(), name='cs_cs_sor_customers_list'),
@@ -1,9 +1,10 @@
-from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
 from django.shortcuts import render, redirect
 from django.http import Http404, JsonResponse, HttpResponse,HttpResponseBadRequest
 from django.conf import settings
 from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.permission import *
+from infinity_fire_solutions.pagination import PaginatedListMixin
+from common_app.search import search_queryset
 from .models import *
 from .serializers import *
 from infinity_fire_solutions.response_schemas import create_api_response, convert_serializer_errors, render_html_response
@@ -20,7 +21,7 @@ from infinity_fire_solutions.email import *
 from contact.models import Contact
 from drf_yasg.utils import swagger_auto_schema
 from infinity_fire_solutions.utils import docs_schema_response_new
-from customer_management.constants import POST_CODES_INFO
+from customer_management.post_codes import post_code_info, search_post_codes
 
 from django.contrib.auth.hashers import make_password
 from django.views import View
@@ -85,7 +86,7 @@ def create_customer(customer, request):
     email = Email()  # Instantiate your Email class
     email.send_mail(customer.email, 'email_templates/customer_password.html', context, 'Your New Account Password')
 
-class CustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
+class CustomerListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     """
     View to get the listing of all contacts.
     Supports both HTML and JSON response formats.
@@ -98,22 +99,6 @@ class CustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
     ordering_fields = ['created_at']
     queryset = CustomerMeta.objects.all()
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
-    
     def get_queryset(self):
         queryset = super().get_queryset()
         queryset = self.get_searched_queryset(queryset)
@@ -121,18 +106,7 @@ class CustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
         return queryset
 
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'customer', self.request.query_params.get('q', ''), field='user_id')
 
     common_get_response = {
     status.HTTP_200_OK: 
@@ -767,17 +741,34 @@ class BillingAddressInfoView(CustomAuthenticationMixin, APIView):
         Handle both AJAX (JSON) and HTML requests.
         """
         post_code = request.query_params.get('post_code')
-        post_code_info = POST_CODES_INFO[post_code]
+        info = post_code_info(post_code)
+        if info is None:
+            return Response({"data": None, "message": "Post Code not found."}, status=status.HTTP_404_NOT_FOUND)
         data = {
             "post_code": post_code,
-            "town": post_code_info[0] if post_code_info[0] else "Not Available",  # some towns are not available in post.
-            "county": post_code_info[1],
-            "country": post_code_info[2]
+            "town": info[0] if info[0] else "Not Available",  # some towns are not available in post.
+            "county": info[1],
+            "country": info[2]
         }
         serialize = self.serializer_class(data=data)
         serialize.is_valid(raise_exception=True)
         return Response({"data": serialize.data})
 
+class PostCodeAutocompleteView(CustomAuthenticationMixin, APIView):
+    """
+    View to suggest the post codes starting with the typed `term` query param.
+
+    Returns a plain list of codes, the format of jQuery UI autocomplete sources. The
+    postcode data does not change between deployments, so browsers may cache answers.
+    """
+    renderer_classes = [JSONRenderer]
+    swagger_schema = None
+
+    def get(self, request, *args, **kwargs):
+        response = Response(search_post_codes(request.query_params.get('term', ''), limit=20))
+        response['Cache-Control'] = 'private, max-age=86400'
+        return response
+
 class ExportCSVView(View):
     def get(self, request, *args, **kwargs):
         stw_ids = request.GET.get('stw_ids', '')
@@ -811,7 +802,7 @@ class ExportCSVView(View):
 
         return response
 
-class CMRequirementListView(CustomAuthenticationMixin,generics.ListAPIView):
+class CMRequirementListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     """
     View to get the listing of all requirements.
     Supports both HTML and JSON response formats.
@@ -874,18 +865,7 @@ class CMRequirementListView(CustomAuthenticationMixin,generics.ListAPIView):
         return queryset
 
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'requirement', self.request.query_params.get('q', ''))
     
     @swagger_auto_schema(operation_id='Requirement Listing', responses={**common_get_response})
     def get(self, request, *args, **kwargs):
@@ -913,9 +893,8 @@ class CMRequirementListView(CustomAuthenticationMixin,generics.ListAPIView):
 
             
             if request.accepted_renderer.format == 'html':
-                page_number = request.GET.get('page', 1)
                 context = {
-                    'requirements': Paginator(self.serializer_class(queryset, many=True).data, 20).get_page(page_number),
+                    'requirements': self.get_serialized_page(queryset, self.serializer_class),
                     'customer_id':customer_id,
                     'customer_instance':customer_data,
                     'sureveyors':sureveyors,
@@ -934,7 +913,7 @@ class CMRequirementListView(CustomAuthenticationMixin,generics.ListAPIView):
             return redirect(reverse('customer_requirement_list', kwargs={'customer_id': customer_id}))  
         
 
-class CMJobsListView(CustomAuthenticationMixin, generics.ListAPIView):
+class CMJobsListView(PaginatedListMixin, CustomAuthenticationMixin, generics.ListAPIView):
     serializer_class = STWJobListSerializer
     renderer_classes = [TemplateHTMLRenderer, JSONRenderer]
     filter_backends = [filters.SearchFilter]
@@ -980,35 +959,8 @@ class CMJobsListView(CustomAuthenticationMixin, generics.ListAPIView):
         
         return queryset
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
-    
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'job', self.request.query_params.get('q', ''))
 
     def get_queryset(self, data_access_value, customer_data):
         """
@@ -1066,7 +1018,7 @@ class CMJobsListView(CustomAuthenticationMixin, generics.ListAPIView):
             messages.error(request, "You are not authorized to perform this action")
             return redirect(reverse('job_customers_list'))
 
-class CMQuotationListView(CustomAuthenticationMixin,generics.ListAPIView):
+class CMQuotationListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     
     renderer_classes = [TemplateHTMLRenderer,JSONRenderer]
     filter_backends = [filters.SearchFilter]
@@ -1075,35 +1027,8 @@ class CMQuotationListView(CustomAuthenticationMixin,generics.ListAPIView):
     ordering_fields = ['created_at'] 
     serializer_class = RequirementQuotationListSerializer
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
-    
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'quotation', self.request.query_params.get('q', ''))
 
     def get_filtered_queryset(self, queryset):
         # Get the filtering parameters from the request's query parameters
@@ -1149,7 +1074,7 @@ class CMQuotationListView(CustomAuthenticationMixin,generics.ListAPIView):
             queryset = self.get_queryset()
            
             if request.accepted_renderer.format == 'html':
-                context = {'quotation_list': self.get_paginated_queryset(self.serializer_class(queryset, many=True).data),
+                context = {'quotation_list': self.get_serialized_page(queryset, self.serializer_class),
                 'customer_id': customer_id,
                 'customer_instance':customer_data,
                 'status_values': QUOTATION_STATUS_CHOICES,
@@ -1160,7 +1085,7 @@ class CMQuotationListView(CustomAuthenticationMixin,generics.ListAPIView):
             messages.error(request, "You are not authorized to perform this action")
             return redirect(reverse('view_customer_list_quotation'))
 
-class CMInvoiceListView(CustomAuthenticationMixin,generics.ListAPIView):
+class CMInvoiceListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     
     renderer_classes = [TemplateHTMLRenderer,JSONRenderer]
     filter_backends = [filters.SearchFilter]
@@ -1169,22 +1094,6 @@ class CMInvoiceListView(CustomAuthenticationMixin,generics.ListAPIView):
     ordering_fields = ['created_at'] 
     serializer_class = InvoiceListSerializer
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
-    
     def get_searched_queryset(self, queryset):
         search_params = self.request.query_params.get('q', '')
         if search_params:
@@ -1251,7 +1160,7 @@ class CMInvoiceListView(CustomAuthenticationMixin,generics.ListAPIView):
            
             if request.accepted_renderer.format == 'html':
                 context = {
-                    'invoice_list': self.get_paginated_queryset(self.serializer_class(queryset, many=True).data),
+                    'invoice_list': self.get_serialized_page(queryset, self.serializer_class),
                     'customer_id': customer_id,
                     'customer_instance': customer_data,
                     'status_values': INVOICE_STATUS_CHOICES,
@@ -1,4 +1,10 @@
 #!/bin/bash
+# Background workers and scheduled jobs pass their management command as arguments,
+# e.g. `python3 manage.py run_pdf_worker`; migrations are left to the web pods.
+if [ "$#" -gt 0 ]; then
+    exec "$@"
+fi
+
 echo "[+] ------ Apply database migrations ------ [+]"
 
 # python3 manage.py makemigrations --merge --no-input 
@@ -13,5 +19,11 @@ python3 manage.py migrate
 
 echo "Starting server"
 
-# Start server
-python3 manage.py runserver 0.0.0.0:8000
+# Start server: gunicorn (see gunicorn.conf.py) unless SERVER_MODE=runserver, the
+# single-process development server. exec hands the process over so the SIGTERM sent
+# on shutdown reaches the server and in-flight requests are drained.
+if [ "${SERVER_MODE:-gunicorn}" = "runserver" ]; then
+    exec python3 manage.py runserver 0.0.0.0:8000
+else
+    exec gunicorn --config gunicorn.conf.py infinity_fire_solutions.wsgi:application
+fi
@@ -0,0 +1,73 @@
+"""
+Gunicorn configuration of the production application server (see entrypoint.sh).
+
+Every value can be overridden with an environment variable of the deployment:
+
+    GUNICORN_BIND                 Address to listen on (0.0.0.0:8000).
+    GUNICORN_WORKERS              Worker processes (2 x CPUs + 1).
+    GUNICORN_THREADS              Threads per worker (4). Requests mostly wait on MySQL
+                                  and S3, so threads add concurrency for little memory.
+    GUNICORN_WORKER_CLASS         'gthread' (default), or 'sync' with GUNICORN_THREADS=1.
+    GUNICORN_TIMEOUT              Seconds a silent worker is given before it is killed (120).
+    GUNICORN_GRACEFUL_TIMEOUT     Seconds a worker has to finish its requests on restart (30).
+    GUNICORN_KEEPALIVE            Seconds an idle keep-alive connection is kept open (5).
+    GUNICORN_MAX_REQUESTS         Requests after which a worker is recycled, 0 never (5000).
+    GUNICORN_MAX_REQUESTS_JITTER  Random extra requests so workers do not recycle together (500).
+    GUNICORN_PRELOAD              Load the application once in the master before forking (true).
+    GUNICORN_LOG_LEVEL            Error log level (info).
+
+Load test, against a staging database, from a machine close to the server:
+
+    # 1. Current setup, the development server.
+    SERVER_MODE=runserver ./entrypoint.sh
+    python3 manage.py benchmark_http http://<host>:8000/readyz/ --requests 2000 --concurrency 50
+    python3 manage.py benchmark_http http://<host>:8000/auth/login/ --requests 2000 --concurrency 50
+
+    # 2. The same commands against this configuration.
+    ./entrypoint.sh
+
+The command prints requests/second and latency percentiles as JSON; record both runs
+with the container CPU/memory limits and the values of the variables above.
+"""
+import os
+import multiprocessing
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Recycle workers regularly so slow leaks (e.g. large PDF or import buffers) are returned
+# to the OS; the jitter spreads the restarts so capacity never drops all at once.
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 5000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 500))
+
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+# Heartbeat files in memory, the container's /tmp may be on a slow overlay filesystem.
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# The load balancer terminates TLS.
+forwarded_allow_ips = os.environ.get('GUNICORN_FORWARDED_ALLOW_IPS', '*')
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+access_log_format = '%(h)s "%(r)s" %(s)s %(b)s %(M)sms'
+
+
+def when_ready(server):
+    # Anything the preloaded application connected to in the master must not be shared
+    # with the forked workers: each worker opens its own database connections.
+    if preload_app:
+        from django.db import connections
+        from django.urls import get_resolver
+
+        # Import the URLconf (and with it every view and serializer) once here, rather than
+        # on the first request of every worker, including each worker recycled by max_requests.
+        get_resolver().url_patterns
+        connections.close_all()
@@ -1,16 +1,109 @@
-from io import BytesIO
+import os
+import time
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
+from django.core.cache import cache
 
-# Set up the S3 client with your AWS credentials and region
-s3_client = boto3.client('s3', region_name='eu-west-2')
+logger = logging.getLogger(__name__)
+
+# Set up the S3 client with your AWS credentials and region.
+# boto3 clients are thread safe; the pool is sized for the upload_many/download_many threads
+# plus the threads of multipart transfers, so they do not wait for a connection.
+s3_client = boto3.client('s3', region_name='eu-west-2', config=Config(
+    max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+    connect_timeout=settings.AWS_S3_CONNECT_TIMEOUT,
+    read_timeout=settings.AWS_S3_READ_TIMEOUT,
+    retries={'max_attempts': settings.AWS_S3_MAX_ATTEMPTS, 'mode': 'standard'},
+    tcp_keepalive=True,
+))
+
+# Files larger than the threshold are transferred in parts, several parts at a time.
+s3_transfer_config = TransferConfig(
+    multipart_threshold=settings.AWS_S3_MULTIPART_THRESHOLD,
+    multipart_chunksize=settings.AWS_S3_MULTIPART_CHUNKSIZE,
+    max_concurrency=settings.AWS_S3_MULTIPART_CONCURRENCY,
+)
+
+_metrics_lock = threading.Lock()
+_metrics = {}
+_metrics_logged_at = time.monotonic()
+
+
+@contextmanager
+def timed_s3_operation(operation):
+    """
+    Record the duration of an S3 operation in the metrics returned by s3_metrics.
+
+    Args:
+        operation (str): Name of the operation, e.g. 'upload' or 'download'.
+    """
+    started = time.monotonic()
+    failed = False
+    try:
+        yield
+    except Exception:
+        failed = True
+        raise
+    finally:
+        duration = time.monotonic() - started
+        with _metrics_lock:
+            metrics = _metrics.setdefault(operation, {'count': 0, 'errors': 0, 'total_time': 0.0, 'max_time': 0.0})
+            metrics['count'] += 1
+            metrics['errors'] += failed
+            metrics['total_time'] += duration
+            metrics['max_time'] = max(metrics['max_time'], duration)
+        logger.debug("S3 %s took %.3fs%s", operation, duration, ' (failed)' if failed else '')
+        _log_s3_metrics()
+
+
+def s3_metrics():
+    """
+    Return a snapshot of the S3 operation metrics of this process.
+
+    Returns:
+        dict: Keyed by operation, with the number of calls, failed calls and the
+              total/average/maximum duration in seconds.
+    """
+    with _metrics_lock:
+        metrics = {operation: dict(values) for operation, values in _metrics.items()}
+    for values in metrics.values():
+        values['avg_time'] = values['total_time'] / (values['count'] or 1)
+    return metrics
+
+
+def reset_s3_metrics():
+    with _metrics_lock:
+        _metrics.clear()
+
+
+def _log_s3_metrics():
+    # Every AWS_S3_METRICS_LOG_INTERVAL seconds the metrics of the process (web or worker)
+    # are logged and started again, so each log line covers one interval.
+    global _metrics_logged_at
+    interval = settings.AWS_S3_METRICS_LOG_INTERVAL
+    if not interval or time.monotonic() - _metrics_logged_at < interval:
+        return
+    with _metrics_lock:
+        if time.monotonic() - _metrics_logged_at < interval:
+            return
+        _metrics_logged_at = time.monotonic()
+    logger.info("S3 metrics of the last %ss: %s", interval, s3_metrics())
+    reset_s3_metrics()
 
 # Function to upload a file to Amazon S3
 def upload_signature_to_s3(file_name, file_path, s3_folder=''):
     try:
         s3_key = f"{s3_folder}/{file_name}"
-        s3_client.upload_file(file_path, settings.AWS_BUCKET_NAME, s3_key)
+        with timed_s3_operation('upload'):
+            s3_client.upload_file(file_path, settings.AWS_BUCKET_NAME, s3_key, Config=s3_transfer_config)
         return True
     except Exception as e:
         print(f"An error occurred: {str(e)}")
@@ -34,62 +127,167 @@ def upload_file_to_s3(unique_filename, file_path, s3_folder=''):
     # Upload the file to S3
     
     s3_key = f"{s3_folder}/{unique_filename}"
-    s3_client.upload_fileobj(file_path, settings.AWS_BUCKET_NAME, s3_key)
+    with timed_s3_operation('upload'):
+        s3_client.upload_fileobj(file_path, settings.AWS_BUCKET_NAME, s3_key, Config=s3_transfer_config)
 
     # Get the link to the uploaded file
     s3_url = f"https://{settings.AWS_BUCKET_NAME}.s3.amazonaws.com/{s3_key}"
 
     return s3_url
 
-def generate_presigned_url(s3_key, expiration=3600):
+
+def upload_many(files, s3_folder='', max_workers=None):
     """
-    Generates a pre-signed URL for downloading a file from Amazon S3.
+    Uploads several files to Amazon S3 concurrently.
+
+    A file that fails to upload is logged and skipped, the other files are still uploaded.
 
     Parameters:
-        s3_key (str): The S3 key of the file to be downloaded.
-        expiration (int, optional): The expiration time of the pre-signed URL in seconds. Default is 3600 (1 hour).
+        files (list): (unique_filename, file-like object) tuples.
+        s3_folder (str, optional): The S3 folder in which to store the files.
+        max_workers (int, optional): Concurrent uploads, defaults to AWS_S3_MAX_WORKERS.
 
     Returns:
-        str: The pre-signed URL for downloading the file from S3.
+        list: The S3 key of every file, in the order of `files`, None for the files that failed.
     """
+    def upload(unique_filename, file):
+        try:
+            upload_file_to_s3(unique_filename, file, s3_folder)
+            return f"{s3_folder}/{unique_filename}"
+        except Exception:
+            logger.exception("Upload of %s to S3 failed", unique_filename)
+            return None
+
+    if len(files) <= 1:
+        return [upload(unique_filename, file) for unique_filename, file in files]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers or settings.AWS_S3_MAX_WORKERS, len(files))) as executor:
+        return list(executor.map(lambda item: upload(*item), files))
+
+def _sign_url(s3_key, expiration):
     try:
-        response = s3_client.generate_presigned_url(
-            'get_object',
-            Params={
-                'Bucket': settings.AWS_BUCKET_NAME,
-                'Key': s3_key
-            },
-            ExpiresIn=expiration
-        )
+        with timed_s3_operation('presign'):
+            return s3_client.generate_presigned_url(
+                'get_object',
+                Params={
+                    'Bucket': settings.AWS_BUCKET_NAME,
+                    'Key': s3_key
+                },
+                ExpiresIn=expiration
+            )
     except ClientError as e:
         # Handle the error
         print(e)
         return None
 
-    return response
 
-def fetch_file_from_s3(unique_filename, s3_folder=''):
+def _presigned_url_cache_key(s3_key, expiration, window):
+    return f"presigned_url:{expiration}:{window}:{hashlib.md5(s3_key.encode('utf-8')).hexdigest()}"
+
+
+def presign_many(s3_keys, expiration=3600):
     """
-    Fetches a file from Amazon S3 and keeps it in memory.
+    Generates pre-signed URLs for downloading several files from Amazon S3.
+
+    URLs are cached per object key for the current PRESIGNED_URL_CACHE_WINDOW: within a
+    window every page gets the same URL for an object, so browsers can reuse the images
+    they have cached. URLs are signed for `expiration` plus the window, so a URL handed
+    out at the end of a window is still valid for at least `expiration` seconds.
 
     Parameters:
-        bucket_name (str): The name of the S3 bucket.
-        key (str): The key of the file in the S3 bucket.
+        s3_keys (iterable): The S3 keys of the files; empty keys are skipped.
+        expiration (int, optional): Minimum validity of the URLs in seconds. Default is 3600 (1 hour).
 
     Returns:
-        BytesIO: A BytesIO object containing the file content.
+        dict: {s3_key: pre-signed URL}. Keys that could not be signed are left out.
     """
-    try:
-        s3_key = f"{s3_folder}/{unique_filename}" if s3_folder else f'{unique_filename}'
+    s3_keys = [s3_key for s3_key in dict.fromkeys(s3_keys) if s3_key]
+    window = settings.PRESIGNED_URL_CACHE_WINDOW
+    if not window:
+        urls = {s3_key: _sign_url(s3_key, expiration) for s3_key in s3_keys}
+        return {s3_key: url for s3_key, url in urls.items() if url}
+
+    now = time.time()
+    window_index = int(now // window)
+    cache_keys = {_presigned_url_cache_key(s3_key, expiration, window_index): s3_key for s3_key in s3_keys}
+    urls = {cache_keys[cache_key]: url for cache_key, url in cache.get_many(list(cache_keys)).items()}
+
+    signed = {}
+    for cache_key, s3_key in cache_keys.items():
+        if s3_key in urls:
+            continue
+        url = _sign_url(s3_key, expiration + window)
+        if url:
+            signed[cache_key] = url
+            urls[s3_key] = url
+    if signed:
+        # Cached until the end of the window only, the next window signs new URLs.
+        cache.set_many(signed, timeout=max(int((window_index + 1) * window - now), 1))
+    return urls
+
+
+def generate_presigned_url(s3_key, expiration=3600):
+    """
+    Generates a pre-signed URL for downloading a file from Amazon S3.
+
+    The URL is cached, see presign_many; prefer presign_many for lists of documents.
+
+    Parameters:
+        s3_key (str): The S3 key of the file to be downloaded.
+        expiration (int, optional): The expiration time of the pre-signed URL in seconds. Default is 3600 (1 hour).
+
+    Returns:
+        str: The pre-signed URL for downloading the file from S3.
+    """
+    return presign_many([s3_key], expiration).get(s3_key)
+
+def download_file_from_s3(s3_key, destination):
+    """
+    Downloads a file from Amazon S3 to disk, in parts for large files, without buffering it in memory.
+
+    Parameters:
+        s3_key (str): The S3 key of the file.
+        destination (str or file-like object): A local path or a binary file opened for writing.
+    """
+    with timed_s3_operation('download'):
+        if isinstance(destination, (str, os.PathLike)):
+            s3_client.download_file(settings.AWS_BUCKET_NAME, s3_key, str(destination), Config=s3_transfer_config)
+        else:
+            s3_client.download_fileobj(settings.AWS_BUCKET_NAME, s3_key, destination, Config=s3_transfer_config)
+
+
+def download_many(s3_keys, destination_dir, max_workers=None):
+    """
+    Downloads several files from Amazon S3 to a local folder concurrently.
+
+    A file that fails to download is logged and skipped, the other files are still downloaded.
+
+    Parameters:
+        s3_keys (list): The S3 keys of the files.
+        destination_dir (str): The local folder, files are saved under their S3 file name.
+        max_workers (int, optional): Concurrent downloads, defaults to AWS_S3_MAX_WORKERS.
+
+    Returns:
+        dict: {s3_key: local path} of the downloaded files.
+    """
+    os.makedirs(destination_dir, exist_ok=True)
+
+    def download(index, s3_key):
+        # The index keeps files with the same name in different folders apart.
+        local_path = os.path.join(destination_dir, f'{index}_{os.path.basename(s3_key)}')
+        try:
+            download_file_from_s3(s3_key, local_path)
+            return s3_key, local_path
+        except Exception:
+            logger.exception("Download of %s from S3 failed", s3_key)
+            return s3_key, None
+
+    if not s3_keys:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers or settings.AWS_S3_MAX_WORKERS, len(s3_keys))) as executor:
+        results = executor.map(lambda item: download(*item), enumerate(s3_keys))
+        return {s3_key: local_path for s3_key, local_path in results if local_path}
 
-        # Download the file from S3
-        file_object = BytesIO()
-        s3_client.download_fileobj(settings.AWS_BUCKET_NAME, s3_key, file_object)
-        file_object.seek(0)  # Reset the file pointer to the beginning
-        return file_object
-    
-    except Exception as e:
-        return None
 
 def move_s3_file(source_key, destination_key):
     # Copy the file
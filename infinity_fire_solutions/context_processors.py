@@ -1,8 +1,7 @@
 # context_processors.py'
-from common_app.models import MenuItem
+from common_app.menu import get_role_menu
+from infinity_fire_solutions.permission import get_user_permission_matrix
 from django.urls import reverse, resolve
-from infinity_fire_solutions.permission import get_user_module_permissions
-import re
 
 
 def breadcrumbs(request):
@@ -31,78 +30,17 @@ def breadcrumbs(request):
     return {'breadcrumbs_data': breadcrumbs_data}
 
 
-def has_view_permission(user, module_name):
-
-    """
-    Custom template filter to check if the user has the 'add' permission for a specific module.
-
-    Args:
-        user (User): The user for whom permissions are to be checked.
-        module_name (str): The name of the module for which 'add' permission is required.
-
-    Returns:
-        bool: True if the user has the 'add' permission for the specified module, False otherwise.
-    """
-    user_permissions = get_user_module_permissions(user, module_name.lower())
-    # Check both "can list data" and "can create data" permissions
-    for permission in user_permissions.values():
-        return permission.get('can_create_data') or permission.get('can_list_data') != 'none'
-            
-    # If no appropriate permission found, return False
-    return False
-
-
-def generate_menu(request, menu_items):
-    menu_data = []
-
-    for item in menu_items:
-        pattern = r"s$"
-        if not item.permission_required or item.parent:
-            # Add the dashboard menu item, visible to all users
-            menu_item = {
-                'url': item.url,
-                'name': item.name,
-                'submenu': None,
-                'icon': item.icon
-            }
-             # Check for submenus of the current item
-            submenu_items = MenuItem.objects.filter(parent=item)
-            if submenu_items:
-             #Generate submenus recursively
-                menu_item['submenu'] = generate_menu(request, submenu_items)
-
-            menu_data.append(menu_item)
-            
-        
-        elif has_view_permission(request.user, re.sub(pattern, "", item.name.replace(" ", "_"))) and not has_view_permission(request.user, re.sub(pattern, "", item.name.replace(" ", "_"))) == 'none':
-            # Add other menu items with view permission
-            menu_item = {
-                'url': item.url,
-                'name': item.name,
-                'submenu': None,
-                'icon': item.icon
-            }
-            
-             # Check for submenus of the current item
-            submenu_items = MenuItem.objects.filter(parent=item)
-            if submenu_items:
-             #Generate submenus recursively
-                menu_item['submenu'] = generate_menu(request, submenu_items)
-
-            menu_data.append(menu_item)
-            
-    return menu_data
-
 def custom_menu(request):
     """
     Context processor for generating a custom menu data structure.
+
+    The menu only depends on the user's role, so it is served from the per-role menu
+    cache (see common_app.menu) and costs no queries once the cache is warm. Without a
+    shared cache it is built from the permission matrix memoized on the request user.
     """
     menu_data = {}
     user = request.user
     if user.is_authenticated:
-        if user.roles:
-            allowed_menu_items = MenuItem.objects.filter(parent=None).distinct().order_by('order')
-            
-            # Generate the final menu data structure using the generate_menu function
-            menu_data = generate_menu(request, allowed_menu_items)
+        if user.roles_id:
+            menu_data = get_role_menu(user.roles_id, get_user_permission_matrix(user))
     return {'menu_items': menu_data}
@@ -0,0 +1,54 @@
+from django.db.models import Count, Q
+
+from .pagination import paginate
+
+
+def customers_with_counts(queryset, count_name, relation, condition=None, only_with_counts=False):
+    """
+    Annotate customers with the number of their related records matching a condition.
+
+    The counts are computed by the database in the same query as the customers, instead
+    of one COUNT query per customer.
+
+    Args:
+        queryset (QuerySet): The customers (User queryset).
+        count_name (str): Name of the annotation, e.g. 'quote_counts'.
+        relation (str): The related query name of the counted model, e.g. 'customer_quotations'.
+        condition (dict, optional): Lookups on the counted model, e.g. {'status': 'approved'}.
+        only_with_counts (bool): When True customers without a matching record are left out.
+
+    Returns:
+        QuerySet: The annotated customers.
+    """
+    count_filter = Q(**{f'{relation}__{lookup}': value for lookup, value in (condition or {}).items()})
+    queryset = queryset.annotate(**{
+        count_name: Count(relation, filter=count_filter, distinct=True),
+    })
+    if only_with_counts:
+        queryset = queryset.filter(**{f'{count_name}__gt': 0})
+    return queryset
+
+
+def paginate_customers_with_counts(queryset, count_name, request, per_page=20):
+    """
+    Paginate annotated customers in the database, see paginate().
+
+    The items of the page are {'customer': customer, count_name: count} dicts, the shape
+    the customer list templates iterate over.
+
+    Args:
+        queryset (QuerySet): Customers annotated by customers_with_counts, ordered.
+        count_name (str): Name of the count annotation.
+        request (HttpRequest): The request, for its `page` query param; invalid pages fall
+                               back to the first or last page.
+        per_page (int): Customers per page.
+
+    Returns:
+        Page: The requested page.
+    """
+    page = paginate(request, queryset, per_page)
+    page.object_list = [
+        {'customer': customer, count_name: getattr(customer, count_name)}
+        for customer in page.object_list
+    ]
+    return page
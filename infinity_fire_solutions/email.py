@@ -1,27 +1,61 @@
+import os
+import uuid
+import base64
 import boto3
+from io import BytesIO
 from botocore import exceptions
-import requests
+from botocore.config import Config
+from email.mime.base import MIMEBase
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
 
-from django.core.validators import URLValidator
 from django.core.exceptions import ValidationError
 from django.conf import settings
 from django.template.loader import render_to_string
 from authentication.models import User
 
+from infinity_fire_solutions.aws_helper import s3_client, timed_s3_operation
+
+# Attachments are read from S3 and base64 encoded this many bytes at a time: a multiple
+# of 57, so every chunk encodes to whole 76 character lines.
+ATTACHMENT_CHUNK_SIZE = 57 * 1024
+
+
+class PermanentEmailError(Exception):
+    """
+    An email that will never be sent, e.g. its attachment is too large; it is not retried.
+    """
+
+
 class Email:
     """
     This class handles the sending of emails using Amazon SES.
+
+    send_mail puts the email in the outbox (see common_app/email_outbox.py), the
+    `run_email_worker` management command sends it with deliver.
     """
 
     from_email = settings.FROM_EMAIL
 
-    def __init__(self):
+    def __init__(self, client=None):
         """
         Initializes the Email instance with the necessary configurations for Amazon SES.
+
+        Parameters:
+        - client: The SES client, shared by the threads of the email worker.
         """
-        self.client = boto3.client('ses',region_name=settings.AWS_REGION)
+        self.client = client or self.create_client()
+
+    @staticmethod
+    def create_client():
+        """
+        Create an SES client; AWS_SES_ENDPOINT_URL points it at a local fake SES.
+        """
+        return boto3.client('ses', region_name=settings.AWS_REGION, endpoint_url=settings.AWS_SES_ENDPOINT_URL, config=Config(
+            max_pool_connections=max(settings.EMAIL_SEND_CONCURRENCY, 10),
+            retries={'max_attempts': 3, 'mode': 'standard'},
+        ))
 
-   
     def get_html_content(self, template_name: str, context: dict):
         """
         Renders the HTML template with the given context and returns the HTML content.
@@ -37,79 +71,115 @@ class Email:
         html_content = render_to_string(template_name, context)
         return html_content
 
-    def send_mail(self, to_email: str, template_name: str, context: dict, subject, attachment_path=None):
+    def send_mail(self, to_email: str, template_name: str, context: dict, subject, attachment_key=None, attachment_name=None):
         """
-        Sends the email using Amazon SES.
+        Renders the email and puts it in the outbox, or sends it straight away when
+        EMAIL_OUTBOX_ASYNC is off.
 
         Parameters:
         - to_email: The email address of the recipient.
         - template_name: The name of the email template.
         - context: The context variables to be used in the email template.
+        - subject: The subject of the email.
+        - attachment_key: The S3 key of a file to attach, e.g. the pdf_path of a document.
+        - attachment_name: The file name of the attachment, defaults to the S3 file name.
+
+        Returns:
+        - The OutboundEmail.
+        """
+        from common_app.email_outbox import queue_email
+
+        outbound = queue_email(
+            to_email, subject, self.get_html_content(template_name, context),
+            template_name=template_name, attachment_key=attachment_key, attachment_name=attachment_name,
+        )
+        if not settings.EMAIL_OUTBOX_ASYNC:
+            from common_app.email_outbox import process_email
+            process_email(outbound, self)
+        return outbound
+
+    def _raw_message(self, outbound):
+        """
+        Build the MIME message of an email with an attachment. The attachment is streamed
+        from S3 and encoded chunk by chunk into the message.
+        """
+        with timed_s3_operation('email_attachment'):
+            s3_object = s3_client.get_object(Bucket=settings.AWS_BUCKET_NAME, Key=outbound.attachment_key)
+        if s3_object['ContentLength'] > settings.EMAIL_MAX_ATTACHMENT_SIZE:
+            s3_object['Body'].close()
+            raise PermanentEmailError(
+                f"Attachment {outbound.attachment_key} is {s3_object['ContentLength']} bytes, "
+                f"above EMAIL_MAX_ATTACHMENT_SIZE."
+            )
+
+        msg = MIMEMultipart()
+        msg['Subject'] = outbound.subject
+        msg['From'] = self.from_email
+        msg['To'] = outbound.to_email
+        msg.attach(MIMEText(outbound.html_content, 'html', 'utf-8'))
+
+        # The attachment part gets a placeholder payload, replaced by the encoded file
+        # when the message is written out.
+        placeholder = uuid.uuid4().hex.encode()
+        maintype, _, subtype = (s3_object.get('ContentType') or 'application/octet-stream').partition('/')
+        attachment = MIMEBase(maintype, subtype or 'octet-stream')
+        attachment['Content-Transfer-Encoding'] = 'base64'
+        attachment.add_header('Content-Disposition', 'attachment',
+                              filename=outbound.attachment_name or os.path.basename(outbound.attachment_key))
+        attachment.set_payload(placeholder.decode())
+        msg.attach(attachment)
+
+        before, after = msg.as_bytes().split(placeholder, 1)
+        raw = BytesIO()
+        raw.write(before)
+        with timed_s3_operation('email_attachment_read'):
+            for chunk in iter(lambda: s3_object['Body'].read(ATTACHMENT_CHUNK_SIZE), b''):
+                raw.write(base64.encodebytes(chunk))
+        raw.write(after.lstrip(b'\n'))
+        return raw.getvalue()
+
+    def deliver(self, outbound):
+        """
+        Sends an outbox email using Amazon SES.
+
+        Parameters:
+        - outbound: The OutboundEmail to send.
+
+        Returns:
+        - The SES message id.
 
         Raises:
         - ClientError: If there is an error while sending the email.
-        - Exception: For general errors while sending the email.
+        - PermanentEmailError: If the email can never be sent.
         """
-        html_content = self.get_html_content(template_name, context)
-        
-        message = {
-            'Subject': {'Data': subject},
-            'Body': {
-                'Html': {'Data': html_content},
-            }
-        }
-        if attachment_path:
-            # Fetch the attachment content from the URL
-            attachment_response = requests.get(attachment_path)
-            if attachment_response.status_code != 200:
-                raise Exception(f"Failed to fetch attachment from URL: {attachment_path}")
-
-            attachment_data = attachment_response.content
-
-            # Create a MIME message with the HTML content and attachment
-            from email.mime.multipart import MIMEMultipart
-            from email.mime.text import MIMEText
-            from email.mime.application import MIMEApplication
-
-            msg = MIMEMultipart()
-            msg['Subject'] = subject
-            msg['From'] = self.from_email
-            msg['To'] = to_email
-
-            body = MIMEText(html_content, 'html')
-            msg.attach(body)
-
-            attachment = MIMEApplication(attachment_data)
-            attachment.add_header('Content-Disposition', 'attachment', filename='attachment.pdf')
-            msg.attach(attachment)
-            try:
-                response = self.client.send_raw_email(
-                    Source=self.from_email,
-                    Destinations=[to_email],
-                    RawMessage={'Data': msg.as_string()}
-                )
-                print("Email sent:", response['MessageId'])
-
-            except exceptions.ClientError as e:
-                print(f"Error sending email: {e.response['Error']['Message']}")
-                raise  # Re-raise the exception to handle it at a higher level
-            except Exception as e:
-                print(f"Error sending email: {str(e)}")
-                raise  # Re-raise the exception to handle it at a higher level
+        if outbound.attachment_key:
+            response = self.client.send_raw_email(
+                Source=self.from_email,
+                Destinations=[outbound.to_email],
+                RawMessage={'Data': self._raw_message(outbound)}
+            )
         else:
-            try:
-                response = self.client.send_email(
-                    Source=self.from_email,
-                    Destination={'ToAddresses': [to_email]},
-                    Message=message
-                    )
-
-                print("Email sent:", response['MessageId'])
-
-            except exceptions.ClientError as e:
-                print(f"Error sending email: {e.response['Error']['Message']}")
-                raise  # Re-raise the exception to handle it at a higher level
-            
-            except Exception as e:
-                print(f"Error sending email: {str(e)}")
-                raise  # Re-raise the exception to handle it at a higher level
\ No newline at end of file
+            response = self.client.send_email(
+                Source=self.from_email,
+                Destination={'ToAddresses': [outbound.to_email]},
+                Message={
+                    'Subject': {'Data': outbound.subject},
+                    'Body': {
+                        'Html': {'Data': outbound.html_content},
+                    }
+                }
+            )
+        return response['MessageId']
+
+
+# SES errors that sending again will not fix.
+PERMANENT_SES_ERRORS = ('MessageRejected', 'MailFromDomainNotVerified', 'InvalidParameterValue')
+
+
+def is_permanent_error(error):
+    """
+    Whether a delivery error must not be retried.
+    """
+    if isinstance(error, PermanentEmailError):
+        return True
+    return isinstance(error, exceptions.ClientError) and error.response['Error'].get('Code') in PERMANENT_SES_ERRORS
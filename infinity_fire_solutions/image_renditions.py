@@ -0,0 +1,170 @@
+import os
+import uuid
+import logging
+import tempfile
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+
+from infinity_fire_solutions.aws_helper import download_many, upload_many
+
+logger = logging.getLogger(__name__)
+
+# Downscaled copies of the uploaded photos: "thumbnail" for list pages and carousels,
+# "print" for the PDFs rendered by wkhtmltopdf. Keyed by the name of the path field
+# stored on the document rows.
+IMAGE_RENDITIONS = {
+    'thumbnail_path': {'max_size': settings.IMAGE_THUMBNAIL_MAX_SIZE, 'quality': settings.IMAGE_THUMBNAIL_QUALITY},
+    'print_path': {'max_size': settings.IMAGE_PRINT_MAX_SIZE, 'quality': settings.IMAGE_PRINT_QUALITY},
+}
+
+
+def is_image(file_name):
+    """
+    Whether renditions are made for a file, from its extension.
+    """
+    return file_name.split('.')[-1].lower() in settings.IMAGE_SUPPORTED_EXTENSIONS
+
+
+def rendition_key(document_path, field):
+    """
+    The S3 key of a rendition: renditions/<thumbnail|print>/<name>.jpg in the folder of the original.
+    """
+    folder, file_name = os.path.split(document_path)
+    name = field.replace('_path', '')
+    return f"{folder}/renditions/{name}/{os.path.splitext(file_name)[0]}.jpg"
+
+
+def make_renditions(file):
+    """
+    Make the JPEG renditions of an image.
+
+    The image is rotated according to its EXIF orientation, flattened to RGB and scaled
+    down to fit the rendition size; it is never scaled up.
+
+    Args:
+        file (file-like object): The original image.
+
+    Returns:
+        dict: {field: BytesIO} with one JPEG per IMAGE_RENDITIONS entry.
+    """
+    from PIL import Image, ImageOps
+
+    file.seek(0)
+    with Image.open(file) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+
+        renditions = {}
+        for field, options in IMAGE_RENDITIONS.items():
+            rendition = image.copy()
+            rendition.thumbnail((options['max_size'], options['max_size']), Image.LANCZOS)
+            output = BytesIO()
+            rendition.save(output, 'JPEG', quality=options['quality'], optimize=True, progressive=True)
+            output.seek(0)
+            renditions[field] = output
+
+    file.seek(0)
+    return renditions
+
+
+def _safe_renditions(file, name):
+    try:
+        return make_renditions(file)
+    except Exception:
+        logger.exception("Renditions of %s could not be made", name)
+        return {}
+
+
+def upload_documents(files, s3_folder, max_workers=None):
+    """
+    Upload documents to S3 with the renditions of the images, all concurrently.
+
+    Args:
+        files (list): The uploaded files.
+        s3_folder (str): The S3 folder of the documents.
+        max_workers (int, optional): Concurrent uploads, defaults to AWS_S3_MAX_WORKERS.
+
+    Returns:
+        list: For every file, in order, None if the upload failed, or a dict with its
+              'document_path' and the rendition fields (None when there is no rendition),
+              ready to be passed to the document model.
+    """
+    unique_filenames = [f"{str(uuid.uuid4())}_{file.name}" for file in files]
+
+    images = [index for index, file in enumerate(files) if is_image(file.name)]
+    with ThreadPoolExecutor(max_workers=max_workers or settings.AWS_S3_MAX_WORKERS) as executor:
+        renditions = dict(zip(images, executor.map(lambda index: _safe_renditions(files[index], files[index].name), images)))
+
+    uploads = list(zip(unique_filenames, files))
+    rendition_uploads = []
+    for index, file_renditions in renditions.items():
+        for field, output in file_renditions.items():
+            key = rendition_key(f"{s3_folder}/{unique_filenames[index]}", field)
+            rendition_uploads.append((index, field, key))
+            uploads.append((key[len(s3_folder) + 1:], output))
+
+    keys = upload_many(uploads, s3_folder, max_workers=max_workers)
+
+    documents = [
+        {'document_path': key, **dict.fromkeys(IMAGE_RENDITIONS)} if key else None
+        for key in keys[:len(files)]
+    ]
+    for (index, field, _), key in zip(rendition_uploads, keys[len(files):]):
+        if documents[index]:
+            documents[index][field] = key
+    return documents
+
+
+def ensure_renditions(model, documents, max_workers=None):
+    """
+    Make the missing renditions of documents already in S3, e.g. uploaded straight from the
+    browser or before renditions existed, and store their keys on the rows.
+
+    Args:
+        model (Model): The document model, with document_path and the IMAGE_RENDITIONS fields.
+        documents (iterable): Rows of the model.
+        max_workers (int, optional): Concurrent documents, defaults to AWS_S3_MAX_WORKERS.
+
+    Returns:
+        int: The number of documents given renditions.
+    """
+    pending = [
+        document for document in documents
+        if is_image(document.document_path) and not all(getattr(document, field) for field in IMAGE_RENDITIONS)
+    ]
+    if not pending:
+        return 0
+
+    def process(document, originals):
+        path = originals.get(document.document_path)
+        if path is None:
+            return {}
+        with open(path, 'rb') as original:
+            renditions = _safe_renditions(original, document.document_path)
+        if not renditions:
+            return {}
+
+        folder = os.path.dirname(document.document_path)
+        uploads = [(rendition_key(document.document_path, field)[len(folder) + 1:], output) for field, output in renditions.items()]
+        keys = upload_many(uploads, folder, max_workers=1)
+        return {field: key for field, key in zip(renditions, keys) if key}
+
+    # The originals are downloaded to disk rather than into memory; a failed download is skipped.
+    with tempfile.TemporaryDirectory() as directory:
+        originals = download_many([document.document_path for document in pending], directory, max_workers=max_workers)
+        with ThreadPoolExecutor(max_workers=min(max_workers or settings.AWS_S3_MAX_WORKERS, len(pending))) as executor:
+            results = list(executor.map(lambda document: process(document, originals), pending))
+
+    # The rows are updated from this thread, the pool threads do not touch the database.
+    updated = 0
+    for document, paths in zip(pending, results):
+        if not paths:
+            continue
+        # bulk_create does not set ids on MySQL, so rows are matched on their S3 key.
+        model.objects.filter(document_path=document.document_path).update(**paths)
+        for field, key in paths.items():
+            setattr(document, field, key)
+        updated += 1
+    return updated
@@ -0,0 +1,388 @@
+import csv
+import html
+import math
+import codecs
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from django.conf import settings
+from django.db import transaction
+from django.utils.html import strip_tags
+
+EXCEL_EXTENSIONS = {'xlsx': 'openpyxl', 'xls': 'xlrd', 'ods': 'odf'}
+CSV_EXTENSIONS = ['csv']
+DATE_FORMATS = ['%d/%m/%Y', '%Y-%m-%d', '%Y-%m-%d %H:%M:%S']
+
+
+class CoercionError(ValueError):
+    """
+    Raised by a coercion function when a cell cannot be converted.
+    """
+
+
+def get_file_ext(file_name):
+    """
+    Get the file extension for a given file name, in lowercase.
+    """
+    return file_name.split('.')[-1].lower()
+
+
+def read_rows(file, encoding='utf-8-sig'):
+    """
+    Lazily iterate over the rows of an uploaded CSV or Excel file as dicts keyed by header.
+
+    CSV files are decoded line by line and xlsx files are read with openpyxl in read-only
+    mode, so memory stays bounded whatever the size of the file. xls and ods files have no
+    streaming reader and are loaded with pandas.
+
+    Rows whose cells are all empty are skipped. Every row carries its spreadsheet row
+    number, the header being row 1, under '_row'.
+
+    Args:
+        file (UploadedFile): The uploaded file.
+        encoding (str): Encoding of CSV files.
+
+    Yields:
+        dict: One row of the file.
+
+    Raises:
+        ValueError: If the file type is not supported.
+    """
+    ext = get_file_ext(file.name)
+
+    if ext in CSV_EXTENSIONS:
+        records = csv.reader(codecs.iterdecode(file, encoding, errors='replace'))
+    elif ext == 'xlsx':
+        records = _read_xlsx(file)
+    elif ext in EXCEL_EXTENSIONS:
+        records = _read_with_pandas(file, EXCEL_EXTENSIONS[ext])
+    else:
+        raise ValueError('The file type is not supported.')
+
+    header = None
+    for row_number, record in enumerate(records, start=1):
+        if header is None:
+            header = [str(name).strip() if name is not None else f'Unnamed: {index}' for index, name in enumerate(record)]
+            continue
+        if all(clean_cell(value) == '' for value in record):
+            continue
+        row = dict(zip(header, record))
+        row['_row'] = row_number
+        yield row
+
+
+def _read_xlsx(file):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        yield from workbook.worksheets[0].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _read_with_pandas(file, engine):
+    import pandas as pd
+
+    data_frame = pd.read_excel(file, engine=engine, header=None, dtype=object)
+    yield from data_frame.itertuples(index=False, name=None)
+
+
+def clean_cell(value):
+    """
+    Normalise a cell value: blanks, NaN and NaT become '' and whole floats lose their ".0".
+    """
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ''
+        if value.is_integer():
+            return str(int(value))
+    if isinstance(value, datetime) and str(value) == 'NaT':
+        return ''
+    if isinstance(value, (datetime, date)):
+        return value
+    return str(value).strip()
+
+
+def html_text(value):
+    """
+    The visible text of a rich text value, e.g. "<p><br></p>" -> "".
+    """
+    return html.unescape(strip_tags(value or '')).strip()
+
+
+def parse_date(value):
+    """
+    Parse a date cell, either a date object (Excel) or a string in one of DATE_FORMATS.
+
+    Returns:
+        date or None: The parsed date, None if it cannot be parsed.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def to_decimal(value):
+    """
+    Coerce a cell to a Decimal, '' stays ''.
+    """
+    if value == '':
+        return value
+    try:
+        number = Decimal(str(value).replace(',', '').lstrip('£'))
+    except InvalidOperation:
+        number = None
+    if number is None or not number.is_finite():
+        raise CoercionError(f"'{value}' is not a valid number.")
+    return number
+
+
+def to_date(value):
+    """
+    Coerce a cell to a date, '' stays ''.
+    """
+    if value == '':
+        return value
+    parsed = parse_date(value)
+    if parsed is None:
+        raise CoercionError(f"'{value}' is not a valid date, use the DD/MM/YYYY format.")
+    return parsed
+
+
+# Coercions by name, for callers that store the import options as JSON.
+COERCIONS = {'decimal': to_decimal, 'date': to_date}
+
+
+def decimal_error(value, max_digits=10, decimal_places=2):
+    """
+    Check a coerced Decimal against the limits of a DecimalField.
+
+    Returns:
+        str or None: The error message, None if the value fits.
+    """
+    _, digits, exponent = value.as_tuple()
+    if -exponent > decimal_places:
+        return f'Ensure that there are no more than {decimal_places} decimal places.'
+    if len(digits) - max(-exponent, 0) > max_digits - decimal_places:
+        return f'Ensure that there are no more than {max_digits} digits in total.'
+    return None
+
+
+def map_row(record, mapping=None, coercions=None):
+    """
+    Map a file row to importer fields, clean every cell and apply the coercions.
+
+    Fields containing a dot are nested, e.g. 'site_address.UPRN' becomes
+    row['site_address']['UPRN']. Coercion failures are collected under row['_errors'] and
+    the '_row' number set by read_rows is kept.
+
+    Args:
+        record (dict): A row of the file keyed by its headers.
+        mapping (dict, optional): {field: header}. Without a mapping the headers are the fields.
+        coercions (dict, optional): {field: callable} converting the cleaned cell.
+
+    Returns:
+        dict: The mapped row.
+    """
+    mapping = mapping or {header: header for header in record if header != '_row'}
+    coercions = coercions or {}
+
+    row = {'_row': record['_row']} if '_row' in record else {}
+    for field, header in mapping.items():
+        value = clean_cell(record.get(header))
+        if field in coercions:
+            try:
+                value = coercions[field](value)
+            except CoercionError as e:
+                row.setdefault('_errors', {})[field] = [str(e)]
+
+        target = row
+        *parents, name = field.split('.')
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[name] = value
+    return row
+
+
+class ImportReport:
+    """
+    Outcome of an import.
+
+    Attributes:
+        total (int): Number of rows read.
+        created (int): Number of records inserted.
+        updated (int): Number of existing records updated.
+        details (dict): Counters specific to a sink, e.g. related records created.
+        errors (list): One dict per rejected row with the file 'row' number, its 'key' (the
+            value of the sink's key_field) and the 'errors' as {field: [messages]}.
+        rolled_back (bool): True if nothing was saved because some rows were rejected.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.created = 0
+        self.updated = 0
+        self.details = {}
+        self.errors = []
+        self.rolled_back = False
+
+    @property
+    def has_errors(self):
+        return bool(self.errors)
+
+    def add_error(self, row_number, field, message, key=''):
+        if self.errors and self.errors[-1]['row'] == row_number:
+            self.errors[-1]['errors'].setdefault(field, []).append(message)
+            return
+        self.errors.append({'row': row_number, 'key': key, 'errors': {field: [message]}})
+
+    def error_messages(self, limit=None):
+        """
+        Flatten the errors into "Row N: message" strings.
+
+        Args:
+            limit (int, optional): Maximum number of messages to return.
+
+        Returns:
+            list: The error messages.
+        """
+        error_messages = []
+        for error in self.errors:
+            for field_messages in error['errors'].values():
+                error_messages.extend(f"Row {error['row']}: {message}" for message in field_messages)
+        return error_messages[:limit] if limit else error_messages
+
+    def error_summary(self, limit=None):
+        """
+        The error messages joined for a single flash message, capped at IMPORT_MAX_ERROR_MESSAGES.
+        """
+        limit = limit or settings.IMPORT_MAX_ERROR_MESSAGES
+        error_messages = self.error_messages()
+        if len(error_messages) > limit:
+            error_messages = error_messages[:limit] + [f'{len(self.errors)} rows could not be imported.']
+        return ', '.join(error_messages)
+
+    def as_dict(self):
+        return {
+            'total': self.total,
+            'created': self.created,
+            'updated': self.updated,
+            'failed': len(self.errors),
+            'rolled_back': self.rolled_back,
+            **self.details,
+            'errors': self.errors,
+        }
+
+
+class ImportSink:
+    """
+    Base class of the bulk importers.
+
+    `run` consumes mapped rows in chunks inside a single transaction and hands each chunk
+    to `write_chunk`, which validates the rows against data prefetched for the whole
+    chunk and saves the valid ones in bulk. Rows with coercion errors never reach
+    `write_chunk`.
+
+    Args:
+        chunk_size (int, optional): Rows validated and saved at a time, defaults to IMPORT_CHUNK_SIZE.
+        all_or_nothing (bool): When True any rejected row rolls the whole import back.
+    """
+    key_field = None
+
+    def __init__(self, chunk_size=None, all_or_nothing=True):
+        self.chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+        self.all_or_nothing = all_or_nothing
+
+    def run(self, rows, first_row_number=2, progress=None):
+        """
+        Import the rows.
+
+        Args:
+            rows (iterable): Row dicts, e.g. map_row results.
+            first_row_number (int): Row number of the first row for rows without a '_row'
+                number, 2 for files with a header.
+            progress (callable, optional): Called with the report after every chunk.
+
+        Returns:
+            ImportReport: The import report.
+        """
+        report = ImportReport()
+        self.start(report)
+
+        numbered_rows = enumerate(rows, start=first_row_number)
+        with transaction.atomic():
+            while True:
+                chunk = list(islice(numbered_rows, self.chunk_size))
+                if not chunk:
+                    break
+                report.total += len(chunk)
+
+                valid_chunk = []
+                for row_number, row in chunk:
+                    row_number = row.pop('_row', row_number)
+                    for field, messages in row.pop('_errors', {}).items():
+                        for message in messages:
+                            self.error(report, row_number, row, field, message)
+                    if not report.errors or report.errors[-1]['row'] != row_number:
+                        valid_chunk.append((row_number, row))
+
+                if valid_chunk:
+                    self.write_chunk(valid_chunk, report)
+                if progress:
+                    progress(report)
+
+            if self.all_or_nothing and report.has_errors:
+                transaction.set_rollback(True)
+                report.rolled_back = True
+                report.created = 0
+                report.updated = 0
+                report.details = {}
+
+        return report
+
+    def start(self, report):
+        """
+        Hook called before the first chunk, e.g. to load lookup tables.
+        """
+
+    def write_chunk(self, rows, report):
+        """
+        Validate and save a chunk of rows.
+
+        Args:
+            rows (list): (row_number, row) tuples.
+            report (ImportReport): Report to record counts and errors on.
+        """
+        raise NotImplementedError
+
+    def error(self, report, row_number, row, field, message):
+        report.add_error(row_number, field, message, key=row.get(self.key_field, '') if self.key_field else '')
+
+
+def import_file(file, sink, mapping=None, coercions=None, encoding='utf-8-sig', progress=None):
+    """
+    Stream an uploaded file through a sink.
+
+    Args:
+        file (UploadedFile): The uploaded CSV or Excel file.
+        sink (ImportSink): The importer saving the rows.
+        mapping (dict, optional): {field: header}, see map_row.
+        coercions (dict, optional): {field: callable}, see map_row.
+        encoding (str): Encoding of CSV files.
+        progress (callable, optional): Called with the report after every chunk.
+
+    Returns:
+        ImportReport: The import report.
+    """
+    rows = (map_row(record, mapping, coercions) for record in read_rows(file, encoding))
+    return sink.run(rows, progress=progress)
@@ -0,0 +1,254 @@
+import json
+import base64
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.paginator import Paginator, Page, PageNotAnInteger, EmptyPage, InvalidPage
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+
+# Orderings paginated with a keyset (cursor), and the fields of their key. Lists in any
+# other order are paginated with OFFSET.
+KEYSET_ORDERINGS = {
+    ('-created_at',): ('created_at', 'pk'),
+    ('-created_at', '-id'): ('created_at', 'pk'),
+    ('-created_at', '-pk'): ('created_at', 'pk'),
+    ('-id',): ('pk',),
+    ('-pk',): ('pk',),
+}
+
+
+def count_cache_key(queryset):
+    sql, params = queryset.query.sql_with_params()
+    return 'pagination_count:' + hashlib.md5(f'{sql}|{params}'.encode()).hexdigest()
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator caching the total count of a queryset for PAGINATION_COUNT_CACHE_TIMEOUT
+    seconds, so paging through a list runs COUNT(*) once instead of on every page.
+
+    The count, and so the number of pages, may be that many seconds old.
+    """
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return len(self.object_list)
+        try:
+            key = count_cache_key(self.object_list)
+        except EmptyResultSet:
+            return 0
+
+        count = cache.get(key)
+        if count is None:
+            count = self.object_list.count()
+            cache.set(key, count, settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+        return count
+
+
+class KeysetPage(Page):
+    """
+    A page read with a cursor: whether there are pages before and after it is known from
+    the rows read, not from the total count.
+    """
+
+    def __init__(self, object_list, number, paginator, has_next, has_previous):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return max(self.number - 1, 1)
+
+
+def keyset_fields(queryset):
+    """
+    The key fields of a queryset ordered by one of KEYSET_ORDERINGS, None otherwise.
+    """
+    if not isinstance(queryset, QuerySet) or queryset.query.distinct_fields:
+        return None
+    ordering = tuple(queryset.query.order_by) or tuple(queryset.model._meta.ordering)
+    return KEYSET_ORDERINGS.get(ordering)
+
+
+def _key_value(obj, field):
+    if isinstance(obj, dict):
+        return obj['id' if field == 'pk' else field]
+    return getattr(obj, field)
+
+
+def encode_cursor(direction, obj, key_fields):
+    """
+    The cursor of the rows after ('next') or before ('prev') a row.
+    """
+    values = [_key_value(obj, field) for field in key_fields]
+    payload = json.dumps([direction, [value.isoformat() if hasattr(value, 'isoformat') else value for value in values]])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, queryset, key_fields):
+    """
+    Returns:
+        tuple: (direction, values) of the cursor.
+
+    Raises:
+        InvalidPage: If the cursor was not made by encode_cursor for these key fields.
+    """
+    try:
+        direction, values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if direction not in ('next', 'prev') or len(values) != len(key_fields):
+            raise ValueError(cursor)
+        opts = queryset.model._meta
+        return direction, [
+            (opts.pk if field == 'pk' else opts.get_field(field)).to_python(value)
+            for field, value in zip(key_fields, values)
+        ]
+    except (ValueError, TypeError, ValidationError) as e:
+        raise InvalidPage('Invalid cursor.') from e
+
+
+def _keyset_filter(key_fields, values, after):
+    # Rows after a key in descending order: (a < x) or (a = x and b < y) ...
+    lookup = 'lt' if after else 'gt'
+    condition = Q()
+    for index, field in enumerate(key_fields):
+        row_condition = Q(**{f'{field}__{lookup}': values[index]})
+        for equal_field, equal_value in zip(key_fields[:index], values[:index]):
+            row_condition &= Q(**{equal_field: equal_value})
+        condition |= row_condition
+    return condition
+
+
+def _keyset_page(paginator, queryset, key_fields, cursor, number):
+    direction, values = decode_cursor(cursor, queryset, key_fields)
+    per_page = paginator.per_page
+
+    if direction == 'next':
+        rows = list(queryset.filter(_keyset_filter(key_fields, values, after=True))[:per_page + 1])
+        return KeysetPage(rows[:per_page], number, paginator, has_next=len(rows) > per_page, has_previous=True)
+
+    # The rows before the cursor are read in ascending order, nearest first, then reversed.
+    rows = list(
+        queryset.filter(_keyset_filter(key_fields, values, after=False)).order_by(*key_fields)[:per_page + 1]
+    )
+    has_previous = len(rows) > per_page
+    rows = rows[:per_page][::-1]
+    return KeysetPage(rows, number if has_previous else 1, paginator, has_next=True, has_previous=has_previous)
+
+
+def _offset_page(paginator, page_number):
+    try:
+        return paginator.page(page_number)
+    except PageNotAnInteger:
+        # If page is not an integer, deliver the first page.
+        return paginator.page(1)
+    except EmptyPage:
+        # If page is out of range, deliver the last page of results.
+        return paginator.page(paginator.num_pages)
+
+
+def paginate(request, queryset, per_page=20):
+    """
+    Paginate a list for the `page` and `cursor` query params of a request.
+
+    Querysets ordered by one of KEYSET_ORDERINGS are paginated with a keyset: the links to
+    the next and previous pages carry a cursor with the key of the last (first) row, and
+    those pages are read with a WHERE on the key instead of an OFFSET, so their cost does
+    not grow with the page number. Numbered pages (`page` without cursor) and lists in
+    other orders use OFFSET. The total count is cached, see CachedCountPaginator.
+
+    The page works like a Django Page in templates and also has `next_page_query` and
+    `previous_page_query`, the query strings of its neighbours keeping the other query
+    params of the request, e.g. the search, or None.
+
+    Args:
+        request (HttpRequest): The request.
+        queryset (QuerySet or list): The ordered rows.
+        per_page (int): Rows per page.
+
+    Returns:
+        Page: The requested page.
+    """
+    key_fields = keyset_fields(queryset)
+    if key_fields:
+        # The key must be unique, so rows with the same created_at are ordered by id.
+        queryset = queryset.order_by(*[f'-{field}' for field in key_fields])
+    paginator = CachedCountPaginator(queryset, per_page)
+
+    page = None
+    cursor = request.GET.get('cursor')
+    if key_fields and cursor:
+        try:
+            number = max(int(request.GET.get('page', 1)), 1)
+        except ValueError:
+            number = 1
+        try:
+            page = _keyset_page(paginator, queryset, key_fields, cursor, number)
+        except InvalidPage:
+            page = None
+    if page is None:
+        page = _offset_page(paginator, request.GET.get('page'))
+
+    params = request.GET.copy()
+    params.pop('cursor', None)
+    params.pop('page', None)
+    page.next_page_query = page.previous_page_query = None
+    if page.has_next():
+        next_params = params.copy()
+        next_params['page'] = page.next_page_number()
+        if key_fields and len(page):
+            next_params['cursor'] = encode_cursor('next', page[len(page) - 1], key_fields)
+        page.next_page_query = next_params.urlencode()
+    if page.has_previous():
+        previous_params = params.copy()
+        previous_params['page'] = page.previous_page_number()
+        if key_fields and len(page) and page.previous_page_number() > 1:
+            previous_params['cursor'] = encode_cursor('prev', page[0], key_fields)
+        page.previous_page_query = previous_params.urlencode()
+    return page
+
+
+class PaginatedListMixin:
+    """
+    Mixin of list views paginating with paginate(): get_paginated_queryset returns the page
+    of `paginate_by` rows, and responses carry the neighbour pages in a Link header and the
+    total count in X-Total-Count, for JSON clients.
+    """
+    paginate_by = 20
+    page = None
+
+    def get_paginated_queryset(self, base_queryset):
+        self.page = paginate(self.request, base_queryset, self.paginate_by)
+        return self.page
+
+    def get_serialized_page(self, queryset, serializer_class):
+        """
+        Paginate a queryset and serialize the rows of the page only.
+        """
+        page = self.get_paginated_queryset(queryset)
+        page.object_list = serializer_class(page.object_list, many=True).data
+        return page
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.page is not None:
+            links = [
+                f'<{request.path}?{query}>; rel="{rel}"'
+                for rel, query in (('next', self.page.next_page_query), ('prev', self.page.previous_page_query))
+                if query
+            ]
+            if links:
+                response['Link'] = ', '.join(links)
+            response['X-Total-Count'] = self.page.paginator.count
+        return response
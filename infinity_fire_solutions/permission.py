@@ -9,6 +9,8 @@ from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
 from authentication.models import *
 from django.db.models import Q
+from django.conf import settings
+from infinity_fire_solutions.shared_cache import shared_cache
 
 
 class CustomAuthenticationMixin:
@@ -70,6 +72,135 @@ class CustomAuthenticationMixin:
             raise AuthenticationFailed("Authentication credentials were not provided.")
         
 
+PERMISSION_VERSION_KEY = 'permissions:version'
+PERMISSION_ACTIONS = ('list', 'create', 'change', 'view', 'delete')
+
+
+def invalidate_permission_cache():
+    """
+    Invalidate every cached role permission matrix by bumping the version stamp.
+    """
+    try:
+        shared_cache.incr(PERMISSION_VERSION_KEY)
+    except ValueError:
+        shared_cache.set(PERMISSION_VERSION_KEY, 1, timeout=None)
+
+
+def get_role_permission_matrix(role_id):
+    """
+    Get the permissions of a role for every module, loaded with a single query.
+
+    The matrix is cached between requests and invalidated by the UserRole/UserRolePermission
+    signals in authentication.signals; a per-process cache keeps it for LOCAL_CACHE_TIMEOUT
+    seconds at most (see infinity_fire_solutions.shared_cache).
+
+    Args:
+        role_id (int): The id of the UserRole.
+
+    Returns:
+        dict: {'role_name': str, 'modules': {module: {'can_list_data': ..., ...}}}.
+              Access values are lower-cased ("self", "all" or "none"), 'can_create_data' is a bool.
+    """
+    version = shared_cache.get_or_set(PERMISSION_VERSION_KEY, 1, timeout=None)
+    cache_key = f'permissions:role:{role_id}:{version}'
+    matrix = shared_cache.get(cache_key)
+    if matrix is not None:
+        return matrix
+
+    matrix = {'role_name': None, 'modules': {}}
+    role = UserRole.objects.filter(id=role_id).first()
+    if role:
+        matrix['role_name'] = role.name
+        for permission in UserRolePermission.objects.filter(role_id=role_id):
+            matrix['modules'][permission.module] = {
+                'can_list_data': permission.can_list_data.lower(),
+                'can_create_data': permission.can_create_data,
+                'can_change_data': permission.can_change_data.lower(),
+                'can_delete_data': permission.can_delete_data.lower(),
+                'can_view_data': permission.can_view_data.lower(),
+            }
+
+    shared_cache.set(cache_key, matrix, settings.PERMISSION_CACHE_TIMEOUT)
+    return matrix
+
+
+def get_user_permission_matrix(user):
+    """
+    Get the permission matrix of the user's role, memoized on the user for the request.
+
+    Args:
+        user (User): The user for whom permissions are to be retrieved.
+
+    Returns:
+        dict: The role permission matrix, see get_role_permission_matrix.
+    """
+    if not getattr(user, 'roles_id', None):
+        return {'role_name': None, 'modules': {}}
+
+    matrix = getattr(user, '_permission_matrix', None)
+    if matrix is None or user._permission_matrix_role_id != user.roles_id:
+        matrix = get_role_permission_matrix(user.roles_id)
+        user._permission_matrix = matrix
+        user._permission_matrix_role_id = user.roles_id
+    return matrix
+
+
+def can(user, module_name, action):
+    """
+    Check whether the user may perform an action on a module.
+
+    Args:
+        user (User): The user whose role is checked.
+        module_name (str): The name of the module, e.g. "customer".
+        action (str): One of "list", "create", "change", "view" or "delete".
+
+    Returns:
+        The data access value ("self" or "all") for list/change/view/delete, True for create,
+        or False if the action is not allowed.
+    """
+    return matrix_can(get_user_permission_matrix(user), module_name, action)
+
+
+def role_can(role_id, module_name, action):
+    """
+    Check whether a role may perform an action on a module, see can().
+
+    Args:
+        role_id (int): The id of the UserRole.
+        module_name (str): The name of the module, e.g. "customer".
+        action (str): One of "list", "create", "change", "view" or "delete".
+
+    Returns:
+        The data access value, True for create, or False if the action is not allowed.
+    """
+    return matrix_can(get_role_permission_matrix(role_id), module_name, action)
+
+
+def matrix_can(matrix, module_name, action):
+    """
+    Check an action against a permission matrix already loaded, see can().
+
+    Args:
+        matrix (dict): A role permission matrix, see get_role_permission_matrix.
+        module_name (str): The name of the module, e.g. "customer".
+        action (str): One of "list", "create", "change", "view" or "delete".
+
+    Returns:
+        The data access value, True for create, or False if the action is not allowed.
+    """
+    if action not in PERMISSION_ACTIONS:
+        raise ValueError(f"Unknown permission action: {action}")
+
+    permission = matrix['modules'].get(module_name)
+    if permission is None:
+        return False
+
+    value = permission[f'can_{action}_data']
+    if action == 'create':
+        return bool(value)
+    return value if value != "none" else False
+
+
 def get_user_module_permissions(user, module_name):
     """
     Get the module permissions for a specific user.
@@ -87,19 +218,13 @@ def get_user_module_permissions(user, module_name):
               - 'can_delete_data': Permission to delete data (either "yes" or "none").
     """
     user_permissions = {}
-    if user.roles:
-        role = user.roles
-        permission = UserRolePermission.objects.filter(role=role, module=module_name).first()
+    matrix = get_user_permission_matrix(user)
+    if matrix['role_name']:
+        permission = matrix['modules'].get(module_name)
         if permission:
-            user_permissions[role.name] = {
-                'can_list_data': permission.can_list_data.lower(),
-                'can_create_data': permission.can_create_data,
-                'can_change_data': permission.can_change_data.lower(),
-                'can_delete_data': permission.can_delete_data.lower(),
-                'can_view_data': permission.can_view_data.lower(),
-            }
+            user_permissions[matrix['role_name']] = dict(permission)
         else:
-            user_permissions[role.name] = {
+            user_permissions[matrix['role_name']] = {
                 'can_list_data': "none",
                 'can_create_data': "none",
                 'can_change_data': "none",
@@ -122,15 +247,11 @@ class HasListDataPermission(BasePermission):
         self.module_name = module_name
 
     def has_permission(self, request, view):
-        user = request.user
-        user_permissions = get_user_module_permissions(user, self.module_name)
-
-        for permission in user_permissions.values():
-            if permission['can_list_data'] != "none":
-                return permission['can_list_data']
+        access = can(request.user, self.module_name, 'list')
+        if access:
+            return access
 
         # If no permission is found, raise PermissionDenied
-        
         raise PermissionDenied()
 
 class HasCreateDataPermission(BasePermission):
@@ -161,12 +282,8 @@ class HasCreateDataPermission(BasePermission):
         Raises:
             PermissionDenied: If no permission is found.
         """
-        user = request.user
-        user_permissions = get_user_module_permissions(user, self.module_name)
-
-        for permission in user_permissions.values():
-            if permission['can_create_data'] != False:
-                return permission['can_create_data']
+        if can(request.user, self.module_name, 'create'):
+            return True
 
         # If no permission is found, raise PermissionDenied
         raise PermissionDenied()
@@ -198,12 +315,9 @@ class HasUpdateDataPermission(BasePermission):
         Raises:
             PermissionDenied: If no permission is found.
         """
-        user = request.user
-        user_permissions = get_user_module_permissions(user, self.module_name)
-
-        for permission in user_permissions.values():
-            if permission['can_change_data'] != "none":
-                return permission['can_change_data']
+        access = can(request.user, self.module_name, 'change')
+        if access:
+            return access
 
         # If no permission is found, raise PermissionDenied
         raise PermissionDenied()
@@ -235,12 +349,9 @@ class HasDeleteDataPermission(BasePermission):
         Raises:
             PermissionDenied: If no permission is found.
         """
-        user = request.user
-        user_permissions = get_user_module_permissions(user, self.module_name)
-
-        for permission in user_permissions.values():
-            if permission['can_delete_data'] != "none":
-                return permission['can_delete_data']
+        access = can(request.user, self.module_name, 'delete')
+        if access:
+            return access
 
         # If no permission is found, raise PermissionDenied
         raise PermissionDenied()
@@ -272,12 +383,9 @@ class HasViewDataPermission(BasePermission):
         Raises:
             PermissionDenied: If no permission is found.
         """
-        user = request.user
-        user_permissions = get_user_module_permissions(user, self.module_name)
-
-        for permission in user_permissions.values():
-            if permission['can_view_data'] != "none":
-                return permission['can_view_data']
+        access = can(request.user, self.module_name, 'view')
+        if access:
+            return access
 
         # If no permission is found, raise PermissionDenied
         raise PermissionDenied()
@@ -88,6 +88,36 @@ MIDDLEWARE = [
 ]
 DRF_API_LOGGER_DATABASE = True  # Default to False
 
+# InfinityLogs writer (see authentication/log_writer.py)
+INFINITY_LOGS_ASYNC = os.environ.get('INFINITY_LOGS_ASYNC', 'true').lower() == 'true'
+INFINITY_LOGS_BATCH_SIZE = int(os.environ.get('INFINITY_LOGS_BATCH_SIZE', 100))
+INFINITY_LOGS_FLUSH_INTERVAL = float(os.environ.get('INFINITY_LOGS_FLUSH_INTERVAL', 2.0))
+INFINITY_LOGS_MAX_QUEUE_SIZE = int(os.environ.get('INFINITY_LOGS_MAX_QUEUE_SIZE', 5000))
+INFINITY_LOGS_ENQUEUE_TIMEOUT = float(os.environ.get('INFINITY_LOGS_ENQUEUE_TIMEOUT', 0.05))
+INFINITY_LOGS_OVERFLOW_POLICY = os.environ.get('INFINITY_LOGS_OVERFLOW_POLICY', 'spill')  # 'spill' or 'drop'
+INFINITY_LOGS_SPILL_DIR = os.environ.get('INFINITY_LOGS_SPILL_DIR', '/tmp/infinity_logs')
+INFINITY_LOGS_METRICS_INTERVAL = float(os.environ.get('INFINITY_LOGS_METRICS_INTERVAL', 300))
+
+# Request bodies in InfinityLogs (see authentication/request_capture.py): capture mode per
+# URL namespace or module, 'skip' (not logged), 'none' (logged without body) or 'preview'.
+# Previews read text bodies up to INFINITY_LOGS_BODY_CAPTURE_MAX_SIZE bytes and keep
+# INFINITY_LOGS_BODY_PREVIEW_SIZE characters per value; file uploads are only described.
+INFINITY_LOGS_BODY_CAPTURE = {
+    'admin': 'skip',
+    'auth': 'none',
+}
+INFINITY_LOGS_BODY_CAPTURE_DEFAULT = os.environ.get('INFINITY_LOGS_BODY_CAPTURE_DEFAULT', 'preview')
+INFINITY_LOGS_BODY_CAPTURE_MAX_SIZE = int(os.environ.get('INFINITY_LOGS_BODY_CAPTURE_MAX_SIZE', 64 * 1024))
+INFINITY_LOGS_BODY_PREVIEW_SIZE = int(os.environ.get('INFINITY_LOGS_BODY_PREVIEW_SIZE', 2000))
+
+# InfinityLogs storage (see authentication/log_storage.py and `manage.py maintain_infinity_logs`):
+# monthly partitions older than the retention are archived to S3 and dropped. The table is
+# partitioned once with `manage.py partition_infinity_logs`.
+INFINITY_LOGS_RETENTION_MONTHS = int(os.environ.get('INFINITY_LOGS_RETENTION_MONTHS', 6))
+INFINITY_LOGS_PARTITIONS_AHEAD = int(os.environ.get('INFINITY_LOGS_PARTITIONS_AHEAD', 3))
+INFINITY_LOGS_ARCHIVE_FOLDER = os.environ.get('INFINITY_LOGS_ARCHIVE_FOLDER', 'archive/infinity_logs')
+INFINITY_LOGS_ROLLUP_LOOKBACK_HOURS = int(os.environ.get('INFINITY_LOGS_ROLLUP_LOOKBACK_HOURS', 2))
+
 ROOT_URLCONF = 'infinity_fire_solutions.urls'
 
 TEMPLATES = [
@@ -134,6 +164,32 @@ DATABASES = {
 
 
 
+# Cache
+# Defaults to a per-process cache; point CACHE_BACKEND/CACHE_LOCATION at a shared
+# backend (e.g. Redis or memcached) so invalidations reach every worker immediately.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'infinity-fire-solutions'),
+    }
+}
+
+# Seconds permission matrices and menus stay cached in a per-process cache, where the
+# invalidations of another worker are not seen (see infinity_fire_solutions/shared_cache.py).
+LOCAL_CACHE_TIMEOUT = int(os.environ.get('LOCAL_CACHE_TIMEOUT', 30))
+
+# Seconds a per-role navigation menu stays cached (see common_app/menu.py).
+MENU_CACHE_TIMEOUT = int(os.environ.get('MENU_CACHE_TIMEOUT', 300))
+
+# Seconds the total count of a paginated list stays cached (see infinity_fire_solutions/pagination.py).
+PAGINATION_COUNT_CACHE_TIMEOUT = int(os.environ.get('PAGINATION_COUNT_CACHE_TIMEOUT', 60))
+
+# Seconds a role permission matrix stays cached (see infinity_fire_solutions/permission.py).
+PERMISSION_CACHE_TIMEOUT = int(os.environ.get('PERMISSION_CACHE_TIMEOUT', 300))
+
+# Seconds a pre-signed S3 URL is reused for (see infinity_fire_solutions/aws_helper.py), 0 to sign every time.
+PRESIGNED_URL_CACHE_WINDOW = int(os.environ.get('PRESIGNED_URL_CACHE_WINDOW', 900))
+
 
 # settings.py
 REST_FRAMEWORK = {
@@ -224,6 +280,86 @@ SUPPORTED_EXTENSIONS = ['png', 'jpg', 'jpeg', 'txt', 'pdf', 'doc', 'docx', 'csv'
 IMAGE_VIDEO_SUPPORTED_EXTENSIONS = ['png', 'jpg', 'jpeg']
 IMAGE_SUPPORTED_EXTENSIONS = ["png", "jpg", "jpeg"]
 
+# S3 transfers (see infinity_fire_solutions/aws_helper.py)
+AWS_S3_MAX_POOL_CONNECTIONS = int(os.environ.get('AWS_S3_MAX_POOL_CONNECTIONS', 50))
+AWS_S3_CONNECT_TIMEOUT = float(os.environ.get('AWS_S3_CONNECT_TIMEOUT', 5))
+AWS_S3_READ_TIMEOUT = float(os.environ.get('AWS_S3_READ_TIMEOUT', 60))
+AWS_S3_MAX_ATTEMPTS = int(os.environ.get('AWS_S3_MAX_ATTEMPTS', 5))
+AWS_S3_MAX_WORKERS = int(os.environ.get('AWS_S3_MAX_WORKERS', 8))
+AWS_S3_MULTIPART_THRESHOLD = int(os.environ.get('AWS_S3_MULTIPART_THRESHOLD', 16 * 1024 * 1024))
+AWS_S3_MULTIPART_CHUNKSIZE = int(os.environ.get('AWS_S3_MULTIPART_CHUNKSIZE', 16 * 1024 * 1024))
+AWS_S3_MULTIPART_CONCURRENCY = int(os.environ.get('AWS_S3_MULTIPART_CONCURRENCY', 4))
+# Seconds between the logs of the S3 operation counts and durations of a process, 0 to disable.
+AWS_S3_METRICS_LOG_INTERVAL = int(os.environ.get('AWS_S3_METRICS_LOG_INTERVAL', 300))
+
+# Direct browser uploads to S3 (see common_app/direct_uploads.py)
+DIRECT_UPLOAD_MAX_SIZE = int(os.environ.get('DIRECT_UPLOAD_MAX_SIZE', 5 * 1024 * 1024))
+DIRECT_UPLOAD_MAX_FILES = int(os.environ.get('DIRECT_UPLOAD_MAX_FILES', 50))
+DIRECT_UPLOAD_EXPIRATION = int(os.environ.get('DIRECT_UPLOAD_EXPIRATION', 900))
+
+# Photo renditions (see infinity_fire_solutions/image_renditions.py), sizes in pixels
+IMAGE_THUMBNAIL_MAX_SIZE = int(os.environ.get('IMAGE_THUMBNAIL_MAX_SIZE', 320))
+IMAGE_THUMBNAIL_QUALITY = int(os.environ.get('IMAGE_THUMBNAIL_QUALITY', 75))
+IMAGE_PRINT_MAX_SIZE = int(os.environ.get('IMAGE_PRINT_MAX_SIZE', 1600))
+IMAGE_PRINT_QUALITY = int(os.environ.get('IMAGE_PRINT_QUALITY', 80))
+
+# Renditions of photos uploaded straight to S3 (see common_app/rendition_jobs.py and `manage.py run_rendition_worker`)
+RENDITION_WORKER_POLL_INTERVAL = float(os.environ.get('RENDITION_WORKER_POLL_INTERVAL', 2.0))
+RENDITION_JOB_MAX_ATTEMPTS = int(os.environ.get('RENDITION_JOB_MAX_ATTEMPTS', 3))
+RENDITION_JOB_STALE_AFTER = int(os.environ.get('RENDITION_JOB_STALE_AFTER', 600))
+
+# PDF rendering worker (see common_app/pdf_jobs.py and `manage.py run_pdf_worker`)
+PDF_RENDER_CONCURRENCY = int(os.environ.get('PDF_RENDER_CONCURRENCY', 2))
+PDF_WORKER_POLL_INTERVAL = float(os.environ.get('PDF_WORKER_POLL_INTERVAL', 1.0))
+PDF_JOB_MAX_ATTEMPTS = int(os.environ.get('PDF_JOB_MAX_ATTEMPTS', 3))
+PDF_JOB_STALE_AFTER = int(os.environ.get('PDF_JOB_STALE_AFTER', 600))
+
+# Bulk CSV/Excel imports (see infinity_fire_solutions/importers.py)
+IMPORT_CHUNK_SIZE = int(os.environ.get('IMPORT_CHUNK_SIZE', 1000))
+IMPORT_MAX_ERROR_MESSAGES = int(os.environ.get('IMPORT_MAX_ERROR_MESSAGES', 20))
+
+# Background import jobs (see common_app/import_jobs.py and `manage.py run_import_worker`)
+IMPORT_JOBS_ASYNC = os.environ.get('IMPORT_JOBS_ASYNC', 'true').lower() == 'true'
+IMPORT_WORKER_POLL_INTERVAL = float(os.environ.get('IMPORT_WORKER_POLL_INTERVAL', 2.0))
+IMPORT_JOB_MAX_ATTEMPTS = int(os.environ.get('IMPORT_JOB_MAX_ATTEMPTS', 3))
+IMPORT_JOB_STALE_AFTER = int(os.environ.get('IMPORT_JOB_STALE_AFTER', 3600))
+IMPORT_JOB_MAX_STORED_ERRORS = int(os.environ.get('IMPORT_JOB_MAX_STORED_ERRORS', 50000))
+
+# Email outbox (see common_app/email_outbox.py and `manage.py run_email_worker`).
+# EMAIL_OUTBOX_ASYNC = false sends in the request, e.g. for local development.
+# AWS_SES_ENDPOINT_URL points the SES client at a local fake SES, e.g. for tests.
+EMAIL_OUTBOX_ASYNC = os.environ.get('EMAIL_OUTBOX_ASYNC', 'true').lower() == 'true'
+AWS_SES_ENDPOINT_URL = os.environ.get('AWS_SES_ENDPOINT_URL') or None
+EMAIL_SEND_CONCURRENCY = int(os.environ.get('EMAIL_SEND_CONCURRENCY', 8))
+EMAIL_MAX_SEND_RATE = float(os.environ.get('EMAIL_MAX_SEND_RATE', 14))
+EMAIL_WORKER_POLL_INTERVAL = float(os.environ.get('EMAIL_WORKER_POLL_INTERVAL', 1.0))
+EMAIL_MAX_ATTEMPTS = int(os.environ.get('EMAIL_MAX_ATTEMPTS', 5))
+EMAIL_RETRY_BACKOFF = int(os.environ.get('EMAIL_RETRY_BACKOFF', 60))
+EMAIL_STALE_AFTER = int(os.environ.get('EMAIL_STALE_AFTER', 300))
+EMAIL_MAX_ATTACHMENT_SIZE = int(os.environ.get('EMAIL_MAX_ATTACHMENT_SIZE', 7 * 1024 * 1024))
+
+# Document numbers (see common_app/sequences.py): values reserved per process at a time,
+# 1 keeps the numbers gapless and in order of creation.
+DOCUMENT_SEQUENCE_BLOCK_SIZE = int(os.environ.get('DOCUMENT_SEQUENCE_BLOCK_SIZE', 1))
+
+# STW to FRA conversion (see work_planning_management/stw_conversion.py): STWs converted
+# per transaction, and rows per bulk insert.
+STW_CONVERSION_BATCH_SIZE = int(os.environ.get('STW_CONVERSION_BATCH_SIZE', 50))
+STW_CONVERSION_BULK_SIZE = int(os.environ.get('STW_CONVERSION_BULK_SIZE', 500))
+
+# Scheduling calendar feed (see work_planning_management/calendar_feed.py), in days
+CALENDAR_FEED_DEFAULT_DAYS = int(os.environ.get('CALENDAR_FEED_DEFAULT_DAYS', 42))
+CALENDAR_FEED_MAX_DAYS = int(os.environ.get('CALENDAR_FEED_MAX_DAYS', 400))
+# Longest event the forms accept; the feed only looks this far back for events that
+# started before the window.
+CALENDAR_EVENT_MAX_DAYS = int(os.environ.get('CALENDAR_EVENT_MAX_DAYS', 366))
+
+# Search index (see common_app/search.py). SEARCH_NGRAM_TOKEN_SIZE must match the
+# ngram_token_size of the MySQL server; shorter words are matched without the index.
+SEARCH_RESULTS_LIMIT = int(os.environ.get('SEARCH_RESULTS_LIMIT', 20))
+SEARCH_MAX_RESULTS = int(os.environ.get('SEARCH_MAX_RESULTS', 100))
+SEARCH_NGRAM_TOKEN_SIZE = int(os.environ.get('SEARCH_NGRAM_TOKEN_SIZE', 2))
+
 # Include data for English language translations
 CITIES_LIGHT_TRANSLATION_LANGUAGES = ['en']
 
@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache
+
+# Backends that keep their entries in one process (or on one host): a version stamp
+# bumped by one worker is not seen by the others.
+LOCAL_BACKENDS = (LocMemCache, FileBasedCache, DummyCache)
+
+
+def is_shared_cache():
+    """
+    Whether the default cache is shared by every worker, e.g. Redis or memcached.
+    """
+    return not isinstance(caches['default'], LOCAL_BACKENDS)
+
+
+class SharedCache:
+    """
+    The default cache, for data invalidated by signals bumping a version stamp
+    (permissions, menus).
+
+    With a shared backend every worker sees a bump at once. With a per-process backend
+    only the worker handling the change does, so entries expire after at most
+    LOCAL_CACHE_TIMEOUT seconds and the other workers catch up within that time.
+    Version stamps themselves (timeout None) are kept.
+    """
+
+    def _timeout(self, timeout):
+        if timeout is None or is_shared_cache():
+            return timeout
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = caches['default'].default_timeout
+        return min(timeout, settings.LOCAL_CACHE_TIMEOUT)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, **kwargs):
+        return caches['default'].set(key, value, self._timeout(timeout), **kwargs)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, **kwargs):
+        return caches['default'].add(key, value, self._timeout(timeout), **kwargs)
+
+    def get_or_set(self, key, default, timeout=DEFAULT_TIMEOUT, **kwargs):
+        return caches['default'].get_or_set(key, default, self._timeout(timeout), **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(caches['default'], name)
+
+
+shared_cache = SharedCache()
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.3 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('invoice_management', '0005_alter_invoice_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='invoice',
+            name='pdf_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pending'), ('rendering', 'Rendering'), ('completed', 'Completed'), ('failed', 'Failed')], max_length=30, null=True, verbose_name='Invoice PDF Status'),
+        ),
+    ]
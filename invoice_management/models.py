@@ -1,6 +1,7 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django.urls import reverse
+from common_app.models import PDF_JOB_STATUS_CHOICES
 
 from requirement_management.models import User, Requirement, Report, RequirementDefect, Quotation
 
@@ -28,6 +29,8 @@ class Invoice(models.Model):
         status (CharField): The status of the invoice.
         submitted_at (DateTimeField): Date and time when the invoice was submitted.
         pdf_path (CharField): Path to the PDF document of the invoice stored in S3.
+        pdf_status (CharField): Status of the PDF rendering job of the invoice.
+        pdf_hash (CharField): Content hash of the HTML the current PDF was rendered from.
         created_at (DateTimeField): Date and time when the invoice was created.
         updated_at (DateTimeField): Date and time when the invoice was last updated.
 
@@ -71,6 +74,12 @@ class Invoice(models.Model):
     
     # Invoice PDF document saved on s3's path
     pdf_path = models.CharField(max_length=500, null=True, blank=True, verbose_name=_("Invoice PDF Path"))
+
+    # Status of the background job rendering the PDF document
+    pdf_status = models.CharField(max_length=30, choices=PDF_JOB_STATUS_CHOICES, null=True, blank=True, verbose_name=_("Invoice PDF Status"))
+
+    # Content hash of the HTML the current PDF document was rendered from
+    pdf_hash = models.CharField(max_length=64, null=True, blank=True, verbose_name=_("Invoice PDF Hash"))
     
     # Creation and Updation details
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Created At"))
@@ -4,8 +4,7 @@ from django.utils import timezone
 
 from rest_framework import serializers
 
-from infinity_fire_solutions.aws_helper import upload_signature_to_s3, generate_presigned_url
-from infinity_fire_solutions.custom_form_validation import save_pdf_from_html
+from common_app.pdf_jobs import queue_pdf_render
 from infinity_fire_solutions.email import Email
 
 from customer_management.serializers import ( 
@@ -161,16 +160,12 @@ class InvoiceCreateSerializer(serializers.ModelSerializer):
                 'instance': instance
             }
 
-            # Generate the PDF file from the template
-            pdf_file = save_pdf_from_html(context=context, file_name=unique_pdf_filename, content_html='invoice.html')
-            
-            if pdf_file:
-                # Upload the PDF file to the given path
-                upload_signature_to_s3(unique_pdf_filename, pdf_file, pdf_path)
-                
-                # Update the PDF file path of the instance and save the changes.
-                instance.pdf_path = f'{pdf_path}/{unique_pdf_filename}'
-                instance.save()
+            # Queue the PDF file; the PDF worker renders it and updates the PDF path of the instance.
+            queue_pdf_render(
+                instance, 'invoice', 'invoice.html', context, pdf_path, unique_pdf_filename,
+                user=getattr(self.context.get('request'), 'user', None),
+            )
+            instance.save(update_fields=['submitted_at'])
 
         return instance
 
@@ -208,17 +203,12 @@ class InvoiceCreateSerializer(serializers.ModelSerializer):
                 'instance': instance
             }
 
-            # Generate the PDF file from the template
-            pdf_file = save_pdf_from_html(context=context, file_name=unique_pdf_filename, content_html='invoice.html')
-            
-            if pdf_file:
-                # Upload the PDF file to the given path
-                upload_signature_to_s3(unique_pdf_filename, pdf_file, pdf_path)
-                
-                # Update the PDF file path of the instance and save the changes.
-                instance.pdf_path = f'{pdf_path}/{unique_pdf_filename}'
-                instance.submitted_at = timezone.now()
-                instance.save()
+            # Queue the PDF file; the PDF worker renders it and updates the PDF path of the instance.
+            queue_pdf_render(
+                instance, 'invoice', 'invoice.html', context, pdf_path, unique_pdf_filename,
+                user=getattr(self.context.get('request'), 'user', None),
+            )
+            instance.save(update_fields=['submitted_at'])
 
         return instance
 
@@ -279,16 +269,13 @@ class InvoiceStatusUpdateSerializer(serializers.ModelSerializer):
         context = {
             'invoice': InvoiceListSerializer(instance).data,
         }
-        # Generate presigned URL for the invoice attachment
-        attachment_path = generate_presigned_url(instance.pdf_path)
-
-        # Send email notification with invoice and attachment
+        # Queue the email notification with the invoice PDF attached from S3
         self.email.send_mail(
             instance.customer.email,
             'email_templates/invoice_email.html',
             context,
             "Invoice for a quotation",
-            attachment_path
+            instance.pdf_path
         )
     
     def update(self, instance, validated_data):
@@ -10,6 +10,8 @@ from requirement_management.models import SORItem
 from requirement_management.quotation_views import DecimalEncoder
 
 from customer_management.models import BillingAddress
+from common_app.models import PDF_JOB_ACTIVE_STATUSES
+from common_app.pdf_jobs import retry_pdf_render
 
 from infinity_fire_solutions.permission import *
 from infinity_fire_solutions.response_schemas import create_api_response, render_html_response, convert_serializer_errors
@@ -657,6 +659,22 @@ class SendInvoiceToCustomerView(CustomAuthenticationMixin, generics.GenericAPIVi
             messages.error(request, "You are not authorized to perform this action")
             return redirect(reverse('cs_customer_invoice_list', kwargs={'customer_id': kwargs.get('customer_id')}))
         
+        if instance.pdf_status in PDF_JOB_ACTIVE_STATUSES:
+            messages.warning(request, "The invoice PDF is still being generated, please try again in a moment.")
+            return redirect(reverse('cs_customer_invoice_list', kwargs={'customer_id': kwargs.get('customer_id')}))
+
+        # A failed render leaves no PDF, or the one of a previous version: never send it.
+        if instance.pdf_status == 'failed':
+            if retry_pdf_render(instance, 'invoice'):
+                messages.warning(request, "The invoice PDF could not be generated and is being generated again, please try again in a moment.")
+            else:
+                messages.error(request, "The invoice PDF could not be generated, please save the invoice again.")
+            return redirect(reverse('cs_customer_invoice_list', kwargs={'customer_id': kwargs.get('customer_id')}))
+
+        if not instance.pdf_path:
+            messages.error(request, "The invoice has no PDF yet, please save the invoice again.")
+            return redirect(reverse('cs_customer_invoice_list', kwargs={'customer_id': kwargs.get('customer_id')}))
+
         data = {
             'status': 'sent_to_customer'
         }
@@ -7,6 +7,7 @@ from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.custom_form_validation import *
 from django.conf import settings
 from stock_management.models import Item
+from stock_management.ledger import record_receipts
 from django.utils.translation import gettext as _
 from authentication.models import User
 from django.utils import timezone
@@ -738,7 +739,11 @@ class PurchaseOrderInvoiceSerializer(serializers.ModelSerializer):
         
         return value
 
+    @transaction.atomic
     def create(self, validated_data):
+        # The invoice, its received rows, the stock movements and the purchase order status
+        # are saved together: a failure leaves neither an invoice nor moved stock behind.
+
         # Pop the 'file' field from validated_data
         file = validated_data.pop('file', None)
 
@@ -750,17 +755,29 @@ class PurchaseOrderInvoiceSerializer(serializers.ModelSerializer):
                 {'purchase_order_items': ['Items are required to create a purchase order.']}
             )
 
+        purchase_order = validated_data.get('purchase_order_id')
+        if purchase_order and not purchase_order.inventory_location_id and not purchase_order.site_address:
+            raise serializers.ValidationError(
+                {'purchase_order_items': ['Inventory cannot be received if neither an Inventory Location nor a Site Address is selected in the purchase order.']}
+            )
+
         # Create a new instance of Conversation with 'title' and 'message'
         instance = super().create(validated_data)
 
         items_serializer = PurchaseOrderReceivedInventorySerializer(data=purchase_order_items[0], many=True)
         if not items_serializer.is_valid():
-            instance.delete()
             raise serializers.ValidationError(
                 {'purchase_order_items': items_serializer.errors}
             )
 
         inventory = items_serializer.save(purchase_order_invoice_id=instance)
+
+        # The received quantities enter the stock ledger of the purchase order's location.
+        request = self.context.get('request')
+        try:
+            record_receipts(inventory, user=request.user if request else None)
+        except ValueError as error:
+            raise serializers.ValidationError({'purchase_order_items': [str(error)]})
         
         purchase_order = instance.purchase_order_id
         partially_completed_inventory = [inv for inv in inventory if inv.purchase_order_item_id.quantity != inv.received_inventory ]
@@ -1,3 +1,77 @@
-from django.test import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.db import connection
+from django.test import TransactionTestCase, override_settings, skipUnlessDBFeature
+from django.utils import timezone
 
-# Create your tests here.
+from authentication.models import User
+from common_app import sequences
+from stock_management.models import InventoryLocation, Vendor
+from .models import PurchaseOrder
+from .serializers import PurchaseOrderSerializer
+from .views import po_number_generated
+
+
+@skipUnlessDBFeature('has_select_for_update')
+class PurchaseOrderNumberConcurrencyTests(TransactionTestCase):
+    """
+    Purchase orders created in parallel through the save path of PurchaseOrderAddView get
+    unique numbers.
+
+    A TransactionTestCase, so every thread commits on its own connection and the row lock
+    of the sequence is really contended.
+    """
+    threads = 16
+    orders = 2000
+
+    def setUp(self):
+        # The created sequences and the reserved blocks are remembered per process.
+        sequences._created.clear()
+        sequences._blocks.clear()
+        self.addCleanup(sequences._blocks.clear)
+        self.addCleanup(sequences._created.clear)
+
+        self.user = User.objects.create_user(
+            email='buyer@example.com', password='password', first_name='Buyer', last_name='User',
+        )
+        self.vendor = Vendor.objects.create(
+            user_id=self.user, first_name='Vendor', last_name='User', email='vendor@example.com',
+            phone_number='01234567890',
+        )
+        self.location = InventoryLocation.objects.create(user_id=self.user, name='Warehouse')
+
+    def create_order(self, _):
+        try:
+            serializer = PurchaseOrderSerializer(data={
+                'vendor_id': self.vendor.pk,
+                'inventory_location_id': self.location.pk,
+                'sub_total': '10.00',
+                'total_amount': '10.00',
+                'po_due_date': (timezone.now().date() + timedelta(days=7)).strftime('%d/%m/%Y'),
+                'items': [{'item_name': 'Fire door', 'quantity': 1, 'unit_price': '10.00', 'row_total': '10.00'}],
+            })
+            serializer.is_valid(raise_exception=True)
+            return serializer.save(created_by=self.user, po_number=po_number_generated()).po_number
+        finally:
+            connection.close()
+
+    def create_orders(self):
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            return list(executor.map(self.create_order, range(self.orders)))
+
+    def assertUniqueNumbers(self, numbers):
+        self.assertEqual(len(set(numbers)), self.orders)
+        self.assertEqual(set(PurchaseOrder.objects.values_list('po_number', flat=True)), set(numbers))
+
+    @override_settings(DOCUMENT_SEQUENCE_BLOCK_SIZE=1)
+    def test_concurrent_orders(self):
+        numbers = self.create_orders()
+        self.assertUniqueNumbers(numbers)
+        self.assertEqual(
+            sorted(numbers),
+            sorted(sequences.format_number('purchase_order', value) for value in range(1, self.orders + 1)),
+        )
+
+    @override_settings(DOCUMENT_SEQUENCE_BLOCK_SIZE=20)
+    def test_concurrent_orders_from_blocks(self):
+        self.assertUniqueNumbers(self.create_orders())
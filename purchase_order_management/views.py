@@ -18,6 +18,7 @@ from rest_framework.renderers import TemplateHTMLRenderer, JSONRenderer
 from django.contrib import messages
 from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.permission import *
+from infinity_fire_solutions.pagination import PaginatedListMixin, CachedCountPaginator, paginate
 from infinity_fire_solutions.response_schemas import create_api_response, render_html_response
 from infinity_fire_solutions.utils import docs_schema_response_new
 from stock_management.models import Vendor, InventoryLocation, Item
@@ -28,12 +29,11 @@ from stock_management.models import Item
 from django.http import JsonResponse
 from django.core import serializers
 from django.views import View
-from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
 from django.db import transaction
 from datetime import datetime
 from django.db.models import Sum
-from django.db.models import F
-from stock_management.models import Inventory
+from stock_management.ledger import record_movement
+from common_app.sequences import next_number, preview_number
 import json
 from rest_framework.response import Response
 from common_app.models import *
@@ -43,61 +43,28 @@ from work_planning_management.models import Job
 
 def po_number_generated():
     """
-    Generate a new purchase order number based on existing numbers.
+    Allocate a new purchase order number from the "purchase_order" document sequence.
 
     Returns:
-        str: The newly generated purchase order number.
+        str: The newly generated purchase order number, e.g. IFB0012.
     """
-
-    # Check if any existing PO numbers exist
-    existing_purchases = PurchaseOrder.objects.all()
-    existing_purchases = existing_purchases.order_by('-created_at').first()
-
-    new_po_number = 'IFB0001'  # Default starting PO number
-
-    if existing_purchases:
-        if existing_purchases.po_number:
-            last_po_number = existing_purchases.po_number
-            last_po_number_int = int(last_po_number[3:])  # Extract the numeric part
-            new_po_number_int = last_po_number_int + 1
-            new_po_number = f'IFB{str(new_po_number_int).zfill(4)}'  # Generate the new PO number
-
-    return new_po_number
+    return next_number('purchase_order')
 
 
 def update_or_create_inventory(purchase_order, item, quantity):
-    # Try to retrieve the existing inventory entry or create a new one
+    """
+    Record stock received for a purchase order item in the stock ledger and return the
+    updated inventory of the purchase order's location or site address.
+    """
     if not purchase_order.site_address and not purchase_order.inventory_location_id:
         raise ValueError('Inventory cannot be added if both Inventory Location and Site Address is not selected in purchase order, either of them is required.')
-    
-    inventory = None
-
-    if purchase_order.inventory_location_id and not inventory:
 
-        inventory, created = Inventory.objects.get_or_create(
-            item_id=item.item,
-            inventory_location = purchase_order.inventory_location_id,
-            defaults={
-                'total_inventory': quantity
-            }
-        )
-    
-    if purchase_order.site_address and not inventory:
-
-        inventory, created = Inventory.objects.get_or_create(
-            item_id=item.item,
-            site_address = purchase_order.site_address,
-            defaults={
-                'total_inventory': quantity
-            }
-        )
-    
-    if not created:
-        # If the inventory entry already exists, update the total_inventory
-        inventory.total_inventory = F('total_inventory') + quantity
-        inventory.save()
-
-    return inventory
+    return record_movement(
+        item.item, 'receipt', quantity,
+        inventory_location=purchase_order.inventory_location_id,
+        site_address=purchase_order.site_address,
+        note=purchase_order.po_number or '',
+    ).inventory
 
 def get_paginated_data(request, queryset, serializer_class, search_field=None):
     search_value = request.GET.get('search[value]', '')
@@ -127,9 +94,9 @@ def get_paginated_data(request, queryset, serializer_class, search_field=None):
     if  vendor_query:
         data_queryset = data_queryset.filter(vendor_query)
             
-    paginator = Paginator(data_queryset, 25)
     start = int(request.GET.get('start', 0))
     length = int(request.GET.get('length', 25))
+    paginator = CachedCountPaginator(data_queryset, length)
     page_number = (start // length) + 1
     page_obj = paginator.get_page(page_number)
 
@@ -137,7 +104,7 @@ def get_paginated_data(request, queryset, serializer_class, search_field=None):
 
     response_data = {
             "draw": int(request.GET.get('draw', 1)),
-            "recordsTotal": data_queryset.count(),
+            "recordsTotal": paginator.count,
             "recordsFiltered": paginator.count,
             "data": serializer.data,
         }
@@ -178,11 +145,7 @@ def get_paginated_data_for_web(request, queryset, search_field=None):
     if  vendor_query:
         data_queryset = data_queryset.filter(vendor_query)
             
-    paginator = Paginator(data_queryset, 20)
-    page_number = request.GET.get('page', 1)
-    page_obj = paginator.get_page(page_number)
-
-    return page_obj
+    return paginate(request, data_queryset, 20)
     
     
 def get_order_items(data):
@@ -277,7 +240,7 @@ def filter_purchase_order(data_access_value, user):
         queryset = queryset.filter(filter_mapping.get(data_access_value, Q()))
     return queryset 
 
-class PurchaseOrderListView(CustomAuthenticationMixin,generics.ListAPIView):
+class PurchaseOrderListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     """
 
     View to get the listing of all Purchase Orders.
@@ -348,21 +311,6 @@ class PurchaseOrderListView(CustomAuthenticationMixin,generics.ListAPIView):
         
         return queryset
     
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
     
     def get_searched_queryset(self, queryset):
         search_params = self.request.query_params.get('q', '')
@@ -448,7 +396,7 @@ class PurchaseOrderAddView(CustomAuthenticationMixin, generics.CreateAPIView):
                 'inventory_location_list':inventory_location_list,
                 'customer_list': customer_list,
                 'tax_rate':tax_rate,
-                'new_po_number':po_number_generated(),
+                'new_po_number':preview_number('purchase_order'),
                 'sub_contractor_list': sub_contractor_list,
                 'job_list': job_list
             }
@@ -462,11 +410,11 @@ class PurchaseOrderAddView(CustomAuthenticationMixin, generics.CreateAPIView):
         """
         Handle POST request to add a requirement.
         """
-        po_number = po_number_generated()
         serializer = self.serializer_class(data=request.data)
         if serializer.is_valid():
+            # Allocated once the order is valid, so rejected forms leave no gaps in the numbers.
             purchase_order = serializer.save(
-                created_by=request.user, po_number=po_number
+                created_by=request.user, po_number=po_number_generated()
             )
             
             if purchase_order.status == 'pending':
@@ -741,7 +689,7 @@ class PurchaseOrderConvertToInvoiceView(CustomAuthenticationMixin,generics.ListA
             messages.error(request, "You are not authorized to perform this action.")
             return redirect(reverse('purchase_order_list'))
 
-        serializer = PurchaseOrderInvoiceSerializer(data=request.data)
+        serializer = PurchaseOrderInvoiceSerializer(data=request.data, context={'request': request})
 
         if serializer.is_valid():
             try:
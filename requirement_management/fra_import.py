@@ -0,0 +1,254 @@
+from datetime import datetime, time
+from django.utils import timezone
+
+from common_app.search import index_queryset
+from customer_management.models import SiteAddress
+from customer_management.post_codes import is_valid_post_code
+from infinity_fire_solutions.importers import ImportSink, html_text, parse_date
+from requirement_management.models import Requirement
+
+SITE_ADDRESS_FIELDS = ['site_name', 'UPRN', 'address', 'country', 'town', 'county', 'post_code']
+TEXT_FIELDS = ['RBNO', 'UPRN', 'action', 'description']
+
+
+class FRAImporter(ImportSink):
+    """
+    Set based import of FRA requirements for a customer.
+
+    For every chunk the existing Job Numbers (RBNO), UPRNs and the customer's site
+    addresses are fetched with a few IN queries, the rows are validated in memory and the
+    valid ones are inserted with bulk_create.
+
+    Each row is a dict with 'RBNO', 'action', 'description', 'due_date' and 'site_address',
+    which is either the id of an existing site address of the customer or a dict with the
+    SITE_ADDRESS_FIELDS. A site address dict is matched on the customer's UPRN and created
+    when it does not exist yet. Rows may also carry a requirement 'UPRN', which must be
+    unique, and a 'date' used as the creation date.
+
+    Args:
+        customer (User): The customer the requirements belong to.
+        user (User): The user running the import.
+        chunk_size (int, optional): Rows validated and inserted at a time.
+        all_or_nothing (bool): When True any rejected row rolls the whole import back.
+    """
+    key_field = 'RBNO'
+
+    def __init__(self, customer, user, chunk_size=None, all_or_nothing=True):
+        super().__init__(chunk_size, all_or_nothing)
+        self.customer = customer
+        self.user = user
+
+    def start(self, report):
+        self._seen_rbno = set()
+        self._seen_uprn = set()
+        # Site addresses by UPRN created during this import, shared across chunks.
+        self._new_site_addresses = {}
+        report.details['site_addresses_created'] = 0
+
+    def write_chunk(self, rows, report):
+        for _, row in rows:
+            self._text_cells(row)
+        existing = self._prefetch(rows)
+
+        valid_rows = []
+        for row_number, row in rows:
+            if self._validate(row_number, row, existing, report):
+                valid_rows.append(row)
+
+        if not valid_rows:
+            return
+
+        report.details['site_addresses_created'] += self._create_site_addresses(valid_rows, existing)
+
+        requirements = []
+        created_dates = {}
+        for row in valid_rows:
+            site_address = row['site_address']
+            if isinstance(site_address, dict):
+                site_address_id = existing['site_address_by_uprn'][site_address['UPRN']]
+            else:
+                site_address_id = int(site_address)
+
+            requirements.append(Requirement(
+                user_id=self.user,
+                customer_id=self.customer,
+                RBNO=row['RBNO'],
+                UPRN=row.get('UPRN') or None,
+                action=row['action'],
+                description=row['description'],
+                due_date=row['_due_date'],
+                site_address_id=site_address_id,
+            ))
+            if row.get('_created_at'):
+                created_dates.setdefault(row['_created_at'], []).append(row['RBNO'])
+
+        Requirement.objects.bulk_create(requirements, batch_size=self.chunk_size)
+        report.created += len(requirements)
+
+        # bulk_create always stamps auto_now_add fields, so imported creation dates are set afterwards.
+        for created_date, rbnos in created_dates.items():
+            Requirement.objects.filter(customer_id=self.customer, RBNO__in=rbnos).update(
+                created_at=timezone.make_aware(datetime.combine(created_date, time.min))
+            )
+
+        # bulk_create sends no signals, so the search entries are written here.
+        index_queryset('requirement', Requirement.objects.filter(
+            customer_id=self.customer, RBNO__in=[requirement.RBNO for requirement in requirements]
+        ))
+
+    def _text_cells(self, row):
+        """
+        Turn text cells the spreadsheet typed as dates back into strings, so they are
+        length checked and matched like any other value.
+        """
+        cells = [(row, TEXT_FIELDS)]
+        if isinstance(row.get('site_address'), dict):
+            cells.append((row['site_address'], SITE_ADDRESS_FIELDS))
+        for values, fields in cells:
+            for field in fields:
+                if values.get(field) is not None and not isinstance(values[field], str):
+                    values[field] = str(values[field])
+
+    def _prefetch(self, rows):
+        """
+        Fetch everything the validation of a chunk needs with one query per lookup.
+        """
+        rbnos, uprns, site_uprns, site_ids = set(), set(), set(), set()
+        for _, row in rows:
+            if row.get('RBNO'):
+                rbnos.add(row['RBNO'])
+            if row.get('UPRN'):
+                uprns.add(row['UPRN'])
+            site_address = row.get('site_address')
+            if isinstance(site_address, dict):
+                if site_address.get('UPRN'):
+                    site_uprns.add(site_address['UPRN'])
+            elif site_address and str(site_address).isdigit():
+                site_ids.add(int(site_address))
+
+        site_address_by_uprn = dict(self._new_site_addresses)
+        if site_uprns:
+            # The lowest id wins, which is the address get_object_or_404 used to pick.
+            for site_id, uprn in SiteAddress.objects.filter(
+                user_id=self.customer, UPRN__in=site_uprns
+            ).order_by('-id').values_list('id', 'UPRN'):
+                site_address_by_uprn[uprn] = site_id
+
+        return {
+            'rbno': set(Requirement.objects.filter(RBNO__in=rbnos).values_list('RBNO', flat=True)) if rbnos else set(),
+            'uprn': set(Requirement.objects.filter(UPRN__in=uprns).values_list('UPRN', flat=True)) if uprns else set(),
+            'site_address_by_uprn': site_address_by_uprn,
+            'site_address_ids': set(SiteAddress.objects.filter(
+                user_id=self.customer, id__in=site_ids
+            ).values_list('id', flat=True)) if site_ids else set(),
+            'new_site_addresses': {},
+        }
+
+    def _validate(self, row_number, row, existing, report):
+        """
+        Validate one row against the prefetched data, recording its errors on the report.
+
+        Returns:
+            bool: True if the row can be inserted.
+        """
+        errors_before = len(report.errors)
+
+        def error(field, message):
+            self.error(report, row_number, row, field, message)
+
+        rbno = row.get('RBNO', '')
+        if not rbno:
+            error('RBNO', 'Job Number is required.')
+        elif len(rbno) > 12:
+            error('RBNO', 'Job Number must not have more than 12 characters.')
+        elif rbno in existing['rbno'] or rbno in self._seen_rbno:
+            error('RBNO', f"Job Number '{rbno}' already exists.")
+
+        uprn = row.get('UPRN', '')
+        if uprn:
+            if len(uprn) > 12:
+                error('UPRN', 'UPRN must not have more than 12 characters.')
+            elif uprn in existing['uprn'] or uprn in self._seen_uprn:
+                error('UPRN', f"UPRN '{uprn}' already exists.")
+
+        for field, label in (('action', 'Action'), ('description', 'Description')):
+            value = row.get(field, '')
+            if not html_text(value):
+                error(field, f'{label} is required.')
+            elif len(value) > 1000:
+                error(field, f'{label} must not have more than 1000 characters.')
+
+        due_date = parse_date(row.get('due_date'))
+        if not due_date:
+            error('due_date', 'Due Date is required and must be in DD/MM/YYYY format.')
+        elif due_date < timezone.localdate():
+            error('due_date', "Due Date must not be smaller than today's date.")
+        row['_due_date'] = due_date
+
+        if row.get('date'):
+            row['_created_at'] = parse_date(row['date'])
+
+        site_address = row.get('site_address')
+        if isinstance(site_address, dict):
+            self._validate_site_address(site_address, existing, error)
+        elif not (str(site_address).isdigit() and int(site_address) in existing['site_address_ids']):
+            error('site_address', "Invalid site address. It does not match the customer's site address.")
+
+        if len(report.errors) > errors_before:
+            return False
+
+        self._seen_rbno.add(rbno)
+        if uprn:
+            self._seen_uprn.add(uprn)
+        if isinstance(site_address, dict) and site_address['UPRN'] not in existing['site_address_by_uprn']:
+            existing['new_site_addresses'].setdefault(site_address['UPRN'], site_address)
+        return True
+
+    def _validate_site_address(self, site_address, existing, error):
+        uprn = site_address.get('UPRN', '')
+        if not uprn:
+            error('site_address', 'UPRN and Customer is a required field for Site Address')
+            return
+        if uprn in existing['site_address_by_uprn'] or uprn in existing['new_site_addresses']:
+            return
+
+        if len(uprn) > 10:
+            error('UPRN', 'UPRN must not have more than 10 characters.')
+        site_name = site_address.get('site_name', '')
+        if not 3 <= len(site_name) <= 255:
+            error('site_name', 'Site name must have between 3 and 255 characters.')
+        address = site_address.get('address', '')
+        if not 5 <= len(address) <= 255:
+            error('address', 'Address must have between 5 and 255 characters.')
+        for field in ('country', 'town', 'county'):
+            if not site_address.get(field):
+                error(field, f'{field.title()} is required.')
+            elif len(site_address[field]) > 255:
+                error(field, f'{field.title()} must not have more than 255 characters.')
+        if not is_valid_post_code(site_address.get('post_code')):
+            error('post_code', f"\"{site_address.get('post_code', '')}\" is not a valid Post Code.")
+
+    def _create_site_addresses(self, valid_rows, existing):
+        """
+        Insert the site addresses of a chunk and add their ids to the UPRN lookup.
+
+        Returns:
+            int: The number of site addresses created.
+        """
+        new_site_addresses = existing['new_site_addresses']
+        if not new_site_addresses:
+            return 0
+
+        SiteAddress.objects.bulk_create([
+            SiteAddress(user_id=self.customer, **{field: site_address.get(field) for field in SITE_ADDRESS_FIELDS})
+            for site_address in new_site_addresses.values()
+        ], batch_size=self.chunk_size)
+
+        # MySQL does not return the ids of bulk inserted rows, so they are read back by UPRN.
+        for site_id, uprn in SiteAddress.objects.filter(
+            user_id=self.customer, UPRN__in=list(new_site_addresses)
+        ).order_by('-id').values_list('id', 'UPRN'):
+            existing['site_address_by_uprn'][uprn] = site_id
+            self._new_site_addresses[uprn] = site_id
+
+        return len(new_site_addresses)
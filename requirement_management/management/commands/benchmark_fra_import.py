@@ -0,0 +1,83 @@
+import time
+import json
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from authentication.models import User
+from customer_management.post_codes import search_post_codes
+from infinity_fire_solutions.importers import map_row, read_rows
+from requirement_management.fra_import import FRAImporter
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the bulk FRA import on generated rows or on a CSV/Excel file. Nothing is saved unless --keep is given.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('customer_id', type=int, help='The customer the FRAs are imported for.')
+        parser.add_argument('user_id', type=int, help='The user running the import.')
+        parser.add_argument('--rows', type=int, default=50000, help='Number of generated rows.')
+        parser.add_argument('--file', help='Import this CSV/Excel file instead of generated rows. Its headers are the importer '
+                                 'fields, e.g. RBNO, due_date, site_address.UPRN.')
+        parser.add_argument('--chunk-size', type=int, help='Rows validated and inserted at a time.')
+        parser.add_argument('--keep', action='store_true', help='Commit the imported rows.')
+
+    def generate_rows(self, count):
+        due_date = (timezone.localdate() + timedelta(days=30)).strftime('%d/%m/%Y')
+        run_id = int(time.time()) % 100000
+        post_codes = search_post_codes('E', limit=50)
+        for index in range(count):
+            yield {
+                'RBNO': f'B{run_id:05d}{index:06d}',
+                'action': f'<p>Replace fire door {index}</p>',
+                'description': f'<p>Fire door on floor {index % 20} does not close.</p>',
+                'due_date': due_date,
+                'site_address': {
+                    # A few rows share every site address, like blocks of one estate.
+                    'UPRN': f'U{run_id:05d}{index // 10:04d}'[-10:],
+                    'site_name': f'Block {index // 10}',
+                    'address': f'{index // 10} Benchmark Street',
+                    'country': 'United Kingdom',
+                    'town': 'London',
+                    'county': 'Greater London',
+                    'post_code': post_codes[index % len(post_codes)],
+                },
+            }
+
+    def handle(self, *args, **options):
+        customer = User.objects.filter(id=options['customer_id']).first()
+        user = User.objects.filter(id=options['user_id']).first()
+        if not customer or not user:
+            raise CommandError('Customer or user not found.')
+
+        if options['file']:
+            file = open(options['file'], 'rb')
+            rows = (map_row(record) for record in read_rows(file))
+        else:
+            file = None
+            rows = self.generate_rows(options['rows'])
+
+        importer = FRAImporter(customer, user, chunk_size=options['chunk_size'])
+        try:
+            with transaction.atomic(), CaptureQueriesContext(connection) as queries:
+                started = time.monotonic()
+                report = importer.run(rows)
+                elapsed = time.monotonic() - started
+                if not options['keep']:
+                    transaction.set_rollback(True)
+        finally:
+            if file:
+                file.close()
+
+        summary = report.as_dict()
+        summary['errors'] = report.error_messages(limit=10)
+        summary.update({
+            'seconds': round(elapsed, 2),
+            'rows_per_second': round(report.total / elapsed, 1) if elapsed else None,
+            'queries': len(queries),
+            'chunk_size': importer.chunk_size,
+            'kept': options['keep'],
+        })
+        self.stdout.write(json.dumps(summary, indent=2))
@@ -0,0 +1,62 @@
+import time
+import json
+from django.core.management.base import BaseCommand, CommandError
+from django.template.loader import render_to_string
+import pdfkit
+
+from infinity_fire_solutions.aws_helper import generate_presigned_url
+from infinity_fire_solutions.custom_form_validation import pdf_options
+from infinity_fire_solutions.image_renditions import ensure_renditions
+from requirement_management.models import Report, RequirementAsset, RequirementDefectDocument
+from requirement_management.serializers import RequirementAssetSerializer, RequirementDefectDocumentSerializer
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the PDF rendering of a report with the original photos and with their print renditions.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('report_id', type=int, help='The report to render.')
+        parser.add_argument('--runs', type=int, default=3, help='Renders per variant.')
+
+    def render(self, context, runs):
+        html_content = render_to_string('report_detail.html', context)
+        timings, size = [], 0
+        for _ in range(runs):
+            started = time.monotonic()
+            pdf = pdfkit.from_string(html_content, False, options=pdf_options)
+            timings.append(time.monotonic() - started)
+            size = len(pdf)
+        return {'seconds': [round(timing, 2) for timing in timings], 'best_seconds': round(min(timings), 2), 'pdf_bytes': size}
+
+    def handle(self, *args, **options):
+        report = Report.objects.select_related('requirement_id').filter(pk=options['report_id']).first()
+        if not report:
+            raise CommandError('Report not found.')
+
+        defects = report.defect_id.all()
+        images = RequirementAsset.objects.filter(requirement_id=report.requirement_id)
+        defect_images = RequirementDefectDocument.objects.filter(defect_id__in=defects)
+        ensure_renditions(RequirementAsset, images)
+        ensure_renditions(RequirementDefectDocument, defect_images)
+
+        context = {
+            'requirement_instance': report.requirement_id,
+            'requirement_defects': defects,
+            'requirement_images': RequirementAssetSerializer(images, many=True).data,
+            'requirement_defect_images': RequirementDefectDocumentSerializer(defect_images, many=True).data,
+            'comment': report.comments,
+            'signature_data_url': generate_presigned_url(report.signature_path) if report.signature_path else '',
+        }
+        renditions = self.render(context, options['runs'])
+
+        # The same context with the original photos in place of the print renditions.
+        for image in context['requirement_images'] + context['requirement_defect_images']:
+            image['document_path']['print_url'] = image['document_path']['url']
+        originals = self.render(context, options['runs'])
+
+        self.stdout.write(json.dumps({
+            'report': report.id,
+            'images': len(context['requirement_images']) + len(context['requirement_defect_images']),
+            'originals': originals,
+            'print_renditions': renditions,
+        }, indent=2))
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.3 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('requirement_management', '0048_alter_quotation_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quotation',
+            name='pdf_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pending'), ('rendering', 'Rendering'), ('completed', 'Completed'), ('failed', 'Failed')], max_length=30, null=True),
+        ),
+        migrations.AddField(
+            model_name='report',
+            name='pdf_status',
+            field=models.CharField(blank=True, choices=[('pending', 'Pending'), ('rendering', 'Rendering'), ('completed', 'Completed'), ('failed', 'Failed')], max_length=30, null=True),
+        ),
+    ]
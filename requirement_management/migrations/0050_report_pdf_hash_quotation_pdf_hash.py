@@ -0,0 +1,23 @@
+# Generated by Django 4.2.3 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('requirement_management', '0049_report_pdf_status_quotation_pdf_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quotation',
+            name='pdf_hash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='report',
+            name='pdf_hash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
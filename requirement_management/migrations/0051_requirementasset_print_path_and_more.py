@@ -0,0 +1,33 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('requirement_management', '0050_report_pdf_hash_quotation_pdf_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='requirementasset',
+            name='print_path',
+            field=models.CharField(blank=True, max_length=256, null=True),
+        ),
+        migrations.AddField(
+            model_name='requirementasset',
+            name='thumbnail_path',
+            field=models.CharField(blank=True, max_length=256, null=True),
+        ),
+        migrations.AddField(
+            model_name='requirementdefectdocument',
+            name='print_path',
+            field=models.CharField(blank=True, max_length=256, null=True),
+        ),
+        migrations.AddField(
+            model_name='requirementdefectdocument',
+            name='thumbnail_path',
+            field=models.CharField(blank=True, max_length=256, null=True),
+        ),
+    ]
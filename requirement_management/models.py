@@ -8,6 +8,7 @@ from stock_management.models import Category
 from customer_management.models import SiteAddress
 from django.utils import timezone
 from datetime import datetime,time
+from common_app.models import PDF_JOB_STATUS_CHOICES
 
 
 
@@ -131,11 +132,15 @@ class RequirementAsset(models.Model):
     Attributes:
         requirement_id (ForeignKey): The requirement associated with the asset.
         document_path (CharField): Path to the asset document.
+        thumbnail_path (CharField): Path to the thumbnail of an image.
+        print_path (CharField): Path to the downscaled copy of an image used in PDFs.
         created_at (DateTimeField): Date and time when the asset was created.
         updated_at (DateTimeField): Date and time when the asset was last updated.
     """
     requirement_id = models.ForeignKey(Requirement, on_delete=models.CASCADE)
     document_path = models.CharField(max_length=256)
+    thumbnail_path = models.CharField(max_length=256, null=True, blank=True)
+    print_path = models.CharField(max_length=256, null=True, blank=True)
     create_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -182,12 +187,16 @@ class RequirementDefectDocument(models.Model):
         requirement_id (ForeignKey): The requirement associated with the defect document.
         defect_id (ForeignKey): The defect associated with the defect document.
         document_path (CharField): Path to the defect document.
+        thumbnail_path (CharField): Path to the thumbnail of an image.
+        print_path (CharField): Path to the downscaled copy of an image used in PDFs.
         created_at (DateTimeField): Date and time when the defect document was created.
         updated_at (DateTimeField): Date and time when the defect document was last updated.
     """
     requirement_id = models.ForeignKey(Requirement, on_delete=models.CASCADE)
     defect_id = models.ForeignKey(RequirementDefect, on_delete=models.CASCADE)
     document_path = models.CharField(max_length=256)
+    thumbnail_path = models.CharField(max_length=256, null=True, blank=True)
+    print_path = models.CharField(max_length=256, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -206,6 +215,8 @@ class Report(models.Model):
         defect_id (ManyToManyField): The defects associated with the report.
         signature_path (CharField): Path to the report's signature.
         pdf_path (CharField): Path to the report's PDF.
+        pdf_status (CharField): Status of the PDF rendering job (choices defined in PDF_JOB_STATUS_CHOICES).
+        pdf_hash (CharField): Content hash of the HTML the current PDF was rendered from.
         comments (RichTextField): Comments for the report.
         status (CharField): Status of the report (choices defined in STATUS_CHOICES).
         created_at (DateTimeField): Date and time when the report was created.
@@ -216,6 +227,8 @@ class Report(models.Model):
     defect_id = models.ManyToManyField(RequirementDefect, blank=True)
     signature_path = models.CharField(max_length=500,null=True)
     pdf_path = models.CharField(max_length=500,null=True)
+    pdf_status = models.CharField(max_length=30, choices=PDF_JOB_STATUS_CHOICES, null=True, blank=True)
+    pdf_hash = models.CharField(max_length=64, null=True, blank=True)
     comments = RichTextField(blank=True, null=True)
     status = models.CharField(max_length=30, choices=STATUS_CHOICES, default='draft')
     created_at = models.DateTimeField(auto_now_add=True)
@@ -351,6 +364,8 @@ class Quotation(models.Model):
     status = models.CharField(max_length=30, choices=QUOTATION_STATUS_CHOICES, default='draft')
     submitted_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
     pdf_path = models.CharField(max_length=500,null=True, blank=True)
+    pdf_status = models.CharField(max_length=30, choices=PDF_JOB_STATUS_CHOICES, null=True, blank=True)
+    pdf_hash = models.CharField(max_length=64, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -1,5 +1,7 @@
 from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.permission import *
+from infinity_fire_solutions.pagination import PaginatedListMixin
+from common_app.search import search_queryset
 from infinity_fire_solutions.response_schemas import create_api_response, render_html_response
 from rest_framework import generics, status
 from rest_framework.renderers import TemplateHTMLRenderer, JSONRenderer
@@ -16,11 +18,12 @@ from datetime import datetime
 from infinity_fire_solutions.email import *
 import uuid
 from work_planning_management.models import Job
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from common_app.models import PDF_JOB_ACTIVE_STATUSES
+from common_app.pdf_jobs import queue_pdf_render, retry_pdf_render
 from requirement_management.serializers import RequirementReportListSerializer, RequirementQuotationListSerializer
 
 
-class QuotationCustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
+class QuotationCustomerListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     serializer_class = QuotationCustomerSerializer
     renderer_classes = [TemplateHTMLRenderer,JSONRenderer]
     filter_backends = [filters.SearchFilter]
@@ -43,34 +46,10 @@ class QuotationCustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
         return queryset
     
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'customer', self.request.query_params.get('q', ''))
 
     def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(self.get_searched_queryset(base_queryset), items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
+        return super().get_paginated_queryset(self.get_searched_queryset(base_queryset))
 
     def get(self, request, *args, **kwargs):
         authenticated_user, data_access_value = check_authentication_and_permissions(
@@ -116,7 +95,7 @@ class QuotationCustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
                                     message="Data retrieved",
                                     data=serializer.data)
 
-class QuotationCustomerReportListView(CustomAuthenticationMixin,generics.ListAPIView):
+class QuotationCustomerReportListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     
     serializer_class = RequirementReportListSerializer
     renderer_classes = [TemplateHTMLRenderer,JSONRenderer]
@@ -125,22 +104,6 @@ class QuotationCustomerReportListView(CustomAuthenticationMixin,generics.ListAPI
     template_name = 'quote/quotation_customer_report_list.html'
     ordering_fields = ['created_at'] 
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
-    
     def get_searched_queryset(self, queryset):
         search_params = self.request.query_params.get('q', '')
         if search_params:
@@ -435,13 +398,14 @@ class QuotationAddView(CustomAuthenticationMixin,generics.ListAPIView):
                     'requirement_instance':requirement_instance,
                     'queryset':quotation_instance
                 }
-                pdf_file = save_pdf_from_html(context=context, file_name=unique_pdf_filename, content_html = 'quote/quotation_pdf.html')
                 pdf_path = f'requirement/{requirement_instance.id}/quotation/pdf'
-                
-                upload_signature_to_s3(unique_pdf_filename, pdf_file, pdf_path)
-                
-                quotation_instance.pdf_path = f'requirement/{requirement_instance.id}/quotation/pdf/{unique_pdf_filename}'
-                quotation_instance.save()
+
+                # The PDF is rendered and uploaded by the PDF worker.
+                queue_pdf_render(
+                    quotation_instance, 'quotation', 'quote/quotation_pdf.html', context, pdf_path, unique_pdf_filename,
+                    user=request.user,
+                )
+                quotation_instance.save(update_fields=['submitted_at'])
 
             messages.success(request, message)
             return JsonResponse({'success': True,  'status':status.HTTP_204_NO_CONTENT})  # Return success response
@@ -514,12 +478,27 @@ class QuotationSendForApprovalView(CustomAuthenticationMixin, generics.GenericAP
             messages.error(request, 'No Customer email found, please add a email in Customer General Information.')
             return redirect(reverse('view_customer_quotation_list', kwargs={'customer_id': customer.id}))
 
+        if instance.pdf_status in PDF_JOB_ACTIVE_STATUSES:
+            messages.warning(request, 'The quotation PDF is still being generated, please try again in a moment.')
+            return redirect(reverse('view_customer_quotation_list', kwargs={'customer_id': customer.id}))
+
+        # A failed render leaves no PDF, or the one of a previous version: never send it.
+        if instance.pdf_status == 'failed':
+            if retry_pdf_render(instance, 'quotation'):
+                messages.warning(request, 'The quotation PDF could not be generated and is being generated again, please try again in a moment.')
+            else:
+                messages.error(request, 'The quotation PDF could not be generated, please save the quotation again.')
+            return redirect(reverse('view_customer_quotation_list', kwargs={'customer_id': customer.id}))
+
+        if not instance.pdf_path:
+            messages.error(request, 'The quotation has no PDF yet, please save the quotation again.')
+            return redirect(reverse('view_customer_quotation_list', kwargs={'customer_id': customer.id}))
+
         context = {
             'user': customer,
         }
 
         email = Email()
-        attachment_path = generate_presigned_url(instance.pdf_path)
 
         try:
             email.send_mail(
@@ -527,7 +506,7 @@ class QuotationSendForApprovalView(CustomAuthenticationMixin, generics.GenericAP
                 'email_templates/quotation_client.html', 
                 context, 
                 "Quotation Submission for Review", 
-                attachment_path
+                instance.pdf_path
             )
         except Exception as e:
             pass
@@ -605,7 +584,7 @@ class QuotationApproveView(CustomAuthenticationMixin, generics.GenericAPIView):
         return redirect(reverse('view_customer_quotation_list', kwargs={'customer_id': customer.id}))
 
 
-class CustomerQuotationListView(CustomAuthenticationMixin,generics.ListAPIView):
+class CustomerQuotationListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     
     renderer_classes = [TemplateHTMLRenderer,JSONRenderer]
     filter_backends = [filters.SearchFilter]
@@ -614,35 +593,8 @@ class CustomerQuotationListView(CustomAuthenticationMixin,generics.ListAPIView):
     ordering_fields = ['created_at'] 
     serializer_class = RequirementQuotationListSerializer
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
-    
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'quotation', self.request.query_params.get('q', ''))
 
     def get_filtered_queryset(self, queryset):
         # Get the filtering parameters from the request's query parameters
@@ -0,0 +1,58 @@
+from django.template.loader import render_to_string
+from infinity_fire_solutions.aws_helper import generate_presigned_url
+from infinity_fire_solutions.image_renditions import ensure_renditions
+from .models import RequirementAsset, RequirementDefectDocument
+from .serializers import RequirementAssetSerializer, RequirementDefectDocumentSerializer
+
+
+def _report_photos(report, defects):
+    return (
+        RequirementAsset.objects.filter(requirement_id=report.requirement_id_id),
+        RequirementDefectDocument.objects.filter(defect_id__in=defects),
+    )
+
+
+def report_pdf_context(report):
+    """
+    Get the context of the PDF template of a submitted report.
+
+    Photos embed their print rendition, or the original while it has none; the PDF worker
+    makes the missing renditions, see render_report_with_renditions.
+
+    Args:
+        report (Report): The report.
+
+    Returns:
+        dict: The template context.
+    """
+    defects = report.defect_id.all()
+    images, defect_images = _report_photos(report, defects)
+    return {
+        'requirement_instance': report.requirement_id,
+        'requirement_defects': defects,
+        'requirement_images': RequirementAssetSerializer(images, many=True).data,
+        'requirement_defect_images': RequirementDefectDocumentSerializer(defect_images, many=True).data,
+        'comment': report.comments,
+        'signature_data_url': generate_presigned_url(report.signature_path) if report.signature_path else "",
+    }
+
+
+def render_report_with_renditions(report, template_name):
+    """
+    Make the missing renditions of the photos of a report and render its PDF template again.
+
+    Called by the PDF worker before it renders the PDF, so the originals are downloaded and
+    re-encoded there rather than in the request that submitted the report.
+
+    Args:
+        report (Report): The report.
+        template_name (str): The PDF template.
+
+    Returns:
+        str: The HTML embedding the new renditions, None if no rendition was made.
+    """
+    images, defect_images = _report_photos(report, report.defect_id.all())
+    made = ensure_renditions(RequirementAsset, images) + ensure_renditions(RequirementDefectDocument, defect_images)
+    if not made:
+        return None
+    return render_to_string(template_name, report_pdf_context(report))
@@ -5,7 +5,7 @@ from infinity_fire_solutions.response_schemas import create_api_response, conver
 from rest_framework import generics, status
 from rest_framework.renderers import TemplateHTMLRenderer, JSONRenderer
 from .serializers import *
-from .models import Requirement, RequirementDefect,RequirementDefectDocument, RequirementAsset
+from .models import Requirement, RequirementDefect,RequirementDefectDocument
 from django.contrib import messages
 from rest_framework.response import Response
 from rest_framework import filters
@@ -15,9 +15,8 @@ from django.http import JsonResponse
 from .views import filter_requirements,requirement_image
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 import ast
-import os
-import pdfkit
-from django.template.loader import render_to_string
+from common_app.pdf_jobs import queue_pdf_render
+from .report_pdf import report_pdf_context
 from infinity_fire_solutions.email import *
 
 
@@ -236,13 +235,11 @@ class ReportEdit(CustomAuthenticationMixin,generics.ListAPIView):
         search_fields (list): The fields used for searching.
         template_name (str): The name of the HTML template used for rendering the response.
         ordering_fields (list): The fields used for ordering the queryset.
-        pdf_options (dict): Options for generating the PDF from HTML content.
 
     Methods:
-        save_pdf_from_html: Save a PDF file from HTML content.
         get_queryset: Get the filtered queryset for requirements based on the authenticated user.
         get: Handle GET requests for editing a requirement report and rendering HTML responses.
-        post: Handle POST requests for updating a requirement report, generating a PDF, and sending emails.
+        post: Handle POST requests for updating a requirement report and queuing its PDF and email.
     """
 
     
@@ -252,41 +249,6 @@ class ReportEdit(CustomAuthenticationMixin,generics.ListAPIView):
     search_fields = ['customer_id__first_name', 'customer_id__last_name']
     template_name = 'report_edit.html'
     ordering_fields = ['created_at'] 
-    pdf_options = {
-        'page-size': 'A4',  # You can change this to 'A4' or custom size
-        'margin-top': '10mm',
-        'margin-right': '0mm',
-        'margin-bottom': '0mm',
-        'margin-left': '0mm',
-    }
-    def save_pdf_from_html(self, context, file_name):
-        """
-        Save the PDF file from the HTML content.
-        Args:
-            context (dict): Context data for rendering the HTML template.
-            file_name (str): Name of the PDF file.
-        Returns:
-            Output file path or None.
-        """
-        output_file = None
-        local_folder = '/tmp'
-
-        if local_folder:
-            try:
-                os.makedirs(local_folder, exist_ok=True)
-                output_file = os.path.join(local_folder, file_name)
-
-                # get the html text from the tmplate
-                html_content = render_to_string('report_detail.html', context)
-
-                # create the PDF file for the invoice
-                pdfkit.from_string(html_content, output_file, options=self.pdf_options)
-                
-            except Exception as e:
-                # Handle any exceptions that occur during PDF generation
-                print("error")
-
-        return output_file
     def get_queryset(self):
         """
         Get the filtered queryset for requirements based on the authenticated user.
@@ -355,48 +317,18 @@ class ReportEdit(CustomAuthenticationMixin,generics.ListAPIView):
 
         if report_instance:
             if report_instance.status == "submit":
-                all_report_defects = report_instance.defect_id.all()
-                
-                requirement_document_images = RequirementAsset.objects.filter(requirement_id=report_instance.requirement_id.id)
-                requirement_document_images_serializer = RequirementAssetSerializer(requirement_document_images, many=True)
+                # Photos without print renditions yet get them in the PDF worker.
+                context = report_pdf_context(report_instance)
 
-                requirement_defect_images = RequirementDefectDocument.objects.filter(defect_id__in=all_report_defects)
-                requirement_defect_images_serializer = RequirementDefectDocumentSerializer(requirement_defect_images, many=True)
-
-                
-                if report_instance.signature_path:
-                    signature_data_url = generate_presigned_url(report_instance.signature_path)
-                else:
-                    signature_data_url = ""
-                    
-                context = {
-                    'requirement_instance': report_instance.requirement_id,
-                    'requirement_defects': all_report_defects,
-                    'requirement_images': requirement_document_images_serializer.data,
-                    'requirement_defect_images': requirement_defect_images_serializer.data,
-                    'comment': report_instance.comments,
-                    'signature_data_url':signature_data_url,
-                }
-                    
                 unique_pdf_filename = f"{str(uuid.uuid4())}_report_{report_instance.id}.pdf"
-                
-                pdf_file = self.save_pdf_from_html(context=context, file_name=unique_pdf_filename)
                 pdf_path = f'requirement/{report_instance.requirement_id.id}/report/pdf'
-                
-                
-                
-                upload_signature_to_s3(unique_pdf_filename, pdf_file, pdf_path)
-                
-                report_instance.pdf_path = f'requirement/{report_instance.requirement_id.id}/report/pdf/{unique_pdf_filename}'
-                report_instance.save()
-                
-                # send email to QS
-                if report_instance.requirement_id.quantity_surveyor and report_instance.requirement_id.surveyor:
-                    context = {'user': report_instance.requirement_id.quantity_surveyor,'surveyor': report_instance.requirement_id.surveyor,'site_url': get_site_url(request) }
 
-                    email = Email()
-                    attachment_path = generate_presigned_url(report_instance.pdf_path)
-                    email.send_mail(report_instance.requirement_id.quantity_surveyor.email, 'email_templates/report.html', context, "Submission of Survey Report", attachment_path)
+                # The PDF is rendered by the PDF worker, which also emails the QS once it is uploaded.
+                queue_pdf_render(
+                    report_instance, 'report', 'report_detail.html', context, pdf_path, unique_pdf_filename,
+                    user=request.user, extra={'notify_quantity_surveyor': True, 'site_url': get_site_url(request)},
+                    make_renditions=True,
+                )
 
                 messages.success(request, "Your requirement report has been added successfully. ")
                 return create_api_response(status_code=status.HTTP_404_NOT_FOUND,
@@ -5,11 +5,13 @@ from rest_framework.fields import empty
 from .models import *
 from django.utils.html import strip_tags
 from authentication.models import User
-from customer_management.models import SiteAddress, POST_CODE_LIST
+from customer_management.models import SiteAddress
+from customer_management.post_codes import PostCodeField
 from customer_management.serializers import SiteAddressSerializer
 from infinity_fire_solutions.custom_form_validation import *
 from infinity_fire_solutions.validators import CustomFileValidator
 from infinity_fire_solutions.aws_helper import *
+from infinity_fire_solutions.image_renditions import upload_documents
 from django.db import transaction
 from django.core.exceptions import ValidationError
 from collections import OrderedDict
@@ -404,17 +406,12 @@ class RequirementAddSerializer(serializers.ModelSerializer):
         instance = Requirement.objects.create(**validated_data)
 
         if file_list and len(file_list) > 0:
-            for file in file_list:
-                unique_filename = f"{str(uuid.uuid4())}_{file.name}"
-                try:
-                    upload_file_to_s3(unique_filename, file, f'requirement/{instance.id}')
-                    file_path = f'requirement/{instance.id}/{unique_filename}'
-                    
-                    document = RequirementAsset.objects.create(requirement_id=instance, document_path=file_path)
-                
-                except Exception as e:
-                    # Handle the exception (e.g., log the error) and decide what to do next
-                    pass
+            # Upload the files and the renditions of the images concurrently; files that fail to upload are skipped.
+            documents = upload_documents(file_list, f'requirement/{instance.id}')
+            RequirementAsset.objects.bulk_create([
+                RequirementAsset(requirement_id=instance, **document)
+                for document in documents if document
+            ])
 
         return instance
     
@@ -439,18 +436,11 @@ class RequirementAddSerializer(serializers.ModelSerializer):
             instance.save()
             # Update associated documents if file_list is provided
             if file_list and len(file_list) > 0:
-                for file in file_list:
-                    try:
-                        unique_filename = f"{str(uuid.uuid4())}_{file.name}"
-                        upload_file_to_s3(unique_filename, file, f'requirement/{instance.id}')
-                        file_path = f'requirement/{instance.id}/{unique_filename}'
-
-                        RequirementAsset.objects.create(
-                            requirement_id=instance,
-                            document_path=file_path,
-                        )
-                    except Exception as e:
-                        print(f"Error uploading file {file.name}: {str(e)}")
+                documents = upload_documents(file_list, f'requirement/{instance.id}')
+                RequirementAsset.objects.bulk_create([
+                    RequirementAsset(requirement_id=instance, **document)
+                    for document in documents if document
+                ])
         
         return instance
    
@@ -637,6 +627,38 @@ class RequirementDefectAddSerializer(serializers.ModelSerializer):
     
 
     
+    def add_documents(self, instance, file_list):
+        """
+        Upload the documents of a defect, with the renditions of the images, and create their rows.
+
+        Args:
+            instance (RequirementDefect): The defect.
+            file_list (list): The uploaded files.
+
+        Raises:
+            serializers.ValidationError: If a file could not be uploaded; no row is created
+                then, and the caller's transaction rolls the defect back.
+        """
+        # Upload the files and the renditions of the images concurrently
+        documents = upload_documents(file_list, f'requirement/{instance.id}/defects')
+        failed = [file.name for file, document in zip(file_list, documents) if document is None]
+        if failed:
+            for document in documents:
+                if document:
+                    delete_file_from_s3(document['document_path'])
+            raise serializers.ValidationError({
+                'file_list': [f'"{name}" could not be uploaded, please try again.' for name in failed]
+            })
+
+        RequirementDefectDocument.objects.bulk_create([
+            RequirementDefectDocument(
+                requirement_id=instance.requirement_id,
+                defect_id=instance,
+                **document,
+            )
+            for document in documents
+        ])
+
     def create(self, validated_data):
         """
         Create a new Requirement Defect instance with associated documents.
@@ -649,25 +671,14 @@ class RequirementDefectAddSerializer(serializers.ModelSerializer):
         """
         # Pop the 'file_list' field from validated_data
         file_list = validated_data.pop('file_list', None)
-        # Create a new instance of Requirement with other fields from validated_data
-        instance = RequirementDefect.objects.create(**validated_data)
-
-        if file_list and len(file_list) > 0:
+        with transaction.atomic():
+            # Create a new instance of Requirement with other fields from validated_data
+            instance = RequirementDefect.objects.create(**validated_data)
 
-            for file in file_list:
-                # Generate a unique filename for each file
-                unique_filename = f"{str(uuid.uuid4())}_{file.name}"
-                upload_file_to_s3(unique_filename, file, f'requirement/{instance.id}/defects')
-                file_path = f'requirement/{instance.id}/defects/{unique_filename}'
-                
-                document = RequirementDefectDocument.objects.create(
-                requirement_id=instance.requirement_id,
-                defect_id = instance,
-                document_path=file_path,
-                )
-            
+            if file_list and len(file_list) > 0:
+                self.add_documents(instance, file_list)
 
-        instance.save()
+            instance.save()
         return instance
     
     def update(self, instance, validated_data):
@@ -691,17 +702,7 @@ class RequirementDefectAddSerializer(serializers.ModelSerializer):
 
             # Update associated documents if file_list is provided
             if file_list and len(file_list) > 0:
-                
-                for file in file_list:
-                    unique_filename = f"{str(uuid.uuid4())}_{file.name}"
-                    upload_file_to_s3(unique_filename, file, f'requirement/{instance.id}/defects')
-                    file_path = f'requirement/{instance.id}/defects/{unique_filename}'
-                
-                    RequirementDefectDocument.objects.create(
-                        requirement_id=instance.requirement_id,
-                        defect_id=instance,
-                        document_path=file_path,
-                    )
+                self.add_documents(instance, file_list)
         
         return instance
     
@@ -773,7 +774,12 @@ class RequirementAssetSerializer(serializers.Serializer):
 
         ret['requirement_id'] = {'id': instance.requirement_id.id, 'name': instance.requirement_id.__str__()}
 
-        ret['document_path'] = {'name': instance.document_path,  'url': generate_presigned_url(instance.document_path) }
+        ret['document_path'] = {
+            'name': instance.document_path,
+            'url': generate_presigned_url(instance.document_path),
+            # Downscaled copy for the report PDF, the original when there is none.
+            'print_url': generate_presigned_url(instance.print_path or instance.document_path),
+        }
         return ret
 
 class RequirementDefectDocumentSerializer(serializers.Serializer):
@@ -817,7 +823,12 @@ class RequirementDefectDocumentSerializer(serializers.Serializer):
         ret['requirement_id'] = {'id': instance.requirement_id.id, 'name': instance.requirement_id.__str__()}
         ret['defect_id'] = {'id': instance.defect_id.id, 'name': instance.defect_id.__str__()}
 
-        ret['document_path'] = {'name': instance.document_path,  'url': generate_presigned_url(instance.document_path) }
+        ret['document_path'] = {
+            'name': instance.document_path,
+            'url': generate_presigned_url(instance.document_path),
+            # Downscaled copy for the report PDF, the original when there is none.
+            'print_url': generate_presigned_url(instance.print_path or instance.document_path),
+        }
         return ret
 
 
@@ -1140,9 +1151,8 @@ class BulkRequirementAddSiteAddressSerializer(serializers.ModelSerializer):
     
     county = serializers.CharField()
     
-    post_code = serializers.ChoiceField(
+    post_code = PostCodeField(
         required = True,
-        choices=POST_CODE_LIST,
     )
     UPRN = serializers.CharField()
 
@@ -0,0 +1,143 @@
+import re
+from django.utils import timezone
+
+from infinity_fire_solutions.importers import ImportSink, decimal_error, html_text
+from requirement_management.models import SORCategory, SORItem, UNIT_CHOICES
+
+UNITS = frozenset(unit for unit, _ in UNIT_CHOICES)
+SOR_UPDATE_FIELDS = ['name', 'category_id', 'price', 'description', 'units', 'updated_at']
+
+
+class SORImporter(ImportSink):
+    """
+    Bulk import of a customer's SOR items.
+
+    Rows have 'name', 'reference_number', 'category_id', 'price', 'description' and
+    'units'; the price should be coerced with to_decimal. Categories are loaded once per
+    import and the existing SOR codes of every chunk are fetched with one IN query.
+
+    Args:
+        customer (User): The customer the SOR items belong to.
+        user (User): The user running the import.
+        category_lookup (str): SORCategory field the 'category_id' column refers to, 'name' or 'id'.
+        update_existing (bool): When True a row whose SOR code already exists for the customer
+            updates that item; when False any existing SOR code is rejected.
+        strict_names (bool): Apply the bulk upload name rules (at least 3 characters,
+            alphanumeric characters and spaces, not only digits).
+        chunk_size (int, optional): Rows validated and saved at a time.
+        all_or_nothing (bool): When True any rejected row rolls the whole import back.
+    """
+    key_field = 'reference_number'
+
+    def __init__(self, customer, user, category_lookup='name', update_existing=True, strict_names=True,
+                 chunk_size=None, all_or_nothing=True):
+        super().__init__(chunk_size, all_or_nothing)
+        self.customer = customer
+        self.user = user
+        self.category_lookup = category_lookup
+        self.update_existing = update_existing
+        self.strict_names = strict_names
+
+    def start(self, report):
+        self._seen_references = set()
+        self._categories = {
+            str(key): category_id
+            for key, category_id in SORCategory.objects.values_list(self.category_lookup, 'id')
+        }
+
+    def write_chunk(self, rows, report):
+        references = {row.get('reference_number') for _, row in rows if row.get('reference_number')}
+        if self.update_existing:
+            existing = {
+                item.reference_number: item
+                for item in SORItem.objects.filter(customer_id=self.customer, reference_number__in=references)
+            }
+        else:
+            existing = set(SORItem.objects.filter(reference_number__in=references).values_list('reference_number', flat=True))
+
+        new_items, updated_items = [], []
+        now = timezone.now()
+        for row_number, row in rows:
+            if not self._validate(row_number, row, existing, report):
+                continue
+
+            values = {
+                'name': row['name'],
+                'category_id_id': self._categories[str(row['category_id'])],
+                'price': row['price'],
+                'description': row['description'],
+                'units': row['units'],
+            }
+            item = existing.get(row['reference_number']) if self.update_existing else None
+            if item is not None:
+                for field, value in values.items():
+                    setattr(item, field, value)
+                item.updated_at = now
+                updated_items.append(item)
+            else:
+                new_items.append(SORItem(
+                    user_id=self.user, customer_id=self.customer, reference_number=row['reference_number'], **values
+                ))
+
+        if new_items:
+            SORItem.objects.bulk_create(new_items, batch_size=self.chunk_size)
+            report.created += len(new_items)
+        if updated_items:
+            SORItem.objects.bulk_update(updated_items, SOR_UPDATE_FIELDS, batch_size=self.chunk_size)
+            report.updated += len(updated_items)
+
+    def _validate(self, row_number, row, existing, report):
+        errors_before = len(report.errors)
+
+        def error(field, message):
+            self.error(report, row_number, row, field, message)
+
+        name = row.get('name', '')
+        if not name:
+            error('name', 'Name is required.')
+        elif len(name) > 225:
+            error('name', 'Name must not have more than 225 characters.')
+        elif self.strict_names:
+            if len(name) < 3:
+                error('name', 'Item Name must be at least 3 characters long.')
+            elif name.isdigit():
+                error('name', 'Item Name cannot consist of only integers.')
+            elif not re.match(r'^[a-zA-Z0-9\s]*$', name):
+                error('name', 'Item Name can only contain alphanumeric characters and spaces.')
+
+        reference_number = row.get('reference_number', '')
+        if not reference_number:
+            error('reference_number', 'Reference Number is required.')
+        elif len(reference_number) > 50:
+            error('reference_number', 'Reference Number must not have more than 50 characters.')
+        elif reference_number in self._seen_references:
+            error('reference_number', f"SOR code '{reference_number}' appears more than once in the file.")
+        elif not self.update_existing and reference_number in existing:
+            error('reference_number', 'This SOR code is already in Use.')
+
+        category = row.get('category_id', '')
+        if str(category) not in self._categories:
+            error('category_id', f"Category with {self.category_lookup} '{category}' does not exist.")
+
+        price = row.get('price', '')
+        if price == '':
+            error('price', 'Price is required.')
+        elif price <= 0:
+            error('price', 'Price cannot be negative or zero')
+        elif decimal_error(price):
+            error('price', decimal_error(price))
+
+        description = row.get('description', '')
+        if not html_text(description):
+            error('description', 'Description is required.')
+        elif len(description) > 1000:
+            error('description', 'Description must not have more than 1000 characters.')
+
+        if row.get('units') not in UNITS:
+            error('units', f"\"{row.get('units', '')}\" is not a valid choice for Units.")
+
+        if len(report.errors) > errors_before:
+            return False
+
+        self._seen_references.add(reference_number)
+        return True
@@ -13,9 +13,8 @@ from rest_framework.renderers import TemplateHTMLRenderer, JSONRenderer
 from django.core.serializers import serialize
 from drf_yasg.utils import swagger_auto_schema
 from infinity_fire_solutions.utils import docs_schema_response_new
-import csv 
 import chardet
-import pandas as pd
+from common_app.import_jobs import queue_import
 from datetime import datetime, time
 from django.utils import timezone
 from common_app.models import UpdateWindowConfiguration
@@ -582,58 +581,22 @@ class SORCSVView(CustomAuthenticationMixin, generics.CreateAPIView):
                     messages.error(request, 'Unsupported file format. Please upload a CSV, XLS, or XLSX file.')
                     return redirect(reverse('customer_sor_list', kwargs={'customer_id': customer_id}))
 
-                # Explicitly specify the encoding as ISO-8859-1 (latin1)
-                decoded_file = csv_file.read().decode('ISO-8859-1').splitlines()
-                print(decoded_file)
-                
-                if file_extension == 'csv':
-                    csv_reader = csv.DictReader(decoded_file)
-                else:
-                    # Use pandas to read Excel data
-                    xls = pd.ExcelFile(csv_file)
-                    df = xls.parse(xls.sheet_names[0])  # Assuming you want to read the first sheet
-                    csv_reader = df.to_dict(orient='records')
-
-                success = True  # Flag to track if the import was successful
-                for row in csv_reader:
-                    # Extract the date from the CSV row (you may need to format it properly)
-                    serializer_data = {
-                        'name': row.get('Name', ''),
-                        'reference_number': row.get('SOR code', ''),
-                        'category_id': row.get('Category',''),
-                        'description': row.get('Description', ''),
-                        'price': row.get('Price', ''),
-                        'units': row.get('Unit', ''),
-                        'file_list': [],  # Empty file_list since you want to pass null
-                    }
-                    serializer = SORSerializer(data=serializer_data,context={'request': request})
-                    print(serializer_data)
-
-                    if serializer.is_valid():
-                        serializer.validated_data['user_id'] = request.user 
-                        serializer.validated_data['customer_id'] = customer_data
-                        # print(serializer.data)
-                        serializer.save()  # Save the sor
-                        # Check if the SOR item was updated within the update window
-                        # update_window = UpdateWindowConfiguration.objects.filter(is_active=True).first()
-                        # if update_window and sor_item.updated_at >= update_window.start_date and sor_item.updated_at <= update_window.end_date:
-                        #     message = f"You have updated SOR on {sor_item.updated_at}."
-                        #     messages.success(request, message)
-                    else:
-                        success = False
-                         # Attach serializer errors to the error message
-                        error_message = "Failed to import file.Check the file again.. "
-                        messages.error(request, error_message)
-                        print(serializer.errors)
-
-                # Fetch the imported data and pass it to the template
-                if success:
-                    sor_data = SORItem.objects.filter(customer_id=customer_data.id)
-                    context = {
-                      ' sor_data': sor_data,
+                mapping = {
+                    'name': 'Name',
+                    'reference_number': 'SOR code',
+                    'category_id': 'Category',
+                    'description': 'Description',
+                    'price': 'Price',
+                    'units': 'Unit',
                 }
-                    messages.success(request,'SOR CSV file imported and data imported successfully.')
-            
+                # Valid rows are imported, invalid rows are reported back.
+                job = queue_import(
+                    request.user, csv_file, 'sor', mapping, coercions={'price': 'decimal'}, encoding='ISO-8859-1',
+                    customer_id=customer_data.id, category_lookup='id', update_existing=False,
+                    strict_names=False, all_or_nothing=False,
+                )
+                messages.success(request, 'The SOR file has been uploaded and is being imported.')
+                return redirect(f"{reverse('customer_sor_list', kwargs={'customer_id': customer_id})}?import_job={job.id}")
             else:
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         except ValidationError as e:
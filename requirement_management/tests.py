@@ -1,3 +1,46 @@
+from datetime import date, timedelta
 from django.test import TestCase
+from django.utils import timezone
 
-# Create your tests here.
+from authentication.models import User
+from .fra_import import FRAImporter
+from .models import Requirement
+
+
+class FRAImporterTests(TestCase):
+    """
+    Cells the spreadsheet typed as dates are imported as text in the text columns.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='surveyor@example.com', password='password', first_name='Surveyor', last_name='User',
+        )
+        cls.customer = User.objects.create_user(
+            email='customer@example.com', password='password', first_name='Customer', last_name='User',
+        )
+
+    def test_date_cells_in_text_columns(self):
+        due_date = (timezone.localdate() + timedelta(days=30)).strftime('%d/%m/%Y')
+        report = FRAImporter(self.customer, self.user).run([{
+            'RBNO': date(2024, 5, 1),
+            'action': 'Replace the fire door',
+            'description': 'Fire door',
+            'due_date': due_date,
+            'site_address': {
+                'site_name': date(2024, 5, 1),
+                'UPRN': '1000233369',
+                'address': '1 Test Street',
+                'country': 'United Kingdom',
+                'town': 'London',
+                'county': 'Greater London',
+                'post_code': 'SW1A',
+            },
+        }])
+
+        self.assertEqual(report.errors, [])
+        self.assertEqual(report.created, 1)
+        requirement = Requirement.objects.get(customer_id=self.customer)
+        self.assertEqual(requirement.RBNO, '2024-05-01')
+        self.assertEqual(requirement.site_address.site_name, '2024-05-01')
@@ -1,8 +1,10 @@
 from django.shortcuts import render, redirect
 from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.permission import *
+from infinity_fire_solutions.pagination import PaginatedListMixin
+from common_app.search import search_queryset
 from infinity_fire_solutions.response_schemas import create_api_response, convert_serializer_errors, render_html_response
-from rest_framework import generics, status
+from rest_framework import generics, serializers, status
 from rest_framework.renderers import TemplateHTMLRenderer, JSONRenderer
 from .serializers import *
 from .models import Requirement, RequirementDefect,RequirementDefectDocument, RequirementAsset
@@ -12,21 +14,17 @@ from rest_framework import filters
 from drf_yasg.utils import swagger_auto_schema
 from infinity_fire_solutions.utils import docs_schema_response_new
 from django.http import JsonResponse
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.core.paginator import Paginator
 import ast
-import os
-import pdfkit
-from django.template.loader import render_to_string
+from common_app.pdf_jobs import queue_pdf_render
+from .report_pdf import report_pdf_context
+from common_app.import_jobs import queue_import
 from infinity_fire_solutions.email import *
 from rest_framework.parsers import FileUploadParser
-import csv
 import chardet
-import pandas as pd
 from datetime import datetime, time
 from django.utils import timezone
-from io import BytesIO
 from rest_framework.request import Request
-from itertools import chain
 
 
 def get_customer_data(customer_id):
@@ -100,7 +98,10 @@ def requirement_image(requirement_instance):
     """
     document_paths = []
     
-    for document in RequirementAsset.objects.filter(requirement_id=requirement_instance):
+    documents = list(RequirementAsset.objects.filter(requirement_id=requirement_instance))
+    # Sign all the URLs at once, the signatures are cached and reused across pages.
+    urls = presign_many([path for document in documents for path in (document.document_path, document.thumbnail_path)])
+    for document in documents:
         extension = document.document_path.split('.')[-1].lower()
 
         # is_video = extension in ['mp4', 'avi', 'mov']  # Add more video extensions if needed
@@ -108,7 +109,8 @@ def requirement_image(requirement_instance):
         is_video = False
         is_image = extension in ['jpg', 'jpeg', 'png', 'gif']  # Add more image extensions if needed
         document_paths.append({
-            'presigned_url': generate_presigned_url(document.document_path),
+            'presigned_url': urls.get(document.document_path),
+            'thumbnail_url': urls.get(document.thumbnail_path or document.document_path),
             'filename': document.document_path,
             'id': document.id,
             'is_video': is_video,
@@ -187,7 +189,7 @@ def filter_requirements(data_access_value, user, customer=None, request=None):
                     queryset = queryset.filter(**{filter_mapping[filter_name]: filter_value.strip()})
     return queryset 
 
-class RequirementCustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
+class RequirementCustomerListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     """
     View for listing Requirement customers.
 
@@ -219,35 +221,9 @@ class RequirementCustomerListView(CustomAuthenticationMixin,generics.ListAPIView
         queryset = User.objects.filter(is_active=False,  roles__name='Customer').exclude(pk=self.request.user.id)
         return queryset
         
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
     
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'customer', self.request.query_params.get('q', ''))
 
     def get(self, request, *args, **kwargs):
         """
@@ -309,7 +285,7 @@ class RequirementCustomerListView(CustomAuthenticationMixin,generics.ListAPIView
                                     data=serializer.data)
 
 
-class RequirementListView(CustomAuthenticationMixin,generics.ListAPIView):
+class RequirementListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     """
     View to get the listing of all requirements.
     Supports both HTML and JSON response formats.
@@ -331,18 +307,7 @@ class RequirementListView(CustomAuthenticationMixin,generics.ListAPIView):
     }
 
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'requirement', self.request.query_params.get('q', ''))
     
     @swagger_auto_schema(operation_id='Requirement Listing', responses={**common_get_response})
     def get(self, request, *args, **kwargs):
@@ -374,9 +339,8 @@ class RequirementListView(CustomAuthenticationMixin,generics.ListAPIView):
 
             
             if request.accepted_renderer.format == 'html':
-                page_number = request.GET.get('page', 1)
                 context = {
-                    'requirements': Paginator(self.serializer_class(queryset, many=True).data, 20).get_page(page_number),
+                    'requirements': self.get_serialized_page(queryset, self.serializer_class),
                     'customer_id':customer_id,
                     # 'quantity_sureveyors': quantity_sureveyors,
                     'customer_data':customer_data,
@@ -510,47 +474,10 @@ class RequirementDetailView(CustomAuthenticationMixin, generics.RetrieveAPIView)
         renderer_classes (list): The renderer classes for HTML and JSON.
         template_name (str): The template name for HTML rendering.
         serializer_class (RequirementAddSerializer): The serializer class for Requirement objects.
-        pdf_options (dict): PDF generation options.
     """
     renderer_classes = [TemplateHTMLRenderer, JSONRenderer]
     template_name = 'requirement_detail.html'
     serializer_class = RequirementAddSerializer
-    pdf_options = {
-        'page-size': 'A4',  # You can change this to 'A4' or custom size
-        'margin-top': '10mm',
-        'margin-right': '0mm',
-        'margin-bottom': '0mm',
-        'margin-left': '0mm',
-    }
-    def save_pdf_from_html(self, context, file_name):
-        """
-        Save the PDF file from the HTML content.
-        Args:
-            context (dict): Context data for rendering the HTML template.
-            file_name (str): Name of the PDF file.
-        Returns:
-            Output file path or None.
-        """
-        output_file = None
-        local_folder = '/tmp'
-
-        if local_folder:
-            try:
-                os.makedirs(local_folder, exist_ok=True)
-                output_file = os.path.join(local_folder, file_name)
-
-                # get the html text from the tmplate
-                html_content = render_to_string('report_detail.html', context)
-
-                # create the PDF file for the invoice
-                pdfkit.from_string(html_content, output_file, options=self.pdf_options)
-                
-            except Exception as e:
-                # Handle any exceptions that occur during PDF generation
-                print("error", f'{str(e)}')
-
-        return output_file
-    
     def get_queryset(self, data_access_value):
         """
         Get the queryset for listing Requirement items.
@@ -740,46 +667,20 @@ class RequirementDetailView(CustomAuthenticationMixin, generics.RetrieveAPIView)
                 instance.save()
 
 
-                all_report_defects = report.defect_id.all()
-            
-                requirement_document_images = RequirementAsset.objects.filter(requirement_id=instance.id)
-                requirement_document_images_serializer = RequirementAssetSerializer(requirement_document_images, many=True)
+                # Photos without print renditions yet get them in the PDF worker.
+                context = report_pdf_context(report)
 
-                requirement_defect_images = RequirementDefectDocument.objects.filter(defect_id__in=all_report_defects)
-                requirement_defect_images_serializer = RequirementDefectDocumentSerializer(requirement_defect_images, many=True)
-
-                
-                if report.signature_path:
-                    signature_data_url = generate_presigned_url(report.signature_path)
-                else:
-                    signature_data_url = ""
-                    
-                context = {
-                    'requirement_instance': instance,
-                    'requirement_defects': all_report_defects,
-                    'requirement_images': requirement_document_images_serializer.data,
-                    'requirement_defect_images': requirement_defect_images_serializer.data,
-                    'comment': report.comments,
-                    'signature_data_url': signature_data_url,
-                }
-                
                 unique_pdf_filename = f"{str(uuid.uuid4())}_report_{report.id}.pdf"
                 
                 try:
-                    pdf_file = self.save_pdf_from_html(context=context, file_name=unique_pdf_filename)
                     pdf_path = f'requirement/{instance.id}/report/pdf'
-                    
-                    upload_signature_to_s3(unique_pdf_filename, pdf_file, pdf_path)
-                    report.pdf_path = f'requirement/{instance.id}/report/pdf/{unique_pdf_filename}'
-                    report.save()
-                    # send email to QS
-                    if instance.quantity_surveyor and instance.surveyor:
-                        context = {'user': instance.quantity_surveyor, 'surveyor': instance.surveyor, 'site_url': get_site_url(request)}
-
-                        email = Email()
-                        attachment_path = generate_presigned_url(report.pdf_path)
-                        email.send_mail(instance.quantity_surveyor.email, 'email_templates/report.html', context,
-                                        "Submission of Survey Report", attachment_path)
+
+                    # The PDF is rendered by the PDF worker, which also emails the QS once it is uploaded.
+                    queue_pdf_render(
+                        report, 'report', 'report_detail.html', context, pdf_path, unique_pdf_filename,
+                        user=request.user, extra={'notify_quantity_surveyor': True, 'site_url': get_site_url(request)},
+                        make_renditions=True,
+                    )
 
                 except Exception as e:
                     pass
@@ -903,7 +804,8 @@ class RequirementUpdateView(CustomAuthenticationMixin, generics.UpdateAPIView):
             
             if not any(file_list):
                 data = data.copy()      # make a mutable copy of data before performing delete.
-                del data['file_list']
+                # Files uploaded straight to S3 are not sent with the form at all.
+                data.pop('file_list', None)
             
             serializer_data = request.data if any(file_list) else data
             # serializer_data['RBNO'] = instance.RBNO
@@ -1113,11 +1015,21 @@ class RequirementDefectView(CustomAuthenticationMixin, generics.CreateAPIView):
         
         
         if serializer.is_valid():
-            if  not defect_instance:
-                serializer.validated_data['requirement_id'] = requirement_instance
-                serializer.save()
-            else:
-                serializer.update(defect_instance, validated_data=serializer.validated_data)
+            try:
+                if  not defect_instance:
+                    serializer.validated_data['requirement_id'] = requirement_instance
+                    serializer.save()
+                else:
+                    serializer.update(defect_instance, validated_data=serializer.validated_data)
+            except serializers.ValidationError as e:
+                # A document could not be uploaded to S3, nothing was saved.
+                error_message = ' '.join(e.detail.get('file_list', [])) or str(e.detail)
+                if request.accepted_renderer.format == 'html':
+                    messages.error(request, error_message)
+                    return redirect(request.get_full_path())
+                return create_api_response(status_code=status.HTTP_400_BAD_REQUEST,
+                                    message=error_message,
+                                    data=convert_serializer_errors(e.detail))
 
             if request.accepted_renderer.format == 'html':
                 messages.success(request, message)
@@ -1195,14 +1107,18 @@ class RequirementDefectDetailView(CustomAuthenticationMixin, generics.CreateAPIV
         document_paths = []
         
         defect_instance = self.get_queryset().first()
-        for document in RequirementDefectDocument.objects.filter(defect_id=defect_instance):
+        documents = list(RequirementDefectDocument.objects.filter(defect_id=defect_instance))
+        # Sign all the URLs at once, the signatures are cached and reused across pages.
+        urls = presign_many([path for document in documents for path in (document.document_path, document.thumbnail_path)])
+        for document in documents:
                 extension = document.document_path.split('.')[-1].lower()
 
                 is_video = extension in ['mp4', 'avi', 'mov']  # Add more video extensions if needed
                 is_image = extension in ['jpg', 'jpeg', 'png', 'gif']  # Add more image extensions if needed
                 
                 document_paths.append({
-                    'presigned_url': generate_presigned_url(document.document_path),
+                    'presigned_url': urls.get(document.document_path),
+                    'thumbnail_url': urls.get(document.thumbnail_path or document.document_path),
                     'filename': document.document_path,
                     'id': document.id,
                     'is_video': is_video,
@@ -1505,69 +1421,14 @@ class RequirementCSVView(CustomAuthenticationMixin, generics.CreateAPIView):
                 if file_extension not in allowed_formats:
                     messages.error(request, 'Unsupported file format. Please upload a CSV, XLS, or XLSX file.')
                     return redirect(reverse('customer_requirement_list', kwargs={'customer_id': customer_id}))
-                # Explicitly specify the encoding as ISO-8859-1 (latin1)
-                decoded_file = csv_file.read().decode('ISO-8859-1').splitlines()
-                # print(decoded_file)
-                if file_extension == 'csv':
-                    csv_reader = csv.DictReader(decoded_file)
-                else:
-                    # Use pandas to read Excel data
-                    xls = pd.ExcelFile(csv_file)
-                    df = xls.parse(xls.sheet_names[0])  # Assuming you want to read the first sheet
-                    csv_reader = df.to_dict(orient='records')
-                success = True  # Flag to track if the import was successful
-                existing_rbno_set = set()  # To store existing Job Number values encountered in the file
-                existing_uprn_set = set()  # To store existing UPRN values encountered in the file
-                for row in csv_reader:
-                    # Extract the date from the CSV row (you may need to format it properly)
-                    csv_date = row.get('date', None)
-                    rbno = row.get('RBNO', '')
-                    uprn = row.get('UPRN', '')
-                    # Check if the Job Number already exists in the database
-                    if rbno and Requirement.objects.filter(RBNO=rbno).exists():
-                        messages.error(request, f"Job Number '{rbno}' already exists.")
-                        success = False
-                        continue
-                    # Check if the UPRN already exists in the database
-                    if uprn and Requirement.objects.filter(UPRN=uprn).exists():
-                        messages.error(request, f"UPRN '{uprn}' already exists.")
-                        success = False
-                        continue
-                    serializer_data = {
-                        'action': row.get('action', ''),
-                        'RBNO': rbno,
-                        'UPRN': uprn,
-                        'description': row.get('description', ''),
-                        'site_address': row.get('site_address', ''),
-                        'due_date':row.get('due_date'),
-                        'file_list': [],  # Empty file_list since you want to pass null
-                    }
-                    # Retrieve the customer's site address using the related name
-                    customer_site_address = SiteAddress.objects.filter(user_id=customer_data.id, id=serializer_data['site_address']).first()
-                    # Check if the customer's site address matches the one in the CSV
-                    if not customer_site_address:
-                        messages.error(request, "Invalid site address. It does not match the customer's site address.")
-                        success = False
-                        continue
-                    serializer = RequirementAddSerializer(data=serializer_data,context={'request': request})
-                    print(serializer_data)
-                    if serializer.is_valid():
-                        serializer.validated_data['user_id'] = request.user
-                        serializer.validated_data['customer_id'] = customer_data
-                        # print(serializer.data)
-                        requirement = serializer.save()
-                        print(requirement) # Save the requirement
-                        requirement.update_created_at(csv_date)
-                        print(requirement)
-                    else:
-                        success = False
-                # Fetch the imported data and pass it to the template
-                if success:
-                    requirements = Requirement.objects.filter(customer_id=customer_data.id)
-                    context = {
-                        'requirements': requirements,
-                    }
-                    messages.success(request,'FRA CSV file imported and data imported successfully.')
+                mapping = {field: field for field in ['action', 'RBNO', 'UPRN', 'description', 'site_address', 'due_date', 'date']}
+                # Valid rows are imported, invalid rows are reported back.
+                job = queue_import(
+                    request.user, csv_file, 'fra', mapping, encoding='ISO-8859-1',
+                    customer_id=customer_data.id, all_or_nothing=False,
+                )
+                messages.success(request, 'The FRA file has been uploaded and is being imported.')
+                return redirect(f"{reverse('customer_requirement_list', kwargs={'customer_id': customer_id})}?import_job={job.id}")
             else:
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         except ValidationError as e:
@@ -1638,66 +1499,7 @@ class BulkImportRequirementView(CustomAuthenticationMixin, generics.CreateAPIVie
     default_site_address_fieldset = [
         'site_name', 'UPRN','address', 'country', 'town', 'county', 'post_code'
     ]
-    EXCEL = ['xlsx', 'xls', 'ods']
-    CSV = ['csv',]
-
-    # File operation Functions ----------------------------------------------
-    def get_file_ext(self, file_name:str) -> str:
-        """
-        Get the file extension for a given file name.
-
-        Args:
-            file_name (str): The name of the file.
-
-        Returns:
-            str: The file extension in lowercase.
-        """
-
-        ext = file_name.split('.')[-1].lower()
-
-        return ext
-
-    # Excel File Supporter Functions ---------------------------------------------
-    def get_excel_engine(self, file_ext: str) -> str or None:
-        """
-        Get the engine to use for reading an Excel file based on its extension.
-
-        Args:
-            file_ext (str): The file extension in lowercase.
 
-        Returns:
-            str or None: The engine to use, or None if the file is not an Excel file.
-        """
-
-        engines = {'xlsx': 'openpyxl', 'xls': 'xlrd', 'ods': 'odf'}
-        return  engines[file_ext]
-
-    def read_file_to_df(self, file) -> pd.DataFrame:
-        """
-        Read a file from an in-memory upload and convert it into a DataFrame.
-
-        Parameters:
-        - file (InMemoryUploadedFile): The in-memory uploaded file.
-
-        Returns:
-        - pd.DataFrame or None: The DataFrame containing the data from the file, or None if an error occurs.
-        """
-        ext = self.get_file_ext(file.name)
-
-        # Convert the in-memory file to a BytesIO object
-        content = BytesIO(file.read())
-
-        if ext in self.EXCEL:
-            engine = self.get_excel_engine(ext)
-            data_frame = pd.read_excel(content, engine=engine)
-            return data_frame
-        
-        if ext in self.CSV:
-            data_frame = pd.read_csv(content)
-            return data_frame
-
-        raise ValueError('The file type is not supported.')
-    
     def post(self, request, *args, **kwargs):
         customer_id = kwargs.get('customer_id', None)
         customer_data = User.objects.filter(id=customer_id).first()
@@ -1725,33 +1527,25 @@ class BulkImportRequirementView(CustomAuthenticationMixin, generics.CreateAPIVie
             messages.error(request, 'Please select correct headers to upload bulk item file')
             return redirect(reverse('customer_requirement_list', kwargs={'customer_id': kwargs['customer_id']}))
         
-        df = self.read_file_to_df(request.FILES.get('excel_file'))
-
-        items_data_list = []
-        for index, row in df.iterrows():
-            items_data = {}
-            site_address_data = {}
-            for key, value in mapping_dict.items():
-                if key in self.default_site_address_fieldset:
-                    site_address_data[key] = row[value]
-                else:
-                    items_data[key] = row[value]
+        excel_file = request.FILES.get('excel_file')
+        if not excel_file:
+            messages.error(request, "Please select a file to import")
+            return redirect(reverse('customer_requirement_list', kwargs={'customer_id': kwargs['customer_id']}))
 
-            items_data['site_address'] = site_address_data
-            items_data_list.append(items_data)
-        
-        serializer = self.serializer_class(data=items_data_list, many=True, context={'request': request, 'customer': customer_data})
-        if serializer.is_valid():
-            serializer.save(customer_id=customer_data, user_id=request.user)
-            messages.success(request, 'Bulk FRA uploaded successfully.')
-        else:
-            errors = [convert_serializer_errors(errors) for errors in serializer.errors]
-            flat_error_messages_set = set(chain.from_iterable(map(dict.values, errors)))
-            flat_error_messages_set = list(flat_error_messages_set)
+        # Site address columns are nested under 'site_address' for the importer.
+        mapping = {
+            f'site_address.{key}' if key in self.default_site_address_fieldset else key: value
+            for key, value in mapping_dict.items()
+        }
 
-            messages.error(request, f'{", ".join(flat_error_messages_set)}') 
-    
-        return redirect(reverse('customer_requirement_list', kwargs={'customer_id': kwargs['customer_id']}))
+        try:
+            job = queue_import(request.user, excel_file, 'fra', mapping, customer_id=customer_data.id)
+        except ValueError as e:
+            messages.error(request, str(e))
+            return redirect(reverse('customer_requirement_list', kwargs={'customer_id': kwargs['customer_id']}))
+
+        messages.success(request, 'The FRA file has been uploaded and is being imported.')
+        return redirect(f"{reverse('customer_requirement_list', kwargs={'customer_id': kwargs['customer_id']})}?import_job={job.id}")
 
 class RequirementSurveyorCalendarView(CustomAuthenticationMixin, generics.ListAPIView):
     """
@@ -1811,7 +1605,7 @@ class RequirementSurveyorCalendarView(CustomAuthenticationMixin, generics.ListAP
                 data=serializer.data
             )
 
-class RequirementSurvyeCustomerListView(CustomAuthenticationMixin, generics.ListAPIView):
+class RequirementSurvyeCustomerListView(PaginatedListMixin, CustomAuthenticationMixin, generics.ListAPIView):
     """
     View to get the listing of all requirements.
     Supports both HTML and JSON response formats.
@@ -1848,35 +1642,9 @@ class RequirementSurvyeCustomerListView(CustomAuthenticationMixin, generics.List
         
         return queryset 
         
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
     
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'customer', self.request.query_params.get('q', ''))
 
     def get(self, request, *args, **kwargs):
         """
@@ -2005,7 +1773,7 @@ def filter_survey_requirements(data_access_value, user, customer=None, request=N
                     queryset = queryset.filter(**{filter_mapping[filter_name]: filter_value.strip()})
     return queryset 
 
-class RequirementSurvyeListView(CustomAuthenticationMixin,generics.ListAPIView):
+class RequirementSurvyeListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     """
     View to get the listing of all requirements.
     Supports both HTML and JSON response formats.
@@ -2027,18 +1795,7 @@ class RequirementSurvyeListView(CustomAuthenticationMixin,generics.ListAPIView):
     }
 
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'requirement', self.request.query_params.get('q', ''))
     
     @swagger_auto_schema(operation_id='Requirement Listing', responses={**common_get_response})
     def get(self, request, *args, **kwargs):
@@ -2069,9 +1826,8 @@ class RequirementSurvyeListView(CustomAuthenticationMixin,generics.ListAPIView):
 
             
             if request.accepted_renderer.format == 'html':
-                page_number = request.GET.get('page', 1)
                 context = {
-                    'requirements': Paginator(self.serializer_class(queryset, many=True).data, 20).get_page(page_number),
+                    'requirements': self.get_serialized_page(queryset, self.serializer_class),
                     'customer_id':customer_id,
                     # 'quantity_sureveyors': quantity_sureveyors,
                     'customer_data':customer_data,
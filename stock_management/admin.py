@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from . models import Vendor,VendorContactPerson,Item,ItemImage,InventoryLocation,Inventory,Category
+from . models import Vendor,VendorContactPerson,Item,ItemImage,InventoryLocation,Inventory,Category,StockMovement
  
 
 
@@ -15,6 +15,32 @@ class VendorContactPersonAdmin(admin.ModelAdmin):
     search_fields = ('first_name','last_name','email')  # Add fields for searching
 
 
+class StockMovementAdmin(admin.ModelAdmin):
+    list_display = ('inventory', 'movement_type', 'quantity', 'balance_after', 'note', 'created_by', 'created_at')
+    list_filter = ('movement_type',)
+
+    # The ledger is append-only and written through stock_management/ledger.py.
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+class InventoryAdmin(admin.ModelAdmin):
+    list_display = ('item_id', 'inventory_location', 'site_address', 'total_inventory', 'assigned_inventory', 'updated_at')
+    # Balances only change through stock movements (see stock_management/ledger.py).
+    readonly_fields = ('item_id', 'inventory_location', 'site_address', 'total_inventory')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
 
 admin.site.register(Vendor, VendorAdmin)
 admin.site.register(VendorContactPerson, VendorContactPersonAdmin)
@@ -22,5 +48,5 @@ admin.site.register(Item)
 admin.site.register(Category)
 admin.site.register(ItemImage)
 admin.site.register(InventoryLocation)
-admin.site.register(Inventory)
-
+admin.site.register(Inventory, InventoryAdmin)
+admin.site.register(StockMovement, StockMovementAdmin)
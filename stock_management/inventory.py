@@ -4,6 +4,7 @@ from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.permission import *
 from .models import *
 from .inventory_serializers import *
+from .ledger import adjust_to
 from infinity_fire_solutions.response_schemas import *
 from django.contrib import messages
 from rest_framework import generics, status, filters
@@ -74,22 +75,13 @@ class InventoryView(CustomAuthenticationMixin, generics.CreateAPIView):
                 inventory_location_id = key.replace('total_inventory_', '')
                 inventory_location = InventoryLocation.objects.get(id=inventory_location_id)
                 
-                # Create a new Inventory instance
-                total_inventory = float(value.strip())
+                total_inventory = Decimal(value.strip())
             
                 assigned_inventory_key = 'assigned_inventory_' + inventory_location_id
                 assigned_inventory = data.get(assigned_inventory_key, 0) # Convert to float with a default value of 0 if not present
                 
-                inventory = Inventory.objects.filter(item_id=item_instance,inventory_location = inventory_location).first()
-                if inventory:
-                    inventory.total_inventory = total_inventory
-
-                else:
-                    inventory = Inventory.objects.create(
-                        item_id=item_instance,
-                        inventory_location=inventory_location,
-                        total_inventory=total_inventory,
-                    )
+                # The counted quantity is recorded in the stock ledger as an adjustment of the balance.
+                inventory = adjust_to(item_instance, total_inventory, inventory_location=inventory_location, user=request.user)
                 if assigned_inventory:
                     inventory.assigned_inventory = float(assigned_inventory.strip())
                 inventory.save()
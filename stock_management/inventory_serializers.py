@@ -5,6 +5,7 @@ from django.db import transaction
 from rest_framework import serializers
 from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.custom_form_validation import *
+from customer_management.post_codes import PostCodeField
 from django.conf import settings
 
 class InventoryLocationSerializer(serializers.ModelSerializer):
@@ -56,12 +57,11 @@ class InventoryLocationSerializer(serializers.ModelSerializer):
             'base_template': 'custom_input.html'
         },
     )
-    post_code = serializers.ChoiceField(
+    post_code = PostCodeField(
         label=('Post Code'),
         required=True,
-        choices=POST_CODE_LIST,
         style={
-            'base_template': 'custom_select.html'
+            'base_template': 'custom_post_code.html'
         },
 
 
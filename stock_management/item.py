@@ -1,4 +1,3 @@
-import pandas as pd
 import xlwt
 from django.shortcuts import render, redirect
 from django.shortcuts import get_object_or_404
@@ -6,6 +5,7 @@ from django.conf import settings
 from django.http import HttpResponse
 from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.permission import *
+from infinity_fire_solutions.pagination import PaginatedListMixin
 from .models import *
 from .item_serializers import *
 from infinity_fire_solutions.response_schemas import *
@@ -19,11 +19,11 @@ from django.core.serializers import serialize
 from drf_yasg.utils import swagger_auto_schema
 from infinity_fire_solutions.utils import docs_schema_response_new
 from django.views import View
-from io import BytesIO
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from common_app.import_jobs import queue_import
+from .ledger import stock_in_hand
 
 
-class ItemListView(CustomAuthenticationMixin,generics.CreateAPIView):
+class ItemListView(PaginatedListMixin, CustomAuthenticationMixin,generics.CreateAPIView):
     """
     View to get the listing of all contacts.
     Supports both HTML and JSON response formats.
@@ -33,6 +33,7 @@ class ItemListView(CustomAuthenticationMixin,generics.CreateAPIView):
     filter_backends = [filters.SearchFilter]
     search_fields = ['name']
     template_name = 'item_list.html'
+    paginate_by = 10
     ordering_fields = ['created_at'] 
 
     common_get_response = {
@@ -70,20 +71,18 @@ class ItemListView(CustomAuthenticationMixin,generics.CreateAPIView):
         queryset = queryset.filter(pk=self.kwargs.get('vendor_id')).first()
         return queryset
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 10
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
+
+    def get_item_list_page(self):
+        """
+        The requested page of items, serialized with their stock in hand read from the
+        stock ledger balances in one query for the page.
+        """
+        current_page = self.get_paginated_queryset(self.get_item_queryset())
+        balances = stock_in_hand([item.id for item in current_page.object_list])
+        current_page.object_list = [
+            {**item, 'stock_in_hand': balances.get(item['id'])}
+            for item in ItemListSerializer(current_page.object_list, many=True).data
+        ]
         return current_page
     
     def get_item_queryset(self):
@@ -140,7 +139,7 @@ class ItemListView(CustomAuthenticationMixin,generics.CreateAPIView):
                 else:
                     serializer = self.serializer_class()
                 
-                context = {'item_list':self.get_paginated_queryset(ItemListSerializer(self.get_item_queryset(), many=True).data),
+                context = {'item_list':self.get_item_list_page(),
                 'vendor_instance':vendor_instance,
                 'vendor_id':vendor_id,
                 'serializer':serializer}
@@ -195,7 +194,7 @@ class ItemListView(CustomAuthenticationMixin,generics.CreateAPIView):
 
             else:
                 context = {
-                    'item_list':self.get_paginated_queryset(ItemListSerializer(self.get_item_queryset(), many=True).data),
+                    'item_list':self.get_item_list_page(),
                     'vendor_instance':vendor_instance,
                     'vendor_id':vendor_instance.id,
                     'serializer':serializer
@@ -687,66 +686,7 @@ class BulkImportItemsView(CustomAuthenticationMixin, generics.CreateAPIView):
     """
     serializer_class = ItemsSerializer
     default_fieldset = ['item_name','category_id','price', 'units','description',  'quantity_per_box','reference_number',]
-    EXCEL = ['xlsx', 'xls', 'ods']
-    CSV = ['csv',]
 
-    # File operation Functions ----------------------------------------------
-    def get_file_ext(self, file_name:str) -> str:
-        """
-        Get the file extension for a given file name.
-
-        Args:
-            file_name (str): The name of the file.
-
-        Returns:
-            str: The file extension in lowercase.
-        """
-
-        ext = file_name.split('.')[-1].lower()
-
-        return ext
-
-    # Excel File Supporter Functions ---------------------------------------------
-    def get_excel_engine(self, file_ext: str) -> str or None:
-        """
-        Get the engine to use for reading an Excel file based on its extension.
-
-        Args:
-            file_ext (str): The file extension in lowercase.
-
-        Returns:
-            str or None: The engine to use, or None if the file is not an Excel file.
-        """
-
-        engines = {'xlsx': 'openpyxl', 'xls': 'xlrd', 'ods': 'odf'}
-        return  engines[file_ext]
-
-    def read_file_to_df(self, file) -> pd.DataFrame:
-        """
-        Read a file from an in-memory upload and convert it into a DataFrame.
-
-        Parameters:
-        - file (InMemoryUploadedFile): The in-memory uploaded file.
-
-        Returns:
-        - pd.DataFrame or None: The DataFrame containing the data from the file, or None if an error occurs.
-        """
-        ext = self.get_file_ext(file.name)
-
-        # Convert the in-memory file to a BytesIO object
-        content = BytesIO(file.read())
-
-        if ext in self.EXCEL:
-            engine = self.get_excel_engine(ext)
-            data_frame = pd.read_excel(content, engine=engine)
-            return data_frame
-        
-        if ext in self.CSV:
-            data_frame = pd.read_csv(content)
-            return data_frame
-
-        raise ValueError('The file type is not supported.')
-    
     def post(self, request, *args, **kwargs):
         data = request.data.copy()
 
@@ -768,22 +708,25 @@ class BulkImportItemsView(CustomAuthenticationMixin, generics.CreateAPIView):
             messages.error(request, 'Please select correct headers to upload bulk item file')
             return redirect(reverse('item_list', kwargs={'vendor_id': kwargs['vendor_id']}))
         
-        df = self.read_file_to_df(request.FILES.get('excel_file'))
+        excel_file = request.FILES.get('excel_file')
+        if not excel_file:
+            messages.error(request, "Please select a file to import")
+            return redirect(reverse('item_list', kwargs={'vendor_id': kwargs['vendor_id']}))
 
-        items_data_list = []
-        for index, row in df.iterrows():
-            items_data = {}
-            for key, value in mapping_dict.items():
-                items_data[key] = row[value]
+        vendor = Vendor.objects.filter(id=kwargs['vendor_id']).first()
+        if not vendor:
+            messages.error(request, "Vendor not found")
+            return redirect(reverse('item_list', kwargs={'vendor_id': kwargs['vendor_id']}))
 
-            items_data_list.append(items_data)
+        try:
+            job = queue_import(
+                request.user, excel_file, 'stock_item', mapping_dict,
+                coercions={'price': 'decimal', 'quantity_per_box': 'decimal'}, vendor_id=vendor.id,
+            )
+        except ValueError as e:
+            messages.error(request, str(e))
+            return redirect(reverse('item_list', kwargs={'vendor_id': kwargs['vendor_id']}))
 
-        serializer = self.serializer_class(data=items_data_list, many=True, context={'request': request, 'vendor_id': kwargs['vendor_id']})
-        if serializer.is_valid():
-            serializer.save()
-            messages.success(request, 'Bulk items uploaded successfully.')
-        else:
-            messages.error(request, 'The file contains irrelevant data. Please review the data and try again.')
-    
-        return redirect(reverse('item_list', kwargs={'vendor_id': kwargs['vendor_id']}))
+        messages.success(request, 'The items file has been uploaded and is being imported.')
+        return redirect(f"{reverse('item_list', kwargs={'vendor_id': kwargs['vendor_id']})}?import_job={job.id}")
         
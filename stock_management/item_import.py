@@ -0,0 +1,113 @@
+import re
+from decimal import Decimal
+
+from common_app.search import index_queryset
+from infinity_fire_solutions.importers import ImportSink, decimal_error
+from stock_management.models import Category, Item, UNIT_CHOICES
+
+UNITS = frozenset(unit for unit, _ in UNIT_CHOICES)
+
+
+class ItemImporter(ImportSink):
+    """
+    Bulk import of a vendor's stock items.
+
+    Rows have 'item_name', 'category_id' (the category name), 'price', 'description',
+    'units', 'quantity_per_box' and 'reference_number'; price and quantity_per_box should
+    be coerced with to_decimal. Categories are loaded once per import and the existing
+    reference numbers of every chunk are fetched with one IN query.
+
+    Args:
+        vendor (Vendor): The vendor the items belong to.
+        user (User): The user running the import.
+        chunk_size (int, optional): Rows validated and saved at a time.
+        all_or_nothing (bool): When True any rejected row rolls the whole import back.
+    """
+    key_field = 'reference_number'
+
+    def __init__(self, vendor, user, chunk_size=None, all_or_nothing=True):
+        super().__init__(chunk_size, all_or_nothing)
+        self.vendor = vendor
+        self.user = user
+
+    def start(self, report):
+        self._seen_references = set()
+        self._categories = dict(Category.objects.values_list('name', 'id'))
+
+    def write_chunk(self, rows, report):
+        references = {row.get('reference_number') for _, row in rows if row.get('reference_number')}
+        existing = set(Item.objects.filter(reference_number__in=references).values_list('reference_number', flat=True))
+
+        items = []
+        for row_number, row in rows:
+            if not self._validate(row_number, row, existing, report):
+                continue
+
+            items.append(Item(
+                vendor_id=self.vendor,
+                user_id=self.user,
+                category_id_id=self._categories[row['category_id']],
+                item_name=row['item_name'],
+                description=row.get('description') or None,
+                price=row['price'],
+                units=row.get('units') or 'single',
+                quantity_per_box=row.get('quantity_per_box') or Decimal('1.0'),
+                reference_number=row['reference_number'],
+            ))
+
+        if items:
+            Item.objects.bulk_create(items, batch_size=self.chunk_size)
+            report.created += len(items)
+            # bulk_create sends no signals, so the search entries are written here.
+            index_queryset('item', Item.objects.filter(reference_number__in=[item.reference_number for item in items]))
+
+    def _validate(self, row_number, row, existing, report):
+        errors_before = len(report.errors)
+
+        def error(field, message):
+            self.error(report, row_number, row, field, message)
+
+        item_name = row.get('item_name', '')
+        if not item_name:
+            error('item_name', 'Item Name is required.')
+        elif len(item_name) > 50:
+            error('item_name', 'Item Name must not have more than 50 characters.')
+        elif len(item_name) < 3:
+            error('item_name', 'Item Name must be at least 3 characters long.')
+        elif item_name.isdigit():
+            error('item_name', 'Item Name cannot consist of only integers.')
+        elif not re.match(r'^[a-zA-Z0-9\s]*$', item_name):
+            error('item_name', 'Item Name can only contain alphanumeric characters and spaces.')
+
+        reference_number = row.get('reference_number', '')
+        if not reference_number:
+            error('reference_number', 'Reference Number is required.')
+        elif len(reference_number) > 50:
+            error('reference_number', 'Reference Number must not have more than 50 characters.')
+        elif reference_number in existing or reference_number in self._seen_references:
+            error('reference_number', 'This reference number is already in use.')
+
+        category = row.get('category_id', '')
+        if category not in self._categories:
+            error('category_id', f"Category with name '{category}' does not exist.")
+
+        price = row.get('price', '')
+        if price == '':
+            error('price', 'Price is required.')
+        elif price < 0:
+            error('price', 'Price cannot be negative.')
+        elif decimal_error(price):
+            error('price', decimal_error(price))
+
+        quantity_per_box = row.get('quantity_per_box', '')
+        if quantity_per_box != '' and decimal_error(quantity_per_box):
+            error('quantity_per_box', decimal_error(quantity_per_box))
+
+        if row.get('units') and row['units'] not in UNITS:
+            error('units', f"\"{row['units']}\" is not a valid choice for Units.")
+
+        if len(report.errors) > errors_before:
+            return False
+
+        self._seen_references.add(reference_number)
+        return True
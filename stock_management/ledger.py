@@ -0,0 +1,127 @@
+from decimal import Decimal
+from django.db import transaction
+from django.db.models import Sum
+
+from .models import Inventory, StockMovement
+
+
+def _balance_lookup(item, inventory_location=None, site_address=None):
+    if inventory_location:
+        return {'item_id': item, 'inventory_location': inventory_location}
+    if site_address:
+        return {'item_id': item, 'site_address': site_address}
+    raise ValueError('Either an Inventory Location or a Site Address is required.')
+
+
+def record_movement(item, movement_type, quantity, inventory_location=None, site_address=None,
+                    received_inventory=None, user=None, note=''):
+    """
+    Record a stock movement and update the balance row it applies to.
+
+    The balance row (Inventory) of the item at the location or site address is locked
+    while it is updated, so concurrent movements are applied one after the other and
+    every movement stores the balance that results from it.
+
+    Args:
+        item (Item): The item.
+        movement_type (str): 'receipt', 'assignment' or 'adjustment'.
+        quantity (Decimal): Signed quantity, negative when stock leaves the location.
+        inventory_location (InventoryLocation, optional): The location of the stock.
+        site_address (SiteAddress, optional): The site address of the stock, when there is no location.
+        received_inventory (PurchaseOrderReceivedInventory, optional): The receipt behind the movement.
+        user (User, optional): The user recording the movement.
+        note (str): Free text, e.g. the reason of an adjustment.
+
+    Returns:
+        StockMovement: The recorded movement, with its updated inventory.
+
+    Raises:
+        ValueError: If neither a location nor a site address is given.
+    """
+    lookup = _balance_lookup(item, inventory_location, site_address)
+    quantity = Decimal(str(quantity))
+
+    with transaction.atomic():
+        inventory = Inventory.objects.select_for_update().filter(**lookup).first()
+        if inventory is None:
+            inventory = Inventory.objects.create(**lookup, total_inventory=0)
+
+        inventory.total_inventory = Decimal(inventory.total_inventory) + quantity
+        inventory.save(update_fields=['total_inventory', 'updated_at'])
+
+        return StockMovement.objects.create(
+            inventory=inventory,
+            movement_type=movement_type,
+            quantity=quantity,
+            balance_after=inventory.total_inventory,
+            received_inventory=received_inventory,
+            note=note[:255],
+            created_by=user,
+        )
+
+
+def record_receipts(received_inventories, user=None):
+    """
+    Record the stock received against a purchase order invoice at the purchase order's
+    inventory location, or at its site address.
+
+    Args:
+        received_inventories (list): PurchaseOrderReceivedInventory rows.
+        user (User, optional): The user recording the invoice.
+
+    Returns:
+        list: The recorded movements.
+    """
+    movements = []
+    for received in received_inventories:
+        order_item = received.purchase_order_item_id
+        purchase_order = order_item.purchase_order_id
+        if not received.received_inventory or not order_item.item_id:
+            continue
+        movements.append(record_movement(
+            order_item.item, 'receipt', received.received_inventory,
+            inventory_location=purchase_order.inventory_location_id,
+            site_address=purchase_order.site_address,
+            received_inventory=received,
+            user=user,
+            note=f'{purchase_order.po_number} - {received.purchase_order_invoice_id.invoice_number}',
+        ))
+    return movements
+
+
+def adjust_to(item, quantity, inventory_location=None, site_address=None, user=None, note='Stock count'):
+    """
+    Adjust the balance of an item at a location to a counted quantity.
+
+    Returns:
+        Inventory: The balance row, created with a zero balance if it did not exist.
+    """
+    lookup = _balance_lookup(item, inventory_location, site_address)
+    quantity = Decimal(str(quantity))
+
+    with transaction.atomic():
+        inventory = Inventory.objects.select_for_update().filter(**lookup).first()
+        current = Decimal(inventory.total_inventory) if inventory else Decimal(0)
+        if quantity != current:
+            return record_movement(
+                item, 'adjustment', quantity - current,
+                inventory_location=inventory_location, site_address=site_address, user=user, note=note,
+            ).inventory
+        if inventory is None:
+            inventory = Inventory.objects.create(**lookup, total_inventory=0)
+        return inventory
+
+
+def stock_in_hand(item_ids):
+    """
+    The stock of items across all their locations, in one query over the balance rows.
+
+    Returns:
+        dict: {item_id: Decimal} with an entry for every item that has a balance row.
+    """
+    return dict(
+        Inventory.objects.filter(item_id__in=item_ids).order_by()
+        .values('item_id').annotate(total=Sum('total_inventory'))
+        .values_list('item_id', 'total')
+    )
+
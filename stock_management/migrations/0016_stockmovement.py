@@ -0,0 +1,57 @@
+# Generated by Django 4.2.3 on 2026-10-18 15:05
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def record_opening_balances(apps, schema_editor):
+    # The current quantities become the opening balances of the ledger.
+    Inventory = apps.get_model('stock_management', 'Inventory')
+    StockMovement = apps.get_model('stock_management', 'StockMovement')
+
+    StockMovement.objects.bulk_create([
+        StockMovement(
+            inventory_id=inventory.id,
+            movement_type='adjustment',
+            quantity=inventory.total_inventory,
+            balance_after=inventory.total_inventory,
+            note='Opening balance',
+            created_at=inventory.updated_at,
+        )
+        for inventory in Inventory.objects.exclude(total_inventory=0).iterator()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('purchase_order_management', '0014_purchaseorderitem_reference_number'),
+        ('stock_management', '0015_inventory_site_address_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockMovement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('movement_type', models.CharField(choices=[('receipt', 'Receipt'), ('assignment', 'Assignment'), ('adjustment', 'Adjustment')], max_length=20)),
+                ('quantity', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('balance_after', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('note', models.CharField(blank=True, default='', max_length=255)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+                ('inventory', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='movements', to='stock_management.inventory')),
+                ('received_inventory', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='purchase_order_management.purchaseorderreceivedinventory')),
+            ],
+            options={
+                'verbose_name': 'Stock Movement',
+                'verbose_name_plural': 'Stock Movements',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['inventory', 'created_at'], name='stock_manag_invento_5e9e13_idx')],
+            },
+        ),
+        migrations.RunPython(record_opening_balances, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:06
+
+import customer_management.post_codes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock_management', '0016_stockmovement'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='vendor',
+            name='post_code',
+            field=models.CharField(blank=True, max_length=10, null=True, validators=[customer_management.post_codes.validate_post_code]),
+        ),
+        migrations.AlterField(
+            model_name='inventorylocation',
+            name='post_code',
+            field=models.CharField(blank=True, max_length=10, null=True, validators=[customer_management.post_codes.validate_post_code]),
+        ),
+    ]
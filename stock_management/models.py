@@ -1,8 +1,9 @@
 from django.db import models
+from django.utils import timezone
 from ckeditor.fields import RichTextField
 from cities_light.models import City, Country, Region
 from authentication.models import User
-from customer_management.constants import POST_CODE_LIST
+from customer_management.post_codes import validate_post_code
 from customer_management.models import SiteAddress
 
 # Choices for Tax Preference
@@ -37,6 +38,13 @@ SALUTATION_CHOICES = [
         ('Miss', 'Miss'),
 ]
 
+# Choices for Stock Movement Type
+STOCK_MOVEMENT_TYPE_CHOICES = (
+    ('receipt', 'Receipt'),
+    ('assignment', 'Assignment'),
+    ('adjustment', 'Adjustment'),
+)
+
 # Choices for Unit
 UNIT_CHOICES = (
     ('single', 'Single Unit'),
@@ -61,7 +69,7 @@ class Vendor(models.Model):
     country = models.CharField(max_length=255, null=True, blank=True)
     town = models.CharField(max_length=255, null=True, blank=True)
     county = models.CharField(max_length=255, null=True, blank=True)
-    post_code = models.CharField(max_length=10, choices=POST_CODE_LIST, null=True, blank=True)
+    post_code = models.CharField(max_length=10, validators=[validate_post_code], null=True, blank=True)
     billing_phone_number = models.CharField(max_length=20, null=True, blank=True)
     vendor_status = models.CharField(max_length=30, choices=VENDOR_STATUS_CHOICES,null=True, blank=True)
     remarks = RichTextField(null=True, blank=True)
@@ -157,7 +165,7 @@ class InventoryLocation(models.Model):
     town = models.CharField(max_length=255, null=True, blank=True)
     county = models.CharField(max_length=255, null=True, blank=True)
     country = models.CharField(max_length=255, null=True, blank=True)
-    post_code = models.CharField(max_length=10, choices=POST_CODE_LIST, null=True, blank=True)
+    post_code = models.CharField(max_length=10, validators=[validate_post_code], null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -181,3 +189,39 @@ class Inventory(models.Model):
 
     class Meta:
         ordering =['created_at']
+
+
+class StockMovement(models.Model):
+    """
+    Append-only ledger of the stock of an item at a location.
+
+    Every change of an Inventory balance row is recorded here with the balance after the
+    movement, so the balance at any date is the balance_after of the last movement before
+    it (see stock_management/ledger.py).
+    """
+    inventory = models.ForeignKey(Inventory, on_delete=models.CASCADE, related_name='movements')
+    movement_type = models.CharField(max_length=20, choices=STOCK_MOVEMENT_TYPE_CHOICES)
+    quantity = models.DecimalField(max_digits=10, decimal_places=2)
+    balance_after = models.DecimalField(max_digits=10, decimal_places=2)
+    received_inventory = models.ForeignKey(
+        'purchase_order_management.PurchaseOrderReceivedInventory', on_delete=models.SET_NULL, null=True, blank=True
+    )
+    note = models.CharField(max_length=255, blank=True, default='')
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = "Stock Movement"
+        verbose_name_plural = "Stock Movements"
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['inventory', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_movement_type_display()} of {self.quantity} ({self.inventory_id})"
+
+    def save(self, *args, **kwargs):
+        if self.pk:
+            raise ValueError('Stock movements cannot be changed, record an adjustment instead.')
+        super().save(*args, **kwargs)
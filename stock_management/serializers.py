@@ -4,7 +4,7 @@ from rest_framework.validators import UniqueValidator
 from infinity_fire_solutions.custom_form_validation import *
 from .models import *
 import re
-from customer_management.constants import POST_CODE_LIST
+from customer_management.post_codes import PostCodeField
 
 class VendorSerializer(serializers.ModelSerializer):
     """
@@ -181,12 +181,11 @@ class BillingDetailSerializer(serializers.ModelSerializer):
         },
     )
 
-    post_code = serializers.ChoiceField(
+    post_code = PostCodeField(
         label=('Post Code'),
         required=True,
-        choices=POST_CODE_LIST,
         style={
-            'base_template': 'custom_select.html'
+            'base_template': 'custom_post_code.html'
         },
 
 
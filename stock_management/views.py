@@ -5,13 +5,14 @@ from django.http import Http404, JsonResponse, HttpResponse, HttpResponseRedirec
 from django.conf import settings
 from drf_yasg.utils import swagger_auto_schema
 from django.shortcuts import get_object_or_404
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from rest_framework import generics, status, filters
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.renderers import TemplateHTMLRenderer, JSONRenderer
 from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.permission import *
+from infinity_fire_solutions.pagination import PaginatedListMixin
+from common_app.search import search_queryset
 from infinity_fire_solutions.response_schemas import create_api_response, convert_serializer_errors, render_html_response
 from infinity_fire_solutions.utils import docs_schema_response_new
 from .models import *
@@ -88,7 +89,7 @@ class VendorSearchAPIView(CustomAuthenticationMixin, generics.RetrieveAPIView):
             data=data
         )
     
-class VendorListView(CustomAuthenticationMixin,generics.ListAPIView):
+class VendorListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     """
 
     View to get the listing of all vendors.
@@ -102,22 +103,6 @@ class VendorListView(CustomAuthenticationMixin,generics.ListAPIView):
     template_name = 'vendor_list.html'
     ordering_fields = ['created_at'] 
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
-    
     def get_queryset(self):
         """
         Get the queryset based on filtering parameters from the request.
@@ -149,18 +134,7 @@ class VendorListView(CustomAuthenticationMixin,generics.ListAPIView):
     
 
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'vendor', self.request.query_params.get('q', ''))
 
     common_get_response = {
         status.HTTP_200_OK: 
@@ -326,7 +300,6 @@ class VendorUpdateView(CustomAuthenticationMixin, generics.UpdateAPIView):
     template_name = 'vendor.html'
 
 
-    
     def get_queryset(self):
         """
         Get the queryset for listing Conatct items.
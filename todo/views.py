@@ -10,6 +10,7 @@ from django.contrib import messages
 from django.shortcuts import redirect
 from django.urls import reverse
 from infinity_fire_solutions.permission import *
+from infinity_fire_solutions.pagination import PaginatedListMixin
 from rest_framework import filters
 from django.apps import apps
 from django.db.models import Q
@@ -18,7 +19,6 @@ from authentication.models import *
 from datetime import datetime
 from drf_yasg.utils import swagger_auto_schema
 from infinity_fire_solutions.utils import docs_schema_response_new
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.views import View
 
     
@@ -69,7 +69,7 @@ class ToDoUserSearchAPIView(CustomAuthenticationMixin, generics.RetrieveAPIView)
                                        data=data)
 
 
-class ToDoListAPIView(CustomAuthenticationMixin,generics.ListAPIView):
+class ToDoListAPIView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
 
     """
     API view to list TODO items.
@@ -81,21 +81,6 @@ class ToDoListAPIView(CustomAuthenticationMixin,generics.ListAPIView):
     template_name = 'todo_list.html'
     serializer_class = TodoListSerializer
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
 
     def get_queryset(self):
         authenticated_user, data_access_value = check_authentication_and_permissions(
@@ -321,7 +306,6 @@ class ToDoUpdateView(CustomAuthenticationMixin, generics.UpdateAPIView):
     template_name = 'todo_form.html'
     serializer_class = TodoAddSerializer
 
-    
     def get_queryset(self):
         """
         Get the queryset for listing TODO items.
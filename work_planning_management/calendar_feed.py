@@ -0,0 +1,118 @@
+import hashlib
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import Events
+
+CALENDAR_DATE_FORMAT = "%m/%d/%Y, %H:%M:%S"
+
+
+class CalendarWindowError(ValueError):
+    """
+    Raised when the requested calendar window cannot be parsed or is too long.
+    """
+
+
+def _parse_bound(value):
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise CalendarWindowError(f"'{value}' is not a valid date.")
+        parsed = datetime.combine(day, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def parse_window(start=None, end=None):
+    """
+    Parse the visible window of the calendar.
+
+    FullCalendar sends the window as ISO dates or datetimes in the `start` and `end`
+    query parameters. Without them the window is CALENDAR_FEED_DEFAULT_DAYS days on
+    either side of today.
+
+    Returns:
+        tuple: The (start, end) aware datetimes.
+
+    Raises:
+        CalendarWindowError: If a bound is invalid, end is not after start or the window
+            is longer than CALENDAR_FEED_MAX_DAYS.
+    """
+    if not start or not end:
+        today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        days = timedelta(days=settings.CALENDAR_FEED_DEFAULT_DAYS)
+        return today - days, today + days
+
+    start, end = _parse_bound(start), _parse_bound(end)
+    if end <= start:
+        raise CalendarWindowError('The end of the window must be after its start.')
+    if end - start > timedelta(days=settings.CALENDAR_FEED_MAX_DAYS):
+        raise CalendarWindowError(f'The window cannot be longer than {settings.CALENDAR_FEED_MAX_DAYS} days.')
+    return start, end
+
+
+def events_in_window(start, end, queryset=None):
+    """
+    The events overlapping a window, found through the (start, end) index.
+
+    Events without an end are treated as instants at their start. The start is bounded
+    below by CALENDAR_EVENT_MAX_DAYS before the window, so the index is scanned from there
+    instead of from the first event ever created; longer events are not shown.
+
+    Args:
+        start (datetime): Start of the window, inclusive.
+        end (datetime): End of the window, exclusive.
+        queryset (QuerySet, optional): Events to filter, defaults to all events.
+
+    Returns:
+        QuerySet: The events, ordered by start.
+    """
+    queryset = Events.objects.all() if queryset is None else queryset
+    return queryset.filter(
+        Q(end__gt=start) | Q(end__isnull=True, start__gte=start),
+        start__gte=start - timedelta(days=settings.CALENDAR_EVENT_MAX_DAYS),
+        start__lt=end,
+    ).order_by('start', 'id')
+
+
+def window_etag(start, end, queryset=None):
+    """
+    ETag of the events of a window, from one aggregate query over the index.
+
+    It changes when an event of the window is added, removed or saved; member and team
+    assignments are saved through the event forms, which bump updated_at.
+    """
+    summary = events_in_window(start, end, queryset).order_by().aggregate(
+        count=Count('id'), last_updated=Max('updated_at'), last_id=Max('id'),
+    )
+    digest = hashlib.md5(
+        f"{start.isoformat()}|{end.isoformat()}|{summary['count']}|{summary['last_updated']}|{summary['last_id']}".encode()
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def serialize_events(events):
+    """
+    Serialize events for FullCalendar, with their team and members loaded in two queries
+    for the whole window.
+
+    Returns:
+        list: One dict per event.
+    """
+    events = events.select_related('team').prefetch_related('members')
+    return [
+        {
+            'title': event.name,
+            'id': event.id,
+            'start': timezone.localtime(event.start).strftime(CALENDAR_DATE_FORMAT),
+            'end': timezone.localtime(event.end or event.start).strftime(CALENDAR_DATE_FORMAT),
+            'team': event.team.team_name if event.team else None,
+            'members': [member.name for member in event.members.all()],
+        }
+        for event in events
+    ]
@@ -5,7 +5,7 @@ from django import forms
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.core.files.base import ContentFile
 
-from infinity_fire_solutions.aws_helper import upload_file_to_s3, fetch_file_from_s3, delete_file_from_s3
+from infinity_fire_solutions.aws_helper import upload_file_to_s3, delete_file_from_s3
 
 from authentication.models import User
 
@@ -0,0 +1,40 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.models import User
+from work_planning_management.models import STWRequirements
+from work_planning_management.stw_conversion import convert_stws
+
+
+class Command(BaseCommand):
+    help = ('Convert STWs to FRAs in transactional batches of STW_CONVERSION_BATCH_SIZE, reporting the '
+            'progress after each batch and the converted and failed STWs at the end.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', required=True, help='Email of the user converting the STWs.')
+        parser.add_argument('--customer', type=int, help='Convert the STWs of this customer id that are not part of a job.')
+        parser.add_argument('--ids', type=int, nargs='+', help='Ids of the STWs to convert.')
+
+    def handle(self, *args, **options):
+        if bool(options['customer']) == bool(options['ids']):
+            raise CommandError('Pass either --customer or --ids.')
+        try:
+            user = User.objects.get(email=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(f'No user with email {options["user"]}.')
+
+        if options['customer']:
+            stw_ids = list(STWRequirements.objects.filter(
+                customer_id=options['customer'], job__isnull=True
+            ).order_by('id').values_list('id', flat=True))
+        else:
+            stw_ids = options['ids']
+
+        def progress(converted, failed, total):
+            self.stdout.write(f'{converted + failed}/{total} STWs processed: {converted} converted, {failed} failed.')
+
+        report = convert_stws(stw_ids, user, progress=progress)
+        self.stdout.write(json.dumps(report, indent=2, default=str))
+        self.stdout.write(self.style.SUCCESS(
+            f'Converted {len(report["converted"])} of {len(stw_ids)} STWs.'
+        ))
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work_planning_management', '0042_rlo_pdf_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stwasset',
+            name='print_path',
+            field=models.CharField(blank=True, max_length=256, null=True),
+        ),
+        migrations.AddField(
+            model_name='stwasset',
+            name='thumbnail_path',
+            field=models.CharField(blank=True, max_length=256, null=True),
+        ),
+        migrations.AddField(
+            model_name='stwdefectdocument',
+            name='print_path',
+            field=models.CharField(blank=True, max_length=256, null=True),
+        ),
+        migrations.AddField(
+            model_name='stwdefectdocument',
+            name='thumbnail_path',
+            field=models.CharField(blank=True, max_length=256, null=True),
+        ),
+    ]
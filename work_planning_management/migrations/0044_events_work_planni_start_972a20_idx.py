@@ -0,0 +1,17 @@
+# Generated by Django 4.2.3 on 2026-10-18 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work_planning_management', '0043_stwasset_print_path_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='events',
+            index=models.Index(fields=['start', 'end'], name='work_planni_start_972a20_idx'),
+        ),
+    ]
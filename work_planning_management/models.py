@@ -7,6 +7,7 @@ from requirement_management.models import Quotation
 
 from authentication.models import User
 from customer_management.models import SiteAddress
+from common_app.models import PDF_JOB_STATUS_CHOICES
 
 
 STW_CHOICES = (
@@ -83,11 +84,15 @@ class STWAsset(models.Model):
     Attributes:
         stw_id (ForeignKey): The stw associated with the asset.
         document_path (CharField): Path to the asset document.
+        thumbnail_path (CharField): Path to the thumbnail of an image.
+        print_path (CharField): Path to the downscaled copy of an image used in PDFs.
         created_at (DateTimeField): Date and time when the asset was created.
         updated_at (DateTimeField): Date and time when the asset was last updated.
     """
     stw_id = models.ForeignKey(STWRequirements, on_delete=models.CASCADE)
     document_path = models.CharField(max_length=256)
+    thumbnail_path = models.CharField(max_length=256, null=True, blank=True)
+    print_path = models.CharField(max_length=256, null=True, blank=True)
     create_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -136,12 +141,16 @@ class STWDefectDocument(models.Model):
         stw_id (ForeignKey): The STW associated with the defect document.
         defect_id (ForeignKey): The defect associated with the defect document.
         document_path (CharField): Path to the defect document.
+        thumbnail_path (CharField): Path to the thumbnail of an image.
+        print_path (CharField): Path to the downscaled copy of an image used in PDFs.
         created_at (DateTimeField): Date and time when the defect document was created.
         updated_at (DateTimeField): Date and time when the defect document was last updated.
     """
     stw_id = models.ForeignKey(STWRequirements, on_delete=models.CASCADE)
     defect_id = models.ForeignKey(STWDefect, on_delete=models.CASCADE)
     document_path = models.CharField(max_length=256)
+    thumbnail_path = models.CharField(max_length=256, null=True, blank=True)
+    print_path = models.CharField(max_length=256, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -227,6 +236,9 @@ class Events(models.Model):
         verbose_name = _('Calendar Events')
         verbose_name_plural = _('Calendar Events')
         ordering =['id']
+        indexes = [
+            models.Index(fields=['start', 'end']),
+        ]
         
 class Job(models.Model):
     customer_id = models.ForeignKey(User, on_delete=models.CASCADE, null=True)
@@ -266,6 +278,9 @@ class RLO(models.Model):
     job = models.ForeignKey(Job, on_delete=models.CASCADE)
     base_template = models.ForeignKey(RLOLetterTemplate, on_delete=models.CASCADE, null=True)
     edited_content =  models.TextField(blank=True, null=True)  # New field to store edited template content 
+    pdf_path = models.CharField(max_length=500, null=True, blank=True)
+    pdf_status = models.CharField(max_length=30, choices=PDF_JOB_STATUS_CHOICES, null=True, blank=True)
+    pdf_hash = models.CharField(max_length=64, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
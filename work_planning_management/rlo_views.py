@@ -4,7 +4,6 @@ from django.shortcuts import render, redirect
 from django.http import Http404, JsonResponse, HttpResponse, HttpResponseRedirect
 from django.conf import settings
 from django.shortcuts import get_object_or_404
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.views.decorators.csrf import csrf_exempt
 
 from drf_yasg.utils import swagger_auto_schema
@@ -13,6 +12,7 @@ from rest_framework import generics, status, filters
 from rest_framework.response import Response
 from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.permission import *
+from infinity_fire_solutions.pagination import PaginatedListMixin
 from rest_framework.renderers import TemplateHTMLRenderer, JSONRenderer
 
 from infinity_fire_solutions.response_schemas import create_api_response, convert_serializer_errors, render_html_response
@@ -21,12 +21,11 @@ from django.views.decorators.csrf import csrf_protect
 
 from .models import *
 from .rlo_serializers  import RLOAddSerializer,RLOLetterTemplateSerializer
-import os
-import pdfkit
-from django.template.loader import render_to_string
+import uuid
+from common_app.pdf_jobs import queue_pdf_render
 
 
-class RLOListView(CustomAuthenticationMixin,generics.ListAPIView):
+class RLOListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     """
     View to get the listing of all RLO.
     Supports both HTML and JSON response formats.
@@ -36,24 +35,10 @@ class RLOListView(CustomAuthenticationMixin,generics.ListAPIView):
     filter_backends = [filters.SearchFilter]
     # search_fields = ['action', 'description','RBNO','UPRN']
     template_name = 'RLO/rlo_list.html'
+    paginate_by = 10
     ordering_fields = ['created_at']
 
     
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 10 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
     
     def get_queryset(self):
         """
@@ -318,43 +303,6 @@ class RLOpdfView(CustomAuthenticationMixin, generics.RetrieveAPIView):
     renderer_classes = [TemplateHTMLRenderer, JSONRenderer]
     template_name = 'RLO/rlo_pdf.html'
     serializer_class = RLOAddSerializer
-    pdf_options = {
-        'page-size': 'A4',  # You can change this to 'A4' or custom size
-        'margin-top': '10mm',
-        'margin-right': '0mm',
-        'margin-bottom': '0mm',
-        'margin-left': '0mm',
-    }
-    def save_pdf_from_html(self, context, file_name):
-        """
-        Save the PDF file from the HTML content.
-        Args:
-            context (dict): Context data for rendering the HTML template.
-            file_name (str): Name of the PDF file.
-        Returns:
-            Output file path or None.
-        """
-        output_file = None
-        local_folder = '/tmp'
-
-        if local_folder:
-            try:
-                os.makedirs(local_folder, exist_ok=True)
-                output_file = os.path.join(local_folder, file_name)
-
-                # get the html text from the tmplate
-                html_content = render_to_string('RLO/rlo_pdf.html', context)
-
-                # create the PDF file for the invoice
-                pdfkit.from_string(html_content, output_file, options=self.pdf_options)
-                
-            except Exception as e:
-                # Handle any exceptions that occur during PDF generation
-                print("error")
-
-        return output_file
-
-
     def get_queryset(self):
         """
         Get the queryset for listing Rlo.
@@ -405,7 +353,45 @@ class RLOpdfView(CustomAuthenticationMixin, generics.RetrieveAPIView):
             else:
                 messages.error(request, "You are not authorized to perform this action")
                 return redirect(reverse('rlo_list'))
-    
+
+    @swagger_auto_schema(auto_schema=None)
+    def post(self, request, *args, **kwargs):
+        """
+        Queue the PDF rendering of the RLO letter.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            Response: The queued job id and the URL to poll for its status.
+        """
+        data_instance = self.get_queryset()
+        if isinstance(data_instance, HttpResponseRedirect):
+            return data_instance
+
+        data_instance = data_instance.first()
+        if not data_instance:
+            return create_api_response(status_code=status.HTTP_404_NOT_FOUND,
+                                       message="RLO not found OR You are not authorized to perform this action.")
+
+        serializer = self.serializer_class(instance=data_instance, context={'request': request})
+        context = {
+            'serializer': serializer,
+            'instance': data_instance,
+            'template_content': data_instance.edited_content,
+        }
+        unique_pdf_filename = f"{str(uuid.uuid4())}_rlo_{data_instance.id}.pdf"
+        pdf_path = f'job/{data_instance.job_id}/rlo/pdf'
+
+        job = queue_pdf_render(data_instance, 'rlo', self.template_name, context, pdf_path, unique_pdf_filename,
+                               user=request.user)
+
+        return create_api_response(
+            status_code=status.HTTP_202_ACCEPTED,
+            message="Your RLO letter PDF is being generated.",
+            data={'job_id': job.id, 'status_url': reverse('pdf_job_status', kwargs={'pk': job.id})},
+        )
+
 class RejectRLOView(CustomAuthenticationMixin, generics.CreateAPIView):
     """
     View for rejecting an RLO.
@@ -0,0 +1,112 @@
+from collections import defaultdict
+from django.db.models import Q
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Job, Team
+
+SCHEDULE_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+
+def member_jobs(member_ids, start=None, end=None):
+    """
+    Resolve the jobs of members, assigned to them directly or through one of their teams,
+    in three queries whatever the number of members, teams and jobs.
+
+    The jobs of a member are listed team by team, then the jobs assigned to the member
+    directly; a job is listed once per member. Jobs without dates cannot be placed on a
+    calendar and are left out.
+
+    Args:
+        member_ids (iterable): Ids of the members.
+        start (datetime, optional): With `end`, only jobs overlapping [start, end) are returned.
+        end (datetime, optional): End of the date range, exclusive.
+
+    Returns:
+        dict: {member_id: [Job, ...]} for every member id.
+    """
+    member_ids = list(dict.fromkeys(member_ids))
+
+    member_teams = defaultdict(list)
+    for member_id, team_id in (
+        Team.members.through.objects.filter(member_id__in=member_ids)
+        .order_by('team_id').values_list('member_id', 'team_id')
+    ):
+        member_teams[member_id].append(team_id)
+
+    member_direct_jobs = defaultdict(list)
+    for member_id, job_id in (
+        Job.assigned_to_member.through.objects.filter(member_id__in=member_ids)
+        .order_by('job_id').values_list('member_id', 'job_id')
+    ):
+        member_direct_jobs[member_id].append(job_id)
+
+    team_ids = {team_id for team_ids in member_teams.values() for team_id in team_ids}
+    job_ids = {job_id for job_ids in member_direct_jobs.values() for job_id in job_ids}
+
+    jobs = Job.objects.filter(
+        Q(assigned_to_team_id__in=team_ids) | Q(id__in=job_ids),
+        start_date__isnull=False, end_date__isnull=False,
+    )
+    if start and end:
+        jobs = jobs.filter(start_date__lt=end, end_date__gt=start)
+    jobs = list(jobs.only('id', 'status', 'start_date', 'end_date', 'customer_id', 'assigned_to_team').order_by('id'))
+
+    jobs_by_id = {job.id: job for job in jobs}
+    jobs_by_team = defaultdict(list)
+    for job in jobs:
+        if job.assigned_to_team_id:
+            jobs_by_team[job.assigned_to_team_id].append(job)
+
+    schedule = {}
+    for member_id in member_ids:
+        member_schedule = [job for team_id in member_teams[member_id] for job in jobs_by_team[team_id]]
+        listed = {job.id for job in member_schedule}
+        member_schedule.extend(
+            jobs_by_id[job_id] for job_id in member_direct_jobs[member_id]
+            if job_id in jobs_by_id and job_id not in listed
+        )
+        schedule[member_id] = member_schedule
+    return schedule
+
+
+def job_class_name(job, now=None):
+    """
+    The calendar colour of a job: completed, overdue or upcoming.
+    """
+    if job.status == 'completed':
+        return 'bg-gradient-success'
+    if job.end_date < (now or timezone.now()):
+        return 'bg-gradient-danger'
+    return 'bg-gradient-warning'
+
+
+def member_calendar_entries(members, start=None, end=None):
+    """
+    FullCalendar entries of the jobs of members, one entry per member and job.
+
+    Args:
+        members (iterable): Member instances, in display order.
+        start (datetime, optional): Start of the date range, see member_jobs.
+        end (datetime, optional): End of the date range, see member_jobs.
+
+    Returns:
+        list: The entries.
+    """
+    members = list(members)
+    schedule = member_jobs([member.id for member in members], start, end)
+    now = timezone.now()
+
+    entries = []
+    for member in members:
+        for job in schedule[member.id]:
+            entries.append({
+                'id': job.id,
+                'title': f'{member.name} - {member.email}',
+                'description': str(job),
+                'start': job.start_date.strftime(SCHEDULE_DATE_FORMAT),
+                'end': job.end_date.strftime(SCHEDULE_DATE_FORMAT),
+                'className': job_class_name(job, now),
+                'url': reverse('job_detail', kwargs={'customer_id': job.customer_id_id, 'job_id': job.id}) if job.customer_id_id else None,
+            })
+    return entries
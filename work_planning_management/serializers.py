@@ -4,14 +4,13 @@ from requirement_management.models import Quotation
 from authentication.models import User
 import re
 import uuid
-from datetime import datetime, timezone
+from datetime import timedelta
 from django.db import transaction
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.utils.html import strip_tags
 from django.core.validators import FileExtensionValidator
-from django.urls import reverse
 
 from rest_framework import serializers
 from rest_framework.fields import empty
@@ -22,13 +21,13 @@ from collections.abc import Mapping
 from authentication.models import User
 from infinity_fire_solutions.custom_form_validation import *
 from infinity_fire_solutions.aws_helper import *
+from infinity_fire_solutions.image_renditions import upload_documents
 from infinity_fire_solutions.validators import CustomImageFileValidator, CustomFileValidator
 from customer_management.models import SiteAddress
 from rest_framework.validators import UniqueValidator
 
 from .models import *
-
-from requirement_management.models import Requirement, RequirementDefect, RequirementDefectDocument, RequirementAsset
+from .schedules import member_calendar_entries
 
 
 class QuotationSerializer(serializers.ModelSerializer):
@@ -309,17 +308,12 @@ class STWRequirementSerializer(serializers.ModelSerializer):
         instance = STWRequirements.objects.create(**validated_data)
 
         if file_list and len(file_list) > 0:
-            for file in file_list:
-                unique_filename = f"{str(uuid.uuid4())}_{file.name}"
-                try:
-                    upload_file_to_s3(unique_filename, file, f'work_planning/{instance.id}')
-                    file_path = f'work_planning/{instance.id}/{unique_filename}'
-                    
-                    document = STWAsset.objects.create(stw_id=instance, document_path=file_path)
-                
-                except Exception as e:
-                    # Handle the exception (e.g., log the error) and decide what to do next
-                    pass
+            # Upload the files and the renditions of the images concurrently; files that fail to upload are skipped.
+            documents = upload_documents(file_list, f'work_planning/{instance.id}')
+            STWAsset.objects.bulk_create([
+                STWAsset(stw_id=instance, **document)
+                for document in documents if document
+            ])
 
         return instance
     
@@ -344,18 +338,11 @@ class STWRequirementSerializer(serializers.ModelSerializer):
             instance.save()
             # Update associated documents if file_list is provided
             if file_list and len(file_list) > 0:
-                for file in file_list:
-                    try:
-                        unique_filename = f"{str(uuid.uuid4())}_{file.name}"
-                        upload_file_to_s3(unique_filename, file, f'work_planning/{instance.id}')
-                        file_path = f'work_planning/{instance.id}/{unique_filename}'
-
-                        STWAsset.objects.create(
-                            stw_id=instance,
-                            document_path=file_path,
-                        )
-                    except Exception as e:
-                        print(f"Error uploading file {file.name}: {str(e)}")
+                documents = upload_documents(file_list, f'work_planning/{instance.id}')
+                STWAsset.objects.bulk_create([
+                    STWAsset(stw_id=instance, **document)
+                    for document in documents if document
+                ])
         
         return instance
     
@@ -406,137 +393,6 @@ class STWRequirementDetailsSerializer(serializers.ModelSerializer):
         ] if instance.stwasset_set.all() else []
         return representation
 
-class ConvertSTWToFRASerializer(serializers.ModelSerializer):
-    action = serializers.CharField(
-        required=True, 
-        validators=[action_description],
-        
-    )
-    RBNO = serializers.CharField(
-        required=True,
-        max_length=12,
-        
-    )
-    UPRN = serializers.CharField(
-        required=True, 
-        max_length=12,
-       
-    )
-    description = serializers.CharField(
-        required=True, 
-        
-        validators=[validate_description],
-        
-    )
-    site_address = serializers.PrimaryKeyRelatedField(
-        required = True,
-        queryset = SiteAddress.objects.all()
-    )
-
-    file_list = serializers.PrimaryKeyRelatedField(
-        queryset = STWAsset.objects.all(),
-        many=True
-    )
-    
-    class Meta:
-        model = Requirement
-        fields = ('RBNO','UPRN','action','description', 'site_address', 'file_list')
-
-    def create(self, validated_data):
-        stw_documents = validated_data.pop('file_list', [])
-        instance = super().create(validated_data)
-        try:
-            if stw_documents:
-                for stw_document in stw_documents:
-                    # Generate a unique filename for each file
-                    unique_filename = f"{stw_document.document_path.split('/')[-1:][0]}"
-
-                    file_path = f'requirement/{instance.id}/{unique_filename}'
-                    move_s3_file(stw_document.document_path, file_path)
-                    
-                    document = RequirementAsset.objects.create(
-                        requirement_id=instance,
-                        document_path=file_path,
-                    )
-        except Exception as e:
-            if 'NoSuchKey' not in str(e):
-                instance.delete()
-                raise serializers.ValidationError({
-                    'file_list': str(e)
-                })
-
-        return instance
-
-class ConvertSTWDefectsToFRADefectsSerializer(serializers.ModelSerializer):
-    action = serializers.CharField(
-        max_length=1000, 
-        required=True, 
-    )
-    
-    description = serializers.CharField(
-        max_length=1000, 
-        required=True, 
-    )
-    
-    rectification_description = serializers.CharField(
-        max_length=1000, 
-        required=True, 
-    )
-
-    defect_type = serializers.ChoiceField(
-        choices=STW_DEFECT_CHOICES,
-        default='actual_defect',
-    )
-
-    file_list = serializers.PrimaryKeyRelatedField(
-        queryset = STWDefectDocument.objects.all(),
-        many=True
-    )
-    
-    class Meta:
-        model = RequirementDefect
-        fields = ('action', 'description', 'rectification_description', 'defect_type', 'reference_number', 'file_list')
-    
-    def create(self, validated_data):
-        stw_defect_documents = validated_data.pop('file_list', [])
-        instance = super().create(validated_data)
-        try:
-            if stw_defect_documents:
-                for stw_defect_document in stw_defect_documents:
-                    # Generate a unique filename for each file
-                    unique_filename = f"{stw_defect_document.document_path.split('/')[-1:][0]}"
-
-                    file_path = f'requirement/{instance.id}/defects/{unique_filename}'
-                    if stw_defect_document.document_path != 'work_planning/31/defects/6551be21-14f1-496f-a6b5-722e54ed684b_Screenshot from 2024-01-30 11-40-01.png':
-                        move_s3_file(stw_defect_document.document_path, file_path)
-                    
-                    document = RequirementDefectDocument.objects.create(
-                        requirement_id=instance.requirement_id,
-                        defect_id = instance,
-                        document_path=file_path,
-                    )
-        except Exception as e:
-            if 'NoSuchKey' not in str(e):
-                instance.delete()
-                raise serializers.ValidationError({
-                    'file_list': str(e)
-                })
-
-        return instance
-
-
-class STWDefectsDetailedSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = STWDefect
-        fields = '__all__'
-    
-    def to_representation(self, instance):
-        ret = super().to_representation(instance)
-        ret['file_list'] = [
-            documents.id for documents in instance.stwdefectdocument_set.all()
-        ] if instance.stwdefectdocument_set.all() else []
-        return ret
-    
 
 class STWDefectSerializer(serializers.ModelSerializer):
     """
@@ -710,17 +566,16 @@ class STWDefectSerializer(serializers.ModelSerializer):
 
         if file_list and len(file_list) > 0:
 
-            for file in file_list:
-                # Generate a unique filename for each file
-                unique_filename = f"{str(uuid.uuid4())}_{file.name}"
-                upload_file_to_s3(unique_filename, file, f'work_planning/{instance.id}/defects')
-                file_path = f'work_planning/{instance.id}/defects/{unique_filename}'
-                
-                document = STWDefectDocument.objects.create(
-                stw_id=instance.stw_id,
-                defect_id = instance,
-                document_path=file_path,
+            # Upload the files and the renditions of the images concurrently
+            documents = upload_documents(file_list, f'work_planning/{instance.id}/defects')
+            STWDefectDocument.objects.bulk_create([
+                STWDefectDocument(
+                    stw_id=instance.stw_id,
+                    defect_id=instance,
+                    **document,
                 )
+                for document in documents if document
+            ])
             instance.save()
             return instance  # Return the created STWDefect instance
             
@@ -1377,6 +1232,16 @@ class EventSerializer(serializers.ModelSerializer):
         model = Events
         fields = ['name', 'team','description','member','start', 'end'] 
 
+    def validate(self, data):
+        # The calendar feed only looks CALENDAR_EVENT_MAX_DAYS back for events overlapping
+        # its window (see calendar_feed.events_in_window).
+        start, end = data.get('start'), data.get('end')
+        if start and end and end - start > timedelta(days=settings.CALENDAR_EVENT_MAX_DAYS):
+            raise serializers.ValidationError({
+                'end': [f'An event cannot be longer than {settings.CALENDAR_EVENT_MAX_DAYS} days.'],
+            })
+        return data
+
 class STWJobListSerializer(serializers.ModelSerializer):
     class Meta:
         model = Job
@@ -1414,53 +1279,24 @@ class JobStatusUpdateSerializer(serializers.ModelSerializer):
 
 class MemberCalendarSerializer(serializers.ModelSerializer):
     """
-    Serializer for Requirement model.
+    Serializer for the jobs of members on the dispatch calendar.
 
-    This serializer is used to get Requirements for a Surveyor and convert Requirement model instances to JSON representations.
+    The instance is a list of members; their jobs, direct and through their teams, are
+    resolved by work_planning_management.schedules in a constant number of queries.
+    An optional date range is read from the 'start' and 'end' context values.
 
     Methods:
-        to_representation: Convert the model instance to JSON representation.
+        to_representation: Convert the members to their calendar entries.
     """
 
     class Meta:
         model = Member
         fields = ('name', )
 
-    def to_representation(self, instance: Member):
-        try:
-            ret = []
-            for ins in instance:
-                className = 'bg-gradient-warning'
-                teams = ins.team_set.all()
-                jobs = [job for team in teams for job in team.job_set.all()]
-                jobs.extend([job for job in ins.job_set.all().exclude(id__in=[job.id for job in jobs])])
-                
-
-                for job in jobs:
-                    if job.status == 'completed':
-                        className = 'bg-gradient-success'
-
-                    title = job.__str__()
-                    member = ins.name
-                    start = job.start_date.strftime('%Y-%m-%dT%H:%M:%S')
-                    end = job.end_date.strftime('%Y-%m-%dT%H:%M:%S')
-
-                    if job.status != 'completed' and job.end_date < datetime.now(timezone.utc):
-                        className = 'bg-gradient-danger'
-                    ret.append(
-                        {
-                            'id': job.id,
-                            'title': f'{member} - {ins.email}',
-                            'description': f'{title}',
-                            'start': f'{start}',
-                            'end': f'{end}',
-                            'className': f'{className}',
-                            'url': f"{reverse('job_detail', kwargs={'customer_id': job.customer_id.id, 'job_id': job.id})}"
-                        }
-                    )
-            return {'jobs': ret}
-        except Exception as e:
-            return {}
+    def to_representation(self, instance):
+        return {
+            'jobs': member_calendar_entries(instance, self.context.get('start'), self.context.get('end')),
+        }
 
 class TeamUpdateSerializer(serializers.ModelSerializer):
     team_name = serializers.CharField(
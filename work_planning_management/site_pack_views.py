@@ -3,7 +3,6 @@ from django.urls import reverse
 from django.contrib import messages
 from django.conf import settings
 from django.http.response import JsonResponse
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 
 from rest_framework import generics, permissions, filters, status, renderers
 from rest_framework.renderers import TemplateHTMLRenderer, JSONRenderer
@@ -12,6 +11,7 @@ from drf_yasg.utils import swagger_auto_schema
 from infinity_fire_solutions.response_schemas import create_api_response, convert_serializer_errors, render_html_response
 from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.permission import *
+from infinity_fire_solutions.pagination import PaginatedListMixin
 from infinity_fire_solutions.utils import docs_schema_response_new
 from django.http import FileResponse, Http404
 import ast
@@ -52,7 +52,7 @@ def sitepack_image(sitepack_instance):
         })
     return document_paths   
 
-class DocumentListView(CustomAuthenticationMixin,generics.ListAPIView):
+class DocumentListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     """
     View to get the listing of all stw requirements.
     Supports both HTML and JSON response formats.
@@ -61,6 +61,7 @@ class DocumentListView(CustomAuthenticationMixin,generics.ListAPIView):
     renderer_classes = [TemplateHTMLRenderer,JSONRenderer]
     filter_backends = [filters.SearchFilter]
     template_name = 'site_packs/document_list.html'
+    paginate_by = 10
     ordering_fields = ['created_at'] 
 
     common_get_response = {
@@ -72,21 +73,6 @@ class DocumentListView(CustomAuthenticationMixin,generics.ListAPIView):
             )
     }
     
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 10 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
     
     def get_queryset(self):
         """
@@ -328,7 +314,7 @@ def download_document(request, asset_id):
         return response
 
 
-class SitepackJobListView(CustomAuthenticationMixin, generics.ListAPIView):
+class SitepackJobListView(PaginatedListMixin, CustomAuthenticationMixin, generics.ListAPIView):
     """
     View to get the listing of all sitepack jobs.
     Supports both HTML and JSON response formats.
@@ -337,6 +323,7 @@ class SitepackJobListView(CustomAuthenticationMixin, generics.ListAPIView):
     renderer_classes = [TemplateHTMLRenderer, JSONRenderer]
     filter_backends = [filters.SearchFilter]
     template_name = 'site_packs/sitepack_job_list.html'
+    paginate_by = 10
     ordering_fields = ['created_at']
     common_get_response = {
         status.HTTP_200_OK:
@@ -346,19 +333,6 @@ class SitepackJobListView(CustomAuthenticationMixin, generics.ListAPIView):
                 message="Data retrieved",
             )
     }
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 10
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If the page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If the page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        return current_page
     
     def get_queryset(self):
         """
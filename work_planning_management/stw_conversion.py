@@ -0,0 +1,193 @@
+from collections import defaultdict
+from django.conf import settings
+from django.db import transaction
+from rest_framework import serializers
+
+from infinity_fire_solutions.custom_form_validation import action_description, validate_description
+from requirement_management.models import Requirement, RequirementAsset, RequirementDefect, RequirementDefectDocument
+from .models import STWRequirements, STWAsset, STWDefect, STWDefectDocument, STW_DEFECT_CHOICES
+
+# Required fields copied to the FRA and their maximum length, None for no limit.
+REQUIREMENT_FIELD_LIMITS = {'RBNO': 12, 'UPRN': 12, 'action': None, 'description': None}
+DEFECT_FIELD_LIMITS = {'action': 1000, 'description': 1000, 'rectification_description': 1000}
+REQUIREMENT_FIELD_VALIDATORS = {'action': action_description, 'description': validate_description}
+
+
+def _field_errors(instance, limits, validators=None):
+    errors = {}
+    for field, max_length in limits.items():
+        value = getattr(instance, field)
+        if not value:
+            errors[field] = ['This field is required.']
+        elif max_length and len(value) > max_length:
+            errors[field] = [f'Ensure this field has no more than {max_length} characters.']
+        elif validators and field in validators:
+            try:
+                validators[field](value)
+            except serializers.ValidationError as e:
+                errors[field] = list(e.detail)
+    return errors
+
+
+def validate_stw(stw, defects):
+    """
+    Check that an STW and its defects can be converted.
+
+    Args:
+        stw (STWRequirements): The STW.
+        defects (list): Its STWDefect instances.
+
+    Returns:
+        dict: The errors by field, with the errors of the defects under 'defects' keyed by
+              defect id; empty if the STW can be converted.
+    """
+    errors = _field_errors(stw, REQUIREMENT_FIELD_LIMITS, REQUIREMENT_FIELD_VALIDATORS)
+    if not stw.site_address_id:
+        errors['site_address'] = ['This field is required.']
+
+    defect_types = dict(STW_DEFECT_CHOICES)
+    defect_errors = {}
+    for defect in defects:
+        error = _field_errors(defect, DEFECT_FIELD_LIMITS)
+        if defect.defect_type not in defect_types:
+            error['defect_type'] = [f'"{defect.defect_type}" is not a valid choice.']
+        if error:
+            defect_errors[defect.id] = error
+    if defect_errors:
+        errors['defects'] = defect_errors
+    return errors
+
+
+def _convert_batch(stws, defects_by_stw, user):
+    """
+    Copy a batch of validated STWs, with their defects, assets and documents, to FRAs and
+    delete the STWs, in one transaction.
+
+    The FRAs are saved one by one, so they get their ids and signals (e.g. the search
+    index); the rows hanging off them are written with one bulk_create per table. The
+    copies keep the S3 keys of the STW files: the objects are not copied or moved.
+
+    Returns:
+        dict: {stw_id: requirement_id}.
+    """
+    stw_ids = [stw.id for stw in stws]
+    assets = STWAsset.objects.filter(stw_id__in=stw_ids).order_by('id')
+    documents = STWDefectDocument.objects.filter(stw_id__in=stw_ids).order_by('id')
+
+    with transaction.atomic():
+        requirements = {}
+        for stw in stws:
+            requirement = Requirement(
+                user_id=user,
+                customer_id_id=stw.customer_id_id,
+                RBNO=stw.RBNO,
+                UPRN=stw.UPRN,
+                action=stw.action,
+                description=stw.description,
+                site_address_id=stw.site_address_id,
+            )
+            requirement.save()
+            requirements[stw.id] = requirement.id
+
+        RequirementAsset.objects.bulk_create([
+            RequirementAsset(
+                requirement_id_id=requirements[asset.stw_id_id],
+                document_path=asset.document_path,
+                thumbnail_path=asset.thumbnail_path,
+                print_path=asset.print_path,
+            )
+            for asset in assets
+        ], batch_size=settings.STW_CONVERSION_BULK_SIZE)
+
+        stw_defects = [defect for stw in stws for defect in defects_by_stw[stw.id]]
+        RequirementDefect.objects.bulk_create([
+            RequirementDefect(
+                requirement_id_id=requirements[defect.stw_id_id],
+                action=defect.action,
+                description=defect.description,
+                rectification_description=defect.rectification_description,
+                reference_number=defect.reference_number,
+                defect_type=defect.defect_type,
+            )
+            for defect in stw_defects
+        ], batch_size=settings.STW_CONVERSION_BULK_SIZE)
+
+        # MySQL does not return the ids of bulk inserted rows. The new FRAs are not
+        # committed, so all their defects are the ones just inserted, and a bulk insert
+        # gives its rows increasing ids in insertion order.
+        new_defect_ids = RequirementDefect.objects.filter(
+            requirement_id__in=requirements.values()
+        ).order_by('id').values_list('id', flat=True)
+        defects = {stw_defect.id: defect_id for stw_defect, defect_id in zip(stw_defects, new_defect_ids)}
+
+        RequirementDefectDocument.objects.bulk_create([
+            RequirementDefectDocument(
+                requirement_id_id=requirements[document.stw_id_id],
+                defect_id_id=defects[document.defect_id_id],
+                document_path=document.document_path,
+                thumbnail_path=document.thumbnail_path,
+                print_path=document.print_path,
+            )
+            for document in documents
+        ], batch_size=settings.STW_CONVERSION_BULK_SIZE)
+
+        STWRequirements.objects.filter(id__in=stw_ids).delete()
+
+    return requirements
+
+
+def convert_stws(stw_ids, user, progress=None):
+    """
+    Convert STWs to FRAs: each STW becomes an FRA of the same customer, created by
+    `user`, with copies of its defects, assets and defect documents; the STW is deleted.
+
+    STWs that are part of a job, and STWs or defects failing validate_stw, are not
+    converted. The others are converted STW_CONVERSION_BATCH_SIZE at a time, each batch
+    in one transaction: if writing a batch fails, none of its STWs is converted.
+
+    Args:
+        stw_ids (iterable): Ids of the STWs.
+        user (User): The user converting the STWs.
+        progress (callable, optional): Called with (converted, failed, total) after each batch.
+
+    Returns:
+        dict: 'converted' as {stw_id: requirement_id} and 'failed' as {stw_id: errors}.
+    """
+    stw_ids = list(dict.fromkeys(stw_ids))
+    report = {'converted': {}, 'failed': {}}
+
+    found = set(STWRequirements.objects.filter(id__in=stw_ids).values_list('id', flat=True))
+    in_jobs = set(STWRequirements.objects.filter(id__in=found, job__isnull=False).values_list('id', flat=True))
+    for stw_id in stw_ids:
+        if stw_id not in found:
+            report['failed'][stw_id] = {'stw': ['STW not found.']}
+        elif stw_id in in_jobs:
+            report['failed'][stw_id] = {'stw': ['The STW is part of a job.']}
+
+    pending = [stw_id for stw_id in stw_ids if stw_id not in report['failed']]
+    batch_size = max(settings.STW_CONVERSION_BATCH_SIZE, 1)
+    for start in range(0, len(pending), batch_size):
+        batch_ids = pending[start:start + batch_size]
+        stws = list(STWRequirements.objects.filter(id__in=batch_ids).order_by('id'))
+        defects_by_stw = defaultdict(list)
+        for defect in STWDefect.objects.filter(stw_id__in=batch_ids).order_by('id'):
+            defects_by_stw[defect.stw_id_id].append(defect)
+
+        valid = []
+        for stw in stws:
+            errors = validate_stw(stw, defects_by_stw[stw.id])
+            if errors:
+                report['failed'][stw.id] = errors
+            else:
+                valid.append(stw)
+
+        if valid:
+            try:
+                report['converted'].update(_convert_batch(valid, defects_by_stw, user))
+            except Exception as e:
+                for stw in valid:
+                    report['failed'][stw.id] = {'stw': [f'Conversion failed: {e}']}
+
+        if progress:
+            progress(len(report['converted']), len(report['failed']), len(stw_ids))
+    return report
@@ -1,3 +1,115 @@
-from django.test import TestCase
+from datetime import datetime, timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
 
-# Create your tests here.
+from authentication.models import User, UserRole, UserRolePermission
+from requirement_management.models import Requirement, Report, Quotation
+from .calendar_feed import events_in_window
+from .models import STWRequirements, Job, Events
+
+
+class CustomerListQueryCountTests(TestCase):
+    """
+    The customer lists count the quotations, STWs and jobs of their customers in the query
+    that pages the customers, so the queries of a page do not grow with the customers on it.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer_role = UserRole.objects.create(name='Customer')
+        admin_role = UserRole.objects.create(name='projects_admin_(IT)')
+        UserRolePermission.objects.create(
+            role=admin_role, module='survey', can_create_data=True,
+            can_list_data='all', can_change_data='all', can_view_data='all', can_delete_data='all',
+        )
+        cls.user = User.objects.create_user(
+            email='admin@example.com', password='password', first_name='Admin', last_name='User', roles=admin_role,
+            enforce_password_change=True,
+        )
+
+    def setUp(self):
+        # The request logger reads the user agent of every request.
+        self.client = self.client_class(HTTP_USER_AGENT='Mozilla/5.0')
+        self.client.force_login(self.user)
+        self.customers = 0
+
+    def add_customers(self, count):
+        """
+        Add customers with an approved quotation not planned yet, an STW and a planned job each.
+        """
+        for _ in range(count):
+            self.customers += 1
+            customer = User.objects.create_user(
+                email=f'customer{self.customers}@example.com', password='password',
+                first_name='Customer', last_name=str(self.customers), roles=self.customer_role, is_active=False,
+            )
+            requirement = Requirement.objects.create(
+                user_id=self.user, customer_id=customer, description='Fire door', action='Replace the fire door',
+            )
+            report = Report.objects.create(user_id=self.user, requirement_id=requirement)
+            Quotation.objects.create(
+                user_id=self.user, customer_id=customer, requirement_id=requirement, report_id=report,
+                quotation_json={}, status='to-commence',
+            )
+            STWRequirements.objects.create(
+                user_id=self.user, customer_id=customer, description='Fire door', action='Replace the fire door',
+                postcode='SW1A 1AA',
+            )
+            Job.objects.create(customer_id=customer, status='planned')
+
+    def assertQueriesIndependentOfCustomers(self, url):
+        self.add_customers(2)
+        # Paginated totals are cached; clear them so both requests count the customers.
+        cache.clear()
+        with CaptureQueriesContext(connection) as baseline:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['customers_with_counts']), 2)
+
+        self.add_customers(3)
+        cache.clear()
+        with self.assertNumQueries(len(baseline)):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['customers_with_counts']), 5)
+        return response
+
+    def test_approved_quotation_customers(self):
+        response = self.assertQueriesIndependentOfCustomers(reverse('approved_quotation_view'))
+        for entry in response.context['customers_with_counts']:
+            self.assertEqual(entry['quote_counts'], 1)
+
+    def test_stw_customers(self):
+        response = self.assertQueriesIndependentOfCustomers(reverse('stw_customers_list'))
+        for entry in response.context['customers_with_counts']:
+            self.assertEqual(entry['stw_counts'], 1)
+
+    def test_job_customers(self):
+        response = self.assertQueriesIndependentOfCustomers(reverse('job_customers_list'))
+        for entry in response.context['customers_with_counts']:
+            self.assertEqual(entry['job_counts'], 1)
+
+
+@override_settings(CALENDAR_EVENT_MAX_DAYS=30)
+class CalendarFeedWindowTests(TestCase):
+    """
+    The feed returns the events overlapping its window, including events that started
+    before it, up to CALENDAR_EVENT_MAX_DAYS back.
+    """
+
+    def test_events_overlapping_the_window(self):
+        start = timezone.make_aware(datetime(2024, 3, 1))
+        end = start + timedelta(days=7)
+        day = timedelta(days=1)
+        inside = Events.objects.create(name='inside', start=start + day, end=start + 2 * day)
+        running = Events.objects.create(name='running', start=start - 20 * day, end=start + day)
+        instant = Events.objects.create(name='instant', start=start + day)
+        Events.objects.create(name='before', start=start - 3 * day, end=start - day)
+        Events.objects.create(name='after', start=end, end=end + day)
+        Events.objects.create(name='too long', start=start - 40 * day, end=start + day)
+
+        self.assertEqual(list(events_in_window(start, end)), [running, inside, instant])
@@ -14,14 +14,19 @@ from rest_framework.request import Request
 import json
 from drf_yasg.utils import swagger_auto_schema
 
-from requirement_management.models import Requirement, Quotation,RequirementDefect
-from .serializers import QuotationSerializer, ConvertSTWToFRASerializer, STWDefectSerializer, ConvertSTWDefectsToFRADefectsSerializer, STWDefectsDetailedSerializer, STWRequirementDetailsSerializer, TeamUpdateSerializer, STWRequirementsListSerializer, STWRequirementDefectSerializer,JobStatusUpdateSerializer
+from requirement_management.models import Quotation
+from .serializers import QuotationSerializer, STWDefectSerializer, STWRequirementDetailsSerializer, TeamUpdateSerializer, STWRequirementsListSerializer, STWRequirementDefectSerializer,JobStatusUpdateSerializer
 from requirement_management.serializers  import RequirementAddSerializer,RequirementDefectAddSerializer,RequirementAssetSerializer
 
 from infinity_fire_solutions.response_schemas import create_api_response, convert_serializer_errors, render_html_response
 from infinity_fire_solutions.aws_helper import *
 from infinity_fire_solutions.permission import *
+from infinity_fire_solutions.pagination import PaginatedListMixin
+from common_app.search import search_queryset
 from infinity_fire_solutions.utils import docs_schema_response_new
+from infinity_fire_solutions.customer_counts import customers_with_counts, paginate_customers_with_counts
+from .calendar_feed import CalendarWindowError, parse_window, events_in_window, window_etag, serialize_events
+from .stw_conversion import convert_stws
 
 from .models import *
 from .serializers import STWRequirementSerializer, CustomerSerializer, STWDefectSerializer, JobListSerializer,AddJobSerializer,MemberSerializer,TeamSerializer,JobAssignmentSerializer,EventSerializer,STWJobListSerializer, JobCreateSerializer, MemberCalendarSerializer, AttachSitePackSerializer, AddAndAttachSitePackSerializer, CreateRLOSeirlaizer, UpdateRLOSeirlaizer
@@ -40,15 +45,14 @@ from django.utils import timezone
 import datetime
 from urllib.parse import quote
 
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.http import (
     Http404,
     HttpResponseBadRequest,
     HttpResponseRedirect,
     JsonResponse,
 )
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.http import FileResponse
+from django.utils.cache import get_conditional_response
 
 from infinity_fire_solutions.aws_helper import generate_presigned_url
 
@@ -101,49 +105,18 @@ class ApprovedQuotationCustomerListView(CustomAuthenticationMixin, generics.List
         Returns:
             QuerySet: A queryset of stw Requirement customers.
         """
-        quote = Quotation.objects.filter(
-            status__in=['to-commence'],
-            job__isnull=True
-        ).order_by('customer_id').values_list('customer_id', flat=True).distinct()
-        
-        if not quote:
-            return []
-        
         queryset = User.objects.filter(
-            is_active=False,  roles__name__icontains='customer',
-            id__in=quote
-            ).exclude(pk=self.request.user.id)
-        return queryset
-        
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
-    
-    def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
+            is_active=False, roles__name__icontains='customer'
+        ).exclude(pk=self.request.user.id)
 
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
+        # Customers with at least one approved quotation which is not planned in a job yet.
+        return customers_with_counts(
+            queryset, 'quote_counts', 'customer_quotations',
+            {'status': 'to-commence', 'job__isnull': True}, only_with_counts=True,
+        ).order_by('-id')
 
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+    def get_searched_queryset(self, queryset):
+        return search_queryset(queryset, 'customer', self.request.query_params.get('q', ''))
 
     def get(self, request, *args, **kwargs):
         """
@@ -174,18 +147,10 @@ class ApprovedQuotationCustomerListView(CustomAuthenticationMixin, generics.List
 
         queryset = self.get_queryset()
         queryset = self.get_searched_queryset(queryset)
-        all_quotes = Quotation.objects.filter(status="to-commence")
-        
-        customers_with_counts = []  # Create a list to store customer objects with counts
-
-        for customer in queryset:
-            quote_counts = all_quotes.filter(customer_id=customer, job__isnull=True).count()
-            customers_with_counts.append({'customer': customer, 'quote_counts': quote_counts})
-
 
         if request.accepted_renderer.format == 'html':
             context = {
-                'customers_with_counts': self.get_paginated_queryset(customers_with_counts),
+                'customers_with_counts': paginate_customers_with_counts(queryset, 'quote_counts', request),
                 'search_fields': ['name', 'email','company name'],
                 'search_value': request.query_params.get('q', '') if isinstance(request.query_params.get('q', []), str) else ', '.join(request.query_params.get('q', [])),
             }  # Pass the list of customers with counts to the template
@@ -196,7 +161,7 @@ class ApprovedQuotationCustomerListView(CustomAuthenticationMixin, generics.List
                                     message="Data retrieved",
                                     data=serializer.data)
     
-class ApprovedQuotationListView(CustomAuthenticationMixin, generics.ListAPIView):
+class ApprovedQuotationListView(PaginatedListMixin, CustomAuthenticationMixin, generics.ListAPIView):
     renderer_classes = [TemplateHTMLRenderer, JSONRenderer]
     serializer_class = RequirementQuotationListSerializer
     filter_backends = [filters.SearchFilter]
@@ -204,34 +169,8 @@ class ApprovedQuotationListView(CustomAuthenticationMixin, generics.ListAPIView)
     template_name = 'approved_quotation_list.html'
 
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'quotation', self.request.query_params.get('q', ''))
     
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
     
     def get_queryset(self):
 
@@ -283,7 +222,7 @@ class ApprovedQuotationListView(CustomAuthenticationMixin, generics.ListAPIView)
         
         if request.accepted_renderer.format == 'html':
             context = {
-                'approved_quotation': self.get_paginated_queryset(self.serializer_class(queryset, many=True).data),
+                'approved_quotation': self.get_serialized_page(queryset, self.serializer_class),
                 'customer_id': customer_id,
                 'customer_data': customer_data,
                 'exclude': self.request.query_params.get('exclude', False),
@@ -348,7 +287,10 @@ def stw_requirement_image(stw_instance):
     """
     document_paths = []
     
-    for document in STWAsset.objects.filter(stw_id=stw_instance):
+    documents = list(STWAsset.objects.filter(stw_id=stw_instance))
+    # Sign all the URLs at once, the signatures are cached and reused across pages.
+    urls = presign_many([path for document in documents for path in (document.document_path, document.thumbnail_path)])
+    for document in documents:
         extension = document.document_path.split('.')[-1].lower()
 
         # is_video = extension in ['mp4', 'avi', 'mov']  # Add more video extensions if needed
@@ -356,7 +298,8 @@ def stw_requirement_image(stw_instance):
         is_video = False
         is_image = extension in ['jpg', 'jpeg', 'png', 'gif']  # Add more image extensions if needed
         document_paths.append({
-            'presigned_url': generate_presigned_url(document.document_path),
+            'presigned_url': urls.get(document.document_path),
+            'thumbnail_url': urls.get(document.thumbnail_path or document.document_path),
             'filename': document.document_path,
             'id': document.id,
             'is_video': is_video,
@@ -447,37 +390,14 @@ class STWCustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
             QuerySet: A queryset of stw Requirement customers.
         """
         queryset = User.objects.filter(is_active=False,  roles__name='Customer').exclude(pk=self.request.user.id)
-        return queryset
-        
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
-    
-    def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
 
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
+        # Customers with the most STW requirements not planned in a job yet first.
+        return customers_with_counts(
+            queryset, 'stw_counts', 'stw_requirement', {'job__isnull': True}
+        ).order_by('-stw_counts', '-id')
 
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+    def get_searched_queryset(self, queryset):
+        return search_queryset(queryset, 'customer', self.request.query_params.get('q', ''))
 
     def get(self, request, *args, **kwargs):
         """
@@ -506,16 +426,9 @@ class STWCustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
 
         queryset = self.get_queryset()
         queryset = self.get_searched_queryset(queryset)
-        all_stw = STWRequirements.objects.filter()
-        
-        customers_with_counts = []  # Create a list to store customer objects with counts
-
-        for customer in queryset:
-            stw_counts = all_stw.filter(customer_id=customer, job__isnull=True).count()
-            customers_with_counts.append({'customer': customer, 'stw_counts': stw_counts})
 
         if request.accepted_renderer.format == 'html':
-            context = {'customers_with_counts': self.get_paginated_queryset(sorted(customers_with_counts, key=lambda x: x['stw_counts'], reverse=True)),
+            context = {'customers_with_counts': paginate_customers_with_counts(queryset, 'stw_counts', request),
                 'search_fields': ['name', 'email','company name'],
                 'search_value': request.query_params.get('q', '') if isinstance(request.query_params.get('q', []), str) else ', '.join(request.query_params.get('q', []))
                 }  # Pass the list of customers with counts to the template
@@ -526,7 +439,7 @@ class STWCustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
                                     message="Data retrieved",
                                     data=serializer.data)
         
-class STWRequirementListView(CustomAuthenticationMixin,generics.ListAPIView):
+class STWRequirementListView(PaginatedListMixin, CustomAuthenticationMixin,generics.ListAPIView):
     """
     View to get the listing of all stw requirements.
     Supports both HTML and JSON response formats.
@@ -562,21 +475,6 @@ class STWRequirementListView(CustomAuthenticationMixin,generics.ListAPIView):
         
         return queryset
     
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
     
     def get_filtered_queryset(self, queryset):
         # Get the filtering parameters from the request's query parameters
@@ -648,7 +546,7 @@ class STWRequirementListView(CustomAuthenticationMixin,generics.ListAPIView):
 
             if request.accepted_renderer.format == 'html':
                 context = {
-                    'stw_requirements': self.get_paginated_queryset(self.serializer_class(queryset, many=True).data), 
+                    'stw_requirements': self.get_serialized_page(queryset, self.serializer_class), 
                     'customer_id':customer_id,
                     'customer_data':customer_data,
                     'search_fields': self.search_fields,
@@ -1008,21 +906,6 @@ class ConvertToFRAView(CustomAuthenticationMixin, generics.UpdateAPIView):
 
         return queryset
 
-    def convert_and_attach_defects_to_fra(self, stw_instance: STWRequirements, fra_instance: Requirement):
-
-        stw_defects = STWDefect.objects.filter(stw_id=stw_instance).all()
-        if not stw_defects:
-            return True, []
-
-        serializer = STWDefectsDetailedSerializer(instance=stw_defects, many=True)
-        convert_defect_serializer = ConvertSTWDefectsToFRADefectsSerializer(data=serializer.data, many=True)
-        if convert_defect_serializer.is_valid():
-            fra_defects = convert_defect_serializer.save(requirement_id=fra_instance)
-            stw_defects.delete()
-            return True, []
-        
-        return False, convert_defect_serializer.errors
-
     def get(self, request, *args, **kwargs):
         """
         Handle GET request to display a form for adding a STW requirement.
@@ -1042,28 +925,18 @@ class ConvertToFRAView(CustomAuthenticationMixin, generics.UpdateAPIView):
             messages.error(request, 'You are not authorised to perform this operation')
             return redirect(reverse('customer_stw_list', kwargs={'customer_id': customer_id}))
 
-        self.customer = instance.customer_id
-        stw_requirements_serializer = self.get_serializer(instance=instance)
-        convert_stw_to_fra_serializer = ConvertSTWToFRASerializer(data=stw_requirements_serializer.data)
-        if convert_stw_to_fra_serializer.is_valid():
-            try:
-                fra_requirement: Requirement = convert_stw_to_fra_serializer.save(user_id=request.user, customer_id=self.customer)
-
-                defectCreated, defectErrors = self.convert_and_attach_defects_to_fra(instance, fra_requirement)
-                if not defectCreated and defectErrors:
-                    fra_requirement.delete()
-                    messages.error(request, 'Unable to validate the STW Defects data to convert it to a FRA Defects, aborting the converstion.')
-                    return redirect(reverse('customer_stw_list', kwargs={'customer_id': customer_id}))
-
-                instance.delete()
-                messages.success(request, 'STW Successfully Converted to the FRA.')
-                return redirect(reverse('customer_requirement_list', kwargs={'customer_id': customer_id}))
-            
-            except Exception as e:
-                messages.error(request, 'Something went wrong while converting the to FRA, please try again later.')
-                return redirect(reverse('customer_stw_list', kwargs={'customer_id': customer_id}))
+        report = convert_stws([instance.id], request.user)
+        if instance.id in report['converted']:
+            messages.success(request, 'STW Successfully Converted to the FRA.')
+            return redirect(reverse('customer_requirement_list', kwargs={'customer_id': customer_id}))
 
-        messages.error(request, 'Unable to validate the STW data to convert it to a FRA.')
+        errors = report['failed'].get(instance.id, {})
+        if 'stw' in errors:
+            messages.error(request, 'Something went wrong while converting the to FRA, please try again later.')
+        elif set(errors) - {'defects'}:
+            messages.error(request, 'Unable to validate the STW data to convert it to a FRA.')
+        else:
+            messages.error(request, 'Unable to validate the STW Defects data to convert it to a FRA Defects, aborting the converstion.')
         return redirect(reverse('customer_stw_list', kwargs={'customer_id': customer_id}))
 
 class STWRemoveDocumentView(generics.DestroyAPIView):
@@ -1094,7 +967,7 @@ class STWRemoveDocumentView(generics.DestroyAPIView):
             )
             
 
-class STWDetailView(CustomAuthenticationMixin,generics.RetrieveAPIView):
+class STWDetailView(PaginatedListMixin, CustomAuthenticationMixin,generics.RetrieveAPIView):
     """
 
     View to get the stw.
@@ -1123,21 +996,6 @@ class STWDetailView(CustomAuthenticationMixin,generics.RetrieveAPIView):
 
         return None
     
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
     
 
     @swagger_auto_schema(auto_schema=None)
@@ -1177,7 +1035,7 @@ class STWDetailView(CustomAuthenticationMixin,generics.RetrieveAPIView):
                 context = {
                     'serializer': serializer, 
                     'stw_instance': instance, 
-                    'stw_defect': self.get_paginated_queryset(STWRequirementDefectSerializer(stw_defect, many=True).data),
+                    'stw_defect': self.get_serialized_page(stw_defect, STWRequirementDefectSerializer),
                     'document_paths': document_paths,
                     'customer_id': kwargs.get('customer_id'),
                     'customer_data':customer_data
@@ -1218,7 +1076,6 @@ class STWDefectView(CustomAuthenticationMixin, generics.CreateAPIView):
         
         return queryset
 
-    
     def get_queryset_defect(self):
         """
         Get the filtered queryset for stw requirements based on the authenticated user.
@@ -1452,14 +1309,18 @@ class STWDefectDetailView(CustomAuthenticationMixin, generics.CreateAPIView):
         document_paths = []
         
         defect_instance = self.get_queryset().first()
-        for document in STWDefectDocument.objects.filter(defect_id=defect_instance):
+        documents = list(STWDefectDocument.objects.filter(defect_id=defect_instance))
+        # Sign all the URLs at once, the signatures are cached and reused across pages.
+        urls = presign_many([path for document in documents for path in (document.document_path, document.thumbnail_path)])
+        for document in documents:
                 extension = document.document_path.split('.')[-1].lower()
 
                 is_video = extension in ['mp4', 'avi', 'mov']  # Add more video extensions if needed
                 is_image = extension in ['jpg', 'jpeg', 'png', 'gif']  # Add more image extensions if needed
                 
                 document_paths.append({
-                    'presigned_url': generate_presigned_url(document.document_path),
+                    'presigned_url': urls.get(document.document_path),
+                    'thumbnail_url': urls.get(document.thumbnail_path or document.document_path),
                     'filename': document.document_path,
                     'id': document.id,
                     'is_video': is_video,
@@ -1667,7 +1528,6 @@ class SORUpdateView(CustomAuthenticationMixin, generics.UpdateAPIView):
     template_name = 'stw_sor/sor_form.html'
 
 
-    
     def get_queryset(self):
         """
         Get the queryset for listing SOR SORs.
@@ -1917,7 +1777,7 @@ def filter_job(data_access_value, user, customer=None):
     # Apply the filter based on data_access_value
     queryset = base_queryset.filter(filter_mapping.get(data_access_value, Q()))
     return queryset
-class JobsListView(CustomAuthenticationMixin, generics.ListAPIView):
+class JobsListView(PaginatedListMixin, CustomAuthenticationMixin, generics.ListAPIView):
     serializer_class = STWJobListSerializer
     renderer_classes = [TemplateHTMLRenderer, JSONRenderer]
     filter_backends = [filters.SearchFilter]
@@ -1967,35 +1827,8 @@ class JobsListView(CustomAuthenticationMixin, generics.ListAPIView):
         
         return queryset
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20 
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
-    
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-
-            queryset = queryset.filter(q_objects)
-        
-        return queryset
+        return search_queryset(queryset, 'job', self.request.query_params.get('q', ''))
 
     def get_queryset(self, data_access_value, customer_data):
         """
@@ -2128,76 +1961,6 @@ class AddJobView(CustomAuthenticationMixin, generics.CreateAPIView):
                                     message="We apologize for the inconvenience, but please review the below information.",
                                     data=convert_serializer_errors(serializer.errors))
 
-class JobCustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
-    """
-    View for listing job Requirement customers.
-
-    This view lists job Requirement customers, optionally filtered and searchable.
-    It provides both HTML and JSON rendering.
-
-    Attributes:
-        serializer_class (JOBCustomerSerializer): The serializer class.
-        renderer_classes (list): The renderer classes for HTML and JSON.
-        filter_backends (list): The filter backends, including search filter.
-        search_fields (list): The fields for search.
-        template_name (str): The template name for HTML rendering.
-        ordering_fields (list): The fields for ordering.
-    """
-
-    serializer_class = CustomerSerializer
-    renderer_classes = [TemplateHTMLRenderer,JSONRenderer]
-    filter_backends = [filters.SearchFilter]
-    search_fields = ['customer_id__first_name', 'customer_id__last_name']
-    template_name = 'job_customer_list.html'
-    ordering_fields = ['created_at'] 
-
-    def get_queryset(self):
-            """
-        Get the queryset of stw Requirement customers.
-
-        Returns:
-            QuerySet: A queryset of stw Requirement customers.
-        """
-            queryset = User.objects.filter(is_active=False,  roles__name__icontains='customer').exclude(pk=self.request.user.id)
-            return queryset
-        
-
-
-    def get(self, request, *args, **kwargs):
-        """
-        Handle GET requests for listing STW Requirement customers.
-
-        Args:
-            request (HttpRequest): The HTTP request object.
-
-        Returns:
-            HttpResponse: The response, either HTML or JSON.
-        """
-        authenticated_user, data_access_value = check_authentication_and_permissions(
-            self, "survey", HasListDataPermission, 'list'
-        )
-        if isinstance(authenticated_user, HttpResponseRedirect):
-            return authenticated_user  # Redirect the user to the page specified in the HttpResponseRedirect
-
-        queryset = self.get_queryset()
-        all_stw = Quotation.objects.filter(status="approved")
-        
-        customers_with_counts = []  # Create a list to store customer objects with counts
-
-        for customer in queryset:
-            stw_counts = all_stw.filter(customer_id=customer).count()
-            customers_with_counts.append({'customer': customer, 'stw_counts': stw_counts})
-
-        if request.accepted_renderer.format == 'html':
-            context = {'customers_with_counts': customers_with_counts}  # Pass the list of customers with counts to the template
-            return render_html_response(context, self.template_name)
-        else:
-            serializer = self.serializer_class(queryset, many=True)
-            return create_api_response(status_code=status.HTTP_200_OK,
-                                    message="Data retrieved",
-                                    data=serializer.data)
-        
-
 # class JobDeleteView(CustomAuthenticationMixin, generics.DestroyAPIView):
 #     """
 #     View for deleting a single job.
@@ -2459,7 +2222,7 @@ class MarkAsCompleteJobView(CustomAuthenticationMixin, generics.GenericAPIView):
         messages.error(request, "You are not authorized to perform this action")
         return redirect(reverse('job_detail', kwargs={'job_id': instance.id, 'customer_id': customer.id}))
  
-class JobSitePacksDetailView(CustomAuthenticationMixin, generics.GenericAPIView):
+class JobSitePacksDetailView(PaginatedListMixin, CustomAuthenticationMixin, generics.GenericAPIView):
     """
     View for retrieving job details.
 
@@ -2477,21 +2240,6 @@ class JobSitePacksDetailView(CustomAuthenticationMixin, generics.GenericAPIView)
     template_name = 'job_site_packs_detail.html'
     queryset = JobDocument.objects.all()
     
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
 
     def get_job_instance(self):
         """
@@ -2818,7 +2566,7 @@ class JobSitePacksDeleteView(CustomAuthenticationMixin, generics.GenericAPIView)
                                     message="Data retrieved",
                                     data=serializer.data)
 
-class JobRLODetailView(CustomAuthenticationMixin, generics.GenericAPIView):
+class JobRLODetailView(PaginatedListMixin, CustomAuthenticationMixin, generics.GenericAPIView):
     """
     View for retrieving job details.
 
@@ -2836,21 +2584,6 @@ class JobRLODetailView(CustomAuthenticationMixin, generics.GenericAPIView):
     template_name = 'job_rlo_detail.html'
     queryset = RLO.objects.all()
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
 
     def get_job_instance(self):
         """
@@ -3380,7 +3113,7 @@ class JobRLORejectView(CustomAuthenticationMixin, generics.CreateAPIView):
                 data = convert_serializer_errors(serializer.errors)
             )
 
-class JobPODetailView(CustomAuthenticationMixin, generics.GenericAPIView):
+class JobPODetailView(PaginatedListMixin, CustomAuthenticationMixin, generics.GenericAPIView):
     """
     View for retrieving job details.
 
@@ -3398,21 +3131,6 @@ class JobPODetailView(CustomAuthenticationMixin, generics.GenericAPIView):
     template_name = 'job_po_detail.html'
     queryset = PurchaseOrder.objects.all()
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
 
     def get_job_instance(self):
         """
@@ -3506,45 +3224,18 @@ class JobCustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
         Returns:
             QuerySet: A queryset of stw Requirement customers.
         """
-        job = Job.objects.filter(
-            status__in=['planned', 'in-progress'],
-        ).order_by('customer_id').values_list('customer_id', flat=True).distinct()
-        
-        if not job:
-            return []
-        
         queryset = User.objects.filter(
-            is_active=False,  roles__name__icontains='customer',
-            id__in=job
-            ).exclude(pk=self.request.user.id)
-        return queryset
+            is_active=False, roles__name__icontains='customer'
+        ).exclude(pk=self.request.user.id)
+
+        # Customers with at least one planned or in progress job.
+        return customers_with_counts(
+            queryset, 'job_counts', 'job',
+            {'status__in': ['planned', 'in-progress']}, only_with_counts=True,
+        ).order_by('-id')
 
-    def get_paginated_queryset(self, base_queryset):
-        items_per_page = 20
-        paginator = Paginator(base_queryset, items_per_page)
-        page_number = self.request.GET.get('page')
-        
-        try:
-            current_page = paginator.page(page_number)
-        except PageNotAnInteger:
-            # If page is not an integer, deliver the first page.
-            current_page = paginator.page(1)
-        except EmptyPage:
-            # If page is out of range, deliver the last page of results.
-            current_page = paginator.page(paginator.num_pages)
-        
-        return current_page
-    
     def get_searched_queryset(self, queryset):
-        search_params = self.request.query_params.get('q', '')
-        if search_params:
-            search_fields = self.search_fields
-            q_objects = Q()
-            # Construct a Q object to search across multiple fields dynamically
-            for field in search_fields:
-                q_objects |= Q(**{f'{field}__icontains': search_params})
-            queryset = queryset.filter(q_objects)
-        return queryset
+        return search_queryset(queryset, 'customer', self.request.query_params.get('q', ''))
 
     def get(self, request, *args, **kwargs):
         """
@@ -3571,18 +3262,9 @@ class JobCustomerListView(CustomAuthenticationMixin,generics.ListAPIView):
 
         queryset = self.get_queryset()
         queryset = self.get_searched_queryset(queryset)
-        all_jobs = Job.objects.filter(status__in=['planned', 'in-progress'])
-        
-        customers_with_counts = []  # Create a list to store customer objects with counts
-
-        for customer in queryset:
-            job_counts = all_jobs.filter(customer_id=customer).count()
-            customers_with_counts.append({'customer': customer, 'job_counts': job_counts})
 
         if request.accepted_renderer.format == 'html':
-            # context = {'customers_with_counts': customers_with_counts,'queryset': self.get_paginated_queryset(queryset)}
-            
-            context = { 'customers_with_counts': self.get_paginated_queryset(customers_with_counts),
+            context = { 'customers_with_counts': paginate_customers_with_counts(queryset, 'job_counts', request),
                 'search_fields': ['first_name', 'last_name','email','company_name'],
                 'search_value': request.query_params.get('q', '') if isinstance(request.query_params.get('q', []), str) else ', '.join(request.query_params.get('q', [])),}
             return render_html_response(context, self.template_name)
@@ -4508,26 +4190,32 @@ class AssignJobView(CustomAuthenticationMixin, generics.CreateAPIView):
 
 def index(request):  
     job_id = request.GET.get('job_id')  # Retrieve job_id from query parameters
-    all_events = Events.objects.all()
+    # The events are loaded by the calendar from all_events, one visible window at a time.
     context = {
-        "events":all_events,
         "job_id": job_id,
     }
     return render(request,'assign_job/fullcalendar.html',context)
 
-def all_events(request):                                                                                                 
-    all_events = Events.objects.all()   
-    print(all_events)                                                                                 
-    out = []                                                                                                             
-    for event in all_events:                                                                                             
-        out.append({                                                                                                     
-            'title': event.name,                                                                                         
-            'id': event.id,                                                                                              
-            'start': event.start.strftime("%m/%d/%Y, %H:%M:%S"),                                                         
-            'end': event.end.strftime("%m/%d/%Y, %H:%M:%S"),                                                             
-        })                                                                                                               
-                                                                                                                      
-    return JsonResponse(out, safe=False) 
+def all_events(request):
+    """
+    Calendar feed: the events overlapping the visible window given by the `start` and
+    `end` query parameters, sent by FullCalendar.
+
+    The response carries an ETag, a request with a matching If-None-Match gets a 304
+    without the events being loaded.
+    """
+    try:
+        start, end = parse_window(request.GET.get('start'), request.GET.get('end'))
+    except CalendarWindowError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    etag = window_etag(start, end)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = JsonResponse(serialize_events(events_in_window(start, end)), safe=False)
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
 
 
 
@@ -4551,7 +4239,7 @@ def add_event(request):
 
 def get_event_details(request, event_id):
     try:
-        event = Events.objects.get(id=event_id)
+        event = Events.objects.select_related('team').prefetch_related('members').get(id=event_id)
         event_data = {
             'title': event.name,
             'start': event.start,
@@ -4769,7 +4457,6 @@ class EventUpdateView(CustomAuthenticationMixin, generics.UpdateAPIView):
     template_name = 'assign_job/event_edit.html'
 
 
-    
     def get_queryset(self):
         """
         Get the queryset for listing Event items.
@@ -4977,7 +4664,7 @@ def retriveMembersAssignedJobs(request):
                 data=[]
             )
 
-        team = Team.objects.filter(id__in=[i for i in teamId.split(',') if i.isdigit()]).all() if teamId else None
+        team = Team.objects.filter(id__in=[i for i in teamId.split(',') if i.isdigit()]).prefetch_related('members') if teamId else None
         members = Member.objects.filter(id__in=[i for i in membersIds.split(',') if i.isdigit()]).all() if membersIds else None
         
         if not team and not members:
@@ -4987,7 +4674,21 @@ def retriveMembersAssignedJobs(request):
                 data=[]
             )
         
-        serializer = MemberCalendarSerializer([member for t in team for member in t.members.all()] if team else members)
+        # Optional date range, e.g. the visible weeks of the calendar.
+        start = end = None
+        if request.GET.get('start') and request.GET.get('end'):
+            try:
+                start, end = parse_window(request.GET.get('start'), request.GET.get('end'))
+            except CalendarWindowError as e:
+                return create_api_response(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    message=str(e),
+                )
+
+        serializer = MemberCalendarSerializer(
+            [member for t in team for member in t.members.all()] if team else members,
+            context={'start': start, 'end': end},
+        )
         return create_api_response(
             status_code=status.HTTP_200_OK,
             message="Assigned Jobs",